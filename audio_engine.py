@@ -0,0 +1,551 @@
+# audio_engine.py
+# File berisi mesin audio adzan/chime: buffer PCM yang di-cache dan pemutaran di thread terpisah
+
+"""
+File ini memutar file WAV (adzan atau chime) untuk sink 'sound' sebagai
+pengganti beep, tanpa membaca ulang file setiap kali reminder fire:
+
+- decode_wav(path) membaca file sekali ke satu buffer bytes dan mengurai
+  header RIFF (chunk 'fmt ' dan 'data'). Sampel PCM adalah memoryview ke
+  buffer tersebut, jadi tidak ada salinan kedua
+- load_clip(path) menyimpan hasilnya di cache per proses. Cache hanya
+  memeriksa (mtime, ukuran) file, sehingga sink yang dibuat ulang (misalnya
+  saat hot-reload) memakai klip yang sama, dan file yang diganti di disk
+  di-decode ulang
+- AudioEngine.play() hanya memasukkan permintaan ke queue terbatas. Thread
+  pemutar memotong klip menjadi irisan memoryview (AUDIO_CONFIG['chunk_ms'])
+  dan menyerahkannya ke backend tanpa menyalin
+
+Backend (AUDIO_CONFIG['backend']):
+- 'aplay'   : proses aplay (ALSA) yang dipakai ulang selama format klip sama;
+              PCM ditulis langsung ke stdin-nya
+- 'winsound': winsound.PlaySound dari buffer file di memori (SND_MEMORY)
+- 'file'    : menulis klip terakhir ke file WAV (AUDIO_CONFIG['output_path'])
+- 'null'    : hanya menghitung sampel (pengujian headless dan benchmark)
+- 'auto'    : winsound di Windows, aplay jika tersedia, selain itu null
+
+Hanya WAV PCM tak terkompresi yang didukung (format tag 1, atau
+WAVE_FORMAT_EXTENSIBLE dengan subformat PCM).
+
+Metrik: waktu sampai sampel pertama (dari play() sampai irisan pertama
+diserahkan ke backend), jumlah klip yang diputar, dibuang dan di-decode.
+"""
+
+import os
+import queue
+import shutil
+import struct
+import subprocess
+import threading
+import time
+
+import metrics
+from config import AUDIO_CONFIG
+
+# Format sampel aplay per lebar sampel (byte)
+_APLAY_FORMATS = {1: 'U8', 2: 'S16_LE', 3: 'S24_3LE', 4: 'S32_LE'}
+
+# Cache klip per proses: path absolut -> ((mtime_ns, ukuran), AudioClip)
+_clip_cache = {}
+_clip_cache_lock = threading.Lock()
+
+
+class AudioClip:
+    """
+    Klip PCM yang sudah di-decode.
+
+    Attributes:
+        path (str): File asal
+        buffer (bytes): Isi file WAV utuh (dipakai backend winsound)
+        frames (memoryview): Sampel PCM (irisan dari buffer, tanpa salinan)
+        channels (int): Jumlah kanal
+        sample_width (int): Byte per sampel
+        frame_rate (int): Frame per detik
+        frame_size (int): Byte per frame (semua kanal)
+    """
+
+    def __init__(self, path, buffer, frames, channels, sample_width, frame_rate):
+        self.path = path
+        self.buffer = buffer
+        self.frames = frames
+        self.channels = channels
+        self.sample_width = sample_width
+        self.frame_rate = frame_rate
+        self.frame_size = channels * sample_width
+
+    @property
+    def frame_count(self):
+        return len(self.frames) // self.frame_size
+
+    @property
+    def duration(self):
+        """
+        Returns:
+            float: Durasi klip (detik)
+        """
+        return self.frame_count / self.frame_rate
+
+    def chunks(self, chunk_ms):
+        """
+        Memotong sampel menjadi irisan memoryview berdurasi chunk_ms.
+
+        Args:
+            chunk_ms (float): Durasi per irisan (milidetik)
+
+        Yields:
+            memoryview: Irisan sampel (tanpa salinan)
+        """
+        step = max(1, int(self.frame_rate * chunk_ms / 1000)) * self.frame_size
+        for offset in range(0, len(self.frames), step):
+            yield self.frames[offset:offset + step]
+
+
+def decode_wav(path):
+    """
+    Membaca file WAV PCM sekali dan mengurai header RIFF-nya.
+
+    Args:
+        path (str): Path file WAV
+
+    Returns:
+        AudioClip: Klip dengan sampel sebagai memoryview ke isi file
+
+    Raises:
+        OSError: Jika file tidak bisa dibaca
+        ValueError: Jika file bukan WAV PCM yang didukung
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < 12 or data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+        raise ValueError(f"Bukan file WAV: {path}")
+
+    fmt = None
+    pcm_range = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        (size,) = struct.unpack_from('<I', data, offset + 4)
+        body = offset + 8
+        if chunk_id == b'fmt ' and size >= 16:
+            fmt = struct.unpack_from('<HHIIHH', data, body)
+            if fmt[0] == 0xFFFE and size >= 26:
+                # WAVE_FORMAT_EXTENSIBLE: format sebenarnya di awal GUID subformat
+                (subformat,) = struct.unpack_from('<H', data, body + 24)
+                fmt = (subformat,) + fmt[1:]
+        elif chunk_id == b'data':
+            # Chunk data yang terpotong (file belum selesai ditulis) tetap dipakai
+            pcm_range = (body, min(body + size, len(data)))
+        # Chunk RIFF selalu berukuran genap (byte padding)
+        offset = body + size + (size & 1)
+
+    if fmt is None or pcm_range is None:
+        raise ValueError(f"File WAV tanpa chunk fmt/data: {path}")
+
+    format_tag, channels, frame_rate, _, block_align, bits = fmt
+    if format_tag != 1:
+        raise ValueError(f"Hanya WAV PCM yang didukung (format {format_tag}): {path}")
+    if channels < 1 or frame_rate < 1 or bits % 8 or block_align != channels * bits // 8:
+        raise ValueError(f"Header WAV tidak valid: {path}")
+
+    start, end = pcm_range
+    end -= (end - start) % block_align
+    return AudioClip(path, data, memoryview(data)[start:end],
+                     channels, bits // 8, frame_rate)
+
+
+def load_clip(path):
+    """
+    Mengambil klip dari cache, atau men-decode-nya jika belum ada atau
+    file di disk sudah berubah.
+
+    Args:
+        path (str): Path file WAV
+
+    Returns:
+        AudioClip: Klip yang sudah di-decode
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _clip_cache_lock:
+        cached = _clip_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    clip = decode_wav(path)
+    metrics.AUDIO_CLIP_DECODES.inc()
+    with _clip_cache_lock:
+        _clip_cache[path] = (signature, clip)
+    return clip
+
+
+def clear_clip_cache():
+    """
+    Mengosongkan cache klip (klip berikutnya di-decode ulang).
+    """
+    with _clip_cache_lock:
+        _clip_cache.clear()
+
+
+class AudioBackend:
+    """
+    Dasar backend pemutaran.
+    Subclass mengimplementasikan play(clip, chunks).
+    """
+
+    name = 'backend'
+
+    def play(self, clip, chunks):
+        """
+        Memutar satu klip sampai selesai (dipanggil dari thread pemutar).
+
+        Args:
+            clip (AudioClip): Klip yang diputar
+            chunks (iterator): Irisan memoryview sampel; berhenti lebih awal
+                jika engine dihentikan
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Melepas device/proses backend. Default tidak melakukan apa pun.
+        """
+
+
+class NullBackend(AudioBackend):
+    """
+    Backend tanpa suara: hanya menghitung klip dan byte sampel.
+    """
+
+    name = 'null'
+
+    def __init__(self):
+        self.clips = 0
+        self.bytes = 0
+
+    def play(self, clip, chunks):
+        for chunk in chunks:
+            self.bytes += len(chunk)
+        self.clips += 1
+
+
+class FileBackend(AudioBackend):
+    """
+    Menulis klip yang diputar ke file WAV (berisi klip terakhir).
+    """
+
+    name = 'file'
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Path file WAV tujuan
+        """
+        self.path = path
+
+    def play(self, clip, chunks):
+        import wave
+
+        with wave.open(self.path, 'wb') as output:
+            output.setnchannels(clip.channels)
+            output.setsampwidth(clip.sample_width)
+            output.setframerate(clip.frame_rate)
+            for chunk in chunks:
+                output.writeframesraw(chunk)
+
+
+class AplayBackend(AudioBackend):
+    """
+    Memutar PCM lewat proses aplay (ALSA) yang dibiarkan hidup di antara
+    klip berformat sama, sehingga klip berikutnya tidak membayar biaya
+    membuat proses dan membuka device.
+    """
+
+    name = 'aplay'
+
+    def __init__(self, command='aplay'):
+        """
+        Args:
+            command (str): Program aplay
+        """
+        self.command = command
+        self._process = None
+        self._format = None
+
+    def _open(self, clip):
+        clip_format = (clip.sample_width, clip.channels, clip.frame_rate)
+        if self._process is not None and self._process.poll() is None \
+                and self._format == clip_format:
+            return
+        self.close()
+        if clip.sample_width not in _APLAY_FORMATS:
+            raise ValueError(f"Lebar sampel tidak didukung aplay: {clip.sample_width} byte")
+        # bufsize=0: stdin berupa FileIO, irisan memoryview langsung ke os.write
+        self._process = subprocess.Popen(
+            [self.command, '-q', '-t', 'raw', '-f', _APLAY_FORMATS[clip.sample_width],
+             '-c', str(clip.channels), '-r', str(clip.frame_rate), '-'],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        self._format = clip_format
+
+    def play(self, clip, chunks):
+        self._open(clip)
+        stdin = self._process.stdin
+        try:
+            for chunk in chunks:
+                while chunk:
+                    written = stdin.write(chunk)
+                    chunk = chunk[written:]
+        except BrokenPipeError:
+            # aplay berhenti (device hilang); klip berikutnya membuka proses baru
+            self.close()
+            raise
+
+    def close(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+class WinsoundBackend(AudioBackend):
+    """
+    Memutar buffer WAV utuh dari memori dengan winsound.PlaySound.
+    PlaySound memblokir thread pemutar sampai klip selesai.
+    """
+
+    name = 'winsound'
+
+    def __init__(self):
+        import winsound
+        self._winsound = winsound
+
+    def play(self, clip, chunks):
+        # Sampel pertama diserahkan ke sistem saat PlaySound dipanggil
+        if next(chunks, None) is None:
+            return
+        self._winsound.PlaySound(clip.buffer, self._winsound.SND_MEMORY)
+
+
+def create_backend(name=None, output_path=None):
+    """
+    Membuat backend sesuai AUDIO_CONFIG['backend'].
+
+    Args:
+        name (str, optional): 'auto', 'aplay', 'winsound', 'file' atau 'null'
+        output_path (str, optional): Tujuan backend 'file'
+
+    Returns:
+        AudioBackend: Objek backend
+    """
+    name = AUDIO_CONFIG['backend'] if name is None else name
+    output_path = AUDIO_CONFIG['output_path'] if output_path is None else output_path
+
+    if name == 'auto':
+        try:
+            return WinsoundBackend()
+        except ImportError:
+            pass
+        if shutil.which('aplay'):
+            return AplayBackend()
+        print("⚠️ Tidak ada backend audio (winsound/aplay); suara adzan tidak diputar")
+        return NullBackend()
+    if name == 'aplay':
+        return AplayBackend()
+    if name == 'winsound':
+        return WinsoundBackend()
+    if name == 'file':
+        return FileBackend(output_path)
+    if name == 'null':
+        return NullBackend()
+    raise ValueError(f"Backend audio tidak dikenal: {name}")
+
+
+class AudioEngine:
+    """
+    Pemutar klip audio non-blocking dengan satu thread pemutar.
+
+    Menggunakan:
+    - Cache klip per proses (load_clip), diisi saat preload()
+    - Queue permintaan terbatas; permintaan saat queue penuh dibuang
+    - Backend yang menerima irisan memoryview
+    """
+
+    def __init__(self, files=None, backend=None, chunk_ms=None, queue_size=None):
+        """
+        Args:
+            files (dict, optional): {nama sholat atau 'default': path WAV}.
+                Default AUDIO_CONFIG['files']
+            backend (AudioBackend, optional): Backend pemutaran. Default
+                create_backend() (dibuat saat klip pertama diputar)
+            chunk_ms (float, optional): Durasi irisan per penulisan ke backend
+            queue_size (int, optional): Kapasitas queue permintaan
+        """
+        self.files = dict(AUDIO_CONFIG['files'] if files is None else files)
+        self.backend = backend
+        self.chunk_ms = AUDIO_CONFIG['chunk_ms'] if chunk_ms is None else chunk_ms
+
+        self._requests = queue.Queue(
+            maxsize=AUDIO_CONFIG['queue_size'] if queue_size is None else queue_size
+        )
+        self._stopping = threading.Event()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'played': 0,
+            'dropped': 0,
+            'failed': 0,
+            'last_first_sample': None
+        }
+
+    def path_for(self, sholat_name):
+        """
+        Returns:
+            str: File WAV untuk sholat ini (atau 'default'), None jika tidak ada
+        """
+        return self.files.get(sholat_name) or self.files.get('default')
+
+    def preload(self):
+        """
+        Men-decode semua file yang dikonfigurasi ke cache sebelum dibutuhkan.
+
+        Returns:
+            int: Jumlah klip yang siap diputar
+        """
+        loaded = 0
+        for name, path in self.files.items():
+            try:
+                load_clip(path)
+                loaded += 1
+            except (OSError, ValueError) as e:
+                print(f"❌ Gagal memuat audio {name} ({path}): {e}")
+        return loaded
+
+    def _start(self):
+        """
+        Memulai thread pemutar saat play() pertama (atau setelah stop()).
+        """
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._playback_loop, daemon=True)
+            self._thread.start()
+
+    def play(self, sholat_name):
+        """
+        Meminta klip sholat diputar tanpa menunggu pemutaran.
+
+        Args:
+            sholat_name (str): Nama sholat
+
+        Returns:
+            bool: False jika tidak ada file audio untuk sholat ini (pemanggil
+                memakai beep); True jika permintaan diterima atau dibuang
+                karena queue penuh
+        """
+        path = self.path_for(sholat_name)
+        if path is None:
+            return False
+
+        self._start()
+        try:
+            self._requests.put_nowait((path, time.monotonic()))
+        except queue.Full:
+            self._count('dropped')
+            metrics.AUDIO_DROPPED.inc()
+        return True
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _chunks(self, clip, requested_at):
+        """
+        Irisan klip untuk backend; mencatat waktu sampai sampel pertama dan
+        berhenti jika engine dihentikan.
+        """
+        first = True
+        for chunk in clip.chunks(self.chunk_ms):
+            if self._stopping.is_set():
+                return
+            if first:
+                first_sample = time.monotonic() - requested_at
+                metrics.AUDIO_FIRST_SAMPLE.observe(first_sample)
+                with self._stats_lock:
+                    self.stats['last_first_sample'] = first_sample
+                first = False
+            yield chunk
+
+    def _playback_loop(self):
+        while True:
+            request = self._requests.get()
+            if request is None or self._stopping.is_set():
+                break
+            path, requested_at = request
+            try:
+                clip = load_clip(path)
+                if self.backend is None:
+                    self.backend = create_backend()
+                self.backend.play(clip, self._chunks(clip, requested_at))
+                self._count('played')
+                metrics.AUDIO_PLAYS.inc()
+            except Exception as e:
+                self._count('failed')
+                print(f"❌ Gagal memutar audio {path}: {e}")
+
+    def pending(self):
+        """
+        Returns:
+            int: Permintaan yang menunggu diputar
+        """
+        return self._requests.qsize()
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Statistik pemutaran engine ini
+        """
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['pending'] = self.pending()
+        return stats
+
+    def stop(self, timeout=5):
+        """
+        Menghentikan thread pemutar (klip yang sedang diputar dihentikan
+        pada irisan berikutnya) lalu menutup backend.
+
+        Args:
+            timeout (float): Batas waktu menunggu thread pemutar (detik)
+        """
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopping.set()
+            try:
+                self._requests.put_nowait(None)
+            except queue.Full:
+                # Thread keluar setelah permintaan berikutnya karena _stopping
+                pass
+            thread.join(timeout=timeout)
+        # Permintaan yang belum diputar tidak dibawa ke start berikutnya
+        while True:
+            try:
+                self._requests.get_nowait()
+            except queue.Empty:
+                break
+        if self.backend is not None:
+            self.backend.close()
+
@@ -0,0 +1,183 @@
+# benchmarks/bench_audio.py
+# Benchmark waktu sampai sampel pertama: klip PCM di-cache vs decode WAV setiap reminder
+
+"""
+Membuat file WAV tiruan (adzan --adzan-seconds detik dan chime 2 detik,
+PCM 16-bit stereo 44.1 kHz) lalu mengukur, untuk --plays pemutaran:
+
+- decode per reminder (pembanding): wave.open + readframes seluruh file
+  setiap kali diputar, lalu diiris sebagai bytes (setiap irisan disalin)
+- AudioEngine: klip di-decode sekali ke cache (preload), play() hanya
+  memasukkan permintaan ke queue dan thread pemutar menyerahkan irisan
+  memoryview ke backend
+
+Yang dilaporkan:
+- waktu sampai sampel pertama (p50/p95) dari permintaan sampai irisan
+  pertama diserahkan ke backend
+- lama pemanggil (worker dispatcher) tertahan di play()
+- alokasi memori puncak per pemutaran (tracemalloc)
+- pemeriksaan backend 'file': isi WAV keluaran sama dengan sampel sumber
+
+Dengan --backend aplay, AudioEngine memutar ke device sungguhan (butuh
+ALSA); default 'null' (headless).
+
+Contoh:
+    python benchmarks/bench_audio.py --plays 50
+    python benchmarks/bench_audio.py --adzan-seconds 180 --backend aplay --plays 3
+"""
+
+import argparse
+import math
+import os
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import audio_engine
+from audio_engine import AudioEngine, FileBackend, NullBackend, create_backend, load_clip
+
+FRAME_RATE = 44100
+
+
+def write_tone(path, seconds, frequency):
+    """
+    Menulis nada sinus PCM 16-bit stereo ke file WAV.
+    """
+    period = [int(12000 * math.sin(2 * math.pi * frequency * i / FRAME_RATE))
+              for i in range(FRAME_RATE)]
+    second = struct.pack(f'<{FRAME_RATE * 2}h', *(sample for value in period
+                                                   for sample in (value, value)))
+    with wave.open(path, 'wb') as output:
+        output.setnchannels(2)
+        output.setsampwidth(2)
+        output.setframerate(FRAME_RATE)
+        for _ in range(int(seconds)):
+            output.writeframes(second)
+
+
+def decode_each_time(path, chunk_ms):
+    """
+    Pembanding: decode seluruh file lalu mengiris bytes untuk setiap pemutaran.
+
+    Returns:
+        float: Waktu sampai irisan pertama (detik)
+    """
+    requested_at = time.perf_counter()
+    with wave.open(path, 'rb') as source:
+        step = int(source.getframerate() * chunk_ms / 1000) * \
+            source.getnchannels() * source.getsampwidth()
+        data = source.readframes(source.getnframes())
+    first_sample = None
+    for offset in range(0, len(data), step):
+        chunk = data[offset:offset + step]
+        if first_sample is None:
+            first_sample = time.perf_counter() - requested_at
+    return first_sample
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def peak_kb(function):
+    """
+    Alokasi puncak satu pemanggilan (KB).
+    """
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def wait_played(engine, played):
+    while engine.get_stats()['played'] + engine.get_stats()['failed'] < played:
+        time.sleep(0.0005)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--plays', type=int, default=50)
+    parser.add_argument('--adzan-seconds', type=int, default=180)
+    parser.add_argument('--chunk-ms', type=float, default=50)
+    parser.add_argument('--backend', default='null', choices=('null', 'aplay', 'auto'))
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        adzan_path = os.path.join(tmp, 'adzan.wav')
+        chime_path = os.path.join(tmp, 'chime.wav')
+        write_tone(adzan_path, options.adzan_seconds, 440)
+        write_tone(chime_path, 2, 880)
+        files = {'Subuh': chime_path, 'default': adzan_path}
+        size_mb = os.path.getsize(adzan_path) / 1024 / 1024
+        print(f"adzan {options.adzan_seconds} s ({size_mb:.1f} MB), chime 2 s, "
+              f"irisan {options.chunk_ms:g} ms, {options.plays} pemutaran, "
+              f"backend {options.backend}")
+        print(f"{'mode':<22} | {'sampel pertama p50':>18} | {'p95':>9} | "
+              f"{'tertahan di play()':>18} | {'memori puncak':>13}")
+
+        # Pembanding: decode setiap reminder
+        baseline = [decode_each_time(adzan_path, options.chunk_ms)
+                    for _ in range(options.plays)]
+        baseline_kb = peak_kb(lambda: decode_each_time(adzan_path, options.chunk_ms))
+        print(f"{'decode per reminder':<22} | {percentile(baseline, 0.5) * 1000:15.3f} ms | "
+              f"{percentile(baseline, 0.95) * 1000:6.3f} ms | {'(sinkron)':>18} | "
+              f"{baseline_kb:10.0f} KB")
+
+        # AudioEngine dengan klip di cache
+        audio_engine.clear_clip_cache()
+        backend = NullBackend() if options.backend == 'null' else create_backend(options.backend)
+        engine = AudioEngine(files=files, backend=backend, chunk_ms=options.chunk_ms,
+                             queue_size=options.plays + 1)
+        preload_start = time.perf_counter()
+        engine.preload()
+        preload_ms = (time.perf_counter() - preload_start) * 1000
+
+        first_samples = []
+        play_calls = []
+        for i in range(options.plays):
+            call_start = time.perf_counter()
+            engine.play('Maghrib')
+            play_calls.append(time.perf_counter() - call_start)
+            wait_played(engine, i + 1)
+            first_samples.append(engine.get_stats()['last_first_sample'])
+
+        def play_once():
+            engine.play('Maghrib')
+            wait_played(engine, options.plays + 1)
+        engine_kb = peak_kb(play_once)
+        print(f"{'AudioEngine (cache)':<22} | {percentile(first_samples, 0.5) * 1000:15.3f} ms | "
+              f"{percentile(first_samples, 0.95) * 1000:6.3f} ms | "
+              f"{statistics.median(play_calls) * 1e6:15.1f} us | {engine_kb:10.0f} KB")
+        stats = engine.get_stats()
+        engine.stop()
+
+        print(f"preload        : {preload_ms:.1f} ms untuk {len(files)} file, "
+              f"{stats['played']} klip diputar, gagal {stats['failed']}, "
+              f"dibuang {stats['dropped']}")
+        print(f"percepatan     : {percentile(baseline, 0.5) / percentile(first_samples, 0.5):.0f}x "
+              f"(p50 sampel pertama)")
+
+        # Backend file: keluaran harus identik dengan sampel sumber
+        output_path = os.path.join(tmp, 'output.wav')
+        engine = AudioEngine(files=files, backend=FileBackend(output_path),
+                             chunk_ms=options.chunk_ms)
+        engine.play('Subuh')
+        wait_played(engine, 1)
+        engine.stop()
+        with wave.open(output_path, 'rb') as output:
+            written = output.readframes(output.getnframes())
+        identical = written == bytes(load_clip(chime_path).frames)
+        print(f"backend file   : {len(written)} byte, "
+              f"{'identik dengan sumber' if identical else 'BERBEDA dari sumber'}")
+
+
+if __name__ == "__main__":
+    main()
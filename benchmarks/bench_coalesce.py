@@ -0,0 +1,172 @@
+# benchmarks/bench_coalesce.py
+# Benchmark penggabungan reminder se-kota pada menit yang sama (Maghrib serentak)
+
+"""
+Memutar ulang --days hari jadwal untuk --subscribers SholatReminder per kota
+di --cities kota (lokasi astronomis dan zona masing-masing) pada satu
+ReminderEngine bersama dengan VirtualClock, sekali tanpa penggabungan
+(coalesce=False) dan sekali dengan penggabungan.
+
+Sink meniru biaya pengiriman nyata (suara/console) dengan menunggu --sink-ms
+milidetik per job notifikasi.
+
+Yang dilaporkan per mode:
+- jumlah notifikasi yang dirender dan job dispatch vs penerima yang dicakup
+  (harus sama dengan jumlah reminder yang fire)
+- waktu engine memproses menit puncak (semua reminder yang jatuh tempo
+  bersamaan) dan waktu sampai semua notifikasi terkirim
+- CPU per reminder
+
+Contoh:
+    python benchmarks/bench_coalesce.py --subscribers 1000 --cities 5
+    python benchmarks/bench_coalesce.py --subscribers 5000 --sink-ms 2
+"""
+
+import argparse
+import contextlib
+import datetime
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from notification_dispatch import NotificationDispatcher, NotificationSink
+from reminder_engine import ReminderEngine
+from sholat_reminder import SholatReminder
+
+CITIES = (
+    ('Jakarta', -6.2088, 106.8456, 7, 'Asia/Jakarta'),
+    ('Bandung', -6.9175, 107.6191, 7, 'Asia/Jakarta'),
+    ('Surabaya', -7.2575, 112.7521, 7, 'Asia/Jakarta'),
+    ('Makassar', -5.1477, 119.4327, 8, 'Asia/Makassar'),
+    ('Jayapura', -2.5337, 140.7181, 9, 'Asia/Jayapura'),
+    ('Medan', 3.5952, 98.6722, 7, 'Asia/Jakarta'),
+    ('Denpasar', -8.6705, 115.2126, 8, 'Asia/Makassar'),
+    ('Ambon', -3.6954, 128.1814, 9, 'Asia/Jayapura'),
+)
+
+
+class SlowSink(NotificationSink):
+    """
+    Sink yang menunggu sebentar per job dan menghitung penerima yang dicakup.
+    """
+
+    name = 'slow'
+
+    def __init__(self, seconds):
+        super().__init__(timeout=1)
+        self.seconds = seconds
+        self.jobs = 0
+        self.recipients = 0
+        self._lock = threading.Lock()
+
+    def send(self, job, timeout):
+        if self.seconds:
+            time.sleep(self.seconds)
+        with self._lock:
+            self.jobs += 1
+            self.recipients += 1 if job['recipients'] is None else len(job['recipients'])
+
+
+def replay(options, coalesce):
+    """
+    Satu replay lengkap.
+
+    Returns:
+        dict: Hasil pengukuran
+    """
+    start = datetime.datetime.combine(datetime.date(2025, 3, 1), datetime.time())
+    end = start + datetime.timedelta(days=options.days)
+    clock = VirtualClock(start=start, limit=start)
+    engine = ReminderEngine(clock=clock)
+    sink = SlowSink(options.sink_ms / 1000)
+    dispatcher = NotificationDispatcher(sinks=[sink], workers=2, queue_size=1000000)
+
+    # Catat durasi setiap pemrosesan reminder sholat yang jatuh tempo
+    # bersamaan (penanda pergantian hari tidak dihitung)
+    ticks = []
+    dispatch_due = engine._dispatch_due
+
+    def timed_dispatch(missed, due):
+        tick_start = time.perf_counter()
+        dispatch_due(missed, due)
+        prayers = sum(1 for _, _, payload in due if payload[1] >= 0)
+        if prayers:
+            ticks.append((prayers, time.perf_counter() - tick_start))
+
+    engine._dispatch_due = timed_dispatch
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        reminders = []
+        for name, latitude, longitude, timezone, zone in CITIES[:options.cities]:
+            location = {'latitude': latitude, 'longitude': longitude, 'elevation': 0,
+                        'timezone': timezone, 'zone': zone, 'method': 'Kemenag',
+                        'asr_factor': 1}
+            for i in range(options.subscribers):
+                reminder = SholatReminder(engine=engine, subscriber_id=f"{name}-{i}",
+                                          location=location, dispatcher=dispatcher,
+                                          quiet=True, clock=clock, journal=False,
+                                          coalesce=coalesce)
+                reminder.start_reminder()
+                reminders.append(reminder)
+
+        submitted_before = dispatcher.get_stats()['submitted']
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        clock.run_until(end)
+        clock.limit_reached.wait()
+        engine_seconds = time.perf_counter() - wall_start
+
+        while dispatcher.get_stats()['queue_depth'] or \
+                dispatcher.get_stats()['dispatched'] < dispatcher.get_stats()['submitted']:
+            time.sleep(0.001)
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+
+        for reminder in reminders:
+            reminder.stop_reminder()
+        engine.stop()
+        dispatcher.stop()
+
+    peak_due, peak_seconds = max(ticks, key=lambda tick: (tick[0], tick[1]))
+    return {
+        'fired': sum(prayers for prayers, _ in ticks),
+        'rendered': dispatcher.get_stats()['submitted'] - submitted_before,
+        'jobs': sink.jobs,
+        'recipients': sink.recipients,
+        'peak_due': peak_due,
+        'peak_ms': peak_seconds * 1000,
+        'engine_s': engine_seconds,
+        'wall_s': wall_seconds,
+        'cpu_us': cpu_seconds / max(sum(prayers for prayers, _ in ticks), 1) * 1e6
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--subscribers', type=int, default=1000, help="Subscriber per kota")
+    parser.add_argument('--cities', type=int, default=5, choices=range(1, len(CITIES) + 1))
+    parser.add_argument('--days', type=int, default=1)
+    parser.add_argument('--sink-ms', type=float, default=0.2,
+                        help="Biaya tiruan per job notifikasi (milidetik)")
+    options = parser.parse_args()
+
+    print(f"{options.cities} kota x {options.subscribers} subscriber x {options.days} hari, "
+          f"sink {options.sink_ms:g} ms/job")
+    print(f"{'mode':<10} | {'fire':>7} | {'render':>7} | {'job':>7} | {'penerima':>8} | "
+          f"{'menit puncak':>20} | {'engine':>7} | {'terkirim':>8} | {'CPU/reminder':>12}")
+
+    for label, coalesce in (('terpisah', False), ('gabungan', True)):
+        result = replay(options, coalesce)
+        print(f"{label:<10} | {result['fired']:>7} | {result['rendered']:>7} | "
+              f"{result['jobs']:>7} | {result['recipients']:>8} | "
+              f"{result['peak_due']:>6} due {result['peak_ms']:7.1f} ms | "
+              f"{result['engine_s']:5.2f} s | {result['wall_s']:6.2f} s | "
+              f"{result['cpu_us']:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
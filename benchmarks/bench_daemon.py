@@ -0,0 +1,79 @@
+# benchmarks/bench_daemon.py
+# Benchmark latensi query daemon lewat Unix socket dengan banyak client
+
+"""
+Menjalankan ReminderDaemon pada socket sementara lalu --clients proses
+client (masing-masing satu koneksi persisten) mengirim --requests query.
+Dicatat latensi per request (median, p99, maksimum) dan throughput total.
+
+Contoh:
+    python benchmarks/bench_daemon.py --clients 16 --requests 2000 --command status
+"""
+
+import argparse
+import contextlib
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from daemon import ReminderDaemon
+from daemon_client import DaemonClient
+from notification_dispatch import NotificationDispatcher
+from sholat_reminder import SholatReminder
+
+
+def run_client(socket_path, command, requests):
+    """
+    Returns:
+        list: Latensi per request (detik)
+    """
+    latencies = []
+    with DaemonClient(socket_path) as client:
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.request(command)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--command', default='next')
+    args = parser.parse_args()
+
+    socket_path = os.path.join(tempfile.mkdtemp(), 'bench.sock')
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        reminder = SholatReminder(dispatcher=NotificationDispatcher(sinks=[]), quiet=True)
+        daemon = ReminderDaemon(reminder, socket_path)
+        server_thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        server_thread.start()
+        while daemon.server is None or not reminder.is_running:
+            time.sleep(0.01)
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.clients) as pool:
+        results = pool.starmap(run_client,
+                               [(socket_path, args.command, args.requests)] * args.clients)
+    elapsed = time.perf_counter() - start
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        daemon.stop()
+        server_thread.join(timeout=2)
+
+    latencies = sorted(value * 1000 for result in results for value in result)
+    print(f"{args.clients} client x {args.requests} request '{args.command}'")
+    print(f"latensi  : median {statistics.median(latencies):.3f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.3f} ms, maks {latencies[-1]:.3f} ms")
+    print(f"throughput: {len(latencies) / elapsed:.0f} request/s (termasuk start proses client)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_dispatch.py
+# Benchmark waktu yang dihabiskan thread monitoring per reminder
+
+"""
+Membandingkan biaya per reminder di thread monitoring:
+- inline   : format notifikasi + sink dijalankan langsung (perilaku lama)
+- dispatch : format notifikasi + submit ke NotificationDispatcher
+
+Sink suara disimulasikan dengan sleep --sink-delay detik agar hasilnya
+tidak bergantung pada perangkat audio.
+
+Contoh:
+    python benchmarks/bench_dispatch.py --reminders 200 --workers 4
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notification_dispatch import NotificationDispatcher, NotificationSink
+from utils import format_prayer_notification
+
+
+class SlowSink(NotificationSink):
+    """
+    Sink tiruan yang memblokir selama delay detik (seperti beep berulang).
+    """
+
+    name = 'slow'
+
+    def __init__(self, delay):
+        super().__init__(timeout=delay * 2)
+        self.delay = delay
+
+    def send(self, job, timeout):
+        time.sleep(self.delay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--reminders', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--sink-delay', type=float, default=0.01)
+    args = parser.parse_args()
+
+    sholat_time = datetime.datetime.now()
+    sink = SlowSink(args.sink_delay)
+
+    # Inline: monitor menjalankan sink sendiri
+    start = time.perf_counter()
+    for _ in range(args.reminders):
+        message = format_prayer_notification('Maghrib', sholat_time)
+        sink.send({'message': message}, sink.timeout)
+    inline_seconds = time.perf_counter() - start
+
+    # Dispatch: monitor hanya submit, worker yang menjalankan sink
+    dispatcher = NotificationDispatcher(sinks=[sink], workers=args.workers,
+                                        queue_size=args.reminders)
+    dispatcher.start()
+    start = time.perf_counter()
+    for _ in range(args.reminders):
+        message = format_prayer_notification('Maghrib', sholat_time)
+        dispatcher.submit('Maghrib', sholat_time, message)
+    submit_seconds = time.perf_counter() - start
+    while dispatcher.get_stats()['dispatched'] < args.reminders:
+        time.sleep(0.001)
+    drain_seconds = time.perf_counter() - start
+    dispatcher.stop()
+    stats = dispatcher.get_stats()
+
+    print(f"inline   : {inline_seconds / args.reminders * 1e6:10.1f} us/reminder di thread monitor")
+    print(f"dispatch : {submit_seconds / args.reminders * 1e6:10.1f} us/reminder di thread monitor, "
+          f"{args.reminders / drain_seconds:8.0f} notifikasi/s selesai")
+    print(f"latensi dispatch rata2 {stats['latency_avg'] * 1000:.1f} ms, "
+          f"maks {stats['latency_max'] * 1000:.1f} ms, "
+          f"queue maks {stats['max_queue_depth']}, dropped {stats['dropped']}")
+
+
+if __name__ == "__main__":
+    main()
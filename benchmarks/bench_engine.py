@@ -0,0 +1,84 @@
+# benchmarks/bench_engine.py
+# Benchmark memori dan throughput ReminderEngine multi-subscriber
+
+"""
+Mengukur ReminderEngine dengan 1k, 10k dan 100k subscriber (masing-masing
+lima reminder): memori heap (tracemalloc), kecepatan pendaftaran subscriber
+dan throughput dispatch ketika semua reminder jatuh tempo sekaligus.
+
+Contoh:
+    python benchmarks/bench_engine.py --subscribers 1000 10000 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SHOLAT_NAMES
+from reminder_engine import ReminderEngine
+
+
+def run(subscriber_count):
+    """
+    Menjalankan satu skenario engine.
+
+    Args:
+        subscriber_count (int): Jumlah subscriber
+
+    Returns:
+        dict: Hasil pengukuran
+    """
+    # Semua reminder sudah jatuh tempo (masih dalam toleransi)
+    due_timestamp = time.time() - 1
+    reminders = [(due_timestamp, index) for index in range(len(SHOLAT_NAMES))]
+    fired = [0]
+
+    def callback(sholat_index, missed):
+        fired[0] += 1
+
+    engine = ReminderEngine()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for subscriber_id in range(subscriber_count):
+        engine.add_subscriber(subscriber_id, reminders, callback)
+    add_seconds = time.perf_counter() - start
+    memory_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    total = engine.pending_count()
+    start = time.perf_counter()
+    engine.start()
+    while fired[0] < total:
+        time.sleep(0.001)
+    dispatch_seconds = time.perf_counter() - start
+    engine.stop()
+
+    return {
+        'subscribers': subscriber_count,
+        'reminders': total,
+        'memory_mb': memory_bytes / 1e6,
+        'bytes_per_subscriber': memory_bytes / subscriber_count,
+        'add_per_second': subscriber_count / add_seconds,
+        'dispatch_per_second': total / dispatch_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--subscribers', type=int, nargs='+', default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    for count in args.subscribers:
+        result = run(count)
+        print(f"{result['subscribers']:>7} subscriber | {result['reminders']:>7} reminder | "
+              f"memori {result['memory_mb']:8.2f} MB ({result['bytes_per_subscriber']:6.0f} B/subscriber) | "
+              f"add {result['add_per_second']:>9.0f}/s | dispatch {result['dispatch_per_second']:>9.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# benchmarks/bench_fanout.py
+# Load test fan-out reminder ke banyak penerima terhadap endpoint tiruan lokal
+
+"""
+Menjalankan mock_fanout_server.py di proses terpisah lalu mengirim
+--reminders reminder ke --recipients penerima lewat NotificationDispatcher
+dengan FanoutWebhookSink dan FanoutQueueSink, untuk setiap kombinasi
+--connections x --batch-size.
+
+Yang dilaporkan per konfigurasi:
+- delivery/detik (penerima x reminder yang di-ack endpoint per detik)
+- latensi delivery p50/p95 (dari submit notifikasi sampai batch di-ack)
+- jumlah retry dan delivery yang gagal (gunakan --fail-rate)
+
+Sebagai pembanding, --baseline delivery dikirim satu request urllib per
+penerima (tanpa batching dan tanpa koneksi keep-alive), seperti
+WebhookSink biasa.
+
+Contoh:
+    python benchmarks/bench_fanout.py --recipients 10000 --reminders 5
+    python benchmarks/bench_fanout.py --connections 1 4 8 --batch-size 100 500
+    python benchmarks/bench_fanout.py --fail-rate 0.05
+"""
+
+import argparse
+import datetime
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fanout_sinks
+from fanout_sinks import FanoutQueueSink, FanoutWebhookSink
+from notification_dispatch import NotificationDispatcher
+
+
+def timed(sink_class):
+    """
+    Subclass sink yang mencatat latensi setiap batch yang di-ack.
+    """
+    class TimedSink(sink_class):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.latencies = []
+
+        def _deliver(self, connection, job, recipients):
+            super()._deliver(connection, job, recipients)
+            self.latencies.append((time.monotonic() - job['submitted_at'], len(recipients)))
+
+    return TimedSink
+
+
+def percentile(weighted, q):
+    """
+    Persentil dari pasangan (nilai, jumlah).
+    """
+    weighted = sorted(weighted)
+    target = q * sum(count for _, count in weighted)
+    running = 0
+    for value, count in weighted:
+        running += count
+        if running >= target:
+            return value
+    return 0.0
+
+
+def run_sink(sink, reminders):
+    """
+    Mengirim reminder lewat dispatcher dan menunggu semua batch selesai.
+
+    Returns:
+        float: Waktu total (detik)
+    """
+    dispatcher = NotificationDispatcher(sinks=[sink], workers=1, queue_size=reminders)
+    dispatcher.start()
+    expected = len(sink.recipients) * reminders
+    sholat_time = datetime.datetime.now().replace(microsecond=0)
+
+    start = time.perf_counter()
+    for i in range(reminders):
+        dispatcher.submit('Subuh', sholat_time, f"Reminder {i}")
+    while True:
+        stats = sink.get_stats()
+        if stats['delivered'] + stats['failed'] + stats['dropped'] >= expected:
+            break
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    dispatcher.stop()
+    return elapsed
+
+
+def run_baseline(url, deliveries):
+    """
+    Satu POST urllib per penerima (koneksi baru setiap request).
+
+    Returns:
+        tuple: (waktu total dalam detik, list (latensi, 1) per request)
+    """
+    latencies = []
+    start = time.perf_counter()
+    for i in range(deliveries):
+        sent = time.perf_counter()
+        payload = json.dumps({'sholat': 'Subuh', 'recipients': [f"user-{i}"]}).encode('utf-8')
+        request = urllib.request.Request(url, data=payload,
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=5) as response:
+            response.read()
+        latencies.append((time.perf_counter() - sent, 1))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--recipients', type=int, default=10000)
+    parser.add_argument('--reminders', type=int, default=5)
+    parser.add_argument('--connections', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--batch-size', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    parser.add_argument('--latency-ms', type=float, default=2.0,
+                        help="Penundaan balasan endpoint tiruan (milidetik)")
+    parser.add_argument('--baseline', type=int, default=500,
+                        help="Jumlah delivery untuk pembanding urllib per penerima (0 = lewati)")
+    parser.add_argument('--port', type=int, default=18090)
+    options = parser.parse_args()
+
+    # Backoff pendek agar retry tidak mendominasi waktu benchmark
+    fanout_sinks.FANOUT_CONFIG['retry_backoff'] = 0.01
+    fanout_sinks.FANOUT_CONFIG['retry_backoff_max'] = 0.1
+
+    http_url = f"http://127.0.0.1:{options.port}/hook"
+    queue_url = f"tcp://127.0.0.1:{options.port + 1}"
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'benchmarks', 'mock_fanout_server.py'),
+         '--http-port', str(options.port), '--queue-port', str(options.port + 1),
+         '--fail-rate', str(options.fail_rate), '--latency-ms', str(options.latency_ms)],
+        cwd=ROOT
+    )
+    try:
+        count_url = f"http://127.0.0.1:{options.port}/count"
+        for _ in range(100):
+            try:
+                urllib.request.urlopen(count_url).read()
+                break
+            except OSError:
+                time.sleep(0.05)
+        else:
+            raise RuntimeError("Endpoint tiruan tidak merespons")
+
+        recipients = [f"user-{i}" for i in range(options.recipients)]
+        total = options.recipients * options.reminders
+        print(f"{options.recipients} penerima x {options.reminders} reminder = {total} delivery, "
+              f"latensi endpoint {options.latency_ms:g} ms, gagal {options.fail_rate:.0%}, "
+              f"{os.cpu_count()} CPU")
+        print(f"{'sink':<15} | {'koneksi':>7} | {'batch':>5} | {'delivery/s':>10} | "
+              f"{'p50':>8} | {'p95':>8} | {'retry':>5} | {'gagal':>5}")
+
+        for sink_class in (FanoutWebhookSink, FanoutQueueSink):
+            url = http_url if sink_class is FanoutWebhookSink else queue_url
+            for connections in options.connections:
+                for batch_size in options.batch_size:
+                    sink = timed(sink_class)(url, recipients, batch_size=batch_size,
+                                             connections=connections, timeout=10)
+                    elapsed = run_sink(sink, options.reminders)
+                    stats = sink.get_stats()
+                    print(f"{sink_class.name:<15} | {connections:>7} | {batch_size:>5} | "
+                          f"{stats['delivered'] / elapsed:10.0f} | "
+                          f"{percentile(sink.latencies, 0.5) * 1000:6.1f}ms | "
+                          f"{percentile(sink.latencies, 0.95) * 1000:6.1f}ms | "
+                          f"{stats['retries']:>5} | {stats['failed']:>5}")
+
+        if options.baseline and not options.fail_rate:
+            elapsed, latencies = run_baseline(http_url, options.baseline)
+            print(f"{'urllib/penerima':<15} | {1:>7} | {1:>5} | {options.baseline / elapsed:10.0f} | "
+                  f"{percentile(latencies, 0.5) * 1000:6.1f}ms | "
+                  f"{percentile(latencies, 0.95) * 1000:6.1f}ms | {'-':>5} | {'-':>5}")
+
+        counts = json.loads(urllib.request.urlopen(count_url).read())
+        print(f"endpoint       : {counts['deliveries']} delivery diterima, "
+              f"{counts['rejected']} batch ditolak, {counts['connections']} koneksi dibuka")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
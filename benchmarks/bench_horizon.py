@@ -0,0 +1,66 @@
+# benchmarks/bench_horizon.py
+# Benchmark pergantian hari pada horizon jadwal multi-hari
+
+"""
+Mensimulasikan SholatReminder yang berjalan berbulan-bulan: pergantian
+tengah malam dipanggil untuk --days hari berturut-turut. Dicatat waktu
+per pergantian hari dan memori (tracemalloc) setiap 30 hari; memori
+harus datar karena hari yang lewat dibuang dan hanya satu hari baru
+dibuat per pergantian.
+
+Contoh:
+    python benchmarks/bench_horizon.py --days 365
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sholat_reminder import SholatReminder
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        reminder = SholatReminder(quiet=True)
+        reminder.start_reminder()
+
+    # Dispatcher dihentikan: pergantian hari dipanggil langsung dengan tanggal simulasi
+    reminder.engine.stop()
+    today = datetime.date.today()
+
+    tracemalloc.start()
+    samples = []
+    elapsed = 0.0
+    # Output dibuang ke devnull agar tidak ikut terhitung sebagai memori
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for day in range(1, args.days + 1):
+            start = time.perf_counter()
+            reminder._roll_over(today + datetime.timedelta(days=day))
+            elapsed += time.perf_counter() - start
+            if day % 30 == 0:
+                samples.append((day, tracemalloc.get_traced_memory()[0]))
+    tracemalloc.stop()
+
+    print(f"horizon {reminder.horizon_days} hari | queue {len(reminder.reminder_queue)} | "
+          f"engine {reminder.engine.pending_count()} reminder aktif")
+    print(f"pergantian hari: {elapsed / args.days * 1e6:8.1f} us rata-rata")
+    for day, memory_bytes in samples:
+        print(f"  hari {day:>4}: memori {memory_bytes / 1024:8.1f} KB")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        reminder.stop_reminder()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# benchmarks/bench_http_api.py
+# Load test HTTP/JSON API (http_api.py) untuk respons yang sudah di-cache
+
+"""
+Menjalankan http_api.py di proses terpisah lalu --connections koneksi
+keep-alive mengirim request GET secara pipelined (--pipeline request per
+putaran) selama --seconds detik.
+
+Yang dilaporkan:
+- request/detik (waktu nyata; client dan server bisa berbagi CPU yang sama)
+- request per detik CPU server (dibaca dari /proc), yaitu kapasitas satu core
+- latensi per putaran pipeline (median, p99)
+
+Contoh:
+    python benchmarks/bench_http_api.py --path /next --seconds 5
+    python benchmarks/bench_http_api.py --path /schedule --etag   # jalur 304
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def server_cpu_seconds(pid):
+    """
+    Returns:
+        float: CPU (user + system) proses server dalam detik
+    """
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+async def run_connection(port, request, response_size, pipeline, deadline, latencies):
+    """
+    Satu koneksi: kirim pipeline request, tunggu semua responsnya, ulangi.
+
+    Returns:
+        int: Jumlah respons yang diterima
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    batch = request * pipeline
+    expected = response_size * pipeline
+    count = 0
+
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        writer.write(batch)
+        await reader.readexactly(expected)
+        latencies.append(time.perf_counter() - start)
+        count += pipeline
+
+    writer.close()
+    return count
+
+
+async def load(port, request, response_size, options):
+    latencies = []
+    deadline = time.perf_counter() + options.seconds
+    counts = await asyncio.gather(*(
+        run_connection(port, request, response_size, options.pipeline, deadline, latencies)
+        for _ in range(options.connections)
+    ))
+    return sum(counts), latencies
+
+
+async def probe(port, request):
+    """
+    Semua respons cache berukuran sama; ukurannya dibaca dari satu request.
+
+    Returns:
+        int: Ukuran satu respons (header + body) dalam bytes
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(request)
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+    await reader.readexactly(length)
+    writer.close()
+    return len(head) + length
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--path', default='/next')
+    parser.add_argument('--port', type=int, default=18080)
+    parser.add_argument('--connections', type=int, default=8)
+    parser.add_argument('--pipeline', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--etag', action='store_true',
+                        help="Kirim If-None-Match (mengukur jalur 304)")
+    options = parser.parse_args()
+
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'http_api.py'), '--no-reminder',
+         '--port', str(options.port)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        url = f"http://127.0.0.1:{options.port}{options.path}"
+        for _ in range(100):
+            try:
+                first = urllib.request.urlopen(url)
+                break
+            except OSError:
+                time.sleep(0.05)
+        else:
+            raise RuntimeError("Server API tidak merespons")
+
+        request = f"GET {options.path} HTTP/1.1\r\nHost: 127.0.0.1\r\n".encode('ascii')
+        if options.etag:
+            request += f"If-None-Match: {first.headers['ETag']}\r\n".encode('ascii')
+        request += b"\r\n"
+        response_size = asyncio.run(probe(options.port, request))
+
+        cpu_start = server_cpu_seconds(server.pid)
+        wall_start = time.perf_counter()
+        total, latencies = asyncio.run(load(options.port, request, response_size, options))
+        wall = time.perf_counter() - wall_start
+        cpu = server_cpu_seconds(server.pid) - cpu_start
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies = sorted(value * 1000 for value in latencies)
+    print(f"{options.path} ({'304' if options.etag else '200'}), {options.connections} koneksi "
+          f"x pipeline {options.pipeline}, {os.cpu_count()} CPU")
+    print(f"request        : {total} dalam {wall:.1f} s = {total / wall:.0f} req/s")
+    if cpu:
+        print(f"CPU server     : {cpu:.2f} s = {total / cpu:.0f} req per detik CPU (satu core)")
+    print(f"latensi putaran: median {statistics.median(latencies):.3f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# benchmarks/bench_journal.py
+# Benchmark waktu recovery FiredJournal terhadap ukuran journal
+
+"""
+Mengukur waktu membuka (recovery) FiredJournal untuk journal berisi
+N baris (5 reminder per hari, berurutan mundur dari hari ini):
+
+- tanpa snapshot : seluruh N baris dibaca ulang dari journal
+- dengan snapshot: journal diringkas ke snapshot setiap
+                   JOURNAL_CONFIG['snapshot_every'] baris (entri lebih tua
+                   dari retention_days dibuang), sehingga recovery membaca
+                   snapshot kecil + sisa journal
+
+Juga mengukur biaya record() per reminder dengan dan tanpa fsync, dan
+dengan group commit (batch): --batch subscriber yang fire bersamaan
+dicatat dengan satu fsync, seperti satu tick engine.
+
+Contoh:
+    python benchmarks/bench_journal.py --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import datetime
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import JOURNAL_CONFIG, SHOLAT_NAMES
+from fired_journal import FiredJournal
+
+
+def journal_lines(count):
+    """
+    Baris journal untuk count reminder, berakhir hari ini.
+
+    Returns:
+        bytes: Isi journal
+    """
+    prayers = len(SHOLAT_NAMES)
+    last_ordinal = datetime.date.today().toordinal()
+    first_ordinal = last_ordinal - count // prayers
+    start = time.mktime(datetime.date.fromordinal(first_ordinal).timetuple())
+
+    lines = []
+    for number in range(count):
+        day, index = divmod(number, prayers)
+        timestamp = start + day * 86400 + 14400 + index * 10800
+        lines.append(f"F {number % 100} {first_ordinal + day} {index} {timestamp:.3f}\n")
+    return ''.join(lines).encode('ascii')
+
+
+def measure_recovery(path, repeat):
+    """
+    Returns:
+        tuple: (median detik, jumlah entri setelah recovery)
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        journal = FiredJournal(path, snapshot_every=sys.maxsize, fsync=False)
+        timings.append(time.perf_counter() - start)
+        entries = len(journal.entries)
+        journal.close()
+    return statistics.median(timings), entries
+
+
+def measure_record(directory, count, fsync):
+    """
+    Returns:
+        float: Mikrodetik per record()
+    """
+    path = os.path.join(directory, f"record_{int(fsync)}.journal")
+    journal = FiredJournal(path, fsync=fsync)
+    ordinal = datetime.date.today().toordinal()
+
+    start = time.perf_counter()
+    for number in range(count):
+        journal.record(ordinal + number // 5, number % 5, 'fired', time.time())
+    elapsed = time.perf_counter() - start
+    journal.close()
+    return elapsed / count * 1e6
+
+
+def measure_batch(directory, count, batch):
+    """
+    Returns:
+        float: Mikrodetik per record() dalam group commit berisi batch baris
+    """
+    path = os.path.join(directory, "batch.journal")
+    journal = FiredJournal(path, fsync=True)
+    ordinal = datetime.date.today().toordinal()
+
+    start = time.perf_counter()
+    for number in range(0, count, batch):
+        with journal.batch():
+            for subscriber in range(batch):
+                journal.record(ordinal + number // batch // 5, number // batch % 5,
+                               'fired', time.time(), subscriber)
+    elapsed = time.perf_counter() - start
+    journal.close()
+    return elapsed / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--records', type=int, default=2000)
+    parser.add_argument('--batch', type=int, default=1000,
+                        help="Subscriber per group commit")
+    args = parser.parse_args()
+
+    snapshot_every = JOURNAL_CONFIG['snapshot_every']
+    print(f"recovery FiredJournal (snapshot_every={snapshot_every}, "
+          f"retention_days={JOURNAL_CONFIG['retention_days']})")
+    print(f"{'baris':>9} | {'tanpa snapshot':>16} | {'dengan snapshot':>16} | entri di memori")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            data = journal_lines(size)
+
+            raw_path = os.path.join(directory, f"raw_{size}.journal")
+            with open(raw_path, 'wb') as f:
+                f.write(data)
+            raw_seconds, raw_entries = measure_recovery(raw_path, args.repeat)
+
+            # Keadaan yang sama dengan menulis N baris lewat record():
+            # snapshot terakhir + sisa baris setelahnya
+            tail = size % snapshot_every
+            lines = data.splitlines(keepends=True)
+            snap_path = os.path.join(directory, f"snap_{size}.journal")
+            with open(snap_path, 'wb') as f:
+                f.writelines(lines[:size - tail])
+            journal = FiredJournal(snap_path, fsync=False)
+            journal.snapshot()
+            journal.close()
+            with open(snap_path, 'ab') as f:
+                f.writelines(lines[size - tail:])
+            snap_seconds, snap_entries = measure_recovery(snap_path, args.repeat)
+
+            print(f"{size:>9} | {raw_seconds * 1000:13.2f} ms | {snap_seconds * 1000:13.2f} ms | "
+                  f"{raw_entries} -> {snap_entries}")
+
+        print(f"record() tanpa fsync : {measure_record(directory, args.records, False):8.1f} us")
+        print(f"record() dengan fsync: {measure_record(directory, args.records, True):8.1f} us")
+        print(f"record() group commit: {measure_batch(directory, args.records, args.batch):8.1f} us "
+              f"({args.batch} baris per fsync)")
+
+
+if __name__ == "__main__":
+    main()
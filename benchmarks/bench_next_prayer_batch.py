@@ -0,0 +1,109 @@
+# benchmarks/bench_next_prayer_batch.py
+# Benchmark throughput NextPrayerIndex.lookup vs pencarian skalar per pasangan
+
+"""
+Membuat timetable biner untuk --locations lokasi (grid lintang/bujur),
+lalu mencari sholat berikutnya untuk --pairs pasangan (lokasi, timestamp)
+acak dalam rentang beberapa tahun:
+
+- batch  : NextPrayerIndex.lookup (np.searchsorted) untuk semua pasangan
+- skalar : loop Python per pasangan memakai TimetableStore.row_minutes
+           (dijalankan pada sampel kecil, juga sebagai pembanding kebenaran)
+
+Contoh:
+    python benchmarks/bench_next_prayer_batch.py --locations 1000 --pairs 5000000
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from next_prayer_batch import NextPrayerIndex
+from timetable_store import UNDEFINED_SLOT, build_timetable, open_timetable
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def scalar_next_prayer(store, location, timezone, timestamp):
+    """
+    Pencarian sholat berikutnya untuk satu pasangan (referensi).
+
+    Returns:
+        tuple: (indeks sholat, timestamp sholat) atau (-1, -1)
+    """
+    local = EPOCH + datetime.timedelta(seconds=timestamp + timezone * 3600)
+    for add in (0, 1):
+        date_obj = local.date() + datetime.timedelta(days=add)
+        midnight = (datetime.datetime.combine(date_obj, datetime.time()) - EPOCH).total_seconds()
+        midnight -= timezone * 3600
+        upcoming = [(minute, index) for index, minute in enumerate(store.row_minutes(location, date_obj))
+                    if minute != UNDEFINED_SLOT and midnight + minute * 60 > timestamp]
+        if upcoming:
+            minute, index = min(upcoming)
+            return index, midnight + minute * 60
+    return -1, -1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--locations', type=int, default=1000)
+    parser.add_argument('--pairs', type=int, default=5000000)
+    parser.add_argument('--scalar-pairs', type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    latitudes = rng.uniform(-60, 65, args.locations)
+    longitudes = rng.uniform(-180, 180, args.locations)
+    timezones = np.round(longitudes / 15)
+    locations = [
+        {'key': f"L{i}", 'latitude': lat, 'longitude': lon, 'timezone': tz}
+        for i, (lat, lon, tz) in enumerate(zip(latitudes, longitudes, timezones))
+    ]
+
+    path = os.path.join(tempfile.mkdtemp(), 'bench.ptt')
+    start = time.perf_counter()
+    build_timetable(path, locations, 2025)
+    store = open_timetable(path)
+    index = NextPrayerIndex.from_timetable(store, timezones)
+    print(f"timetable + indeks : {args.locations} lokasi, {time.perf_counter() - start:.2f} s, "
+          f"key {index.keys.nbytes / 1e6:.1f} MB")
+
+    # Timestamp di dalam tahun timetable (referensi skalar menolak tahun
+    # lain); hari pertama dan terakhir dilewati karena offset zona dan
+    # Isya -> Subuh bisa keluar dari tahun tersebut
+    low = datetime.datetime(2025, 1, 2).timestamp()
+    high = datetime.datetime(2025, 12, 30).timestamp()
+    location_indexes = rng.integers(0, args.locations, args.pairs)
+    timestamps = rng.uniform(low, high, args.pairs)
+
+    start = time.perf_counter()
+    result = index.lookup(location_indexes, timestamps)
+    batch_seconds = time.perf_counter() - start
+    print(f"batch              : {args.pairs} pasangan, {batch_seconds:.2f} s = "
+          f"{args.pairs / batch_seconds / 1e6:.2f} juta pasangan/s "
+          f"(besok: {result['next_day'].mean():.1%})")
+
+    sample = min(args.scalar_pairs, args.pairs)
+    mismatches = 0
+    start = time.perf_counter()
+    for k in range(sample):
+        location = int(location_indexes[k])
+        prayer_index, fire = scalar_next_prayer(store, location, timezones[location], timestamps[k])
+        if prayer_index != result['prayer_index'][k] or (
+                prayer_index >= 0 and fire != result['timestamp'][k]):
+            mismatches += 1
+    scalar_seconds = time.perf_counter() - start
+    print(f"skalar             : {sample} pasangan, {scalar_seconds:.2f} s = "
+          f"{sample / scalar_seconds:.0f} pasangan/s, beda dengan batch: {mismatches}")
+    print(f"percepatan         : {(args.pairs / batch_seconds) / (sample / scalar_seconds):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
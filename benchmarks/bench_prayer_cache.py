@@ -0,0 +1,101 @@
+# benchmarks/bench_prayer_cache.py
+# Benchmark cache LRU perhitungan waktu sholat untuk subscriber berdekatan
+
+"""
+Membuat --subscribers SholatReminder dengan lokasi acak dalam radius
+--radius meter dari satu titik (default Jakarta), lalu membandingkan waktu
+initialize_today_schedule tanpa cache (compute_day_times langsung) dan
+dengan cache bersama. Juga memeriksa bahwa hasil cache sama persis
+dengan perhitungan tanpa pembulatan, serta memuat ulang cache hangat
+dari file.
+
+Contoh:
+    python benchmarks/bench_prayer_cache.py --subscribers 2000 --radius 300
+"""
+
+import argparse
+import datetime
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import prayer_cache
+from prayer_cache import PrayerTimeCache
+from prayer_times import compute_day_times
+from sholat_reminder import SholatReminder
+
+
+def random_locations(count, latitude, longitude, radius_m, seed=1):
+    """
+    Lokasi acak dalam radius tertentu (meter) dari satu titik.
+    """
+    rng = random.Random(seed)
+    locations = []
+    for _ in range(count):
+        distance = radius_m * math.sqrt(rng.random())
+        bearing = rng.random() * 2 * math.pi
+        d_lat = distance * math.cos(bearing) / 111320
+        d_lon = distance * math.sin(bearing) / (111320 * math.cos(math.radians(latitude)))
+        locations.append({'latitude': latitude + d_lat, 'longitude': longitude + d_lon,
+                          'elevation': 8, 'timezone': 7, 'method': 'Kemenag', 'asr_factor': 1})
+    return locations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--subscribers', type=int, default=2000)
+    parser.add_argument('--radius', type=float, default=300, help="Radius dalam meter")
+    parser.add_argument('--latitude', type=float, default=-6.2088)
+    parser.add_argument('--longitude', type=float, default=106.8456)
+    args = parser.parse_args()
+
+    locations = random_locations(args.subscribers, args.latitude, args.longitude, args.radius)
+    today = datetime.date.today()
+
+    # Tanpa cache: satu perhitungan per subscriber
+    start = time.perf_counter()
+    exact = [compute_day_times(loc['latitude'], loc['longitude'], today, loc['timezone'],
+                               loc['elevation'], loc['method'], loc['asr_factor'])
+             for loc in locations]
+    uncached = time.perf_counter() - start
+
+    # Dengan cache bersama: konstruksi SholatReminder lengkap
+    cache = PrayerTimeCache()
+    prayer_cache._default_cache = cache
+    start = time.perf_counter()
+    reminders = [SholatReminder(location=loc, quiet=True) for loc in locations]
+    cached = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for reminder, times in zip(reminders, exact)
+        if [[t.hour, t.minute] for _, t in reminder.today_schedule] != times
+    )
+    stats = cache.get_stats()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        warm_path = os.path.join(tmp, 'prayer_cache.json')
+        cache.save(warm_path)
+        warm = PrayerTimeCache(warm_path=warm_path)
+        start = time.perf_counter()
+        loaded = warm.load()
+        for loc in locations:
+            warm.day_minutes(loc, today)
+        warm_seconds = time.perf_counter() - start
+
+    print(f"{args.subscribers} subscriber dalam radius {args.radius:.0f} m")
+    print(f"compute_day_times tanpa cache : {uncached / args.subscribers * 1e6:8.1f} us/subscriber")
+    print(f"SholatReminder dengan cache   : {cached / args.subscribers * 1e6:8.1f} us/subscriber")
+    print(f"cache: {stats['entries']} entri, hit {stats['hits']}, miss {stats['misses']}, "
+          f"evict {stats['evictions']}, hit rate {stats['hit_rate']:.1%}")
+    print(f"jadwal berbeda dari perhitungan tanpa pembulatan: {mismatches}")
+    print(f"cache hangat: {loaded} entri dimuat, {args.subscribers} lookup dalam "
+          f"{warm_seconds * 1e3:.1f} ms (hit {warm.hits}, miss {warm.misses})")
+
+
+if __name__ == "__main__":
+    main()
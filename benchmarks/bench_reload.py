@@ -0,0 +1,147 @@
+# benchmarks/bench_reload.py
+# Benchmark hot-reload konfigurasi: penjadwalan ulang inkremental vs rebuild penuh
+
+"""
+Mendaftarkan --subscribers SholatReminder (waktu default) pada satu
+ReminderEngine bersama dengan jam virtual yang dibekukan pukul 08:00,
+lalu menerapkan perubahan file konfigurasi TOML lewat ConfigWatcher:
+
+- waktu Maghrib diubah: durasi reload (parse + validasi + penerapan),
+  jumlah reminder yang dijadwalkan ulang, dan pemeriksaan bahwa queue
+  tetap utuh (jumlah reminder aktif di engine sama, queue setiap
+  subscriber tetap terurut dengan waktu Maghrib baru)
+- pembanding: build_reminder_queue untuk semua subscriber (rebuild penuh)
+- dispatch.workers diubah: jumlah thread worker sebelum/sesudah
+- file tidak valid: ditolak dan konfigurasi aktif tidak berubah
+
+Contoh:
+    python benchmarks/bench_reload.py --subscribers 10000
+"""
+
+import argparse
+import contextlib
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from clock import VirtualClock
+from config_reload import ConfigWatcher
+from notification_dispatch import NotificationDispatcher, NotificationSink
+from reminder_engine import ReminderEngine
+from sholat_reminder import SholatReminder
+
+
+class NullSink(NotificationSink):
+    name = 'null'
+
+    def send(self, job, timeout):
+        pass
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--subscribers', type=int, default=10000)
+    args = parser.parse_args()
+
+    start = datetime.datetime.combine(datetime.date(2025, 3, 1), datetime.time(8))
+    clock = VirtualClock(start=start, limit=start)
+    engine = ReminderEngine(clock=clock)
+    dispatcher = NotificationDispatcher(sinks=[NullSink()], queue_size=100000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sholat_config.toml')
+        write(path, "[reminder]\nreminder_tolerance = 60\n")
+        watcher = ConfigWatcher(path)
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            watcher.load()
+            reminders = []
+            for subscriber_id in range(args.subscribers):
+                reminder = SholatReminder(engine=engine, subscriber_id=subscriber_id,
+                                          dispatcher=dispatcher, quiet=True, clock=clock,
+                                          journal=False)
+                reminder.start_reminder()
+                watcher.add(reminder)
+                reminders.append(reminder)
+        pending_before = engine.pending_count()
+
+        # Perubahan waktu Maghrib: hanya reminder Maghrib yang dipindah
+        old_maghrib = list(config.DEFAULT_PRAYER_TIMES[3])
+        write(path, "[reminder]\nreminder_tolerance = 60\n\n"
+                    "[prayer_times]\nMaghrib = \"17:55\"\n")
+        reload_start = time.perf_counter()
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            applied = watcher.check()
+        reload_seconds = time.perf_counter() - reload_start
+
+        maghrib = reminders[0].today_schedule.timestamp(3)
+        ordered = all(
+            [reminder._entry_timestamp(entry) for entry in reminder.reminder_queue]
+            == sorted(reminder._entry_timestamp(entry) for entry in reminder.reminder_queue)
+            for reminder in reminders
+        )
+        print(f"{args.subscribers} subscriber, {pending_before} reminder aktif di engine")
+        print(f"reload Maghrib {old_maghrib[0]:02d}:{old_maghrib[1]:02d} -> 17:55 : "
+              f"{'diterapkan' if applied else 'TIDAK diterapkan'} dalam {reload_seconds * 1000:.1f} ms "
+              f"({reload_seconds / args.subscribers * 1e6:.2f} us/subscriber)")
+        print(f"queue utuh     : aktif {engine.pending_count()} (sebelumnya {pending_before}), "
+              f"urutan {'benar' if ordered else 'SALAH'}, "
+              f"Maghrib hari ini {datetime.datetime.fromtimestamp(maghrib):%H:%M}")
+
+        # Pembanding: rebuild penuh semua subscriber
+        rebuild_start = time.perf_counter()
+        for reminder in reminders:
+            reminder.build_reminder_queue()
+        rebuild_seconds = time.perf_counter() - rebuild_start
+        print(f"rebuild penuh  : {rebuild_seconds * 1000:.1f} ms "
+              f"({rebuild_seconds / reload_seconds:.1f}x reload inkremental)")
+
+        # Ukuran pool dispatcher
+        dispatcher.start()
+        workers_before = dispatcher.worker_count
+        write(path, "[reminder]\nreminder_tolerance = 60\n\n"
+                    "[prayer_times]\nMaghrib = \"17:55\"\n\n[dispatch]\nworkers = 6\n")
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            watcher.reload()
+        time.sleep(0.1)
+        alive = sum(worker.is_alive() for worker in dispatcher._workers)
+        print(f"dispatch pool  : {workers_before} -> {dispatcher.worker_count} worker "
+              f"({alive} thread hidup)")
+
+        # File tidak valid ditolak
+        write(path, "[prayer_times]\nMaghrib = \"17:75\"\n")
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            rejected = not watcher.reload()
+        print(f"file tidak valid: {'ditolak' if rejected else 'DITERIMA'}, Maghrib aktif "
+              f"{config.DEFAULT_PRAYER_TIMES[3][0]:02d}:{config.DEFAULT_PRAYER_TIMES[3][1]:02d}, "
+              f"gagal {watcher.get_stats()['failures']}")
+
+        # Biaya satu pengecekan polling (os.stat) saat file tidak berubah
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            watcher.check()
+        count = 10000
+        check_start = time.perf_counter()
+        for _ in range(count):
+            watcher.check()
+        print(f"polling        : {(time.perf_counter() - check_start) / count * 1e6:.2f} us "
+              f"per pengecekan tanpa perubahan")
+
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            for reminder in reminders:
+                reminder.stop_reminder()
+        engine.stop()
+        dispatcher.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# benchmarks/bench_replay.py
+# Replay jadwal berhari-hari untuk banyak subscriber dengan jam virtual
+
+"""
+Memutar ulang --days hari jadwal untuk --subscribers SholatReminder pada
+satu ReminderEngine bersama yang memakai VirtualClock: setiap penantian
+langsung melompat ke deadline berikutnya, sehingga tidak ada waktu nyata
+yang ditunggu.
+
+Yang diperiksa dan diukur:
+- kebenaran: jumlah reminder yang fire = subscriber x hari x 5, tidak ada
+  yang terlewat (missed), urutan fire per subscriber tidak mundur
+- CPU (process_time) per reminder yang fire dan waktu nyata total
+
+Sink notifikasi diganti dengan penghitung (tanpa suara/console).
+
+Contoh:
+    python benchmarks/bench_replay.py --subscribers 1000 --days 365
+"""
+
+import argparse
+import contextlib
+import datetime
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from config import SHOLAT_NAMES
+from notification_dispatch import NotificationDispatcher, NotificationSink
+from reminder_engine import ReminderEngine
+from sholat_reminder import SholatReminder
+
+
+class CountingSink(NotificationSink):
+    """
+    Sink yang hanya menghitung notifikasi.
+    """
+
+    name = 'counter'
+
+    def __init__(self):
+        super().__init__(timeout=1)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def send(self, job, timeout):
+        with self._lock:
+            self.count += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--subscribers', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=365)
+    args = parser.parse_args()
+
+    # Mulai tengah malam agar semua sholat hari pertama ikut dihitung
+    start = datetime.datetime.combine(datetime.date.today(), datetime.time())
+    end = datetime.datetime.combine(start.date() + datetime.timedelta(days=args.days),
+                                    datetime.time())
+
+    # Jam dibekukan (batas = waktu awal) selama subscriber didaftarkan
+    clock = VirtualClock(start=start, limit=start)
+    engine = ReminderEngine(clock=clock)
+    sink = CountingSink()
+    dispatcher = NotificationDispatcher(sinks=[sink], workers=2, queue_size=10000)
+
+    fired_at = {}
+    counts = {'fired': 0, 'missed': 0, 'disorder': 0}
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        reminders = []
+        for subscriber_id in range(args.subscribers):
+            reminder = SholatReminder(engine=engine, subscriber_id=subscriber_id,
+                                      dispatcher=dispatcher, quiet=True)
+            handle = reminder._handle_fired_reminder
+
+            # Bungkus callback untuk menghitung reminder sholat (bukan penanda
+            # pergantian hari) dan memeriksa urutan fire per subscriber
+            def checked(entry, missed, handle=handle, subscriber_id=subscriber_id):
+                if entry[1] >= 0:
+                    now = clock.time()
+                    if now < fired_at.get(subscriber_id, 0):
+                        counts['disorder'] += 1
+                    fired_at[subscriber_id] = now
+                    counts['missed' if missed else 'fired'] += 1
+                return handle(entry, missed)
+
+            reminder._handle_fired_reminder = checked
+            reminder.start_reminder()
+            reminders.append(reminder)
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        clock.run_until(end)
+        clock.limit_reached.wait()
+
+        # Tunggu worker menyelesaikan notifikasi yang tersisa
+        while dispatcher.get_stats()['queue_depth']:
+            time.sleep(0.01)
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+
+        for reminder in reminders:
+            reminder.stop_reminder()
+        engine.stop()
+        dispatcher.stop()
+
+    expected = args.subscribers * args.days * len(SHOLAT_NAMES)
+    print(f"replay {args.days} hari x {args.subscribers} subscriber "
+          f"({start:%d/%m/%Y} - {end:%d/%m/%Y}, waktu virtual {clock.now():%d/%m/%Y %H:%M})")
+    print(f"reminder fire  : {counts['fired']} dari {expected} "
+          f"(missed {counts['missed']}, urutan mundur {counts['disorder']})")
+    print(f"notifikasi     : {sink.count} terkirim, "
+          f"{dispatcher.get_stats()['dropped']} dibuang")
+    print(f"wakeup engine  : {engine.wakeup_count}")
+    print(f"waktu nyata    : {wall_seconds:.1f} s, CPU {cpu_seconds:.1f} s "
+          f"({cpu_seconds / max(counts['fired'], 1) * 1e6:.1f} us CPU/reminder)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# benchmarks/bench_schedule_io.py
+# Benchmark export/import jadwal massal secara streaming
+
+"""
+Membangun timetable setahun untuk --locations lokasi (butuh NumPy), lalu
+mengekspor seluruh isinya ke JSON Lines, CSV dan iCalendar lewat pipeline
+generator dan mengimpornya kembali per batch. Dicatat throughput (record/s)
+dan puncak memori Python (tracemalloc) selama export dan import; puncak
+memori harus tetap kecil berapa pun jumlah record (dibatasi ukuran batch).
+Throughput diukur dengan tracemalloc aktif sehingga lebih rendah dari
+kondisi normal.
+
+Contoh:
+    python benchmarks/bench_schedule_io.py --locations 100
+    python benchmarks/bench_schedule_io.py --locations 5500   # ~10 juta record
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import schedule_io
+from timetable_store import build_timetable, TIMETABLE_EXTENSION
+
+
+def measure(function):
+    """
+    Menjalankan function dengan tracemalloc.
+
+    Returns:
+        tuple: (hasil, detik, puncak memori dalam byte)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--locations', type=int, default=100)
+    parser.add_argument('--year', type=int, default=datetime.date.today().year)
+    parser.add_argument('--batch-size', type=int, default=schedule_io.DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    locations = [
+        {'key': f"Lokasi-{i}", 'latitude': -11 + 17 * i / args.locations,
+         'longitude': 95 + 46 * i / args.locations, 'timezone': 7}
+        for i in range(args.locations)
+    ]
+    start_date = datetime.date(args.year, 1, 1)
+    end_date = datetime.date(args.year, 12, 31)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timetable_path = os.path.join(tmp, 'jadwal' + TIMETABLE_EXTENSION)
+        build_timetable(timetable_path, locations, args.year)
+
+        for fmt in schedule_io.STREAM_FORMATS:
+            path = os.path.join(tmp, f'jadwal.{fmt}')
+
+            count, export_seconds, export_peak = measure(lambda: schedule_io.export_records(
+                schedule_io.iter_records(schedule_io.timetable_sources(timetable_path),
+                                         start_date, end_date),
+                path
+            ))
+            size_mb = os.path.getsize(path) / 1e6
+
+            stats, import_seconds, import_peak = measure(lambda: schedule_io.import_records(
+                path, lambda batch: None, batch_size=args.batch_size
+            ))
+            os.remove(path)
+
+            print(f"{fmt:<5} | {count:>9} record | {size_mb:8.1f} MB | "
+                  f"export {count / export_seconds:>9.0f}/s (puncak {export_peak / 1024:7.1f} KB) | "
+                  f"import {stats['loaded'] / import_seconds:>9.0f}/s "
+                  f"(puncak {import_peak / 1024:7.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
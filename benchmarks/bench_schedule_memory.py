@@ -0,0 +1,67 @@
+# benchmarks/bench_schedule_memory.py
+# Benchmark memori jadwal: list tuple (nama, datetime) vs DaySchedule
+
+"""
+Mengukur memori (tracemalloc) untuk N jadwal harian dengan dua tata letak:
+- lama     : list berisi tuple (nama_sholat, datetime) per sholat
+- compact  : DaySchedule (array('H') menit + indeks nama bersama)
+
+Hasil diekstrapolasi ke MB per satu juta jadwal.
+
+Contoh:
+    python benchmarks/bench_schedule_memory.py --schedules 200000
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DEFAULT_PRAYER_TIMES, SHOLAT_NAMES
+from day_schedule import DaySchedule
+
+
+def build_tuple_schedules(count, today):
+    return [
+        [(name, datetime.datetime.combine(today, datetime.time(hour, minute)))
+         for name, (hour, minute) in zip(SHOLAT_NAMES, DEFAULT_PRAYER_TIMES)]
+        for _ in range(count)
+    ]
+
+
+def build_compact_schedules(count, today):
+    return [DaySchedule.from_times(today, DEFAULT_PRAYER_TIMES) for _ in range(count)]
+
+
+def measure(builder, count, today):
+    """
+    Memori yang dialokasikan untuk membangun count jadwal (byte).
+    """
+    tracemalloc.start()
+    schedules = builder(count, today)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del schedules
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--schedules', type=int, default=200000)
+    args = parser.parse_args()
+
+    today = datetime.date.today()
+    for label, builder in (('lama (tuple+datetime)', build_tuple_schedules),
+                           ('DaySchedule', build_compact_schedules)):
+        used = measure(builder, args.schedules, today)
+        per_schedule = used / args.schedules
+        mb_per_million = per_schedule * 1_000_000 / 1e6
+        print(f"{label:<22}: {per_schedule:7.1f} B/jadwal = "
+              f"{mb_per_million:8.1f} MB per 1 juta jadwal")
+
+
+if __name__ == "__main__":
+    main()
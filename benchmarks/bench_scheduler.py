@@ -0,0 +1,95 @@
+# benchmarks/bench_scheduler.py
+# Benchmark jitter waktu fire dan jumlah wakeup thread monitoring
+
+"""
+Membandingkan scheduler_mode 'polling' (loop check_interval lama) dengan
+'deadline' (tidur tepat sampai head queue) pada ReminderEngine.
+
+Satu hari disimulasikan dalam waktu yang dipercepat dengan faktor --scale:
+waktu sholat default, check_interval dan reminder_tolerance semuanya
+dibagi dengan faktor tersebut. Keterlambatan fire dilaporkan dalam
+milidetik nyata dan dalam detik-setara (dikalikan kembali dengan --scale).
+
+Contoh:
+    python benchmarks/bench_scheduler.py --scale 8640
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DEFAULT_PRAYER_TIMES, REMINDER_CONFIG
+from reminder_engine import ReminderEngine
+
+
+def run_mode(mode, scale):
+    """
+    Menjalankan satu hari terkompresi dengan mode scheduler tertentu.
+
+    Args:
+        mode (str): 'polling' atau 'deadline'
+        scale (float): Faktor percepatan waktu
+
+    Returns:
+        dict: Hasil pengukuran
+    """
+    REMINDER_CONFIG['scheduler_mode'] = mode
+    REMINDER_CONFIG['check_interval'] = 30 / scale
+    REMINDER_CONFIG['reminder_tolerance'] = 60 / scale
+
+    # Hari terkompresi dimulai sedikit di depan agar engine sempat berjalan
+    day_start = time.time() + 0.2
+    fire_times = [day_start + (hour * 3600 + minute * 60) / scale
+                  for hour, minute in DEFAULT_PRAYER_TIMES]
+    lateness = []
+    missed = []
+
+    def callback(sholat_index, is_missed):
+        if is_missed:
+            missed.append(sholat_index)
+        else:
+            lateness.append(time.time() - fire_times[sholat_index])
+
+    engine = ReminderEngine()
+    engine.add_subscriber(0, [(ts, i) for i, ts in enumerate(fire_times)], callback)
+    engine.start()
+    time.sleep(max(0.0, day_start - time.time()) + 86400 / scale)
+    engine.stop()
+
+    lateness_ms = [value * 1000 for value in lateness]
+    fired = len(lateness_ms)
+
+    return {
+        'mode': mode,
+        'fired': fired,
+        'missed': len(missed),
+        'wakeups_per_day': engine.wakeup_count,
+        'lateness_mean_ms': statistics.mean(lateness_ms) if fired else None,
+        'lateness_max_ms': max(lateness_ms) if fired else None,
+        'jitter_stdev_ms': statistics.pstdev(lateness_ms) if fired else None,
+        'lateness_mean_equiv_s': statistics.mean(lateness_ms) * scale / 1000 if fired else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=float, default=8640,
+                        help="Faktor percepatan waktu (default 8640: 1 hari = 10 detik)")
+    args = parser.parse_args()
+
+    for mode in ('polling', 'deadline'):
+        result = run_mode(mode, args.scale)
+        print(f"{result['mode']:<9} | fired {result['fired']} missed {result['missed']} | "
+              f"wakeups/hari {result['wakeups_per_day']:>5} | "
+              f"telat rata2 {result['lateness_mean_ms'] or 0:7.3f} ms "
+              f"(maks {result['lateness_max_ms'] or 0:7.3f} ms, "
+              f"stdev {result['jitter_stdev_ms'] or 0:7.3f} ms, "
+              f"setara {result['lateness_mean_equiv_s'] or 0:6.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# benchmarks/bench_startup.py
+# Benchmark waktu import dan cold start sampai SholatReminder siap dipakai
+
+"""
+Menjalankan interpreter baru beberapa kali dengan `python -X importtime`
+lalu mengukur:
+- waktu import + konstruksi SholatReminder(quiet=True) di dalam proses
+- waktu total proses (termasuk startup interpreter)
+- modul dengan waktu import kumulatif terbesar
+
+Target: cold start sampai SholatReminder pertama siap < 50 ms.
+Gunakan --json untuk menyimpan hasil per rilis.
+
+Contoh:
+    python benchmarks/bench_startup.py --runs 10 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGET_MS = 50
+
+# Kode yang dijalankan di proses baru; mencetak waktu import + konstruksi (ms)
+_STARTUP_CODE = (
+    "import time; start = time.perf_counter(); "
+    "from sholat_reminder import SholatReminder; SholatReminder(quiet=True); "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def run_once():
+    """
+    Menjalankan satu cold start.
+
+    Returns:
+        tuple: (ms di dalam proses, ms total proses, dict modul -> mikrodetik kumulatif)
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _STARTUP_CODE],
+        cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    )
+    process_ms = (time.perf_counter() - start) * 1000
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # Format: "import time: <self us> | <cumulative us> | <nama modul>"
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports[name.strip()] = int(cumulative)
+
+    return float(result.stdout.strip().splitlines()[-1]), process_ms, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=8)
+    parser.add_argument('--json', help="Simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    in_process, whole_process, imports = [], [], {}
+    for _ in range(args.runs):
+        inner_ms, process_ms, run_imports = run_once()
+        in_process.append(inner_ms)
+        whole_process.append(process_ms)
+        for name, micros in run_imports.items():
+            imports.setdefault(name, []).append(micros)
+
+    slowest = sorted(((statistics.median(v) / 1000, k) for k, v in imports.items()), reverse=True)
+
+    result = {
+        'python': sys.version.split()[0],
+        'runs': args.runs,
+        'import_and_construct_ms': statistics.median(in_process),
+        'process_ms': statistics.median(whole_process),
+        'target_ms': TARGET_MS,
+        'slowest_imports_ms': {name: ms for ms, name in slowest[:args.top]},
+    }
+
+    status = "OK" if result['import_and_construct_ms'] < TARGET_MS else "MELEBIHI TARGET"
+    print(f"import + SholatReminder(quiet=True): {result['import_and_construct_ms']:6.1f} ms "
+          f"(target < {TARGET_MS} ms: {status})")
+    print(f"total proses (termasuk interpreter): {result['process_ms']:6.1f} ms")
+    print("import kumulatif terbesar:")
+    for name, ms in result['slowest_imports_ms'].items():
+        print(f"  {ms:7.2f} ms  {name}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_status.py
+# Benchmark QPS get_system_status dan get_next_prayer_info
+
+"""
+Mengukur jumlah panggilan per detik untuk endpoint status yang di-poll
+terus-menerus:
+
+- tanpa cache : snapshot dibatalkan sebelum setiap panggilan, sehingga
+                status dihitung ulang (perilaku sebelum snapshot di-cache)
+- dengan cache: snapshot dipakai ulang sampai batas menit berikutnya
+
+Contoh:
+    python benchmarks/bench_status.py --seconds 2
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notification_dispatch import NotificationDispatcher
+from sholat_reminder import SholatReminder
+
+
+def measure_qps(function, seconds):
+    """
+    Returns:
+        float: Panggilan per detik
+    """
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            function()
+        calls += 1000
+    return calls / seconds
+
+
+def measure_allocation(function, calls=1000):
+    """
+    Returns:
+        float: Rata-rata byte yang dialokasikan (dan masih hidup) per panggilan
+    """
+    function()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = [function() for _ in range(calls)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return (after - before) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=2)
+    args = parser.parse_args()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        reminder = SholatReminder(dispatcher=NotificationDispatcher(sinks=[]), quiet=True)
+        reminder.build_reminder_queue()
+
+    for name in ('get_system_status', 'get_next_prayer_info'):
+        method = getattr(reminder, name)
+
+        def uncached(method=method):
+            reminder._invalidate_status()
+            return method()
+
+        before = measure_qps(uncached, args.seconds)
+        after = measure_qps(method, args.seconds)
+        print(f"{name:<21} | tanpa cache {before:>10.0f} qps "
+              f"({measure_allocation(uncached):6.0f} B/panggilan) | "
+              f"dengan cache {after:>10.0f} qps "
+              f"({measure_allocation(method):6.0f} B/panggilan) | {after / before:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
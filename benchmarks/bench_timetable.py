@@ -0,0 +1,121 @@
+# benchmarks/bench_timetable.py
+# Benchmark latensi startup: import JSON vs timetable biner (mmap)
+
+"""
+Membandingkan waktu untuk mendapatkan jadwal hari ini saat startup:
+- jalur JSON  : open + json.load file export lalu import_schedule
+- jalur mmap  : membuka timetable biner lalu membaca baris (lokasi, hari ini)
+
+Timetable dibangun dengan --locations lokasi (butuh NumPy). Ada dua file
+JSON pembanding: jadwal satu hari (sama seperti hasil menu export) dan
+jadwal setahun untuk semua lokasi (isi yang setara dengan timetable).
+
+Contoh:
+    python benchmarks/bench_timetable.py --locations 500
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timetable_store
+from sholat_reminder import SholatReminder
+from timetable_store import build_timetable, TimetableStore, TIMETABLE_EXTENSION
+
+
+def measure(function, repeat):
+    """
+    Median waktu eksekusi (mikrodetik).
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--locations', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    today = datetime.date.today()
+    locations = [
+        {'key': f"Lokasi-{i}", 'latitude': -11 + 17 * i / args.locations,
+         'longitude': 95 + 46 * i / args.locations, 'timezone': 7}
+        for i in range(args.locations)
+    ]
+    target = locations[len(locations) // 2]['key']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timetable_path = os.path.join(tmp, 'jadwal' + TIMETABLE_EXTENSION)
+        json_path = os.path.join(tmp, 'jadwal.json')
+        year_json_path = os.path.join(tmp, 'jadwal_tahunan.json')
+
+        build_timetable(timetable_path, locations, today.year)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            reminder = SholatReminder(timetable={'path': timetable_path, 'location': target})
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(reminder.export_schedule(), f, indent=2, ensure_ascii=False)
+
+        store = TimetableStore(timetable_path)
+        slot_dates = timetable_store.year_slot_dates(today.year)
+        with open(year_json_path, 'w', encoding='utf-8') as f:
+            json.dump({loc['key']: [store.row_minutes(i, d) for d in slot_dates]
+                       for i, loc in enumerate(locations)}, f)
+        store.close()
+
+        def load_json_row():
+            with open(json_path, 'r', encoding='utf-8') as f:
+                return json.load(f)['prayers']
+
+        def load_year_json_row():
+            with open(year_json_path, 'r', encoding='utf-8') as f:
+                return json.load(f)[target][timetable_store.day_index(today)]
+
+        def load_mmap_row():
+            store = TimetableStore(timetable_path)
+            row = store.prayer_times(target, today)
+            store.close()
+            return row
+
+        def import_json():
+            with open(json_path, 'r', encoding='utf-8') as f:
+                reminder.import_schedule(json.load(f))
+
+        def import_mmap():
+            for _, opened in timetable_store._open_stores.values():
+                opened.close()
+            timetable_store._open_stores.clear()
+            reminder.import_schedule({'timetable': timetable_path, 'location': target})
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = {
+                'baca baris JSON': measure(load_json_row, args.repeat),
+                'baca baris JSON tahunan': measure(load_year_json_row, max(1, args.repeat // 20)),
+                'baca baris mmap': measure(load_mmap_row, args.repeat),
+                'import_schedule JSON': measure(import_json, args.repeat),
+                'import_schedule mmap': measure(import_mmap, args.repeat),
+            }
+
+        size_kb = os.path.getsize(timetable_path) / 1024
+
+    print(f"timetable: {args.locations} lokasi, {size_kb:.0f} KB")
+    for name, micros in results.items():
+        print(f"{name:<23}: {micros:10.1f} us (median)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# benchmarks/bench_timetable_build.py
+# Benchmark skala pembuatan timetable massal paralel (1 sampai N core)
+
+"""
+Membuat timetable --years tahun untuk --locations lokasi sintetis yang
+tersebar di wilayah Indonesia (seperti jumlah kabupaten/kota, zona WIB,
+WITA dan WIT dari bujurnya) dengan timetable_build.build_timetables untuk
+setiap jumlah worker di --workers.
+
+Yang dilaporkan per jumlah worker:
+- waktu total dan throughput (lokasi-tahun per detik)
+- speedup terhadap 1 worker dan efisiensi skala (speedup / worker)
+
+Hasil setiap jumlah worker dibandingkan byte per byte dengan hasil
+1 worker.
+
+Contoh:
+    python benchmarks/bench_timetable_build.py --locations 514 --years 3
+    python benchmarks/bench_timetable_build.py --workers 1 2 4 8
+"""
+
+import argparse
+import datetime
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timetable_build import build_timetables
+
+
+def indonesia_locations(count):
+    """
+    Lokasi sintetis dalam kotak wilayah Indonesia.
+
+    Returns:
+        list: Dict lokasi untuk build_timetables
+    """
+    locations = []
+    for i in range(count):
+        longitude = 95 + 46 * ((i * 0.618034) % 1)
+        latitude = -11 + 17 * ((i * 0.754878) % 1)
+        timezone = 7 if longitude < 114.5 else 8 if longitude < 127 else 9
+        locations.append({'key': f"Kota-{i}", 'latitude': latitude,
+                          'longitude': longitude, 'timezone': timezone})
+    return locations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--locations', type=int, default=514)
+    parser.add_argument('--years', type=int, default=3)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument('--shard-size', type=int)
+    args = parser.parse_args()
+
+    locations = indonesia_locations(args.locations)
+    first_year = datetime.date.today().year
+    years = list(range(first_year, first_year + args.years))
+    units = args.locations * args.years
+
+    print(f"{args.locations} lokasi x {args.years} tahun, {os.cpu_count()} CPU")
+    print(f"{'worker':>6} | {'waktu':>8} | {'lokasi-tahun/s':>14} | {'speedup':>7} | "
+          f"{'efisiensi':>9} | hasil")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_paths = None
+        baseline_seconds = None
+
+        for workers in args.workers:
+            pattern = os.path.join(tmp, f"w{workers}_{{year}}.ptt")
+            start = time.perf_counter()
+            paths = build_timetables(pattern, locations, years, workers, args.shard_size)
+            seconds = time.perf_counter() - start
+
+            if baseline_paths is None:
+                baseline_paths, baseline_seconds = paths, seconds
+                same = 'acuan'
+            else:
+                same = 'sama' if all(filecmp.cmp(a, b, shallow=False)
+                                     for a, b in zip(baseline_paths, paths)) else 'BEDA'
+
+            speedup = baseline_seconds / seconds
+            print(f"{workers:>6} | {seconds:6.2f} s | {units / seconds:14.0f} | "
+                  f"{speedup:6.2f}x | {speedup / workers * 100:8.0f}% | {same}")
+
+
+if __name__ == "__main__":
+    main()
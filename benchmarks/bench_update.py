@@ -0,0 +1,97 @@
+# benchmarks/bench_update.py
+# Benchmark update waktu sholat: pembaruan inkremental vs rebuild queue penuh
+
+"""
+Mengukur jumlah update per detik saat waktu sholat dikoreksi ketika sistem
+berjalan, di engine bersama yang sudah berisi banyak subscriber lain:
+- inkremental : update_sholat_time (hapus entri lama, sisipkan entri baru)
+- rebuild     : set_time lalu build_reminder_queue (perilaku lama)
+- engine      : ReminderEngine.update_reminder langsung untuk banyak
+                subscriber (koreksi massal)
+
+Contoh:
+    python benchmarks/bench_update.py --subscribers 10000 --updates 20000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SHOLAT_NAMES
+from reminder_engine import ReminderEngine
+from sholat_reminder import SholatReminder
+
+
+def build_engine(subscriber_count):
+    """
+    Membuat engine berisi subscriber latar dengan reminder di masa depan.
+    """
+    engine = ReminderEngine()
+    future = time.time() + 86400
+    reminders = [(future + index * 3600, index) for index in range(len(SHOLAT_NAMES))]
+    for subscriber_id in range(subscriber_count):
+        engine.add_subscriber(subscriber_id, reminders, lambda payload, missed: None)
+    return engine
+
+
+def per_second(function, count):
+    """
+    Menjalankan function(i) sebanyak count kali.
+
+    Returns:
+        float: Operasi per detik
+    """
+    start = time.perf_counter()
+    for i in range(count):
+        function(i)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--subscribers', type=int, default=10000)
+    parser.add_argument('--updates', type=int, default=20000)
+    args = parser.parse_args()
+
+    engine = build_engine(args.subscribers)
+    isya = len(SHOLAT_NAMES) - 1
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        reminder = SholatReminder(engine=engine, subscriber_id='bench', quiet=True)
+        reminder.start_reminder()
+
+        # Isya digeser bolak-balik di akhir hari agar tetap di masa depan
+        incremental = per_second(
+            lambda i: reminder.update_sholat_time(isya, 23, 58 + i % 2), args.updates
+        )
+
+        def full_rebuild(i):
+            reminder.today_schedule.set_time(isya, 23, 58 + i % 2)
+            reminder.build_reminder_queue()
+
+        rebuild = per_second(full_rebuild, args.updates)
+        reminder.stop_reminder()
+
+    rng = random.Random(1)
+    base = time.time() + 86400
+    bulk = per_second(
+        lambda i: engine.update_reminder(rng.randrange(args.subscribers),
+                                         rng.randrange(len(SHOLAT_NAMES)),
+                                         base + rng.random() * 86400),
+        args.updates
+    )
+
+    print(f"engine: {args.subscribers} subscriber, {engine.pending_count()} reminder aktif")
+    print(f"update_sholat_time inkremental : {incremental:>10.0f} update/s")
+    print(f"set_time + build_reminder_queue: {rebuild:>10.0f} update/s")
+    print(f"engine.update_reminder (massal): {bulk:>10.0f} update/s")
+
+
+if __name__ == "__main__":
+    main()
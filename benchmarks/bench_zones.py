@@ -0,0 +1,112 @@
+# benchmarks/bench_zones.py
+# Benchmark jadwal multi-zona: epoch UTC per hari dan urutan heap
+
+"""
+Mengukur dan memeriksa jadwal dengan zona waktu (zones.py) untuk
+campuran zona WIB/WITA/WIT dan zona ber-DST:
+
+- kebenaran : epoch dari day_epochs (batas hari di-cache) dibandingkan
+              dengan datetime(..., tzinfo=zona).timestamp() per waktu untuk
+              setiap hari dalam --year, termasuk hari transisi DST
+- biaya     : membuat epoch fire lima sholat per (zona, hari) lewat
+              day_epochs vs konversi zoneinfo per waktu
+- heap      : push + pop --entries reminder dari zona campuran, diurutkan
+              dengan epoch integer vs datetime aware
+
+Contoh:
+    python benchmarks/bench_zones.py --year 2026 --entries 200000
+"""
+
+import argparse
+import datetime
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DEFAULT_PRAYER_TIMES
+from zones import day_epochs, get_zone
+
+ZONES = ('Asia/Jakarta', 'Asia/Makassar', 'Asia/Jayapura', 'Europe/London',
+         'America/New_York', 'Australia/Sydney', 'Europe/Amsterdam')
+
+
+def year_days(year):
+    start = datetime.date(year, 1, 1)
+    return [start + datetime.timedelta(days=i)
+            for i in range((datetime.date(year + 1, 1, 1) - start).days)]
+
+
+def direct_epochs(zone, date_obj, minutes):
+    """
+    Konversi zoneinfo per waktu (pembanding tanpa cache batas hari).
+    """
+    return [int(datetime.datetime(date_obj.year, date_obj.month, date_obj.day,
+                                  minute // 60, minute % 60, tzinfo=zone).timestamp())
+            for minute in minutes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--year', type=int, default=datetime.date.today().year)
+    parser.add_argument('--entries', type=int, default=200000)
+    args = parser.parse_args()
+
+    zones = [get_zone(name) for name in ZONES]
+    days = year_days(args.year)
+    prayer_minutes = [hour * 60 + minute for hour, minute in DEFAULT_PRAYER_TIMES]
+
+    # Kebenaran: setiap jam (termasuk 01:00-03:00 saat transisi DST) setiap hari
+    probe_minutes = list(range(0, 1440, 30)) + prayer_minutes
+    mismatches = 0
+    for zone in zones:
+        for date_obj in days:
+            if day_epochs(zone, date_obj, probe_minutes) != direct_epochs(zone, date_obj, probe_minutes):
+                mismatches += 1
+    print(f"kebenaran  : {len(zones)} zona x {len(days)} hari, "
+          f"{mismatches} hari berbeda dari zoneinfo per waktu")
+
+    # Biaya epoch fire per (zona, hari); cache batas hari sudah hangat
+    pairs = [(zone, date_obj) for zone in zones for date_obj in days]
+    start = time.perf_counter()
+    for zone, date_obj in pairs:
+        day_epochs(zone, date_obj, prayer_minutes)
+    cached = (time.perf_counter() - start) / len(pairs) * 1e6
+    start = time.perf_counter()
+    for zone, date_obj in pairs:
+        direct_epochs(zone, date_obj, prayer_minutes)
+    direct = (time.perf_counter() - start) / len(pairs) * 1e6
+    print(f"epoch hari : day_epochs {cached:.2f} us vs zoneinfo per waktu {direct:.2f} us "
+          f"per (zona, hari) ({direct / cached:.1f}x)")
+
+    # Heap reminder zona campuran
+    rng = random.Random(1)
+    epochs = []
+    moments = []
+    for _ in range(args.entries):
+        zone = rng.choice(zones)
+        date_obj = rng.choice(days)
+        minute = rng.choice(prayer_minutes)
+        epochs.append(day_epochs(zone, date_obj, (minute,))[0])
+        moments.append(datetime.datetime.combine(
+            date_obj, datetime.time(minute // 60, minute % 60), tzinfo=zone))
+
+    for label, keys in (('epoch int', epochs), ('datetime aware', moments)):
+        heap = []
+        start = time.perf_counter()
+        for sequence, key in enumerate(keys):
+            heapq.heappush(heap, [key, sequence])
+        order = [heapq.heappop(heap)[1] for _ in range(len(keys))]
+        elapsed = time.perf_counter() - start
+        print(f"heap       : {label:<15} {elapsed / len(keys) * 1e6:.2f} us per push+pop")
+        if label == 'epoch int':
+            epoch_order = order
+        elif [epochs[i] for i in order] != [epochs[i] for i in epoch_order]:
+            print("⚠️  urutan heap datetime berbeda dari urutan epoch")
+
+
+if __name__ == "__main__":
+    main()
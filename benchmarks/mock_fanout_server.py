@@ -0,0 +1,120 @@
+# benchmarks/mock_fanout_server.py
+# Endpoint tiruan untuk load test fan-out: webhook HTTP keep-alive dan broker TCP
+
+"""
+Menjalankan dua endpoint lokal (asyncio, satu thread) untuk fanout_sinks:
+
+- webhook : HTTP/1.1 keep-alive. POST berisi JSON {"recipients": [...], ...}
+            dibalas 200 (atau 503 dengan peluang --fail-rate). GET /count
+            mengembalikan jumlah delivery yang diterima sebagai JSON.
+- broker  : protokol FanoutQueueSink, "PUB <n>" + n baris JSON, dibalas
+            "OK <n>" (atau "ERR gagal" dengan peluang --fail-rate)
+
+--latency-ms menunda setiap balasan untuk meniru waktu proses dan jarak
+jaringan endpoint sungguhan.
+
+Contoh:
+    python benchmarks/mock_fanout_server.py --http-port 18090 --queue-port 18091
+    python benchmarks/mock_fanout_server.py --fail-rate 0.05 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import random
+
+COUNTS = {'deliveries': 0, 'batches': 0, 'rejected': 0, 'connections': 0}
+
+
+async def handle_http(reader, writer, options):
+    COUNTS['connections'] += 1
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            request_line, _, header_block = head.decode('latin-1').partition("\r\n")
+            headers = {}
+            for line in header_block.split("\r\n"):
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+            if request_line.startswith('GET /count'):
+                payload = json.dumps(COUNTS).encode('utf-8')
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                             b"Content-Length: %d\r\n\r\n%s" % (len(payload), payload))
+                await writer.drain()
+                continue
+
+            if options.latency_ms:
+                await asyncio.sleep(options.latency_ms / 1000)
+            if random.random() < options.fail_rate:
+                COUNTS['rejected'] += 1
+                writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n\r\n")
+            else:
+                COUNTS['deliveries'] += len(json.loads(body)['recipients'])
+                COUNTS['batches'] += 1
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def handle_queue(reader, writer, options):
+    COUNTS['connections'] += 1
+    try:
+        while True:
+            command = await reader.readline()
+            if not command:
+                break
+            count = int(command.split()[1])
+            for _ in range(count):
+                await reader.readline()
+
+            if options.latency_ms:
+                await asyncio.sleep(options.latency_ms / 1000)
+            if random.random() < options.fail_rate:
+                COUNTS['rejected'] += 1
+                writer.write(b"ERR gagal\n")
+            else:
+                COUNTS['deliveries'] += count
+                COUNTS['batches'] += 1
+                writer.write(b"OK %d\n" % count)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(options):
+    http_server = await asyncio.start_server(
+        lambda r, w: handle_http(r, w, options), '127.0.0.1', options.http_port)
+    queue_server = await asyncio.start_server(
+        lambda r, w: handle_queue(r, w, options), '127.0.0.1', options.queue_port,
+        limit=1 << 20)
+    async with http_server, queue_server:
+        await asyncio.gather(http_server.serve_forever(), queue_server.serve_forever())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--http-port', type=int, default=18090)
+    parser.add_argument('--queue-port', type=int, default=18091)
+    parser.add_argument('--fail-rate', type=float, default=0.0,
+                        help="Peluang batch ditolak (503/ERR) untuk menguji retry")
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help="Penundaan setiap balasan (milidetik)")
+    parser.add_argument('--seed', type=int, default=1)
+    options = parser.parse_args()
+
+    random.seed(options.seed)
+    try:
+        asyncio.run(serve(options))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+# benchmarks/suite.py
+# Suite benchmark regresi: latensi dan memori operasi utama SholatReminder
+
+"""
+Menjalankan sekumpulan benchmark yang dapat diulang lalu menulis hasilnya
+sebagai JSON. Dengan --baseline, hasil dibandingkan dengan file JSON dari
+versi sebelumnya dan metrik yang memburuk lebih dari --threshold dilaporkan
+sebagai regresi (exit code 1).
+
+Kasus:
+- build_reminder_queue, get_next_prayer_info, get_system_status,
+  export_schedule, import_schedule, format_prayer_notification:
+  latensi per panggilan (median/p95) dan puncak memori satu panggilan
+- monitor_loop: keterlambatan fire ReminderEngine pada jadwal yang
+  dimampatkan (reminder setiap beberapa milidetik, bukan jam)
+- monitor_replay: CPU per reminder saat memutar ulang beberapa hari untuk
+  banyak subscriber dengan VirtualClock
+- notification_throughput: throughput NotificationDispatcher dengan sink kosong
+
+Arah metrik ditentukan dari akhirannya: *_per_s lebih besar lebih baik,
+selainnya (*_us, *_ms, *_kb, *_per_reminder) lebih kecil lebih baik.
+
+Contoh:
+    python benchmarks/suite.py --json hasil.json
+    python benchmarks/suite.py --baseline hasil.json --threshold 0.15
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from notification_dispatch import NotificationDispatcher, NotificationSink
+from reminder_engine import ReminderEngine
+from sholat_reminder import SholatReminder
+from utils import format_prayer_notification
+
+# Daftar kasus: (nama, fungsi setup). Setup mengembalikan callable
+# (benchmark mikro) atau dict metrik (benchmark skenario).
+CASES = []
+
+
+def case(name):
+    """
+    Decorator untuk mendaftarkan kasus benchmark.
+    """
+    def register(function):
+        CASES.append((name, function))
+        return function
+    return register
+
+
+class NullSink(NotificationSink):
+    """
+    Sink yang tidak melakukan apa-apa (mengukur overhead dispatcher saja).
+    """
+
+    name = 'null'
+
+    def send(self, job, timeout):
+        pass
+
+
+def _quiet_reminder():
+    """
+    SholatReminder dengan dispatcher tanpa sink dan queue yang sudah dibangun.
+    """
+    reminder = SholatReminder(dispatcher=NotificationDispatcher(sinks=[]), quiet=True)
+    reminder.build_reminder_queue()
+    return reminder
+
+
+@case('build_reminder_queue')
+def bench_build_reminder_queue(options):
+    return _quiet_reminder().build_reminder_queue
+
+
+@case('get_next_prayer_info')
+def bench_get_next_prayer_info(options):
+    return _quiet_reminder().get_next_prayer_info
+
+
+@case('get_system_status')
+def bench_get_system_status(options):
+    return _quiet_reminder().get_system_status
+
+
+@case('export_schedule')
+def bench_export_schedule(options):
+    return _quiet_reminder().export_schedule
+
+
+@case('import_schedule')
+def bench_import_schedule(options):
+    reminder = _quiet_reminder()
+    schedule_data = reminder.export_schedule()
+    return lambda: reminder.import_schedule(schedule_data)
+
+
+@case('format_prayer_notification')
+def bench_format_prayer_notification(options):
+    sholat_time = datetime.datetime(2025, 1, 1, 18, 45)
+    return lambda: format_prayer_notification('Maghrib', sholat_time)
+
+
+@case('monitor_loop')
+def bench_monitor_loop(options):
+    """
+    Reminder dijadwalkan setiap options.spacing_ms milidetik; dicatat
+    selisih waktu fire sebenarnya dengan waktu yang dijadwalkan.
+    """
+    count = options.reminders
+    spacing = options.spacing_ms / 1000
+    lateness = []
+
+    def callback(fire_timestamp, missed):
+        lateness.append(time.time() - fire_timestamp)
+
+    engine = ReminderEngine()
+    start = time.time() + 0.05
+    engine.add_subscriber('suite', [(start + i * spacing, start + i * spacing)
+                                    for i in range(count)], callback)
+    engine.start()
+    deadline = time.monotonic() + 5 + count * spacing
+    while len(lateness) < count and time.monotonic() < deadline:
+        time.sleep(spacing)
+    engine.stop()
+
+    lateness_ms = sorted(value * 1000 for value in lateness)
+    return {
+        'fired': len(lateness_ms),
+        'lateness_median_ms': statistics.median(lateness_ms),
+        'lateness_p95_ms': lateness_ms[int(len(lateness_ms) * 0.95) - 1],
+        'lateness_max_ms': lateness_ms[-1],
+        'wakeups_per_reminder': engine.wakeup_count / count,
+    }
+
+
+@case('monitor_replay')
+def bench_monitor_replay(options):
+    start = datetime.datetime.combine(datetime.date(2025, 1, 1), datetime.time())
+    clock = VirtualClock(start=start, limit=start)
+    engine = ReminderEngine(clock=clock)
+    dispatcher = NotificationDispatcher(sinks=[NullSink()], queue_size=100000)
+
+    reminders = [SholatReminder(engine=engine, subscriber_id=i, dispatcher=dispatcher,
+                                quiet=True, clock=clock)
+                 for i in range(options.replay_subscribers)]
+    for reminder in reminders:
+        reminder.start_reminder()
+
+    cpu_start = time.process_time()
+    clock.run_until(start + datetime.timedelta(days=options.replay_days))
+    clock.limit_reached.wait()
+    cpu_seconds = time.process_time() - cpu_start
+
+    for reminder in reminders:
+        reminder.stop_reminder()
+    engine.stop()
+    dispatcher.stop()
+
+    return {
+        'fired': engine.fired_count,
+        'cpu_us_per_reminder': cpu_seconds / max(engine.fired_count, 1) * 1e6,
+    }
+
+
+@case('notification_throughput')
+def bench_notification_throughput(options):
+    count = options.notifications
+    dispatcher = NotificationDispatcher(sinks=[NullSink()], workers=2,
+                                        queue_size=count)
+    sholat_time = datetime.datetime(2025, 1, 1, 18, 45)
+    message = format_prayer_notification('Maghrib', sholat_time)
+
+    dispatcher.start()
+    start = time.perf_counter()
+    for _ in range(count):
+        dispatcher.submit('Maghrib', sholat_time, message)
+    while dispatcher.get_stats()['dispatched'] < count:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    dispatcher.stop()
+    stats = dispatcher.get_stats()
+
+    return {
+        'notifications_per_s': count / elapsed,
+        'latency_avg_ms': stats['latency_avg'] * 1000,
+        'dropped': stats['dropped'],
+    }
+
+
+def measure_call(function, options):
+    """
+    Latensi per panggilan dan puncak memori satu panggilan.
+
+    Returns:
+        dict: median_us, p95_us, peak_kb
+    """
+    # Pemanasan
+    for _ in range(options.number):
+        function()
+
+    samples = []
+    for _ in range(options.repeat):
+        start = time.perf_counter()
+        for _ in range(options.number):
+            function()
+        samples.append((time.perf_counter() - start) / options.number * 1e6)
+    samples.sort()
+
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'median_us': statistics.median(samples),
+        'p95_us': samples[max(0, int(len(samples) * 0.95) - 1)],
+        'peak_kb': peak / 1024,
+    }
+
+
+def run_suite(options):
+    """
+    Menjalankan semua kasus (atau yang dipilih dengan --only).
+
+    Returns:
+        dict: Hasil per kasus
+    """
+    results = {}
+    with open(os.devnull, 'w') as devnull:
+        for name, setup in CASES:
+            if options.only and name not in options.only:
+                continue
+            with contextlib.redirect_stdout(devnull):
+                target = setup(options)
+                results[name] = target if isinstance(target, dict) else measure_call(target, options)
+    return results
+
+
+def higher_is_better(metric):
+    return metric.endswith('_per_s')
+
+
+def compare(results, baseline, threshold):
+    """
+    Membandingkan hasil dengan baseline.
+
+    Returns:
+        list: Tuple (kasus, metrik, nilai baseline, nilai sekarang, perubahan relatif)
+            untuk metrik yang memburuk lebih dari threshold
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            old = baseline.get(name, {}).get(metric)
+            if not old or metric in ('fired', 'dropped'):
+                continue
+            change = (value - old) / old
+            worse = -change if higher_is_better(metric) else change
+            if worse > threshold:
+                regressions.append((name, metric, old, value, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--json', help="Simpan hasil ke file JSON")
+    parser.add_argument('--baseline', help="File JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Batas perubahan relatif yang dianggap regresi (default 0.10)")
+    parser.add_argument('--only', nargs='+', help="Hanya jalankan kasus tertentu")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--reminders', type=int, default=200)
+    parser.add_argument('--spacing-ms', type=float, default=5)
+    parser.add_argument('--replay-subscribers', type=int, default=100)
+    parser.add_argument('--replay-days', type=int, default=7)
+    parser.add_argument('--notifications', type=int, default=20000)
+    options = parser.parse_args()
+
+    results = run_suite(options)
+    report = {
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'results': results,
+    }
+
+    for name, metrics in results.items():
+        formatted = ", ".join(f"{metric} {value:.2f}" if isinstance(value, float)
+                              else f"{metric} {value}" for metric, value in metrics.items())
+        print(f"{name:<27}: {formatted}")
+
+    if options.json:
+        with open(options.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if options.baseline:
+        with open(options.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+        regressions = compare(results, baseline, options.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regresi (> {options.threshold:.0%}):")
+            for name, metric, old, value, change in regressions:
+                print(f"  {name}.{metric}: {old:.2f} -> {value:.2f} ({change:+.0%})")
+            sys.exit(1)
+        print(f"\n✅ Tidak ada regresi dibanding {options.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# clock.py
+# File berisi abstraksi jam: jam sistem dan jam virtual untuk simulasi
+
+"""
+File ini berisi sumber waktu yang dapat diganti (injectable clock).
+
+- SystemClock  : waktu nyata (time.time, datetime.now, Condition.wait)
+- VirtualClock : waktu simulasi; setiap penantian dengan timeout langsung
+                 melompat ke deadline sehingga jadwal setahun bisa diputar
+                 ulang dalam hitungan detik
+
+SholatReminder dan ReminderEngine menerima parameter clock; fungsi di
+utils.py memakai jam default (get_clock) yang bisa diganti dengan set_clock.
+"""
+
+import datetime
+import threading
+import time
+
+
+class SystemClock:
+    """
+    Jam sistem (waktu nyata).
+    """
+
+    def time(self):
+        """
+        Returns:
+            float: Timestamp epoch saat ini (detik)
+        """
+        return time.time()
+
+    def monotonic(self):
+        """
+        Returns:
+            float: Jam monotonic untuk mengukur selang waktu
+        """
+        return time.monotonic()
+
+    def now(self):
+        """
+        Returns:
+            datetime: Waktu lokal saat ini
+        """
+        return datetime.datetime.now()
+
+    def today(self):
+        """
+        Returns:
+            date: Tanggal lokal hari ini
+        """
+        return datetime.date.today()
+
+    def wait(self, condition, timeout=None):
+        """
+        Menunggu condition (lock harus sudah dipegang) sampai dibangunkan
+        atau timeout habis.
+
+        Args:
+            condition (threading.Condition): Condition yang ditunggu
+            timeout (float, optional): Batas waktu (detik); None = tanpa batas
+        """
+        condition.wait(timeout)
+
+
+class VirtualClock:
+    """
+    Jam simulasi yang hanya bergerak saat dimajukan.
+
+    wait(condition, timeout) tidak tidur: waktu langsung dimajukan sebesar
+    timeout. Jika ada batas (limit), waktu berhenti di batas tersebut dan
+    wait benar-benar menunggu sampai dibangunkan (misal engine dihentikan
+    atau batas dinaikkan dengan run_until).
+    """
+
+    def __init__(self, start=None, limit=None):
+        """
+        Args:
+            start (datetime/float, optional): Waktu awal (datetime lokal atau
+                timestamp epoch). Default waktu nyata saat ini
+            limit (datetime/float, optional): Batas waktu simulasi.
+                Default tanpa batas
+        """
+        self._now = self._to_timestamp(time.time() if start is None else start)
+        self._limit = None if limit is None else self._to_timestamp(limit)
+        self._lock = threading.Lock()
+
+        # Condition yang sedang menunggu di batas (dibangunkan oleh run_until)
+        self._blocked = set()
+
+        # Ditandai saat waktu simulasi mencapai batas
+        self.limit_reached = threading.Event()
+
+    @staticmethod
+    def _to_timestamp(value):
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+        return float(value)
+
+    def time(self):
+        return self._now
+
+    def monotonic(self):
+        return self._now
+
+    def now(self):
+        return datetime.datetime.fromtimestamp(self._now)
+
+    def today(self):
+        return self.now().date()
+
+    def advance(self, seconds):
+        """
+        Memajukan waktu simulasi (tidak melewati batas).
+
+        Args:
+            seconds (float): Selang waktu (detik)
+
+        Returns:
+            bool: True jika waktu berhenti di batas
+        """
+        with self._lock:
+            target = self._now + max(0.0, seconds)
+            if self._limit is not None and target >= self._limit:
+                self._now = max(self._now, self._limit)
+                self.limit_reached.set()
+                return True
+            self._now = target
+            return False
+
+    def run_until(self, limit):
+        """
+        Mengganti batas waktu simulasi lalu membangunkan penantian yang
+        berhenti di batas lama.
+
+        Args:
+            limit (datetime/float/None): Batas baru; None = tanpa batas
+        """
+        with self._lock:
+            self._limit = None if limit is None else self._to_timestamp(limit)
+            self.limit_reached.clear()
+            blocked = list(self._blocked)
+
+        for condition in blocked:
+            with condition:
+                condition.notify_all()
+
+    def wait(self, condition, timeout=None):
+        """
+        Melompat ke deadline (now + timeout) tanpa tidur. Tanpa timeout
+        atau saat batas tercapai, menunggu sungguhan sampai dibangunkan.
+        """
+        with self._lock:
+            if timeout is not None:
+                target = self._now + max(0.0, timeout)
+                if self._limit is None or target < self._limit:
+                    self._now = target
+                    return
+                self._now = max(self._now, self._limit)
+                self.limit_reached.set()
+
+            # Didaftarkan di bawah lock yang sama dengan pemeriksaan batas,
+            # sehingga run_until tidak bisa terlewat membangunkan penantian ini
+            self._blocked.add(condition)
+        try:
+            condition.wait()
+        finally:
+            with self._lock:
+                self._blocked.discard(condition)
+
+
+# Jam default untuk fungsi yang tidak menerima clock secara eksplisit
+_default_clock = SystemClock()
+
+
+def get_clock():
+    """
+    Returns:
+        SystemClock/VirtualClock: Jam default
+    """
+    return _default_clock
+
+
+def set_clock(clock):
+    """
+    Mengganti jam default (misal dengan VirtualClock untuk simulasi).
+
+    Args:
+        clock (SystemClock/VirtualClock, optional): Jam baru; None = jam sistem
+
+    Returns:
+        SystemClock/VirtualClock: Jam default sebelumnya
+    """
+    global _default_clock
+
+    previous = _default_clock
+    _default_clock = SystemClock() if clock is None else clock
+    return previous
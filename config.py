@@ -25,11 +25,59 @@ DEFAULT_PRAYER_TIMES = [
     [18, 57]    # Isya
 ]
 
+# Lokasi untuk perhitungan waktu sholat astronomis (prayer_times.py, butuh NumPy)
+# Jika 'latitude' bernilai None, jadwal diambil dari DEFAULT_PRAYER_TIMES
+LOCATION_CONFIG = {
+    'latitude': None,     # Contoh Jakarta: -6.2088
+    'longitude': None,    # Contoh Jakarta: 106.8456
+    'elevation': 0,       # Meter di atas permukaan laut
+    'timezone': 7,        # WIB = 7, WITA = 8, WIT = 9
+    'zone': None,         # Zona IANA, misal 'Asia/Jakarta'; None = waktu lokal sistem
+    'method': 'Kemenag',  # Kemenag, MWL, ISNA, Egypt, Makkah, Karachi, JAKIM
+    'asr_factor': 1       # 1 = Syafi'i, 2 = Hanafi
+}
+
+# Cache hasil perhitungan waktu sholat (prayer_cache.py)
+# Lokasi yang berdekatan (setelah pembulatan) memakai hasil yang sama
+PRAYER_CACHE_CONFIG = {
+    'max_entries': 4096,  # Jumlah (lokasi, tanggal) maksimum, LRU jika penuh
+    'precision': 2,       # Desimal pembulatan lintang/bujur (2 = ~1 km)
+    'warm_path': None     # File JSON cache hangat, contoh: 'prayer_cache.json'
+}
+
+# Timetable biner tahunan (timetable_store.py) sebagai sumber jadwal
+# Jika 'path' diisi, jadwal hari ini dibaca langsung dari file via mmap
+TIMETABLE_CONFIG = {
+    'path': None,         # Contoh: 'jadwal_2025.ptt'
+    'location': None      # Nama lokasi dalam timetable, contoh: 'Jakarta'
+}
+
+# Pembuatan timetable massal paralel (timetable_build.py)
+TIMETABLE_BUILD_CONFIG = {
+    'workers': None,      # Jumlah proses worker; None = jumlah core CPU
+    'shard_size': 32      # Jumlah lokasi per tugas worker
+}
+
 # Konfigurasi sistem reminder
 REMINDER_CONFIG = {
     # Interval pengecekan dalam detik (30 detik default)
+    # Hanya dipakai pada scheduler_mode 'polling'
     'check_interval': 30,
     
+    # Mode scheduler monitoring:
+    # - 'deadline': tidur tepat sampai waktu sholat berikutnya (event-driven)
+    # - 'polling' : cek queue setiap check_interval detik (perilaku lama)
+    'scheduler_mode': 'deadline',
+    
+    # Jumlah hari jadwal yang dijaga di queue (hari ini + hari berikutnya);
+    # hari baru dibuat saat pergantian tengah malam, tanpa rebuild penuh
+    'horizon_days': 2,
+    
+    # Gabungkan reminder subscriber di engine bersama yang jatuh tempo pada
+    # menit, sholat dan lokasi yang sama menjadi satu notifikasi (satu
+    # format + satu dispatch dengan daftar penerima)
+    'coalesce': True,
+    
     # Toleransi waktu reminder dalam detik (60 detik = 1 menit)
     'reminder_tolerance': 60,
     
@@ -43,6 +91,119 @@ REMINDER_CONFIG = {
     'sound_delay': 0.5
 }
 
+# Journal reminder yang sudah fire (fired_journal.py)
+# Jika 'path' diisi, restart tidak mengulang reminder yang sudah fire dan
+# reminder yang terlewat selama program mati diproses sesuai 'catchup'
+JOURNAL_CONFIG = {
+    'path': None,              # Contoh: 'sholat_fired.journal'
+    'snapshot_every': 256,     # Baris journal sebelum diringkas ke snapshot
+    'fsync': True,             # fsync setiap baris (tahan crash/mati listrik)
+    'retention_days': 7,       # Umur entri yang disimpan di snapshot
+    
+    # Kebijakan reminder yang terlewat selama program mati:
+    # - 'skip'  : hanya dicatat sebagai terlewat
+    # - 'latest': hanya yang paling akhir dikirim, sisanya dilewati
+    # - 'fire'  : semua dikirim (berurutan)
+    'catchup': 'latest',
+    
+    # Reminder yang lebih lama dari ini (detik) tidak dikejar
+    'catchup_window': 3600
+}
+
+# Konfigurasi dispatch notifikasi (notification_dispatch.py)
+DISPATCH_CONFIG = {
+    # Jumlah thread worker yang menjalankan sink
+    'workers': 2,
+    
+    # Kapasitas queue job notifikasi; job yang tidak muat langsung dibuang
+    # (submit tidak pernah menunggu di thread engine)
+    'queue_size': 100,
+    
+    # Sink yang aktif: 'console', 'sound', 'file', 'webhook',
+    # 'fanout_webhook', 'fanout_queue' (lihat FANOUT_CONFIG)
+    'sinks': ['console', 'sound'],
+    
+    # Batas waktu per sink untuk setiap notifikasi (detik)
+    'sink_timeout': 5,
+    
+    # Tujuan sink 'file' dan 'webhook'
+    'file_path': None,
+    'webhook_url': None
+}
+
+# Konfigurasi audio adzan/chime untuk sink 'sound' (audio_engine.py)
+# Jika 'files' kosong, sink 'sound' memakai beep seperti biasa
+AUDIO_CONFIG = {
+    # File WAV (PCM) per sholat; 'default' untuk sholat yang tidak tercantum
+    # Contoh: {'Subuh': 'audio/adzan_subuh.wav', 'default': 'audio/adzan.wav'}
+    'files': {},
+    
+    # Backend: 'auto', 'aplay', 'winsound', 'file' (tulis WAV) atau 'null'
+    'backend': 'auto',
+    'output_path': None,       # Tujuan backend 'file'
+    
+    # Decode semua file saat sink dibuat (bukan saat reminder pertama)
+    'preload': True,
+    
+    # Durasi irisan PCM per penulisan ke backend (milidetik) dan kapasitas
+    # queue permintaan pemutaran
+    'chunk_ms': 50,
+    'queue_size': 8
+}
+
+# Konfigurasi fan-out ke banyak penerima (fanout_sinks.py)
+# Dipakai sink 'fanout_webhook' dan 'fanout_queue' di DISPATCH_CONFIG['sinks']
+FANOUT_CONFIG = {
+    'recipients_path': None,   # File ID penerima, satu per baris
+    
+    # Penerima per request/publish dan jumlah koneksi keep-alive paralel
+    'batch_size': 500,
+    'connections': 4,
+    
+    # Percobaan ulang per batch dengan backoff eksponensial + jitter (detik)
+    'max_retries': 3,
+    'retry_backoff': 0.2,
+    'retry_backoff_max': 5,
+    
+    # Kapasitas queue batch per sink
+    'queue_size': 1000,
+    
+    # Tujuan: URL webhook (http/https) dan alamat broker (tcp://host:port)
+    'webhook_url': None,
+    'queue_url': None
+}
+
+# Konfigurasi metrik (metrics.py)
+# Jika 'http_port' diisi, endpoint /metrics (format Prometheus) dijalankan
+# saat reminder dimulai
+METRICS_CONFIG = {
+    'http_host': '127.0.0.1',  # Hanya lokal; ganti '0.0.0.0' untuk scraper lain
+    'http_port': None          # Contoh: 9464
+}
+
+# Konfigurasi mode daemon (daemon.py dan daemon_client.py)
+DAEMON_CONFIG = {
+    'socket_path': '/tmp/sholat_reminder.sock',
+    'socket_mode': 0o600,          # Hanya pemilik yang boleh terhubung
+    'max_request_bytes': 65536     # Batas panjang satu baris request
+}
+
+# Konfigurasi HTTP/JSON API (http_api.py)
+API_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8080,
+    'backlog': 1024,        # Antrian koneksi yang belum di-accept
+    'max_locations': 1024   # Jumlah lokasi (SholatReminder) yang disimpan, LRU
+}
+
+# Konfigurasi eksternal yang dimuat ulang tanpa restart (config_reload.py)
+# Jika 'path' diisi (file .toml atau .json), isinya menimpa nilai di file ini
+# saat startup, dan perubahan file diterapkan selagi program berjalan
+RELOAD_CONFIG = {
+    'path': None,      # Contoh: 'sholat_config.toml'
+    'interval': 2      # Detik antar pengecekan perubahan file (mtime)
+}
+
 # Konfigurasi tampilan interface
 DISPLAY_CONFIG = {
     'separator_length': 50,
@@ -95,10 +256,31 @@ MAIN_MENU = [
 ]
 
 # Validasi konfigurasi
-def validate_config():
+def validate_config(overrides=None):
     """
     Memvalidasi konfigurasi untuk memastikan konsistensi data.
+    
+    Args:
+        overrides (dict, optional): {nama konfigurasi: nilai} yang divalidasi
+            sebagai pengganti nilai di modul ini (kandidat hot-reload);
+            konfigurasi aktif tidak diubah
     """
+    values = dict(globals(), **(overrides or {}))
+    SHOLAT_NAMES = values['SHOLAT_NAMES']
+    DEFAULT_PRAYER_TIMES = values['DEFAULT_PRAYER_TIMES']
+    LOCATION_CONFIG = values['LOCATION_CONFIG']
+    PRAYER_CACHE_CONFIG = values['PRAYER_CACHE_CONFIG']
+    TIMETABLE_BUILD_CONFIG = values['TIMETABLE_BUILD_CONFIG']
+    REMINDER_CONFIG = values['REMINDER_CONFIG']
+    JOURNAL_CONFIG = values['JOURNAL_CONFIG']
+    DISPATCH_CONFIG = values['DISPATCH_CONFIG']
+    FANOUT_CONFIG = values['FANOUT_CONFIG']
+    AUDIO_CONFIG = values['AUDIO_CONFIG']
+    METRICS_CONFIG = values['METRICS_CONFIG']
+    DAEMON_CONFIG = values['DAEMON_CONFIG']
+    API_CONFIG = values['API_CONFIG']
+    RELOAD_CONFIG = values['RELOAD_CONFIG']
+    
     # Pastikan jumlah nama sholat sama dengan jumlah waktu default
     if len(SHOLAT_NAMES) != len(DEFAULT_PRAYER_TIMES):
         raise ValueError("Jumlah nama sholat tidak sama dengan jumlah waktu default")
@@ -121,6 +303,140 @@ def validate_config():
     
     if REMINDER_CONFIG['reminder_tolerance'] < 0:
         raise ValueError("Toleransi reminder tidak boleh negatif")
+    
+    # Validasi lokasi jika perhitungan astronomis diaktifkan
+    if LOCATION_CONFIG['latitude'] is not None:
+        if not (-90 <= LOCATION_CONFIG['latitude'] <= 90):
+            raise ValueError(f"Lintang tidak valid: {LOCATION_CONFIG['latitude']}")
+        
+        if LOCATION_CONFIG['longitude'] is None or not (-180 <= LOCATION_CONFIG['longitude'] <= 180):
+            raise ValueError(f"Bujur tidak valid: {LOCATION_CONFIG['longitude']}")
+    
+    # Validasi zona waktu (nama IANA)
+    if LOCATION_CONFIG['zone'] is not None:
+        from zones import get_zone
+        
+        get_zone(LOCATION_CONFIG['zone'])
+    
+    # Validasi cache waktu sholat
+    if PRAYER_CACHE_CONFIG['max_entries'] <= 0:
+        raise ValueError("Ukuran cache waktu sholat harus lebih dari 0")
+    
+    if not (0 <= PRAYER_CACHE_CONFIG['precision'] <= 6):
+        raise ValueError("Presisi cache waktu sholat harus antara 0-6 desimal")
+    
+    # Validasi pembuatan timetable massal
+    workers = TIMETABLE_BUILD_CONFIG['workers']
+    if workers is not None and workers <= 0:
+        raise ValueError("Jumlah worker timetable harus lebih dari 0")
+    
+    if TIMETABLE_BUILD_CONFIG['shard_size'] <= 0:
+        raise ValueError("shard_size timetable harus lebih dari 0")
+    
+    # Validasi dispatch notifikasi
+    if DISPATCH_CONFIG['workers'] <= 0:
+        raise ValueError("Jumlah worker notifikasi harus lebih dari 0")
+    
+    if DISPATCH_CONFIG['queue_size'] <= 0:
+        raise ValueError("Kapasitas queue notifikasi harus lebih dari 0")
+    
+    if 'file' in DISPATCH_CONFIG['sinks'] and not DISPATCH_CONFIG['file_path']:
+        raise ValueError("Sink 'file' membutuhkan file_path")
+    
+    if 'webhook' in DISPATCH_CONFIG['sinks'] and not DISPATCH_CONFIG['webhook_url']:
+        raise ValueError("Sink 'webhook' membutuhkan webhook_url")
+    
+    # Validasi fan-out
+    fanout_sinks = {'fanout_webhook': 'webhook_url', 'fanout_queue': 'queue_url'}
+    for sink_name, url_key in fanout_sinks.items():
+        if sink_name not in DISPATCH_CONFIG['sinks']:
+            continue
+        if not FANOUT_CONFIG[url_key]:
+            raise ValueError(f"Sink '{sink_name}' membutuhkan {url_key}")
+        if not FANOUT_CONFIG['recipients_path']:
+            raise ValueError(f"Sink '{sink_name}' membutuhkan recipients_path")
+    
+    if FANOUT_CONFIG['batch_size'] <= 0:
+        raise ValueError("batch_size fan-out harus lebih dari 0")
+    
+    if FANOUT_CONFIG['connections'] <= 0:
+        raise ValueError("Jumlah koneksi fan-out harus lebih dari 0")
+    
+    if FANOUT_CONFIG['max_retries'] < 0:
+        raise ValueError("max_retries tidak boleh negatif")
+    
+    if FANOUT_CONFIG['queue_size'] <= 0:
+        raise ValueError("Kapasitas queue batch fan-out harus lebih dari 0")
+    
+    # Validasi audio
+    if AUDIO_CONFIG['backend'] not in ('auto', 'aplay', 'winsound', 'file', 'null'):
+        raise ValueError(f"Backend audio tidak dikenal: {AUDIO_CONFIG['backend']}")
+    
+    if AUDIO_CONFIG['backend'] == 'file' and not AUDIO_CONFIG['output_path']:
+        raise ValueError("Backend audio 'file' membutuhkan output_path")
+    
+    if not isinstance(AUDIO_CONFIG['files'], dict):
+        raise ValueError("files audio harus berupa dict {nama sholat: path WAV}")
+    
+    for name in AUDIO_CONFIG['files']:
+        if name != 'default' and name not in SHOLAT_NAMES:
+            raise ValueError(f"Sholat tidak dikenal di files audio: {name}")
+    
+    if AUDIO_CONFIG['chunk_ms'] <= 0:
+        raise ValueError("chunk_ms audio harus lebih dari 0")
+    
+    if AUDIO_CONFIG['queue_size'] <= 0:
+        raise ValueError("Kapasitas queue audio harus lebih dari 0")
+    
+    if REMINDER_CONFIG['scheduler_mode'] not in ('deadline', 'polling'):
+        raise ValueError(f"Mode scheduler tidak dikenal: {REMINDER_CONFIG['scheduler_mode']}")
+    
+    if REMINDER_CONFIG['horizon_days'] < 1:
+        raise ValueError("horizon_days minimal 1")
+    
+    # Validasi journal reminder
+    if JOURNAL_CONFIG['catchup'] not in ('skip', 'latest', 'fire'):
+        raise ValueError(f"Kebijakan catch-up tidak dikenal: {JOURNAL_CONFIG['catchup']}")
+    
+    if JOURNAL_CONFIG['catchup_window'] < 0:
+        raise ValueError("catchup_window tidak boleh negatif")
+    
+    if JOURNAL_CONFIG['snapshot_every'] <= 0:
+        raise ValueError("snapshot_every harus lebih dari 0")
+    
+    if JOURNAL_CONFIG['retention_days'] < 1:
+        raise ValueError("retention_days minimal 1")
+    
+    # Validasi mode daemon
+    if DAEMON_CONFIG['max_request_bytes'] <= 0:
+        raise ValueError("max_request_bytes harus lebih dari 0")
+    
+    # Validasi HTTP API
+    if not (0 < API_CONFIG['port'] < 65536):
+        raise ValueError(f"Port API tidak valid: {API_CONFIG['port']}")
+    
+    if API_CONFIG['max_locations'] <= 0:
+        raise ValueError("max_locations harus lebih dari 0")
+    
+    # Validasi endpoint metrik
+    port = METRICS_CONFIG['http_port']
+    if port is not None and not (0 < port < 65536):
+        raise ValueError(f"Port metrik tidak valid: {port}")
+    
+    # Validasi hot-reload konfigurasi
+    if RELOAD_CONFIG['interval'] <= 0:
+        raise ValueError("Interval pengecekan file konfigurasi harus lebih dari 0")
+
+# Status validasi - konfigurasi divalidasi sekali saat pertama dibutuhkan,
+# bukan setiap kali modul ini diimport
+_config_validated = False
 
-# Jalankan validasi saat import
-validate_config()
+def ensure_config_valid():
+    """
+    Menjalankan validate_config() sekali per proses.
+    """
+    global _config_validated
+    
+    if not _config_validated:
+        validate_config()
+        _config_validated = True
@@ -0,0 +1,427 @@
+# config_reload.py
+# File berisi pemuatan konfigurasi dari file TOML/JSON dan hot-reload tanpa restart
+
+"""
+File ini memuat konfigurasi eksternal (RELOAD_CONFIG['path'], .toml atau
+.json) di atas nilai bawaan config.py, lalu memantau file tersebut dan
+menerapkan perubahannya selagi program berjalan, tanpa membuang queue
+reminder di memori.
+
+Contoh file TOML:
+
+    [prayer_times]
+    Maghrib = "17:45"
+
+    [reminder]
+    reminder_tolerance = 120
+
+    [dispatch]
+    workers = 4
+
+    [messages]
+    prayer_reminder = "🔔 Segera tunaikan sholat 🔔"
+
+Alur reload (di thread watcher, di luar jalur dispatch reminder):
+1. Perubahan file dideteksi dari (mtime, ukuran, inode) setiap
+   RELOAD_CONFIG['interval'] detik (polling; tanpa dependensi inotify)
+2. File di-parse dan digabung di atas nilai bawaan; kunci yang dihapus dari
+   file kembali ke nilai bawaan
+3. Kandidat divalidasi dengan validate_config(overrides) tanpa menyentuh
+   konfigurasi aktif; jika gagal, konfigurasi lama tetap dipakai
+4. Setiap bagian yang berubah ditukar dengan satu dict.update (atau satu
+   slice assignment untuk DEFAULT_PRAYER_TIMES), sehingga pembaca melihat
+   nilai lama atau nilai baru, tidak pernah setengah
+5. Hanya bagian yang terdampak yang diterapkan: sholat yang waktunya
+   berubah dijadwalkan ulang, pool dispatcher diubah ukurannya, sink dibuat
+   ulang jika pengaturannya berubah
+
+Bagian dan kunci yang hanya dibaca saat startup (STARTUP_SECTIONS,
+STARTUP_KEYS) dimuat saat startup, tetapi perubahannya saat berjalan hanya
+dilaporkan dan baru berlaku setelah restart.
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+
+import config
+import metrics
+from config import RELOAD_CONFIG, SHOLAT_NAMES
+
+# Nama bagian di file -> nama konfigurasi di config.py
+SECTIONS = {
+    'prayer_times': 'DEFAULT_PRAYER_TIMES',
+    'reminder': 'REMINDER_CONFIG',
+    'messages': 'MESSAGES',
+    'dispatch': 'DISPATCH_CONFIG',
+    'fanout': 'FANOUT_CONFIG',
+    'audio': 'AUDIO_CONFIG',
+    'journal': 'JOURNAL_CONFIG',
+    'location': 'LOCATION_CONFIG',
+    'prayer_cache': 'PRAYER_CACHE_CONFIG',
+    'timetable': 'TIMETABLE_CONFIG',
+    'timetable_build': 'TIMETABLE_BUILD_CONFIG',
+    'metrics': 'METRICS_CONFIG',
+    'daemon': 'DAEMON_CONFIG',
+    'api': 'API_CONFIG'
+}
+
+# Bagian yang dipakai saat objek dibuat (lokasi, cache, server); perubahan
+# saat berjalan butuh restart
+STARTUP_SECTIONS = {'location', 'prayer_cache', 'timetable', 'timetable_build',
+                    'metrics', 'daemon', 'api'}
+
+# Kunci dalam bagian yang dapat di-reload yang tetap hanya dibaca saat startup
+STARTUP_KEYS = {
+    'REMINDER_CONFIG': ('scheduler_mode', 'coalesce'),
+    'JOURNAL_CONFIG': ('path', 'snapshot_every', 'fsync', 'retention_days')
+}
+
+# Kunci dispatch yang menentukan objek sink
+_SINK_KEYS = ('sinks', 'sink_timeout', 'file_path', 'webhook_url')
+
+
+def _parse_time(value, sholat_name):
+    """
+    Waktu sholat dari "HH:MM" atau [jam, menit].
+
+    Returns:
+        list: [jam, menit]
+    """
+    if isinstance(value, str):
+        hour, separator, minute = value.partition(':')
+        if not separator or not hour.isdigit() or not minute.isdigit():
+            raise ValueError(f"Format waktu {sholat_name} harus HH:MM: {value}")
+        return [int(hour), int(minute)]
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        return [int(value[0]), int(value[1])]
+    raise ValueError(f"Format waktu {sholat_name} tidak valid: {value}")
+
+
+def _merge_section(section, base, value):
+    """
+    Menggabungkan isi satu bagian file di atas nilai bawaannya.
+
+    Returns:
+        dict/list: Nilai baru (salinan; nilai bawaan tidak diubah)
+    """
+    if section == 'prayer_times':
+        times = copy.deepcopy(base)
+        if isinstance(value, dict):
+            for sholat_name, time_value in value.items():
+                if sholat_name not in SHOLAT_NAMES:
+                    raise ValueError(f"Sholat tidak dikenal di [prayer_times]: {sholat_name}")
+                index = SHOLAT_NAMES.index(sholat_name)
+                times[index] = _parse_time(time_value, sholat_name)
+        elif isinstance(value, list):
+            times = [_parse_time(item, name) for item, name in zip(value, SHOLAT_NAMES)]
+            if len(value) != len(SHOLAT_NAMES):
+                raise ValueError("Jumlah waktu di [prayer_times] tidak sama dengan jumlah sholat")
+        else:
+            raise ValueError("[prayer_times] harus berupa tabel nama sholat atau list waktu")
+        return times
+
+    if not isinstance(value, dict):
+        raise ValueError(f"[{section}] harus berupa tabel")
+    unknown = sorted(set(value) - set(base))
+    if unknown:
+        raise ValueError(f"Kunci tidak dikenal di [{section}]: {', '.join(unknown)}")
+    merged = copy.deepcopy(base)
+    merged.update(copy.deepcopy(value))
+    return merged
+
+
+def read_config_file(path, baseline):
+    """
+    Membaca file konfigurasi dan menggabungkannya di atas nilai bawaan.
+
+    Args:
+        path (str): File .toml atau .json
+        baseline (dict): {nama konfigurasi: nilai bawaan}
+
+    Returns:
+        dict: {nama konfigurasi: nilai} untuk semua bagian di SECTIONS
+
+    Raises:
+        OSError: Jika file tidak bisa dibaca
+        ValueError: Jika isi file tidak valid
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if path.lower().endswith('.toml'):
+        import tomllib
+
+        try:
+            content = tomllib.loads(data.decode('utf-8'))
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"TOML tidak valid: {e}") from e
+    else:
+        content = json.loads(data.decode('utf-8'))
+    if not isinstance(content, dict):
+        raise ValueError("Isi file konfigurasi harus berupa tabel/objek")
+
+    unknown = sorted(set(content) - set(SECTIONS))
+    if unknown:
+        raise ValueError(f"Bagian tidak dikenal: {', '.join(unknown)}")
+
+    values = {}
+    for section, name in SECTIONS.items():
+        if section in content:
+            values[name] = _merge_section(section, baseline[name], content[section])
+        else:
+            values[name] = copy.deepcopy(baseline[name])
+    return values
+
+
+def _swap(name, value):
+    """
+    Menukar isi satu konfigurasi di tempat (objeknya tetap sama, sehingga
+    modul yang sudah mengimport-nya ikut melihat nilai baru).
+    """
+    target = getattr(config, name)
+    if isinstance(target, dict):
+        target.update(value)
+    else:
+        target[:] = value
+
+
+class ConfigWatcher:
+    """
+    Pemantau file konfigurasi eksternal dengan hot-reload inkremental.
+
+    Menggunakan:
+    - Nilai bawaan config.py (salinan saat watcher dibuat) sebagai dasar
+    - Thread polling mtime yang memvalidasi dan menerapkan perubahan
+    - Daftar SholatReminder dan NotificationDispatcher yang diberi tahu
+    """
+
+    def __init__(self, path=None, interval=None):
+        """
+        Args:
+            path (str, optional): File konfigurasi. Default RELOAD_CONFIG['path']
+            interval (float, optional): Detik antar pengecekan. Default RELOAD_CONFIG['interval']
+        """
+        self.path = RELOAD_CONFIG['path'] if path is None else path
+        self.interval = RELOAD_CONFIG['interval'] if interval is None else interval
+
+        self._baseline = {name: copy.deepcopy(getattr(config, name))
+                          for name in SECTIONS.values()}
+        self._signature = None
+        self._reminders = []
+        self._dispatchers = []
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+
+        self.stats = {
+            'reloads': 0,
+            'failures': 0,
+            'last_error': None,
+            'last_reload': None
+        }
+
+    def add(self, reminder):
+        """
+        Mendaftarkan SholatReminder (beserta dispatcher-nya) untuk diberi
+        tahu perubahan konfigurasi.
+
+        Args:
+            reminder (SholatReminder): Reminder yang jadwalnya ikut diperbarui
+        """
+        with self._lock:
+            if reminder not in self._reminders:
+                self._reminders.append(reminder)
+            if all(dispatcher is not reminder.dispatcher for dispatcher in self._dispatchers):
+                self._dispatchers.append(reminder.dispatcher)
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _read_valid(self):
+        """
+        Membaca dan memvalidasi kandidat konfigurasi tanpa menerapkannya.
+
+        Returns:
+            dict atau None: Kandidat, atau None jika ditolak
+        """
+        try:
+            candidate = read_config_file(self.path, self._baseline)
+            config.validate_config(candidate)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            self.stats['failures'] += 1
+            self.stats['last_error'] = str(e)
+            metrics.CONFIG_RELOAD_FAILURES.inc()
+            print(f"❌ Konfigurasi {self.path} ditolak, konfigurasi lama tetap dipakai: {e}")
+            return None
+        return candidate
+
+    def load(self):
+        """
+        Memuat file saat startup (sebelum SholatReminder dibuat): semua
+        bagian diterapkan, termasuk yang hanya dibaca saat startup.
+
+        Returns:
+            bool: True jika file dimuat
+        """
+        with self._lock:
+            self._signature = self._file_signature()
+            if self._signature is None:
+                print(f"⚠️  File konfigurasi {self.path} tidak ditemukan, memakai config.py")
+                return False
+
+            candidate = self._read_valid()
+            if candidate is None:
+                return False
+            for name, value in candidate.items():
+                _swap(name, value)
+            config.ensure_config_valid()
+            print(f"⚙️  Konfigurasi dimuat dari {self.path}")
+            return True
+
+    def check(self):
+        """
+        Menerapkan file jika berubah sejak pengecekan terakhir.
+
+        Returns:
+            bool: True jika perubahan diterapkan
+        """
+        signature = self._file_signature()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        return self.reload()
+
+    def reload(self):
+        """
+        Membaca, memvalidasi lalu menerapkan perubahan konfigurasi secara
+        inkremental.
+
+        Returns:
+            bool: True jika perubahan diterapkan
+        """
+        with self._lock:
+            candidate = self._read_valid()
+            if candidate is None:
+                return False
+
+            changes = {}
+            for section, name in SECTIONS.items():
+                current = getattr(config, name)
+                value = candidate[name]
+                if value == current:
+                    continue
+                if section in STARTUP_SECTIONS:
+                    print(f"⚠️  Perubahan [{section}] baru berlaku setelah restart")
+                    continue
+                for key in STARTUP_KEYS.get(name, ()):
+                    if value[key] != current[key]:
+                        print(f"⚠️  Perubahan {section}.{key} baru berlaku setelah restart")
+                        value[key] = current[key]
+                if value != current:
+                    changes[name] = (copy.deepcopy(current), value)
+
+            if not changes:
+                return False
+
+            # Tukar semua bagian yang berubah dulu, baru terapkan efeknya
+            for name, (_, value) in changes.items():
+                _swap(name, value)
+            summary = self._apply(changes)
+
+            self.stats['reloads'] += 1
+            self.stats['last_error'] = None
+            self.stats['last_reload'] = time.time()
+            metrics.CONFIG_RELOADS.inc()
+            print(f"🔄 Konfigurasi dimuat ulang: {', '.join(summary)}")
+            return True
+
+    def _apply(self, changes):
+        """
+        Menerapkan efek perubahan ke reminder dan dispatcher yang terdaftar.
+
+        Args:
+            changes (dict): {nama konfigurasi: (nilai lama, nilai baru)}
+
+        Returns:
+            list: Ringkasan perubahan untuk ditampilkan
+        """
+        summary = []
+
+        if 'DEFAULT_PRAYER_TIMES' in changes:
+            old, new = changes['DEFAULT_PRAYER_TIMES']
+            indexes = [i for i in range(len(new)) if old[i] != new[i]]
+            rescheduled = sum(reminder.reload_default_times(indexes)
+                              for reminder in self._reminders)
+            names = ', '.join(f"{SHOLAT_NAMES[i]} {new[i][0]:02d}:{new[i][1]:02d}"
+                              for i in indexes)
+            summary.append(f"waktu {names} ({rescheduled} reminder dijadwalkan ulang)")
+
+        if 'REMINDER_CONFIG' in changes:
+            old, new = changes['REMINDER_CONFIG']
+            if old['horizon_days'] != new['horizon_days']:
+                for reminder in self._reminders:
+                    reminder.set_horizon_days(new['horizon_days'])
+            summary.extend(f"reminder.{key}" for key in new if old[key] != new[key])
+
+        if any(name in changes for name in ('DISPATCH_CONFIG', 'FANOUT_CONFIG', 'AUDIO_CONFIG')):
+            rebuild_sinks = 'FANOUT_CONFIG' in changes or 'AUDIO_CONFIG' in changes
+            if 'DISPATCH_CONFIG' in changes:
+                old, new = changes['DISPATCH_CONFIG']
+                rebuild_sinks = rebuild_sinks or any(old[key] != new[key] for key in _SINK_KEYS)
+                summary.extend(f"dispatch.{key}" for key in new if old[key] != new[key])
+            for name, section in (('FANOUT_CONFIG', 'fanout'), ('AUDIO_CONFIG', 'audio')):
+                if name in changes:
+                    old, new = changes[name]
+                    summary.extend(f"{section}.{key}" for key in new if old[key] != new[key])
+            for dispatcher in self._dispatchers:
+                dispatcher.reload_config(rebuild_sinks)
+
+        for name, section in (('MESSAGES', 'messages'), ('JOURNAL_CONFIG', 'journal')):
+            if name in changes:
+                old, new = changes[name]
+                summary.extend(f"{section}.{key}" for key in new if old[key] != new[key])
+
+        # Status yang di-cache bisa memuat format waktu/pesan lama
+        for reminder in self._reminders:
+            reminder._invalidate_status()
+        return summary
+
+    def _watch_loop(self):
+        while not self._stopping.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"❌ Error saat memuat ulang konfigurasi: {e}")
+
+    def start(self):
+        """
+        Memulai thread pemantau file (daemon).
+        """
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1):
+        """
+        Menghentikan thread pemantau.
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Statistik reload
+        """
+        return dict(self.stats, path=self.path)
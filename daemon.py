@@ -0,0 +1,295 @@
+# daemon.py
+# File berisi mode daemon (tanpa terminal) dengan protokol kontrol lewat Unix socket
+
+"""
+File ini menjalankan SholatReminder tanpa menu interaktif dan melayani
+perintah lewat Unix-domain socket (DAEMON_CONFIG['socket_path']).
+
+Protokol: satu baris perintah teks per request, satu baris JSON per respons.
+Koneksi boleh dipakai untuk banyak request berturut-turut.
+
+    next                      -> sholat berikutnya
+    status                    -> get_system_status()
+    update <indeks> <jam> <menit>
+    import <json>             -> data untuk SholatReminder.import_schedule
+    ping
+    stop                      -> menghentikan daemon
+
+Respons: {"ok": true, "result": ...} atau {"ok": false, "error": "..."}
+
+Query (next, status, ping) tidak memakai lock dan dilayani dari snapshot
+status yang di-cache; hasil encode JSON 'next' juga dipakai ulang selama
+snapshot sama ('status' di-encode setiap kali karena memuat metrik
+terkini). Perintah yang mengubah jadwal dijalankan satu per satu.
+
+Contoh:
+    python daemon.py                     # jalankan daemon
+    python daemon_client.py next         # query dari terminal lain
+    printf 'status\\n' | nc -U /tmp/sholat_reminder.sock
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+
+from config import DAEMON_CONFIG, RELOAD_CONFIG
+
+
+def encode_response(ok, value):
+    """
+    Membuat satu baris respons JSON.
+
+    Args:
+        ok (bool): True jika perintah berhasil
+        value: Hasil (ok=True) atau pesan error (ok=False)
+
+    Returns:
+        bytes: Baris JSON diakhiri newline
+    """
+    body = {'ok': True, 'result': value} if ok else {'ok': False, 'error': value}
+    return (json.dumps(body, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler satu koneksi client: membaca baris perintah sampai client menutup koneksi.
+    """
+
+    def handle(self):
+        daemon = self.server.reminder_daemon
+        limit = DAEMON_CONFIG['max_request_bytes']
+
+        while True:
+            line = self.rfile.readline(limit + 1)
+            if not line:
+                break
+            if len(line) > limit:
+                self.wfile.write(encode_response(False, "Request terlalu besar"))
+                break
+
+            response = daemon.handle_command(line.decode('utf-8', 'replace').strip())
+            try:
+                self.wfile.write(response)
+            except (BrokenPipeError, ConnectionResetError):
+                break
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ReminderDaemon:
+    """
+    Daemon reminder sholat dengan server Unix socket.
+
+    Menggunakan:
+    - Satu SholatReminder (engine dan dispatcher miliknya sendiri)
+    - Thread per koneksi client (ThreadingMixIn)
+    - Lock untuk perintah yang mengubah jadwal
+    """
+
+    def __init__(self, reminder=None, socket_path=None):
+        """
+        Args:
+            reminder (SholatReminder, optional): Reminder yang dilayani.
+                Default SholatReminder(quiet=True)
+            socket_path (str, optional): Path socket. Default DAEMON_CONFIG['socket_path']
+        """
+        # File konfigurasi eksternal dimuat sebelum reminder dibuat
+        self.config_watcher = None
+        if RELOAD_CONFIG['path'] is not None:
+            from config_reload import ConfigWatcher
+
+            self.config_watcher = ConfigWatcher()
+            self.config_watcher.load()
+
+        if reminder is None:
+            from sholat_reminder import SholatReminder
+
+            reminder = SholatReminder(quiet=True)
+        self.reminder = reminder
+        if self.config_watcher is not None:
+            self.config_watcher.add(reminder)
+        self.socket_path = DAEMON_CONFIG['socket_path'] if socket_path is None else socket_path
+
+        self.server = None
+        self._control_lock = threading.Lock()
+
+        # Cache hasil encode respons query: {perintah: (objek snapshot, bytes)}
+        self._encoded = {}
+
+        self._commands = {
+            'next': self._cmd_next,
+            'status': self._cmd_status,
+            'update': self._cmd_update,
+            'import': self._cmd_import,
+            'ping': self._cmd_ping,
+            'stop': self._cmd_stop
+        }
+
+    def _encode_cached(self, command, value):
+        """
+        Respons untuk snapshot status; di-encode ulang hanya jika snapshot berganti.
+        """
+        cached = self._encoded.get(command)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        data = encode_response(True, value)
+        self._encoded[command] = (value, data)
+        return data
+
+    def _cmd_next(self, argument):
+        return self._encode_cached('next', self.reminder.get_next_prayer_info())
+
+    def _cmd_status(self, argument):
+        return encode_response(True, self.reminder.get_system_status())
+
+    def _cmd_ping(self, argument):
+        return encode_response(True, 'pong')
+
+    def _cmd_update(self, argument):
+        try:
+            sholat_index, hour, minute = (int(value) for value in argument.split())
+        except ValueError:
+            return encode_response(False, "Format: update <indeks> <jam> <menit>")
+
+        with self._control_lock:
+            updated = self.reminder.update_sholat_time(sholat_index, hour, minute)
+        if not updated:
+            return encode_response(False, "Update waktu gagal")
+        return encode_response(True, self.reminder.get_next_prayer_info())
+
+    def _cmd_import(self, argument):
+        try:
+            schedule_data = json.loads(argument)
+        except ValueError as e:
+            return encode_response(False, f"JSON tidak valid: {e}")
+        if not isinstance(schedule_data, dict):
+            return encode_response(False, "Data import harus berupa object JSON")
+
+        # import_schedule menghentikan reminder; jalankan lagi setelahnya
+        with self._control_lock:
+            was_running = self.reminder.is_running
+            imported = self.reminder.import_schedule(schedule_data)
+            restarted = True
+            if was_running and not self.reminder.is_running:
+                restarted = self.reminder.start_reminder()
+        if not imported:
+            return encode_response(False, "Import jadwal gagal")
+        if not restarted:
+            return encode_response(False, "Jadwal diimport, tetapi reminder tidak dapat "
+                                          "dimulai lagi (tidak ada sholat yang akan datang)")
+        return encode_response(True, self.reminder.get_next_prayer_info())
+
+    def _cmd_stop(self, argument):
+        # shutdown() menunggu serve_forever selesai, jadi dipanggil dari thread lain
+        threading.Thread(target=self.stop, daemon=True).start()
+        return encode_response(True, 'stopping')
+
+    def handle_command(self, line):
+        """
+        Menjalankan satu baris perintah.
+
+        Args:
+            line (str): Perintah dan argumennya
+
+        Returns:
+            bytes: Baris respons JSON
+        """
+        command, _, argument = line.partition(' ')
+        handler = self._commands.get(command.lower())
+        if handler is None:
+            return encode_response(False, f"Perintah tidak dikenal: {command}")
+
+        try:
+            return handler(argument.strip())
+        except Exception as e:
+            return encode_response(False, str(e))
+
+    def _bind(self):
+        """
+        Membuat server pada socket_path. Socket lama yang tidak dipakai
+        (sisa daemon yang mati) dihapus; socket yang masih melayani
+        dianggap daemon lain yang sedang berjalan.
+        """
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                os.unlink(self.socket_path)
+            else:
+                raise RuntimeError(f"Daemon sudah berjalan di {self.socket_path}")
+            finally:
+                probe.close()
+
+        server = _UnixServer(self.socket_path, _RequestHandler)
+        os.chmod(self.socket_path, DAEMON_CONFIG['socket_mode'])
+        server.reminder_daemon = self
+        self.server = server
+
+    def serve_forever(self):
+        """
+        Memulai reminder lalu melayani client sampai stop() dipanggil.
+
+        Raises:
+            RuntimeError: Jika daemon lain sudah berjalan atau reminder tidak
+                dapat dimulai
+        """
+        self._bind()
+        if not self.reminder.start_reminder():
+            # Tanpa reminder aktif daemon tidak berguna: lepas socket lalu gagal
+            self.server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self.server = None
+            raise RuntimeError("Reminder tidak dapat dimulai (jadwal kosong atau tidak valid)")
+        if self.config_watcher is not None:
+            self.config_watcher.start()
+        print(f"🔌 Daemon reminder mendengarkan di {self.socket_path}")
+
+        try:
+            self.server.serve_forever()
+        finally:
+            if self.config_watcher is not None:
+                self.config_watcher.stop()
+            self.reminder.stop_reminder()
+            self.server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def stop(self):
+        """
+        Menghentikan server (serve_forever kembali setelah request yang berjalan).
+        """
+        if self.server is not None:
+            self.server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Daemon reminder sholat (Unix socket)")
+    parser.add_argument('--socket', help="Path Unix socket (default DAEMON_CONFIG['socket_path'])")
+    args = parser.parse_args()
+
+    daemon = ReminderDaemon(socket_path=args.socket)
+
+    # SIGTERM (misal dari systemd) menghentikan daemon dengan rapi
+    signal.signal(signal.SIGTERM,
+                  lambda signum, frame: threading.Thread(target=daemon.stop, daemon=True).start())
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except (RuntimeError, OSError) as e:
+        print(f"❌ Daemon gagal dijalankan: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
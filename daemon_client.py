@@ -0,0 +1,135 @@
+# daemon_client.py
+# File berisi client untuk daemon reminder sholat (Unix socket)
+
+"""
+Client ringan untuk daemon.py: tidak membuat SholatReminder sendiri,
+cukup mengirim perintah lewat Unix socket.
+
+Contoh:
+    python daemon_client.py next
+    python daemon_client.py status
+    python daemon_client.py update 1 11 55
+    python daemon_client.py import jadwal_sholat_20250101.json
+    python daemon_client.py import jadwal_2025.ptt Jakarta
+    python daemon_client.py stop
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+from config import DAEMON_CONFIG
+
+
+class DaemonClient:
+    """
+    Koneksi persisten ke daemon; satu koneksi bisa dipakai untuk banyak request.
+    """
+
+    def __init__(self, socket_path=None, timeout=5):
+        """
+        Args:
+            socket_path (str, optional): Path socket. Default DAEMON_CONFIG['socket_path']
+            timeout (float): Batas waktu koneksi dan respons (detik)
+        """
+        self.socket_path = DAEMON_CONFIG['socket_path'] if socket_path is None else socket_path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(self.socket_path)
+        self._reader = self._socket.makefile('rb')
+
+    def request(self, line):
+        """
+        Mengirim satu perintah dan menunggu respons.
+
+        Args:
+            line (str): Perintah, contoh 'next' atau 'update 1 11 55'
+
+        Returns:
+            Hasil perintah (sudah di-decode dari JSON)
+
+        Raises:
+            RuntimeError: Jika daemon mengembalikan error
+            ConnectionError: Jika koneksi ditutup daemon
+        """
+        self._socket.sendall(line.encode('utf-8') + b"\n")
+        response = self._reader.readline()
+        if not response:
+            raise ConnectionError("Koneksi ditutup oleh daemon")
+
+        body = json.loads(response)
+        if not body['ok']:
+            raise RuntimeError(body['error'])
+        return body['result']
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def build_import_data(filename, location=None):
+    """
+    Membuat data import dari file, dengan aturan yang sama seperti menu import.
+    Path dijadikan absolut karena daemon membaca file dari direktori kerjanya sendiri.
+
+    Args:
+        filename (str): File JSON, file export massal (.jsonl/.csv/.ics) atau timetable (.ptt)
+        location (str, optional): Nama lokasi (timetable/export massal)
+
+    Returns:
+        dict: Data untuk SholatReminder.import_schedule
+    """
+    from schedule_io import STREAM_FORMATS
+    from timetable_store import TIMETABLE_EXTENSION
+
+    path = os.path.abspath(filename)
+    if filename.endswith(TIMETABLE_EXTENSION):
+        if not location:
+            raise ValueError("Timetable membutuhkan nama lokasi")
+        return {'timetable': path, 'location': location}
+    if filename.lower().endswith(tuple(f".{fmt}" for fmt in STREAM_FORMATS)):
+        return {'records': path, 'location': location}
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Client daemon reminder sholat")
+    parser.add_argument('--socket', help="Path Unix socket (default DAEMON_CONFIG['socket_path'])")
+    parser.add_argument('command', choices=['next', 'status', 'update', 'import', 'ping', 'stop'])
+    parser.add_argument('args', nargs='*')
+    args = parser.parse_args()
+
+    line = args.command
+    if args.command == 'update':
+        line = f"update {' '.join(args.args)}"
+    elif args.command == 'import':
+        if not args.args:
+            parser.error("import membutuhkan nama file")
+        location = args.args[1] if len(args.args) > 1 else None
+        line = f"import {json.dumps(build_import_data(args.args[0], location))}"
+
+    try:
+        with DaemonClient(args.socket) as client:
+            result = client.request(line)
+    except (OSError, ConnectionError) as e:
+        print(f"❌ Tidak bisa terhubung ke daemon: {e}")
+        sys.exit(2)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
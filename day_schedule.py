@@ -0,0 +1,201 @@
+# day_schedule.py
+# File berisi representasi jadwal harian yang ringkas
+
+"""
+File ini berisi class DaySchedule: jadwal sholat satu hari yang disimpan
+sebagai array('H') menit sejak tengah malam, dengan nama sholat disimpan
+sebagai indeks kecil ke tabel nama (SHOLAT_NAMES). Objek datetime hanya
+dibuat saat dibutuhkan untuk tampilan; perbandingan waktu memakai
+epoch UTC integer yang dihitung sekali per hari untuk zona jadwal
+(lihat zones.py), sehingga jadwal dari zona berbeda bisa dibandingkan
+langsung.
+"""
+
+import bisect
+import datetime
+from array import array
+
+from config import SHOLAT_NAMES
+from zones import day_epochs, midnight_epoch
+
+# Tabel nama sholat yang di-intern: indeks kecil -> nama
+_NAME_TABLE = list(SHOLAT_NAMES)
+_NAME_INDEX = {name: i for i, name in enumerate(_NAME_TABLE)}
+
+# Indeks nama untuk urutan default, dipakai bersama oleh semua jadwal
+_DEFAULT_NAME_INDEXES = bytes(range(len(SHOLAT_NAMES)))
+
+
+def intern_name(sholat_name):
+    """
+    Mendapatkan indeks kecil untuk nama sholat (nama baru ditambahkan ke tabel).
+
+    Args:
+        sholat_name (str): Nama sholat
+
+    Returns:
+        int: Indeks nama
+    """
+    index = _NAME_INDEX.get(sholat_name)
+    if index is None:
+        if len(_NAME_TABLE) >= 256:
+            raise ValueError("Tabel nama sholat penuh (maks 256 nama)")
+        index = len(_NAME_TABLE)
+        _NAME_TABLE.append(sholat_name)
+        _NAME_INDEX[sholat_name] = index
+    return index
+
+
+class DaySchedule:
+    """
+    Jadwal sholat satu hari.
+
+    Menggunakan:
+    - array('H') untuk menit sejak tengah malam per sholat (waktu dinding)
+    - bytes berisi indeks nama ke tabel nama yang di-intern
+    - array('q') epoch UTC waktu fire per sholat, dihitung saat jadwal
+      dibuat/diubah dengan batas hari zona yang di-cache
+    - salinan epoch terurut (dibuat saat dibutuhkan) untuk pencarian bisect
+
+    Elemen dapat diakses seperti list tuple (nama_sholat, datetime);
+    tuple tersebut dibuat saat diakses (datetime waktu dinding di zona jadwal).
+    """
+
+    __slots__ = ('date', 'minutes', 'name_indexes', 'zone', 'midnight', 'epochs',
+                 '_sorted_epochs')
+
+    def __init__(self, date_obj, minutes=(), name_indexes=None, zone=None):
+        """
+        Args:
+            date_obj (date): Tanggal jadwal
+            minutes (iterable): Menit sejak tengah malam per sholat
+            name_indexes (bytes, optional): Indeks nama per sholat.
+                Default urutan SHOLAT_NAMES
+            zone (ZoneInfo, optional): Zona waktu jadwal. Default waktu lokal sistem
+        """
+        self.date = date_obj
+        self.minutes = array('H', minutes)
+        if name_indexes is None:
+            name_indexes = _DEFAULT_NAME_INDEXES[:len(self.minutes)]
+        self.name_indexes = name_indexes
+        self.zone = zone
+
+        # Epoch UTC tengah malam dan waktu fire setiap sholat di zona jadwal
+        self.midnight = midnight_epoch(zone, date_obj)
+        self.epochs = array('q', day_epochs(zone, date_obj, self.minutes))
+
+        # Epoch terurut untuk bisect; None = perlu dibuat ulang
+        self._sorted_epochs = None
+
+    @classmethod
+    def from_times(cls, date_obj, prayer_times, sholat_names=None, zone=None):
+        """
+        Membuat jadwal dari daftar [jam, menit].
+
+        Args:
+            date_obj (date): Tanggal jadwal
+            prayer_times (list): Waktu dalam format [[jam, menit], ...]
+            sholat_names (list, optional): Nama sholat. Default SHOLAT_NAMES
+            zone (ZoneInfo, optional): Zona waktu jadwal. Default waktu lokal sistem
+
+        Returns:
+            DaySchedule: Jadwal baru
+        """
+        minutes = [hour * 60 + minute for hour, minute in prayer_times]
+        if sholat_names is None or list(sholat_names) == _NAME_TABLE[:len(minutes)]:
+            return cls(date_obj, minutes, zone=zone)
+        return cls(date_obj, minutes, bytes(intern_name(name) for name in sholat_names), zone)
+
+    def __len__(self):
+        return len(self.minutes)
+
+    def __getitem__(self, index):
+        return self.name(index), self.datetime_at(index)
+
+    def __iter__(self):
+        for index in range(len(self.minutes)):
+            yield self[index]
+
+    def name(self, index):
+        """
+        Nama sholat pada indeks tertentu.
+        """
+        return _NAME_TABLE[self.name_indexes[index]]
+
+    def datetime_at(self, index):
+        """
+        Membuat objek datetime waktu sholat (untuk tampilan). Aware (tzinfo
+        = zona jadwal) jika jadwal punya zona, naive untuk waktu lokal sistem.
+        """
+        minute = self.minutes[index]
+        return datetime.datetime.combine(self.date, datetime.time(minute // 60, minute % 60),
+                                         tzinfo=self.zone)
+
+    def timestamp(self, index):
+        """
+        Epoch UTC (detik, integer) waktu sholat pada indeks tertentu.
+        """
+        return self.epochs[index]
+
+    def _set_minute(self, index, minute):
+        self.minutes[index] = minute
+        self.epochs[index] = day_epochs(self.zone, self.date, (minute,))[0]
+        self._sorted_epochs = None
+
+    def set_time(self, index, hour, minute):
+        """
+        Mengubah waktu sholat pada indeks tertentu.
+
+        Args:
+            index (int): Indeks sholat
+            hour (int): Jam (0-23)
+            minute (int): Menit (0-59)
+        """
+        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+            raise ValueError(f"Waktu tidak valid: {hour}:{minute}")
+        self._set_minute(index, hour * 60 + minute)
+
+    def append(self, sholat_name, hour, minute):
+        """
+        Menambahkan satu waktu sholat di akhir jadwal.
+
+        Args:
+            sholat_name (str): Nama sholat
+            hour (int): Jam (0-23)
+            minute (int): Menit (0-59)
+        """
+        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+            raise ValueError(f"Waktu tidak valid: {hour}:{minute}")
+        self.name_indexes = self.name_indexes + bytes((intern_name(sholat_name),))
+        self.minutes.append(0)
+        self.epochs.append(0)
+        self._set_minute(len(self.minutes) - 1, hour * 60 + minute)
+
+    def upcoming_indexes(self, now_timestamp):
+        """
+        Indeks sholat yang waktunya belum lewat, diurutkan berdasarkan waktu.
+
+        Args:
+            now_timestamp (float): Timestamp saat ini
+
+        Returns:
+            list: Indeks sholat
+        """
+        upcoming = [i for i, epoch in enumerate(self.epochs) if epoch > now_timestamp]
+        upcoming.sort(key=self.epochs.__getitem__)
+        return upcoming
+
+    def passed_count(self, now_timestamp):
+        """
+        Jumlah sholat yang waktunya sudah lewat (atau tepat sekarang).
+        Dicari dengan bisect pada epoch terurut (O(log n)).
+
+        Args:
+            now_timestamp (float): Timestamp saat ini
+
+        Returns:
+            int: Jumlah sholat yang sudah lewat
+        """
+        if self._sorted_epochs is None:
+            self._sorted_epochs = sorted(self.epochs)
+        return bisect.bisect_right(self._sorted_epochs, now_timestamp)
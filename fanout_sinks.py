@@ -0,0 +1,402 @@
+# fanout_sinks.py
+# File berisi sink notifikasi fan-out ke banyak penerima dengan batching dan koneksi keep-alive
+
+"""
+File ini berisi sink untuk mengirim setiap reminder ke ribuan penerima:
+
+- FanoutWebhookSink : HTTP POST ke endpoint webhook, satu request per batch
+                      penerima: {"sholat", "time", "message", "recipients": [...]}
+                      (+ "subscribers" untuk notifikasi gabungan)
+- FanoutQueueSink   : publish ke broker gaya message queue lewat TCP.
+                      Protokol per batch: baris "PUB <n>", n baris JSON
+                      (satu pesan per penerima), lalu broker membalas
+                      "OK <n>" (atau "ERR <alasan>" untuk dicoba ulang)
+
+Keduanya turunan BatchingSink: send() hanya memecah daftar penerima
+menjadi batch (FANOUT_CONFIG['batch_size']) dan memasukkannya ke queue
+terbatas milik sink, sehingga worker NotificationDispatcher tidak
+menunggu jaringan. Thread pengirim sink (FANOUT_CONFIG['connections'])
+masing-masing memegang satu koneksi keep-alive yang dipakai ulang untuk
+semua batch (pool koneksi). Batch yang gagal dicoba ulang paling banyak
+max_retries kali dengan backoff eksponensial + full jitter; koneksi
+dibuka ulang setelah error.
+
+Metrik: latensi delivery (dari submit notifikasi sampai batch diterima
+endpoint), jumlah delivery, retry dan kegagalan (lihat metrics.py).
+"""
+
+import http.client
+import json
+import queue
+import random
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+import metrics
+from config import FANOUT_CONFIG
+from notification_dispatch import NotificationSink
+
+
+class DeliveryError(Exception):
+    """
+    Error pengiriman batch.
+
+    Attributes:
+        retryable (bool): True jika batch boleh dicoba ulang
+    """
+
+    def __init__(self, message, retryable=True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def read_recipients(path):
+    """
+    Membaca daftar penerima (satu ID per baris, baris kosong dilewati).
+
+    Args:
+        path (str): Path file penerima
+
+    Returns:
+        list: ID penerima
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+class BatchingSink(NotificationSink):
+    """
+    Dasar sink fan-out: batching penerima, pool koneksi dan retry.
+    Subclass mengimplementasikan _connect() dan _deliver(connection, job, recipients).
+
+    Menggunakan:
+    - Queue batch terbatas (backpressure ke send)
+    - Thread pengirim, masing-masing dengan satu koneksi keep-alive
+    """
+
+    name = 'fanout'
+
+    def __init__(self, recipients, batch_size=None, connections=None, max_retries=None,
+                 timeout=None):
+        """
+        Args:
+            recipients (list): ID penerima
+            batch_size (int, optional): Penerima per batch. Default FANOUT_CONFIG['batch_size']
+            connections (int, optional): Jumlah koneksi/thread pengirim.
+                Default FANOUT_CONFIG['connections']
+            max_retries (int, optional): Batas percobaan ulang per batch.
+                Default FANOUT_CONFIG['max_retries']
+            timeout (float, optional): Batas waktu send() menunggu queue batch
+                dan batas waktu I/O per request (detik)
+        """
+        super().__init__(timeout)
+        self.recipients = list(recipients)
+        self.batch_size = FANOUT_CONFIG['batch_size'] if batch_size is None else batch_size
+        self.connection_count = (FANOUT_CONFIG['connections']
+                                 if connections is None else connections)
+        self.max_retries = FANOUT_CONFIG['max_retries'] if max_retries is None else max_retries
+        self.backoff = FANOUT_CONFIG['retry_backoff']
+        self.backoff_max = FANOUT_CONFIG['retry_backoff_max']
+
+        self._batches = queue.Queue(maxsize=FANOUT_CONFIG['queue_size'])
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'batches': 0,
+            'delivered': 0,
+            'failed': 0,
+            'retries': 0,
+            'dropped': 0,
+            'reconnects': 0
+        }
+
+        self._senders = []
+        self._senders_lock = threading.Lock()
+
+    def _start_senders(self):
+        """
+        Memulai thread pengirim saat send() pertama (atau setelah close()).
+        """
+        with self._senders_lock:
+            if self._senders:
+                return
+            self._stopping.clear()
+            for _ in range(self.connection_count):
+                sender = threading.Thread(target=self._sender_loop, daemon=True)
+                sender.start()
+                self._senders.append(sender)
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def send(self, job, timeout):
+        """
+        Memecah daftar penerima sink menjadi batch dan memasukkannya ke
+        queue sink. Penerima job gabungan (job['recipients']) adalah
+        subscriber_id engine, bukan tujuan fan-out, sehingga tidak
+        menggantikan daftar penerima sink. Batch yang tidak muat dalam batas
+        waktu dibuang (dicatat 'dropped').
+        """
+        self._start_senders()
+        recipients = self.recipients
+        deadline = time.monotonic() + timeout
+        for start in range(0, len(recipients), self.batch_size):
+            batch = (job, recipients[start:start + self.batch_size])
+            try:
+                self._batches.put(batch, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                dropped = len(recipients) - start
+                self._count('dropped', dropped)
+                raise DeliveryError(f"Queue batch {self.name} penuh, {dropped} delivery dibuang")
+
+    def _connect(self):
+        """
+        Membuka satu koneksi ke endpoint.
+        """
+        raise NotImplementedError
+
+    def _deliver(self, connection, job, recipients):
+        """
+        Mengirim satu batch lewat koneksi.
+
+        Raises:
+            DeliveryError, OSError, http.client.HTTPException: Jika gagal
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _close(connection):
+        if connection is not None:
+            try:
+                connection.close()
+            except OSError:
+                pass
+
+    def _sender_loop(self):
+        """
+        Thread function pengirim: satu koneksi keep-alive untuk semua batch.
+        """
+        connection = None
+        while True:
+            batch = self._batches.get()
+            if batch is None:
+                break
+            job, recipients = batch
+
+            delivered = False
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    # Full jitter: acak antara 0 dan backoff eksponensial
+                    self._count('retries')
+                    metrics.DELIVERY_RETRIES.inc()
+                    delay = random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt))
+                    if self._stopping.wait(delay):
+                        break
+                try:
+                    if connection is None:
+                        connection = self._connect()
+                        self._count('reconnects')
+                    self._deliver(connection, job, recipients)
+                except (DeliveryError, OSError, http.client.HTTPException) as e:
+                    # Koneksi mungkin rusak; buka ulang pada percobaan berikutnya
+                    self._close(connection)
+                    connection = None
+                    if isinstance(e, DeliveryError) and not e.retryable:
+                        break
+                    continue
+                delivered = True
+                break
+
+            if not delivered:
+                self._fail(job, recipients)
+                continue
+
+            latency = time.monotonic() - job['submitted_at']
+            metrics.DELIVERY_LATENCY.observe(latency, len(recipients))
+            metrics.DELIVERIES.inc(len(recipients))
+            with self._stats_lock:
+                self.stats['batches'] += 1
+                self.stats['delivered'] += len(recipients)
+
+        self._close(connection)
+
+    def _fail(self, job, recipients):
+        self._count('failed', len(recipients))
+        metrics.DELIVERY_FAILURES.inc(len(recipients))
+        print(f"❌ Sink {self.name}: {len(recipients)} delivery {job['sholat_name']} gagal")
+
+    def pending_batches(self):
+        """
+        Returns:
+            int: Batch yang menunggu di queue sink
+        """
+        return self._batches.qsize()
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Statistik delivery sink ini
+        """
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['pending_batches'] = self.pending_batches()
+        return stats
+
+    def _drop_pending(self):
+        """
+        Membuang batch yang masih di queue (dicatat 'dropped').
+        """
+        dropped = 0
+        while True:
+            try:
+                batch = self._batches.get_nowait()
+            except queue.Empty:
+                break
+            if batch is not None:
+                dropped += len(batch[1])
+        if dropped:
+            self._count('dropped', dropped)
+            print(f"⚠️  Sink {self.name}: {dropped} delivery dibuang saat close")
+
+    def close(self, timeout=5):
+        """
+        Mengirim batch yang tersisa (tanpa retry) lalu menghentikan thread
+        pengirim. Jika queue batch masih penuh setelah timeout, sisa batch
+        dibuang agar close() tidak tertahan.
+
+        Args:
+            timeout (float): Batas waktu menunggu setiap thread (detik)
+        """
+        with self._senders_lock:
+            senders, self._senders = self._senders, []
+        # Set sebelum join: thread yang sedang menunggu backoff langsung
+        # bangun dan batch berikutnya tidak dicoba ulang
+        self._stopping.set()
+
+        deadline = time.monotonic() + timeout
+        for _ in senders:
+            try:
+                self._batches.put(None, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                self._drop_pending()
+                self._batches.put_nowait(None)
+        for sender in senders:
+            sender.join(timeout=timeout)
+
+
+class FanoutWebhookSink(BatchingSink):
+    """
+    Fan-out ke endpoint webhook HTTP(S): satu POST JSON per batch penerima.
+    Status 2xx = berhasil; 429 dan 5xx dicoba ulang; status lain tidak.
+    """
+
+    name = 'fanout_webhook'
+
+    def __init__(self, url, recipients, **options):
+        """
+        Args:
+            url (str): URL endpoint webhook (http:// atau https://)
+            recipients (list): ID penerima
+            **options: batch_size, connections, max_retries, timeout (lihat BatchingSink)
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"URL webhook harus http/https: {url}")
+        self.url = url
+        self._https = parts.scheme == 'https'
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        super().__init__(recipients, **options)
+
+    def _connect(self):
+        connection_class = (http.client.HTTPSConnection if self._https
+                            else http.client.HTTPConnection)
+        return connection_class(self._host, self._port, timeout=self.timeout)
+
+    def _deliver(self, connection, job, recipients):
+        body = {
+            'sholat': job['sholat_name'],
+            'time': job['sholat_time'].isoformat(),
+            'message': job['message'],
+            'recipients': recipients
+        }
+        if job.get('recipients') is not None:
+            # Subscriber notifikasi gabungan, terpisah dari tujuan fan-out
+            body['subscribers'] = job['recipients']
+        body = json.dumps(body, ensure_ascii=False).encode('utf-8')
+
+        connection.request('POST', self._path, body, {
+            'Content-Type': 'application/json; charset=utf-8',
+            'Connection': 'keep-alive'
+        })
+        response = connection.getresponse()
+        response.read()
+
+        if response.status >= 300:
+            retryable = response.status == 429 or response.status >= 500
+            raise DeliveryError(f"HTTP {response.status}", retryable)
+        if response.will_close:
+            connection.close()
+
+
+class FanoutQueueSink(BatchingSink):
+    """
+    Fan-out ke broker gaya message queue lewat TCP (tcp://host:port).
+    Setiap penerima menjadi satu pesan JSON; satu batch di-ack sekaligus.
+    """
+
+    name = 'fanout_queue'
+
+    def __init__(self, url, recipients, **options):
+        """
+        Args:
+            url (str): Alamat broker, misal 'tcp://127.0.0.1:5673'
+            recipients (list): ID penerima
+            **options: batch_size, connections, max_retries, timeout (lihat BatchingSink)
+        """
+        parts = urlsplit(url)
+        if parts.scheme != 'tcp' or parts.port is None:
+            raise ValueError(f"Alamat broker harus tcp://host:port: {url}")
+        self.url = url
+        self._address = (parts.hostname, parts.port)
+        super().__init__(recipients, **options)
+
+    def _connect(self):
+        sock = socket.create_connection(self._address, timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return _QueueConnection(sock)
+
+    def _deliver(self, connection, job, recipients):
+        # Bagian pesan yang sama untuk semua penerima di-encode sekali
+        tail = json.dumps({
+            'sholat': job['sholat_name'],
+            'time': job['sholat_time'].isoformat(),
+            'message': job['message']
+        }, ensure_ascii=False)[1:]
+        lines = [f"PUB {len(recipients)}\n"]
+        lines.extend(f'{{"recipient":{json.dumps(recipient)},{tail}\n' for recipient in recipients)
+        connection.sock.sendall(''.join(lines).encode('utf-8'))
+
+        reply = connection.reader.readline()
+        if not reply:
+            raise DeliveryError("Koneksi broker tertutup")
+        if reply.strip() != f"OK {len(recipients)}".encode('ascii'):
+            raise DeliveryError(f"Broker menolak batch: {reply.strip().decode('utf-8', 'replace')}")
+
+
+class _QueueConnection:
+    """
+    Koneksi TCP ke broker beserta reader baris untuk ack.
+    """
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.reader = sock.makefile('rb')
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
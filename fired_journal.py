@@ -0,0 +1,429 @@
+# fired_journal.py
+# File berisi journal append-only reminder yang sudah fire, dengan snapshot berkala
+
+"""
+File ini berisi FiredJournal: catatan tahan-crash tentang reminder yang
+sudah diproses, agar restart tidak mengirim ulang reminder yang sudah
+fire dan reminder yang terlewat selama program mati bisa dikejar.
+
+Format journal: satu baris teks per kejadian, ditulis (dan di-fsync)
+sebelum notifikasi dikirim:
+
+    <jenis> <subscriber> <ordinal tanggal> <indeks sholat> <timestamp>
+
+Jenis: F = fire, M = terlewat (dilewati), C = dikejar setelah restart,
+S = penanda hidup (start, pergantian hari, stop) dengan indeks -1.
+Subscriber ditulis ter-escape (urllib.parse.quote, tanpa spasi); '*' =
+subscriber default (reminder tanpa subscriber_id). Baris format lama
+tanpa kolom subscriber dibaca sebagai subscriber default.
+
+Satu journal dipakai bersama oleh semua subscriber di path yang sama
+(open_journal). Reminder yang jatuh tempo dalam satu tick engine ditulis
+sebagai satu group commit (batch): semua baris ditulis, satu flush dan
+satu fsync, baru kemudian notifikasinya dikirim (after_commit).
+
+Setiap JOURNAL_CONFIG['snapshot_every'] baris, seluruh isi journal
+diringkas ke file snapshot (JSON, ditulis atomik lewat os.replace) lalu
+journal dikosongkan. Recovery = baca snapshot + baca ulang sisa journal;
+replay bersifat idempoten, jadi crash di antara penulisan snapshot dan
+pengosongan journal tidak merusak apa pun. Baris terakhir yang terpotong
+(crash saat menulis) dibuang.
+"""
+
+import contextlib
+import datetime
+import json
+import os
+import threading
+import time
+from urllib.parse import quote
+
+from config import JOURNAL_CONFIG
+
+# Kode jenis kejadian di journal <-> status
+_KIND_TO_STATUS = {b'F': 'fired', b'M': 'missed', b'C': 'caught_up'}
+_STATUS_TO_KIND = {status: kind.decode('ascii') for kind, status in _KIND_TO_STATUS.items()}
+_ALIVE = 'S'
+
+# Subscriber default (reminder tanpa subscriber_id); '*' selalu di-escape
+# oleh quote sehingga tidak bentrok dengan ID subscriber mana pun
+DEFAULT_SUBSCRIBER = '*'
+
+_SNAPSHOT_VERSION = 2
+
+
+def subscriber_key(subscriber_id):
+    """
+    Kunci subscriber di journal.
+
+    Args:
+        subscriber_id (hashable, optional): ID subscriber; None = subscriber default
+
+    Returns:
+        str: ID ter-escape tanpa spasi (ID int dan str yang sama menjadi satu kunci)
+    """
+    if subscriber_id is None:
+        return DEFAULT_SUBSCRIBER
+    return quote(str(subscriber_id), safe='')
+
+
+class FiredJournal:
+    """
+    Journal reminder yang sudah diproses, dipakai bersama banyak subscriber.
+
+    Menggunakan:
+    - File teks append-only untuk kejadian baru
+    - File snapshot JSON untuk ringkasan kejadian lama
+    - Dictionary (subscriber, ordinal tanggal, indeks sholat) -> status di memori
+    """
+
+    def __init__(self, path, snapshot_every=None, fsync=None, retention_days=None):
+        """
+        Membuka journal dan memulihkan isinya (snapshot + sisa journal).
+
+        Args:
+            path (str): Path file journal; snapshot disimpan di path + '.snapshot'
+            snapshot_every (int, optional): Jumlah baris journal sebelum
+                snapshot dibuat. Default JOURNAL_CONFIG['snapshot_every']
+            fsync (bool, optional): fsync setiap commit. Default JOURNAL_CONFIG['fsync']
+            retention_days (int, optional): Umur entri (hari) yang disimpan di
+                snapshot. Default JOURNAL_CONFIG['retention_days']
+        """
+        self.path = path
+        self.snapshot_path = path + '.snapshot'
+        self.snapshot_every = (JOURNAL_CONFIG['snapshot_every']
+                               if snapshot_every is None else snapshot_every)
+        self.fsync = JOURNAL_CONFIG['fsync'] if fsync is None else fsync
+        self.retention_days = (JOURNAL_CONFIG['retention_days']
+                               if retention_days is None else retention_days)
+
+        # Format: {(subscriber, ordinal tanggal, indeks sholat): status}
+        self.entries = {}
+
+        # Timestamp kejadian terakhir yang tercatat: seluruh journal dan per
+        # subscriber (None/tidak ada = belum ada riwayat)
+        self.last_seen = None
+        self.subscriber_seen = {}
+
+        # Baris journal sejak snapshot terakhir
+        self.pending_lines = 0
+
+        # Statistik recovery terakhir dan group commit
+        self.recovery_seconds = 0.0
+        self.replayed_lines = 0
+        self.commits = 0
+
+        # RLock: batch() memegang lock selama satu tick engine, sementara
+        # record() dipanggil dari callback di thread yang sama
+        self._lock = threading.RLock()
+        self._file = None
+
+        # Group commit yang sedang berjalan: kedalaman batch, baris yang
+        # belum di-fsync dan aksi yang menunggu commit
+        self._batch_depth = 0
+        self._uncommitted = 0
+        self._after_commit = []
+        self.recover()
+
+    def _load_snapshot(self):
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return
+        except ValueError as e:
+            print(f"⚠️  Snapshot journal rusak dan diabaikan: {e}")
+            return
+
+        version = snapshot.get('version')
+        if version == 1:
+            # Snapshot lama: semua entri milik subscriber default
+            self.last_seen = snapshot['last_seen']
+            if self.last_seen is not None:
+                self.subscriber_seen[DEFAULT_SUBSCRIBER] = self.last_seen
+            for ordinal, index, status in snapshot['entries']:
+                self.entries[(DEFAULT_SUBSCRIBER, ordinal, index)] = status
+            return
+        if version != _SNAPSHOT_VERSION:
+            print(f"⚠️  Versi snapshot journal tidak dikenal: {version}")
+            return
+
+        self.last_seen = snapshot['last_seen']
+        self.subscriber_seen.update(snapshot['subscriber_seen'])
+        for subscriber, ordinal, index, status in snapshot['entries']:
+            self.entries[(subscriber, ordinal, index)] = status
+
+    def _replay(self, data):
+        """
+        Menerapkan baris-baris journal ke memori. Baris yang rusak dilewati.
+
+        Returns:
+            int: Jumlah baris yang diterapkan
+        """
+        entries = self.entries
+        subscriber_seen = self.subscriber_seen
+        last_seen = self.last_seen
+        applied = 0
+
+        for line in data.split(b'\n'):
+            fields = line.split()
+            if len(fields) == 4:
+                fields.insert(1, DEFAULT_SUBSCRIBER.encode('ascii'))
+            try:
+                kind, subscriber, ordinal, index, timestamp = fields
+                timestamp = float(timestamp)
+            except ValueError:
+                continue
+
+            subscriber = subscriber.decode('ascii', 'replace')
+            status = _KIND_TO_STATUS.get(kind)
+            if status is not None:
+                entries[(subscriber, int(ordinal), int(index))] = status
+            if timestamp > subscriber_seen.get(subscriber, timestamp - 1):
+                subscriber_seen[subscriber] = timestamp
+            if last_seen is None or timestamp > last_seen:
+                last_seen = timestamp
+            applied += 1
+
+        self.last_seen = last_seen
+        return applied
+
+    def recover(self):
+        """
+        Memuat ulang isi journal dari disk (dipanggil saat dibuka).
+        """
+        start = time.perf_counter()
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self.entries = {}
+            self.last_seen = None
+            self.subscriber_seen = {}
+            self._load_snapshot()
+
+            try:
+                with open(self.path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = b''
+
+            # Buang baris terakhir yang terpotong agar append berikutnya
+            # dimulai di baris baru
+            complete = data.rfind(b'\n') + 1
+            if complete < len(data):
+                with open(self.path, 'r+b') as f:
+                    f.truncate(complete)
+                data = data[:complete]
+
+            self.replayed_lines = self._replay(data)
+            self.pending_lines = self.replayed_lines
+            self._file = open(self.path, 'ab')
+
+        self.recovery_seconds = time.perf_counter() - start
+
+    def _append(self, kind, subscriber, ordinal, index, timestamp):
+        """
+        Menulis satu baris ke journal; di luar batch langsung di-commit.
+        Dipanggil dengan lock terpegang.
+        """
+        self._file.write(f"{kind} {subscriber} {ordinal} {index} {timestamp:.3f}\n"
+                         .encode('ascii'))
+
+        if timestamp > self.subscriber_seen.get(subscriber, timestamp - 1):
+            self.subscriber_seen[subscriber] = timestamp
+        if self.last_seen is None or timestamp > self.last_seen:
+            self.last_seen = timestamp
+        self.pending_lines += 1
+        self._uncommitted += 1
+        if not self._batch_depth:
+            self._commit()
+
+    def _commit(self):
+        """
+        Flush + fsync baris yang belum di-commit, lalu snapshot jika journal
+        sudah cukup panjang. Dipanggil dengan lock terpegang.
+        """
+        if self._uncommitted:
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._uncommitted = 0
+            self.commits += 1
+        if self.pending_lines >= self.snapshot_every:
+            self._write_snapshot()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Group commit: semua record() di dalam blok ditulis dengan satu
+        flush dan satu fsync di akhir blok, lalu aksi after_commit
+        dijalankan (di luar lock). Blok boleh bersarang.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                actions = []
+                if not self._batch_depth:
+                    self._commit()
+                    actions, self._after_commit = self._after_commit, []
+        for action in actions:
+            try:
+                action()
+            except Exception as e:
+                print(f"❌ Error setelah commit journal: {e}")
+
+    def after_commit(self, action):
+        """
+        Menjalankan action setelah baris yang sudah ditulis ter-commit: di
+        akhir batch yang sedang berjalan, atau langsung di luar batch.
+
+        Args:
+            action (function): Fungsi tanpa argumen (misal pengiriman notifikasi)
+        """
+        with self._lock:
+            if self._batch_depth:
+                self._after_commit.append(action)
+                return
+        action()
+
+    def record(self, ordinal, index, status, timestamp=None, subscriber=None):
+        """
+        Mencatat reminder yang diproses (sebelum notifikasinya dikirim).
+
+        Args:
+            ordinal (int): Ordinal tanggal jadwal
+            index (int): Indeks sholat
+            status (str): 'fired', 'missed' atau 'caught_up'
+            timestamp (float, optional): Waktu kejadian. Default time.time()
+            subscriber (hashable, optional): ID subscriber. Default subscriber default
+        """
+        kind = _STATUS_TO_KIND[status]
+        subscriber = subscriber_key(subscriber)
+        with self._lock:
+            self.entries[(subscriber, ordinal, index)] = status
+            self._append(kind, subscriber, ordinal, index,
+                         time.time() if timestamp is None else timestamp)
+
+    def mark_alive(self, timestamp=None, subscriber=None):
+        """
+        Mencatat bahwa subscriber hidup pada waktu tertentu. Reminder sebelum
+        waktu ini tidak dianggap terlewat saat restart.
+
+        Args:
+            timestamp (float, optional): Waktu. Default time.time()
+            subscriber (hashable, optional): ID subscriber. Default subscriber default
+        """
+        with self._lock:
+            self._append(_ALIVE, subscriber_key(subscriber), 0, -1,
+                         time.time() if timestamp is None else timestamp)
+
+    def is_processed(self, ordinal, index, subscriber=None):
+        """
+        Returns:
+            bool: True jika reminder subscriber sudah pernah diproses (fire,
+                dilewati atau dikejar)
+        """
+        return (subscriber_key(subscriber), ordinal, index) in self.entries
+
+    def last_seen_for(self, subscriber=None):
+        """
+        Returns:
+            float atau None: Kejadian terakhir subscriber (None = belum ada riwayat)
+        """
+        return self.subscriber_seen.get(subscriber_key(subscriber))
+
+    def _write_snapshot(self):
+        """
+        Menulis snapshot lalu mengosongkan journal. Dipanggil dengan lock terpegang.
+        """
+        # Entri yang lebih tua dari retention_days tidak dibutuhkan lagi
+        # (satu batas untuk seluruh journal, bukan per subscriber)
+        if self.last_seen is not None:
+            newest = datetime.date.fromtimestamp(self.last_seen).toordinal()
+            oldest = newest - self.retention_days
+            self.entries = {key: status for key, status in self.entries.items()
+                            if key[1] >= oldest}
+            oldest_seen = self.last_seen - self.retention_days * 86400
+            self.subscriber_seen = {subscriber: seen
+                                    for subscriber, seen in self.subscriber_seen.items()
+                                    if seen >= oldest_seen}
+
+        snapshot = {
+            'version': _SNAPSHOT_VERSION,
+            'last_seen': self.last_seen,
+            'subscriber_seen': self.subscriber_seen,
+            'entries': [[subscriber, ordinal, index, status]
+                        for (subscriber, ordinal, index), status in self.entries.items()]
+        }
+
+        temp_path = self.snapshot_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        # Isi journal sudah tercakup snapshot
+        self._file.flush()
+        self._file.truncate(0)
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.pending_lines = 0
+
+    def snapshot(self):
+        """
+        Membuat snapshot sekarang (misal sebelum program berhenti).
+        """
+        with self._lock:
+            self._write_snapshot()
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Jumlah entri dan subscriber, baris journal sejak snapshot,
+                jumlah commit (fsync) dan recovery terakhir
+        """
+        return {
+            'entries': len(self.entries),
+            'subscribers': len(self.subscriber_seen),
+            'pending_lines': self.pending_lines,
+            'commits': self.commits,
+            'last_seen': self.last_seen,
+            'recovery_ms': round(self.recovery_seconds * 1000, 3)
+        }
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._commit()
+                self._file.close()
+                self._file = None
+
+
+# Journal yang sudah dibuka: {path: FiredJournal}
+_open_journals = {}
+_open_journals_lock = threading.Lock()
+
+
+def open_journal(path):
+    """
+    Membuka journal (atau memakai ulang objek yang sudah terbuka untuk path
+    yang sama). Semua subscriber di path yang sama berbagi satu file, satu
+    file descriptor dan satu group commit per tick engine.
+
+    Args:
+        path (str): Path file journal
+
+    Returns:
+        FiredJournal: Journal yang sudah dipulihkan
+    """
+    with _open_journals_lock:
+        journal = _open_journals.get(path)
+        if journal is None or journal._file is None:
+            journal = FiredJournal(path)
+            _open_journals[path] = journal
+        return journal
@@ -0,0 +1,511 @@
+# http_api.py
+# File berisi HTTP/JSON API lokal (asyncio, stdlib) untuk sholat berikutnya dan jadwal hari ini
+
+"""
+File ini berisi server HTTP/1.1 kecil di atas asyncio.Protocol (tanpa
+dependensi luar) untuk backend aplikasi:
+
+    GET /next       -> get_next_prayer_info()
+    GET /schedule   -> export_schedule() (jadwal hari ini)
+    GET /health     -> {"status": "ok"}
+
+Parameter lokasi opsional: ?lat=-6.2&lon=106.8&tz=7&elevation=0&method=Kemenag&asr=1
+dan zone=Europe/London untuk zona ber-DST (butuh NumPy untuk perhitungan). Tanpa parameter, dipakai SholatReminder utama.
+
+Respons disimpan sudah ter-serialisasi (header + body dalam bytes) per
+(lokasi, endpoint) dan berlaku selama snapshot status lokasi tersebut sama,
+yaitu sampai batas menit berikutnya atau jadwal berubah. ETag dihitung dari
+isi body; request dengan If-None-Match yang cocok dijawab 304 tanpa body.
+Koneksi keep-alive dan pipelining didukung.
+
+Respons yang belum ada di cache (lokasi baru, menit baru) dihitung di
+thread executor agar event loop tidak tertahan perhitungan jadwal.
+Reminder per lokasi hanya dipakai untuk membaca jadwal: memakai engine
+dan dispatcher milik reminder utama, tanpa thread sendiri, dan disimpan
+dalam LRU berukuran API_CONFIG['max_locations'].
+
+Contoh:
+    python http_api.py --port 8080
+    curl -i http://127.0.0.1:8080/next
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import threading
+from collections import OrderedDict, deque
+from urllib.parse import parse_qsl
+
+from config import API_CONFIG, LOCATION_CONFIG, PRAYER_CACHE_CONFIG
+from zones import get_zone
+
+# Batas ukuran header satu request (bytes)
+_MAX_HEADER_BYTES = 8192
+
+_REASONS = {
+    200: b"OK",
+    304: b"Not Modified",
+    400: b"Bad Request",
+    404: b"Not Found",
+    405: b"Method Not Allowed",
+    431: b"Request Header Fields Too Large",
+    500: b"Internal Server Error"
+}
+
+
+def _response_head(status, body_length, etag=None):
+    """
+    Membuat status line dan header respons.
+
+    Returns:
+        bytes: Header diakhiri baris kosong
+    """
+    lines = [b"HTTP/1.1 %d %s" % (status, _REASONS[status]),
+             b"Content-Type: application/json; charset=utf-8",
+             b"Content-Length: %d" % body_length]
+    if etag is not None:
+        lines.append(b"ETag: " + etag)
+        lines.append(b"Cache-Control: no-cache")
+    return b"\r\n".join(lines) + b"\r\n\r\n"
+
+
+def _error_response(status, message):
+    body = json.dumps({'error': message}).encode('utf-8')
+    return _response_head(status, len(body)), body
+
+
+_HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_RESPONSE = (_response_head(200, len(_HEALTH_BODY)), _HEALTH_BODY)
+
+
+class CachedResponse:
+    """
+    Respons yang sudah ter-serialisasi untuk satu (lokasi, endpoint).
+    """
+
+    __slots__ = ('snapshot', 'etag', 'head', 'body', 'not_modified')
+
+    def __init__(self, snapshot, body):
+        """
+        Args:
+            snapshot (dict): Snapshot status sumber data (penanda kedaluwarsa)
+            body (bytes): Body JSON
+        """
+        self.snapshot = snapshot
+        self.etag = b'"%s"' % hashlib.sha1(body).hexdigest()[:16].encode('ascii')
+        self.body = body
+        self.head = _response_head(200, len(body), self.etag)
+        self.not_modified = (_response_head(304, 0, self.etag), b"")
+
+
+class ScheduleAPI:
+    """
+    Logika API: memilih SholatReminder per lokasi dan menyimpan respons
+    yang sudah ter-serialisasi.
+
+    Menggunakan:
+    - OrderedDict sebagai LRU SholatReminder per lokasi terbulatkan
+    - Dictionary (lokasi, endpoint) -> CachedResponse
+    """
+
+    def __init__(self, reminder=None, max_locations=None):
+        """
+        Args:
+            reminder (SholatReminder, optional): Reminder untuk request tanpa
+                parameter lokasi. Default SholatReminder(quiet=True)
+            max_locations (int, optional): Jumlah lokasi yang disimpan.
+                Default API_CONFIG['max_locations']
+        """
+        from sholat_reminder import SholatReminder
+
+        self._reminder_class = SholatReminder
+        self.reminder = SholatReminder(quiet=True) if reminder is None else reminder
+        self.max_locations = (API_CONFIG['max_locations']
+                              if max_locations is None else max_locations)
+
+        self._locations = OrderedDict()
+        self._responses = {}
+        self._lock = threading.Lock()
+
+        # Perhitungan respons cache miss (di thread executor) diserialkan
+        self._compute_lock = threading.Lock()
+
+        self._endpoints = {
+            '/next': lambda reminder: reminder.get_next_prayer_info(),
+            '/schedule': lambda reminder: reminder.export_schedule()
+        }
+
+    def _location_from_query(self, query):
+        """
+        Membaca lokasi dari query string.
+
+        Returns:
+            tuple: (key lokasi, dict lokasi) atau (None, None) tanpa parameter lokasi
+
+        Raises:
+            ValueError: Jika parameter lokasi tidak valid
+        """
+        params = dict(parse_qsl(query))
+        if 'lat' not in params and 'lon' not in params:
+            return None, None
+
+        latitude = float(params['lat'])
+        longitude = float(params['lon'])
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError("Lintang/bujur di luar jangkauan")
+
+        precision = PRAYER_CACHE_CONFIG['precision']
+        location = {
+            'latitude': round(latitude, precision),
+            'longitude': round(longitude, precision),
+            'elevation': int(round(float(params.get('elevation', 0)), -1)),
+            'timezone': float(params.get('tz', LOCATION_CONFIG['timezone'])),
+            'method': params.get('method', LOCATION_CONFIG['method']),
+            'asr_factor': int(params.get('asr', LOCATION_CONFIG['asr_factor'])),
+            'zone': params.get('zone', LOCATION_CONFIG['zone'])
+        }
+        if location['zone'] is not None:
+            get_zone(location['zone'])
+        key = (location['latitude'], location['longitude'], location['elevation'],
+               location['timezone'], location['method'], location['asr_factor'],
+               location['zone'])
+        return key, location
+
+    def _reminder_for(self, key, location):
+        """
+        SholatReminder untuk lokasi tertentu (dibuat saat pertama diminta).
+        """
+        if key is None:
+            return self.reminder
+
+        with self._lock:
+            reminder = self._locations.get(key)
+            if reminder is not None:
+                self._locations.move_to_end(key)
+                return reminder
+
+        # Reminder lokasi hanya dibaca (tidak pernah dijalankan): engine dan
+        # dispatcher dipinjam dari reminder utama agar tidak membuat sink
+        # dan thread per lokasi. Journal (JOURNAL_CONFIG) hanya untuk reminder utama
+        reminder = self._reminder_class(location=location, quiet=True, journal=False,
+                                        engine=self.reminder.engine,
+                                        dispatcher=self.reminder.dispatcher,
+                                        coalesce=False)
+        with self._lock:
+            self._locations[key] = reminder
+            while len(self._locations) > self.max_locations:
+                old_key, _ = self._locations.popitem(last=False)
+                for path in self._endpoints:
+                    self._responses.pop((old_key, path), None)
+        return reminder
+
+    @staticmethod
+    def _refresh(reminder):
+        """
+        Reminder yang tidak berjalan di engine tidak memajukan queue-nya
+        sendiri; queue dimajukan (tanpa metrik queue monitor) jika sholat
+        berikutnya sudah lewat atau hari sudah berganti.
+        """
+        if reminder.is_running:
+            return
+        next_info = reminder.get_next_prayer_info()
+        if (next_info is None or next_info['is_past']
+                or reminder.today_schedule.date != reminder.local_today()):
+            reminder.refresh_schedule()
+
+    def _parse(self, path, query):
+        """
+        Endpoint dan lokasi dari satu request.
+
+        Returns:
+            tuple: (produce, key, location) atau (None, None, respons error)
+        """
+        produce = self._endpoints.get(path)
+        if produce is None:
+            return None, None, _error_response(404, f"Endpoint tidak dikenal: {path}")
+
+        try:
+            key, location = self._location_from_query(query)
+        except (KeyError, ValueError) as e:
+            return None, None, _error_response(400, f"Parameter lokasi tidak valid: {e}")
+        return produce, key, location
+
+    def lookup_cached(self, path, query):
+        """
+        Respons tanpa perhitungan jadwal (dipanggil di event loop): respons
+        cache yang masih berlaku, /health atau error parameter.
+
+        Args:
+            path (str): Path endpoint
+            query (str): Query string (tanpa '?')
+
+        Returns:
+            CachedResponse/tuple/None: None jika respons harus dihitung (lookup)
+        """
+        if path == '/health':
+            return _HEALTH_RESPONSE
+
+        produce, key, location = self._parse(path, query)
+        if produce is None:
+            return location
+
+        if key is None:
+            reminder = self.reminder
+        else:
+            with self._lock:
+                reminder = self._locations.get(key)
+                if reminder is not None:
+                    self._locations.move_to_end(key)
+            if reminder is None:
+                return None
+
+        # Hanya snapshot yang masih berlaku; menghitung ulang status
+        # (kedaluwarsa tiap menit) dilakukan lookup di executor
+        snapshot = reminder.cached_status()
+        cached = self._responses.get((key, path))
+        if cached is not None and snapshot is not None and cached.snapshot is snapshot:
+            return cached
+        return None
+
+    def lookup(self, path, query):
+        """
+        Respons untuk satu request GET. Cache miss menghitung jadwal, jadi
+        server memanggilnya di thread executor.
+
+        Args:
+            path (str): Path endpoint
+            query (str): Query string (tanpa '?')
+
+        Returns:
+            CachedResponse atau tuple: Respons cache, atau (head, body) untuk error
+        """
+        if path == '/health':
+            return _HEALTH_RESPONSE
+
+        produce, key, location = self._parse(path, query)
+        if produce is None:
+            return location
+
+        with self._compute_lock:
+            try:
+                reminder = self._reminder_for(key, location)
+                snapshot = reminder.status_snapshot()
+                cached = self._responses.get((key, path))
+                if cached is not None and cached.snapshot is snapshot:
+                    return cached
+
+                # Cache miss: paling banyak sekali per menit per (lokasi, endpoint)
+                self._refresh(reminder)
+                snapshot = reminder.status_snapshot()
+                data = produce(reminder)
+            except KeyError as e:
+                return _error_response(404, f"Lokasi tidak ditemukan: {e}")
+            except ValueError as e:
+                return _error_response(400, f"Jadwal lokasi tidak dapat dihitung: {e}")
+
+            body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            cached = CachedResponse(snapshot, body)
+            self._responses[(key, path)] = cached
+            return cached
+
+
+def etag_matches(if_none_match, etag):
+    """
+    Mencocokkan ETag dengan header If-None-Match (daftar entity-tag
+    dipisah koma, '*' cocok dengan apa pun, awalan W/ diabaikan karena
+    If-None-Match memakai perbandingan lemah).
+
+    Args:
+        if_none_match (bytes): Nilai header If-None-Match
+        etag (bytes): ETag respons (dengan tanda kutip)
+
+    Returns:
+        bool: True jika salah satu entity-tag sama persis
+    """
+    for tag in if_none_match.split(b","):
+        tag = tag.strip()
+        if tag == b"*":
+            return True
+        if tag.startswith(b"W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+class _HTTPProtocol(asyncio.Protocol):
+    """
+    Satu koneksi HTTP/1.1: parsing request minimal (GET/HEAD) dan keep-alive.
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self.transport = None
+        self._buffer = b""
+
+        # Respons yang belum dikirim, urut sesuai request (pipelining):
+        # [respons atau None selagi dihitung, close, include_body, if_none_match]
+        self._pending = deque()
+        self._closing = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        self._closing = True
+
+    def data_received(self, data):
+        self._buffer += data
+
+        # Proses semua request lengkap di buffer (mendukung pipelining)
+        while not self._closing:
+            end = self._buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(self._buffer) > _MAX_HEADER_BYTES:
+                    self._respond(_error_response(431, "Header terlalu besar"), close=True)
+                return
+
+            head = self._buffer[:end]
+            self._buffer = self._buffer[end + 4:]
+            if not self._handle(head):
+                return
+
+    def _respond(self, response, close=False, include_body=True, if_none_match=None):
+        """
+        Mengirim respons, atau mengantrekannya di belakang respons yang
+        masih dihitung agar urutan pipelining terjaga.
+        """
+        self._pending.append([response, close, include_body, if_none_match])
+        self._flush()
+
+    def _flush(self):
+        while self._pending and self._pending[0][0] is not None:
+            response, close, include_body, if_none_match = self._pending.popleft()
+            if self.transport.is_closing():
+                self._pending.clear()
+                return
+            self._write(response, close, include_body, if_none_match)
+            if close:
+                self._pending.clear()
+                return
+
+    def _write(self, response, close, include_body, if_none_match):
+        if isinstance(response, CachedResponse):
+            if if_none_match is not None and etag_matches(if_none_match, response.etag):
+                head, body = response.not_modified
+            else:
+                head, body = response.head, response.body
+        else:
+            head, body = response
+        self.transport.write(head + body if include_body else head)
+        if close:
+            self._closing = True
+            self.transport.close()
+
+    def _computed(self, slot, future):
+        """
+        Callback executor: mengisi respons yang selesai dihitung lalu mengirim
+        respons yang sudah siap secara berurutan.
+        """
+        try:
+            slot[0] = future.result()
+        except Exception as e:
+            slot[0] = _error_response(500, str(e))
+        self._flush()
+
+    def _handle(self, head):
+        """
+        Menangani satu request.
+
+        Returns:
+            bool: False jika koneksi ditutup
+        """
+        lines = head.split(b"\r\n")
+        try:
+            method, target, version = lines[0].split(b" ")
+        except ValueError:
+            self._respond(_error_response(400, "Request line tidak valid"), close=True)
+            return False
+
+        if_none_match = None
+        close = version == b"HTTP/1.0"
+        for line in lines[1:]:
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"if-none-match":
+                if_none_match = value.strip()
+            elif name == b"connection":
+                value = value.strip().lower()
+                close = value == b"close" or (close and value != b"keep-alive")
+            elif name == b"content-length" and value.strip() not in (b"", b"0"):
+                self._respond(_error_response(400, "Request body tidak didukung"), close=True)
+                return False
+
+        if method not in (b"GET", b"HEAD"):
+            self._respond(_error_response(405, "Hanya GET dan HEAD"), close=close)
+            return not close
+
+        path, _, query = target.decode('latin-1').partition('?')
+        include_body = method == b"GET"
+        try:
+            response = self.api.lookup_cached(path, query)
+        except Exception as e:
+            response = _error_response(500, str(e))
+
+        if response is not None:
+            self._respond(response, close, include_body, if_none_match)
+        else:
+            # Cache miss: hitung di executor, respons dikirim sesuai urutan
+            slot = [None, close, include_body, if_none_match]
+            self._pending.append(slot)
+            future = asyncio.get_running_loop().run_in_executor(
+                None, self.api.lookup, path, query)
+            future.add_done_callback(lambda done, slot=slot: self._computed(slot, done))
+        return not close
+
+
+async def serve(api, host=None, port=None):
+    """
+    Menjalankan server sampai dibatalkan.
+
+    Args:
+        api (ScheduleAPI): Logika API
+        host (str, optional): Alamat bind. Default API_CONFIG['host']
+        port (int, optional): Port. Default API_CONFIG['port']
+    """
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(
+        lambda: _HTTPProtocol(api),
+        API_CONFIG['host'] if host is None else host,
+        API_CONFIG['port'] if port is None else port,
+        backlog=API_CONFIG['backlog']
+    )
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP/JSON API jadwal sholat")
+    parser.add_argument('--host', help="Alamat bind (default API_CONFIG['host'])")
+    parser.add_argument('--port', type=int, help="Port (default API_CONFIG['port'])")
+    parser.add_argument('--no-reminder', action='store_true',
+                        help="Hanya melayani API, tanpa menjalankan reminder")
+    args = parser.parse_args()
+
+    api = ScheduleAPI()
+    if not args.no_reminder:
+        api.reminder.start_reminder()
+
+    print(f"🌐 API jadwal sholat di http://{args.host or API_CONFIG['host']}:"
+          f"{args.port or API_CONFIG['port']}")
+    try:
+        asyncio.run(serve(api, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.reminder.stop_reminder()
+
+
+if __name__ == "__main__":
+    main()
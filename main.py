@@ -12,7 +12,7 @@ import os
 from datetime import datetime
 
 # Import dari file-file dalam proyek
-from config import MAIN_MENU, MESSAGES, DISPLAY_CONFIG, SHOLAT_NAMES
+from config import MAIN_MENU, MESSAGES, DISPLAY_CONFIG, SHOLAT_NAMES, RELOAD_CONFIG
 from utils import (
     print_header,
     print_separator,
@@ -23,6 +23,8 @@ from utils import (
     clear_screen
 )
 from sholat_reminder import SholatReminder
+from timetable_store import TIMETABLE_EXTENSION
+from schedule_io import STREAM_FORMATS
 
 class MainInterface:
     """
@@ -33,8 +35,21 @@ class MainInterface:
         """
         Inisialisasi interface utama.
         """
+        # File konfigurasi eksternal dimuat sebelum reminder dibuat,
+        # lalu dipantau agar perubahannya berlaku tanpa restart
+        self.config_watcher = None
+        if RELOAD_CONFIG['path'] is not None:
+            from config_reload import ConfigWatcher
+            
+            self.config_watcher = ConfigWatcher()
+            self.config_watcher.load()
+        
         self.reminder = SholatReminder()
         self.running = True
+        
+        if self.config_watcher is not None:
+            self.config_watcher.add(self.reminder)
+            self.config_watcher.start()
     
     def display_welcome(self):
         """
@@ -292,14 +307,40 @@ class MainInterface:
     
     def export_schedule(self):
         """
-        Export jadwal ke file JSON.
+        Export jadwal hari ini ke file JSON, atau beberapa hari ke
+        JSONL/CSV/iCalendar (streaming).
         """
+        formats = ('json',) + STREAM_FORMATS
+        
+        def validate_format(fmt):
+            if fmt.lower() in formats or fmt == '':
+                return True, "Valid"
+            return False, f"Format harus salah satu dari: {', '.join(formats)}"
+        
+        fmt = safe_input(f"Format export ({'/'.join(formats)}) [json]: ", str, validate_format)
+        if fmt is None:
+            return
+        fmt = fmt.lower() or 'json'
+        
         try:
-            schedule_data = self.reminder.export_schedule()
-            filename = f"jadwal_sholat_{datetime.now().strftime('%Y%m%d')}.json"
+            filename = f"jadwal_sholat_{datetime.now().strftime('%Y%m%d')}.{fmt}"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(schedule_data, f, indent=2, ensure_ascii=False)
+            if fmt == 'json':
+                schedule_data = self.reminder.export_schedule()
+                
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(schedule_data, f, indent=2, ensure_ascii=False)
+            else:
+                days = safe_input(
+                    "Jumlah hari (1-3660): ",
+                    int,
+                    lambda d: (True, "Valid") if 1 <= d <= 3660 else (False, "Jumlah hari harus 1-3660")
+                )
+                if days is None:
+                    return
+                
+                count = self.reminder.export_schedule_range(filename, days)
+                print(f"📦 {count} waktu sholat ditulis")
             
             print(f"✅ Jadwal berhasil diexport ke: {filename}")
         
@@ -308,9 +349,11 @@ class MainInterface:
     
     def import_schedule(self):
         """
-        Import jadwal dari file JSON.
+        Import jadwal dari file JSON, file export massal (JSONL/CSV/iCalendar)
+        atau timetable biner.
         """
-        filename = safe_input("Masukkan nama file JSON: ", str)
+        extensions = '/'.join(f".{fmt}" for fmt in STREAM_FORMATS)
+        filename = safe_input(f"Masukkan nama file JSON/{extensions}/{TIMETABLE_EXTENSION}: ", str)
         
         if not filename:
             return
@@ -320,8 +363,21 @@ class MainInterface:
                 print(f"❌ File tidak ditemukan: {filename}")
                 return
             
-            with open(filename, 'r', encoding='utf-8') as f:
-                schedule_data = json.load(f)
+            if filename.endswith(TIMETABLE_EXTENSION):
+                # Timetable biner: cukup sebutkan lokasi, baris hari ini dibaca via mmap
+                location = safe_input("Masukkan nama lokasi: ", str)
+                if not location:
+                    return
+                schedule_data = {'timetable': filename, 'location': location}
+            elif filename.lower().endswith(tuple(f".{fmt}" for fmt in STREAM_FORMATS)):
+                # File export massal: dibaca streaming, hanya hari ini yang diambil
+                location = safe_input("Masukkan nama lokasi (kosongkan untuk lokasi pertama): ", str)
+                if location is None:
+                    return
+                schedule_data = {'records': filename, 'location': location or None}
+            else:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    schedule_data = json.load(f)
             
             success = self.reminder.import_schedule(schedule_data)
             
@@ -0,0 +1,357 @@
+# metrics.py
+# File berisi instrumentasi ringan (counter, gauge, histogram) dan endpoint Prometheus
+
+"""
+File ini berisi metrik internal pipeline reminder:
+
+- Counter   : nilai yang hanya bertambah (jumlah rebuild queue, reminder fire)
+- Gauge     : nilai terakhir (kedalaman queue engine dan queue notifikasi)
+- Histogram : distribusi nilai dalam bucket tetap (keterlambatan fire,
+              durasi dispatch, durasi build queue, durasi suara)
+
+Histogram memakai bucket tetap ala Prometheus: observe() hanya bisect ke
+array batas bucket lalu menambah satu counter, tanpa menyimpan sampel,
+sehingga memori tetap dan biayanya sekitar satu mikrodetik.
+
+Metrik dibaca lewat get_system_status() (snapshot()) atau lewat HTTP dalam
+format teks Prometheus (start_http_server(), lihat METRICS_CONFIG).
+"""
+
+import bisect
+import threading
+
+from config import METRICS_CONFIG
+
+# Batas bucket default (detik) dari 1 ms sampai 5 menit
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 60, 300)
+
+
+class Counter:
+    """
+    Counter yang hanya bertambah.
+    """
+
+    kind = 'counter'
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self):
+        return [(self.name, '', self.value)]
+
+    def snapshot(self):
+        return self.value
+
+
+class Gauge:
+    """
+    Gauge berisi nilai terakhir yang di-set.
+    """
+
+    kind = 'gauge'
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def set(self, value):
+        # Assignment atribut sudah atomik; tidak perlu lock
+        self.value = value
+
+    def samples(self):
+        return [(self.name, '', self.value)]
+
+    def snapshot(self):
+        return self.value
+
+
+class Histogram:
+    """
+    Histogram dengan bucket tetap.
+
+    Menggunakan:
+    - Tuple batas atas bucket (terurut) untuk bisect
+    - List counter per bucket (non-kumulatif; dijumlahkan saat dibaca)
+    """
+
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+
+        # Satu slot tambahan untuk nilai di atas bucket terbesar (+Inf)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value, count=1):
+        """
+        Mencatat satu nilai.
+
+        Args:
+            value (float): Nilai (detik untuk metrik durasi)
+            count (int): Jumlah observasi dengan nilai yang sama (misal satu
+                batch penerima yang diterima bersamaan)
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += count
+            self._sum += value * count
+            self._count += count
+
+    def _read(self):
+        with self._lock:
+            return list(self._counts), self._sum, self._count
+
+    def quantile(self, q, counts=None, count=None):
+        """
+        Perkiraan kuantil: batas atas bucket tempat kuantil jatuh.
+
+        Returns:
+            float atau None: None jika belum ada data; inf jika di atas bucket terbesar
+        """
+        if counts is None:
+            counts, _, count = self._read()
+        if not count:
+            return None
+
+        rank = q * count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return bound
+        return float('inf')
+
+    def samples(self):
+        counts, total, count = self._read()
+        rows = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            rows.append((f"{self.name}_bucket", f'le="{bound:g}"', cumulative))
+        rows.append((f"{self.name}_bucket", 'le="+Inf"', count))
+        rows.append((f"{self.name}_sum", '', total))
+        rows.append((f"{self.name}_count", '', count))
+        return rows
+
+    def snapshot(self):
+        counts, total, count = self._read()
+        return {
+            'count': count,
+            'avg': total / count if count else 0.0,
+            'p50': self.quantile(0.5, counts, count),
+            'p95': self.quantile(0.95, counts, count)
+        }
+
+
+class MetricsRegistry:
+    """
+    Kumpulan metrik yang bisa dirender ke format Prometheus.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, help_text):
+        return self._register(Counter(name, help_text))
+
+    def gauge(self, name, help_text):
+        return self._register(Gauge(name, help_text))
+
+    def histogram(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, help_text, buckets))
+
+    def render(self):
+        """
+        Returns:
+            str: Semua metrik dalam format teks Prometheus (versi 0.0.4)
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, labels, value in metric.samples():
+                label_text = f"{{{labels}}}" if labels else ''
+                lines.append(f"{sample_name}{label_text} {value}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: {nama metrik: nilai} (histogram: count, avg, p50, p95)
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+
+# Registry bersama untuk semua komponen dalam proses ini
+REGISTRY = MetricsRegistry()
+
+# Metrik pipeline reminder
+FIRE_LATENESS = REGISTRY.histogram(
+    'sholat_fire_lateness_seconds',
+    "Selisih waktu fire sebenarnya dengan waktu sholat",
+    (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 60)
+)
+REMINDERS_FIRED = REGISTRY.counter(
+    'sholat_reminders_fired_total', "Reminder yang fire tepat waktu")
+REMINDERS_MISSED = REGISTRY.counter(
+    'sholat_reminders_missed_total', "Reminder yang terlewat melebihi toleransi")
+ENGINE_PENDING = REGISTRY.gauge(
+    'sholat_engine_pending_reminders', "Reminder aktif di heap engine")
+REMINDER_BATCH_SIZE = REGISTRY.histogram(
+    'sholat_reminder_batch_size',
+    "Penerima per notifikasi gabungan (subscriber dengan batch_key dan waktu fire sama)",
+    (1, 2, 5, 10, 50, 100, 500, 1000, 5000, 10000, 50000)
+)
+DUE_DISPATCH_DURATION = REGISTRY.histogram(
+    'sholat_due_dispatch_seconds',
+    "Durasi memproses semua reminder yang jatuh tempo pada waktu fire yang sama",
+    (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+)
+PROCESS_DURATION = REGISTRY.histogram(
+    'sholat_process_reminder_seconds',
+    "Durasi process_prayer_reminder (format dan submit notifikasi)",
+    (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.1)
+)
+DISPATCH_DURATION = REGISTRY.histogram(
+    'sholat_dispatch_duration_seconds',
+    "Durasi dispatch notifikasi dari submit sampai semua sink selesai"
+)
+NOTIFICATION_QUEUE_DEPTH = REGISTRY.gauge(
+    'sholat_notification_queue_depth', "Job notifikasi yang menunggu worker")
+NOTIFICATIONS_DROPPED = REGISTRY.counter(
+    'sholat_notifications_dropped_total', "Job notifikasi yang dibuang karena queue penuh")
+SINK_TIMEOUTS = REGISTRY.counter(
+    'sholat_sink_timeouts_total', "Panggilan sink yang melewati batas waktu")
+SINK_BUSY = REGISTRY.counter(
+    'sholat_sink_busy_total',
+    "Panggilan sink yang dilewati karena semua thread runner sink masih sibuk")
+QUEUE_REBUILDS = REGISTRY.counter(
+    'sholat_queue_rebuilds_total', "Jumlah build_reminder_queue")
+QUEUE_BUILD_DURATION = REGISTRY.histogram(
+    'sholat_queue_build_seconds',
+    "Durasi build_reminder_queue (tanpa tampilan console)",
+    (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.1)
+)
+REMINDER_QUEUE_SIZE = REGISTRY.gauge(
+    'sholat_reminder_queue_size', "Panjang queue reminder setelah build terakhir")
+SOUND_DURATION = REGISTRY.histogram(
+    'sholat_sound_duration_seconds', "Durasi play_reminder_sound")
+
+# Metrik audio adzan/chime (audio_engine.py)
+AUDIO_FIRST_SAMPLE = REGISTRY.histogram(
+    'sholat_audio_first_sample_seconds',
+    "Waktu dari permintaan pemutaran sampai sampel pertama diserahkan ke backend",
+    (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.1)
+)
+AUDIO_PLAYS = REGISTRY.counter(
+    'sholat_audio_plays_total', "Klip audio yang selesai diputar")
+AUDIO_DROPPED = REGISTRY.counter(
+    'sholat_audio_dropped_total', "Permintaan pemutaran yang dibuang karena queue penuh")
+AUDIO_CLIP_DECODES = REGISTRY.counter(
+    'sholat_audio_clip_decodes_total', "File WAV yang di-decode ke cache klip")
+
+# Metrik hot-reload konfigurasi (config_reload.py)
+CONFIG_RELOADS = REGISTRY.counter(
+    'sholat_config_reloads_total', "Perubahan file konfigurasi yang diterapkan")
+CONFIG_RELOAD_FAILURES = REGISTRY.counter(
+    'sholat_config_reload_failures_total',
+    "Perubahan file konfigurasi yang ditolak (parse/validasi gagal)")
+
+# Metrik fan-out (fanout_sinks.py)
+DELIVERY_LATENCY = REGISTRY.histogram(
+    'sholat_delivery_latency_seconds',
+    "Latensi delivery per penerima dari submit notifikasi sampai diterima endpoint"
+)
+DELIVERIES = REGISTRY.counter(
+    'sholat_deliveries_total', "Delivery fan-out yang diterima endpoint")
+DELIVERY_RETRIES = REGISTRY.counter(
+    'sholat_delivery_retries_total', "Percobaan ulang batch fan-out")
+DELIVERY_FAILURES = REGISTRY.counter(
+    'sholat_delivery_failures_total', "Delivery fan-out yang gagal setelah semua percobaan")
+
+
+# Server HTTP metrik (satu per proses)
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_http_server(port=None, host=None):
+    """
+    Menjalankan endpoint /metrics (format teks Prometheus) di thread daemon.
+    Pemanggilan berikutnya mengembalikan server yang sudah berjalan.
+
+    Args:
+        port (int, optional): Port HTTP. Default METRICS_CONFIG['http_port']
+        host (str, optional): Alamat bind. Default METRICS_CONFIG['http_host']
+
+    Returns:
+        ThreadingHTTPServer: Server yang berjalan
+    """
+    global _server
+
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = REGISTRY.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Tanpa log per request di console
+
+    with _server_lock:
+        if _server is None:
+            address = (METRICS_CONFIG['http_host'] if host is None else host,
+                       METRICS_CONFIG['http_port'] if port is None else port)
+            server = ThreadingHTTPServer(address, MetricsHandler)
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            _server = server
+        return _server
+
+
+def stop_http_server():
+    """
+    Menghentikan endpoint /metrics jika sedang berjalan.
+    """
+    global _server
+
+    with _server_lock:
+        if _server is not None:
+            _server.shutdown()
+            _server.server_close()
+            _server = None
@@ -0,0 +1,295 @@
+# next_prayer_batch.py
+# File berisi pencarian "sholat berikutnya" massal untuk banyak pasangan (lokasi, timestamp)
+
+"""
+File ini berisi NextPrayerIndex: jawaban get_next_prayer_info untuk jutaan
+pasangan (lokasi, timestamp) sekaligus, di atas matriks timetable
+(lokasi x 366 hari x sholat, tata letak tahun kabisat seperti timetable_store).
+
+Seluruh matriks diratakan menjadi satu array key terurut:
+
+    key = (lokasi * 366 + slot hari) * 2048 + menit
+
+Setiap baris hari diurutkan berdasarkan menit (indeks sholat aslinya
+disimpan terpisah), sehingga sholat berikutnya untuk banyak query cukup
+dicari dengan satu np.searchsorted (query diurutkan lebih dulu). Jika hari tersebut sudah habis
+(setelah Isya), posisi hasil pencarian jatuh di blok hari berikutnya dan
+diarahkan ke sholat pertama hari berikutnya (Isya -> Subuh besok),
+termasuk pergantian tahun dan 28 Februari -> 1 Maret di tahun non-kabisat.
+
+Timestamp adalah epoch UTC; offset zona waktu per lokasi (jam) dipakai
+untuk mendapatkan tanggal dan menit lokal. Lokasi di zona ber-DST diberi
+nama zona IANA (zones): tanggal, menit dinding dan epoch sholatnya
+memakai batas hari dari zones.py per hari, sehingga offset mengikuti
+tanggal query; hanya hari transisi DST yang dihitung per query.
+"""
+
+import datetime
+
+import numpy as np
+
+from config import LOCATION_CONFIG
+from zones import get_zone, midnight_epoch, wall_epoch
+
+DAYS_PER_YEAR = 366
+
+_DAY_SECONDS = 86400
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# Lebar satu blok hari dalam key (pangkat dua > 1440 menit, sehingga menit
+# bisa diambil dengan key & _MINUTE_MASK); menit tidak terdefinisi
+# dipetakan ke _UNDEFINED_KEY sehingga selalu berada di akhir blok
+_DAY_KEY_WIDTH = 2048
+_MINUTE_MASK = _DAY_KEY_WIDTH - 1
+_UNDEFINED_KEY = _DAY_KEY_WIDTH - 1
+
+# Slot 29 Februari; dilewati di tahun non-kabisat
+_FEB_29_SLOT = 59
+
+
+def _day_slots(days):
+    """
+    Slot hari (0-365, tata letak tahun kabisat) untuk hari sejak epoch.
+    Dihitung sekali per hari unik dalam rentang query lalu dipetakan
+    lewat tabel (konversi datetime64 per query relatif mahal).
+
+    Args:
+        days (ndarray): Jumlah hari sejak 1970-01-01 (int64)
+
+    Returns:
+        ndarray: Slot hari (int64)
+    """
+    if not days.size:
+        return days
+    first = days.min()
+    table_days = np.arange(first, days.max() + 1, dtype=np.int64)
+
+    year_start = table_days.astype('datetime64[D]').astype('datetime64[Y]')
+    years = year_start.astype(np.int64) + 1970
+    day_of_year = table_days - year_start.astype('datetime64[D]').astype(np.int64)
+
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    table = day_of_year + ((~leap) & (day_of_year >= _FEB_29_SLOT))
+    return table[days - first]
+
+
+def _zone_midnights(zone, first, last):
+    """
+    Epoch tengah malam di zona untuk hari first sampai last + 1 (hari sejak
+    1970-01-01 waktu lokal), dari batas hari zones.py yang di-cache.
+
+    Returns:
+        ndarray: Epoch tengah malam (int64), panjang last - first + 2
+    """
+    return np.array([midnight_epoch(zone, datetime.date.fromordinal(day + _EPOCH_ORDINAL))
+                     for day in range(first, last + 2)], dtype=np.int64)
+
+
+def _zone_wall_minutes(zone, seconds):
+    """
+    Hari lokal dan menit waktu dinding di zona untuk setiap epoch.
+
+    Args:
+        zone (ZoneInfo): Zona waktu
+        seconds (ndarray): Epoch UTC (int64, detik)
+
+    Returns:
+        tuple: (hari sejak 1970-01-01 waktu lokal, menit sejak tengah malam)
+    """
+    # Offset zona paling banyak +-14 jam: hari lokal berada dalam
+    # rentang hari UTC +-1
+    first = int(seconds.min() // _DAY_SECONDS) - 1
+    midnights = _zone_midnights(zone, first, int(seconds.max() // _DAY_SECONDS) + 1)
+    slots = np.searchsorted(midnights, seconds, side='right') - 1
+    minutes = (seconds - midnights[slots]) // 60
+
+    # Hari transisi DST: menit dinding tidak sama dengan menit sejak tengah malam
+    for i in np.flatnonzero(np.diff(midnights)[slots] != _DAY_SECONDS):
+        local = datetime.datetime.fromtimestamp(int(seconds[i]), zone)
+        minutes[i] = local.hour * 60 + local.minute
+    return first + slots, minutes
+
+
+def _zone_epochs(zone, days, minutes):
+    """
+    Epoch UTC untuk waktu dinding (hari lokal, menit) di zona.
+
+    Args:
+        zone (ZoneInfo): Zona waktu
+        days (ndarray): Hari sejak 1970-01-01 waktu lokal
+        minutes (ndarray): Menit sejak tengah malam
+
+    Returns:
+        ndarray: Epoch UTC (int64)
+    """
+    first = int(days.min())
+    midnights = _zone_midnights(zone, first, int(days.max()))
+    slots = days - first
+    epochs = midnights[slots] + minutes * 60
+
+    for i in np.flatnonzero(np.diff(midnights)[slots] != _DAY_SECONDS):
+        epochs[i] = wall_epoch(zone, datetime.date.fromordinal(int(days[i]) + _EPOCH_ORDINAL),
+                               int(minutes[i]))
+    return epochs
+
+
+class NextPrayerIndex:
+    """
+    Indeks untuk pencarian sholat berikutnya secara vektor.
+
+    Menggunakan:
+    - Array int64 key terurut (satu entri per lokasi, hari, sholat)
+    - Array int8 indeks sholat asli untuk setiap posisi key
+    - Array offset zona waktu per lokasi (detik)
+    - Array indeks zona IANA per lokasi (-1 = pakai offset tetap)
+    """
+
+    def __init__(self, minutes, timezones=None, undefined=None, zones=None):
+        """
+        Args:
+            minutes (array-like): Menit sejak tengah malam waktu lokal,
+                berbentuk (lokasi, 366, sholat) dengan tata letak tahun kabisat
+            timezones (array-like/float, optional): Offset zona waktu (jam) per
+                lokasi. Default LOCATION_CONFIG['timezone']
+            undefined (int, optional): Nilai menit yang berarti tidak terdefinisi.
+                Default: semua nilai di luar 0-1439
+            zones (list/str, optional): Nama zona IANA per lokasi (atau satu
+                nama untuk semua lokasi); lokasi dengan zona mengabaikan
+                timezones dan mengikuti DST. None = offset tetap
+
+        Raises:
+            ValueError: Jika bentuk matriks, jumlah zona atau nama zona tidak valid
+        """
+        minutes = np.asarray(minutes)
+        if minutes.ndim != 3 or minutes.shape[1] != DAYS_PER_YEAR:
+            raise ValueError(f"Matriks timetable harus berbentuk (lokasi, {DAYS_PER_YEAR}, sholat)")
+
+        self.location_count, _, self.prayer_count = minutes.shape
+
+        if timezones is None:
+            timezones = LOCATION_CONFIG['timezone']
+        self.offsets = np.rint(
+            np.broadcast_to(np.asarray(timezones, dtype=np.float64), (self.location_count,))
+            * 3600
+        ).astype(np.int64)
+
+        if zones is None or isinstance(zones, str):
+            zones = [zones] * self.location_count
+        if len(zones) != self.location_count:
+            raise ValueError(f"Jumlah zona ({len(zones)}) harus sama dengan jumlah lokasi "
+                             f"({self.location_count})")
+        self.zones = []
+        zone_ids = {}
+        self.zone_ids = np.full(self.location_count, -1, dtype=np.int64)
+        for location, name in enumerate(zones):
+            if name is None:
+                continue
+            zone = get_zone(name)
+            if zone not in zone_ids:
+                zone_ids[zone] = len(self.zones)
+                self.zones.append(zone)
+            self.zone_ids[location] = zone_ids[zone]
+
+        # Menit tidak terdefinisi diletakkan di akhir blok harinya
+        values = minutes.astype(np.int64)
+        invalid = (values < 0) | (values >= 1440)
+        if undefined is not None:
+            invalid |= values == undefined
+        values = np.where(invalid, _UNDEFINED_KEY, values)
+
+        # Urutkan setiap baris hari (Isya bisa melewati tengah malam di
+        # lintang tinggi), simpan indeks sholat aslinya
+        order = np.argsort(values, axis=2, kind='stable')
+        values = np.take_along_axis(values, order, axis=2)
+
+        blocks = np.arange(self.location_count * DAYS_PER_YEAR, dtype=np.int64)
+        blocks = blocks.reshape(self.location_count, DAYS_PER_YEAR, 1)
+        self.keys = (blocks * _DAY_KEY_WIDTH + values).ravel()
+        self.prayer_indexes = order.astype(np.int8).ravel()
+
+    @classmethod
+    def from_timetable(cls, store, timezones=None, zones=None):
+        """
+        Membuat indeks dari TimetableStore (matriks dibaca langsung dari mmap).
+
+        Args:
+            store (TimetableStore): Timetable biner
+            timezones (array-like/float, optional): Offset zona waktu (jam) per lokasi
+            zones (list/str, optional): Nama zona IANA per lokasi
+
+        Returns:
+            NextPrayerIndex: Indeks baru
+        """
+        from timetable_store import UNDEFINED_SLOT
+
+        return cls(store.as_array(), timezones, UNDEFINED_SLOT, zones)
+
+    def lookup(self, location_indexes, timestamps):
+        """
+        Sholat berikutnya (waktunya lebih besar dari timestamp) untuk setiap pasangan.
+
+        Args:
+            location_indexes (array-like): Indeks lokasi per query
+            timestamps (array-like): Timestamp epoch UTC per query (detik)
+
+        Returns:
+            dict: Array sepanjang jumlah query:
+                - 'prayer_index'      : indeks sholat (urutan SHOLAT_NAMES), -1 jika tidak ada
+                - 'minute'            : menit sejak tengah malam waktu lokal
+                - 'timestamp'         : timestamp epoch waktu sholat
+                - 'seconds_remaining' : detik sampai waktu sholat
+                - 'next_day'          : True jika sholat berikutnya jatuh besok
+        """
+        locations = np.asarray(location_indexes, dtype=np.int64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        locations, timestamps = np.broadcast_arrays(locations, timestamps)
+        if locations.size and (locations.min() < 0 or locations.max() >= self.location_count):
+            raise IndexError("Indeks lokasi di luar jangkauan")
+
+        # Tanggal dan menit waktu lokal (aritmetika integer pada detik)
+        offsets = self.offsets[locations]
+        seconds = np.floor(timestamps).astype(np.int64)
+        local_minutes = (seconds + offsets) // 60
+        days = local_minutes // 1440
+        minute_now = local_minutes - days * 1440
+
+        # Lokasi ber-zona: offset mengikuti tanggal (DST)
+        zone_ids = self.zone_ids[locations]
+        zoned = [(zone, zone_ids == zone_id) for zone_id, zone in enumerate(self.zones)]
+        zoned = [(zone, mask) for zone, mask in zoned if mask.any()]
+        for zone, mask in zoned:
+            days[mask], minute_now[mask] = _zone_wall_minutes(zone, seconds[mask])
+
+        # Cari key pertama yang lebih besar dari menit sekarang di blok hari ini.
+        # Query diurutkan dulu agar searchsorted membaca key secara berurutan
+        # (query acak membuat hampir setiap langkah pencarian cache miss)
+        block = locations * DAYS_PER_YEAR + _day_slots(days)
+        query_keys = block * _DAY_KEY_WIDTH + minute_now
+        order = np.argsort(query_keys)
+        positions = np.empty_like(query_keys)
+        positions[order] = np.searchsorted(self.keys, query_keys[order], side='right')
+
+        # Hari ini sudah habis (atau sisanya tidak terdefinisi): sholat
+        # pertama hari berikutnya
+        found_keys = self.keys[np.minimum(positions, self.keys.size - 1)]
+        found = ((positions < (block + 1) * self.prayer_count)
+                 & ((found_keys & _MINUTE_MASK) != _UNDEFINED_KEY))
+        next_day = ~found
+
+        next_block = locations * DAYS_PER_YEAR + _day_slots(days + 1)
+        positions = np.where(found, positions, next_block * self.prayer_count)
+
+        key_minutes = self.keys[positions] & _MINUTE_MASK
+        defined = key_minutes != _UNDEFINED_KEY
+        fire = (days + next_day) * 86400 + key_minutes * 60 - offsets
+        for zone, mask in zoned:
+            fire[mask] = _zone_epochs(zone, (days + next_day)[mask],
+                                      np.where(defined, key_minutes, 0)[mask])
+
+        return {
+            'prayer_index': np.where(defined, self.prayer_indexes[positions], -1),
+            'minute': np.where(defined, key_minutes, -1),
+            'timestamp': np.where(defined, fire, -1),
+            'seconds_remaining': np.where(defined, fire - timestamps, -1),
+            'next_day': next_day
+        }
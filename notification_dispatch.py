@@ -0,0 +1,599 @@
+# notification_dispatch.py
+# File berisi pool worker untuk mengirim notifikasi reminder secara non-blocking
+
+"""
+File ini berisi tahap dispatch notifikasi. Thread monitoring hanya
+memasukkan job notifikasi ke queue berukuran terbatas; pool worker
+mengeksekusi sink (suara, console, file, webhook) dengan batas waktu
+per sink, sehingga suara yang lambat tidak menahan reminder lain.
+
+submit dipanggil dari thread engine bersama, jadi tidak pernah menunggu:
+jika queue penuh, job langsung dibuang dan dicatat sebagai dropped.
+Reminder subscriber lain tidak tertahan oleh sink yang lambat.
+
+Setiap sink dijalankan di thread runner miliknya sendiri (_SinkRunner),
+sehingga semua sink satu job berjalan bersamaan dan worker hanya menunggu
+paling lama sink.timeout. Panggilan yang melewati batas waktu dicatat
+sebagai timeout dan ditinggalkan; sink yang macet tidak menahan sink lain
+maupun pool worker. Jika semua thread runner sink masih menjalankan
+panggilan lama, job tersebut dilewati untuk sink itu dan dicatat sebagai
+busy (bukan timeout).
+"""
+
+import queue
+import threading
+import time
+
+import metrics
+from config import DISPATCH_CONFIG, REMINDER_CONFIG
+from utils import play_reminder_sound, format_time, format_date
+
+
+# Penanda di queue job untuk membangunkan worker yang dikurangi resize()
+_RETIRE = object()
+
+
+class NotificationSink:
+    """
+    Dasar semua sink notifikasi.
+    Subclass mengimplementasikan send(job, timeout).
+    """
+
+    name = 'sink'
+
+    def __init__(self, timeout=None):
+        """
+        Args:
+            timeout (float, optional): Batas waktu per pengiriman (detik).
+                Default DISPATCH_CONFIG['sink_timeout']
+        """
+        self.timeout = DISPATCH_CONFIG['sink_timeout'] if timeout is None else timeout
+
+    def send(self, job, timeout):
+        """
+        Mengirim satu job notifikasi.
+
+        Args:
+            job (dict): Job notifikasi (lihat NotificationDispatcher.submit)
+            timeout (float): Batas waktu pengiriman (detik)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Melepas resource sink (koneksi, thread). Default tidak melakukan apa pun.
+        """
+
+
+class ConsoleSink(NotificationSink):
+    """
+    Mencetak notifikasi ke stdout.
+    """
+
+    name = 'console'
+
+    def send(self, job, timeout):
+        print(job['message'])
+
+
+class SoundSink(NotificationSink):
+    """
+    Memainkan suara reminder (dibatasi timeout).
+    Dengan AudioEngine, klip adzan/chime sholat diputar di thread pemutar
+    tanpa menahan worker; sholat tanpa file audio tetap memakai beep.
+    """
+
+    name = 'sound'
+
+    def __init__(self, timeout=None, audio=None):
+        """
+        Args:
+            timeout (float, optional): Batas waktu per pengiriman (detik)
+            audio (AudioEngine, optional): Pemutar klip audio
+        """
+        super().__init__(timeout)
+        self.audio = audio
+
+    def send(self, job, timeout):
+        if self.audio is not None and REMINDER_CONFIG['sound_enabled']:
+            if self.audio.play(job['sholat_name']):
+                return
+        play_reminder_sound(timeout=timeout)
+
+    def close(self):
+        if self.audio is not None:
+            self.audio.stop()
+
+
+class FileSink(NotificationSink):
+    """
+    Menambahkan satu baris per notifikasi ke file log.
+    """
+
+    name = 'file'
+
+    def __init__(self, path, timeout=None):
+        """
+        Args:
+            path (str): Path file log notifikasi
+            timeout (float, optional): Batas waktu per pengiriman (detik)
+        """
+        super().__init__(timeout)
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send(self, job, timeout):
+        line = (f"{format_date(job['sholat_time'])} {format_time(job['sholat_time'])} "
+                f"{job['sholat_name']}\n")
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+class WebhookSink(NotificationSink):
+    """
+    Mengirim notifikasi sebagai JSON ke URL webhook (HTTP POST).
+    """
+
+    name = 'webhook'
+
+    def __init__(self, url, timeout=None):
+        """
+        Args:
+            url (str): URL webhook
+            timeout (float, optional): Batas waktu per pengiriman (detik)
+        """
+        super().__init__(timeout)
+        self.url = url
+
+    def send(self, job, timeout):
+        # Import di sini agar startup tidak membayar biaya urllib/http.client
+        import json
+        import urllib.request
+        
+        body = {
+            'sholat': job['sholat_name'],
+            'time': job['sholat_time'].isoformat(),
+        }
+        if job['recipients'] is not None:
+            body['recipients'] = job['recipients']
+        payload = json.dumps(body).encode('utf-8')
+        request = urllib.request.Request(
+            self.url, data=payload, headers={'Content-Type': 'application/json'}
+        )
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+
+
+class _SinkRunner:
+    """
+    Thread daemon yang menjalankan send() satu sink. Worker dispatcher
+    menunggu hasilnya dengan batas waktu; panggilan yang terlambat tetap
+    berjalan di runner tetapi tidak ditunggu lagi.
+    """
+
+    def __init__(self, sink):
+        self.sink = sink
+        self._calls = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def call(self, job, threads):
+        """
+        Menjadwalkan sink.send(job) di thread runner.
+
+        Args:
+            job (dict): Job notifikasi
+            threads (int): Jumlah thread runner yang dipastikan hidup
+                (sama dengan jumlah worker dispatcher)
+
+        Returns:
+            dict: {'done': Event, 'error': Exception/None, 'abandoned': bool},
+                atau None jika runner masih penuh dengan panggilan lama
+                (sink sibuk, tidak dijadwalkan)
+        """
+        with self._lock:
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            # Antrian panggilan sebanyak jumlah thread berarti semua thread
+            # tertahan panggilan lama; jangan menumpuk panggilan baru
+            if self._calls.qsize() >= threads:
+                return None
+            while len(self._threads) < threads:
+                thread = threading.Thread(target=self._run_loop, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+        result = {'done': threading.Event(), 'error': None, 'abandoned': False}
+        self._calls.put((job, result))
+        return result
+
+    def _run_loop(self):
+        while True:
+            item = self._calls.get()
+            if item is None:
+                break
+            job, result = item
+            if result['abandoned']:
+                # Sudah ditinggalkan worker sebelum sempat dijalankan
+                result['done'].set()
+                continue
+            try:
+                self.sink.send(job, self.sink.timeout)
+            except Exception as e:
+                result['error'] = e
+            finally:
+                result['done'].set()
+
+    def close(self):
+        """
+        Menghentikan thread runner setelah panggilan yang sudah dijadwalkan.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._calls.put(None)
+
+
+def create_sinks_from_config():
+    """
+    Membuat daftar sink sesuai DISPATCH_CONFIG['sinks'].
+
+    Returns:
+        list: Objek sink
+    """
+    sinks = []
+    for sink_name in DISPATCH_CONFIG['sinks']:
+        if sink_name == 'console':
+            sinks.append(ConsoleSink())
+        elif sink_name == 'sound':
+            # Import di sini agar konfigurasi tanpa file audio tidak memuat audio_engine
+            from config import AUDIO_CONFIG
+            
+            audio = None
+            if AUDIO_CONFIG['files']:
+                from audio_engine import AudioEngine
+                
+                audio = AudioEngine()
+                if AUDIO_CONFIG['preload']:
+                    audio.preload()
+            sinks.append(SoundSink(audio=audio))
+        elif sink_name == 'file':
+            sinks.append(FileSink(DISPATCH_CONFIG['file_path']))
+        elif sink_name == 'webhook':
+            sinks.append(WebhookSink(DISPATCH_CONFIG['webhook_url']))
+        elif sink_name in ('fanout_webhook', 'fanout_queue'):
+            # Import di sini agar konfigurasi tanpa fan-out tidak memuat http.client
+            from config import FANOUT_CONFIG
+            from fanout_sinks import FanoutQueueSink, FanoutWebhookSink, read_recipients
+            
+            recipients = read_recipients(FANOUT_CONFIG['recipients_path'])
+            if sink_name == 'fanout_webhook':
+                sinks.append(FanoutWebhookSink(FANOUT_CONFIG['webhook_url'], recipients))
+            else:
+                sinks.append(FanoutQueueSink(FANOUT_CONFIG['queue_url'], recipients))
+        else:
+            raise ValueError(f"Sink notifikasi tidak dikenal: {sink_name}")
+    return sinks
+
+
+class NotificationDispatcher:
+    """
+    Pool worker berukuran tetap dengan queue job terbatas.
+
+    Statistik yang dicatat: submitted, dispatched, dropped, failed,
+    timeouts, busy, kedalaman queue (saat ini dan maksimum) serta latensi
+    dispatch (dari submit sampai semua sink selesai).
+    """
+
+    def __init__(self, sinks=None, workers=None, queue_size=None):
+        """
+        Args:
+            sinks (list, optional): Daftar sink. Default dari DISPATCH_CONFIG
+            workers (int, optional): Jumlah thread worker
+            queue_size (int, optional): Kapasitas queue job
+        """
+        self.sinks = create_sinks_from_config() if sinks is None else list(sinks)
+        self.worker_count = DISPATCH_CONFIG['workers'] if workers is None else workers
+
+        # Pengaturan yang mengikuti DISPATCH_CONFIG (ikut berubah saat hot-reload)
+        self._from_config = {
+            'sinks': sinks is None,
+            'workers': workers is None,
+            'queue_size': queue_size is None
+        }
+
+        # Queue job terbatas (backpressure)
+        self._jobs = queue.Queue(
+            maxsize=DISPATCH_CONFIG['queue_size'] if queue_size is None else queue_size
+        )
+        self._workers = []
+        self._pool_lock = threading.Lock()
+
+        # Worker yang harus berhenti karena resize() mengecilkan pool
+        self._retiring = 0
+
+        # Runner per sink (kunci id sink)
+        self._runners = {}
+        self._runners_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.is_running = False
+
+        self.stats = {
+            'submitted': 0,
+            'dispatched': 0,
+            'dropped': 0,
+            'failed': 0,
+            'timeouts': 0,
+            'busy': 0,
+            'max_queue_depth': 0,
+            'latency_total': 0.0,
+            'latency_max': 0.0
+        }
+
+    def start(self):
+        """
+        Memulai thread worker jika belum berjalan.
+        """
+        with self._pool_lock:
+            if self.is_running:
+                return
+            self.is_running = True
+
+            for _ in range(self.worker_count):
+                self._start_worker()
+
+    def _start_worker(self):
+        """
+        Memulai satu thread worker. Dipanggil dengan _pool_lock terpegang.
+        """
+        worker = threading.Thread(target=self._worker_loop, daemon=True)
+        worker.start()
+        self._workers.append(worker)
+
+    def stop(self, timeout=1):
+        """
+        Menghentikan worker setelah job yang sudah ada di queue selesai.
+
+        Args:
+            timeout (float): Batas waktu menunggu setiap worker (detik)
+        """
+        with self._pool_lock:
+            if not self.is_running:
+                return
+            self.is_running = False
+            self._retiring = 0
+            workers, self._workers = self._workers, []
+
+        # Satu penanda berhenti per worker aktif, diletakkan setelah job yang
+        # tersisa (di luar _pool_lock agar queue penuh tidak menahan resize)
+        for _ in workers:
+            try:
+                self._jobs.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        for worker in workers:
+            worker.join(timeout=timeout)
+
+        for sink in self.sinks:
+            sink.close()
+        self._close_runners(self.sinks)
+
+    def resize(self, workers):
+        """
+        Mengubah jumlah worker tanpa menghentikan dispatcher dan tanpa
+        menunggu queue. Worker baru langsung dimulai; worker yang dikurangi
+        berhenti setelah menyelesaikan job yang sedang dikerjakan (worker
+        yang menganggur dibangunkan dengan penanda jika queue masih muat).
+
+        Args:
+            workers (int): Jumlah worker baru
+        """
+        if workers <= 0:
+            raise ValueError("Jumlah worker notifikasi harus lebih dari 0")
+
+        wake = 0
+        with self._pool_lock:
+            if self.is_running:
+                self._workers = [worker for worker in self._workers if worker.is_alive()]
+                added = workers - self.worker_count
+                if added > 0:
+                    # Batalkan pengurangan yang belum terlaksana lebih dulu
+                    cancelled = min(added, self._retiring)
+                    self._retiring -= cancelled
+                    for _ in range(added - cancelled):
+                        self._start_worker()
+                else:
+                    self._retiring -= added
+                    wake = -added
+            self.worker_count = workers
+
+        for _ in range(wake):
+            try:
+                self._jobs.put_nowait(_RETIRE)
+            except queue.Full:
+                break  # Worker yang sibuk memeriksa _retiring setelah job-nya
+
+    def _take_retirement(self):
+        """
+        Dipanggil worker: True jika worker ini harus berhenti karena resize().
+        """
+        with self._pool_lock:
+            if self._retiring > 0:
+                self._retiring -= 1
+                return True
+            return False
+
+    def set_queue_size(self, queue_size):
+        """
+        Mengubah kapasitas queue job. Job yang sudah ada tidak dibuang;
+        jika queue mengecil, submit berikutnya menunggu sampai muat.
+
+        Args:
+            queue_size (int): Kapasitas baru
+        """
+        with self._jobs.mutex:
+            self._jobs.maxsize = queue_size
+            self._jobs.not_full.notify_all()
+
+    def replace_sinks(self, sinks):
+        """
+        Mengganti daftar sink. Job berikutnya memakai sink baru; sink lama
+        ditutup setelah diganti.
+
+        Args:
+            sinks (list): Objek sink baru
+        """
+        old_sinks, self.sinks = self.sinks, list(sinks)
+        for sink in old_sinks:
+            sink.close()
+        self._close_runners(old_sinks)
+
+    def _runner_for(self, sink):
+        """
+        Runner milik sink (dibuat saat pertama dibutuhkan).
+        """
+        with self._runners_lock:
+            runner = self._runners.get(id(sink))
+            if runner is None or runner.sink is not sink:
+                runner = _SinkRunner(sink)
+                self._runners[id(sink)] = runner
+            return runner
+
+    def _close_runners(self, sinks):
+        """
+        Menghentikan runner milik sink-sink tertentu.
+        """
+        with self._runners_lock:
+            runners = [self._runners.pop(id(sink), None) for sink in sinks]
+        for runner in runners:
+            if runner is not None:
+                runner.close()
+
+    def reload_config(self, rebuild_sinks=False):
+        """
+        Menerapkan DISPATCH_CONFIG terbaru (hot-reload) pada pengaturan yang
+        tidak diberikan eksplisit saat konstruksi: jumlah worker, kapasitas
+        queue dan (jika rebuild_sinks) daftar sink.
+
+        Args:
+            rebuild_sinks (bool): True jika pengaturan sink berubah
+        """
+        if self._from_config['workers'] and DISPATCH_CONFIG['workers'] != self.worker_count:
+            self.resize(DISPATCH_CONFIG['workers'])
+        if self._from_config['queue_size'] and DISPATCH_CONFIG['queue_size'] != self._jobs.maxsize:
+            self.set_queue_size(DISPATCH_CONFIG['queue_size'])
+        if rebuild_sinks and self._from_config['sinks']:
+            self.replace_sinks(create_sinks_from_config())
+
+    def submit(self, sholat_name, sholat_time, message, recipients=None):
+        """
+        Memasukkan job notifikasi ke queue tanpa menjalankan sink dan tanpa
+        menunggu (dipanggil dari thread engine bersama).
+
+        Args:
+            sholat_name (str): Nama sholat
+            sholat_time (datetime): Waktu sholat
+            message (str): Teks notifikasi yang sudah diformat
+            recipients (list, optional): Penerima notifikasi gabungan (subscriber
+                dengan menit, sholat dan lokasi yang sama); None = satu penerima
+
+        Returns:
+            bool: True jika job masuk queue, False jika dibuang karena queue penuh
+        """
+        job = {
+            'sholat_name': sholat_name,
+            'sholat_time': sholat_time,
+            'message': message,
+            'recipients': recipients,
+            'submitted_at': time.monotonic()
+        }
+
+        try:
+            self._jobs.put_nowait(job)
+        except queue.Full:
+            with self._stats_lock:
+                self.stats['dropped'] += 1
+            metrics.NOTIFICATIONS_DROPPED.inc()
+            print(f"⚠️  Queue notifikasi penuh, notifikasi {sholat_name} dibuang")
+            return False
+
+        with self._stats_lock:
+            self.stats['submitted'] += 1
+            depth = self._jobs.qsize()
+            if depth > self.stats['max_queue_depth']:
+                self.stats['max_queue_depth'] = depth
+        metrics.NOTIFICATION_QUEUE_DEPTH.set(depth)
+        return True
+
+    def _run_sinks(self, job):
+        """
+        Menjalankan semua sink untuk satu job secara bersamaan dan menunggu
+        masing-masing paling lama sink.timeout. Sink yang gagal atau
+        melewati batas waktu dicatat; panggilan yang terlambat ditinggalkan.
+        Sink yang runner-nya masih penuh dilewati dan dicatat sebagai busy.
+        """
+        start = time.monotonic()
+        threads = max(self.worker_count, 1)
+        calls = [(sink, self._runner_for(sink).call(job, threads)) for sink in self.sinks]
+
+        for sink, call in calls:
+            if call is None:
+                with self._stats_lock:
+                    self.stats['busy'] += 1
+                metrics.SINK_BUSY.inc()
+                print(f"⚠️  Sink {sink.name} masih sibuk, {job['sholat_name']} dilewati")
+                continue
+            remaining = start + sink.timeout - time.monotonic()
+            if not call['done'].wait(max(remaining, 0)):
+                call['abandoned'] = True
+                with self._stats_lock:
+                    self.stats['timeouts'] += 1
+                metrics.SINK_TIMEOUTS.inc()
+                print(f"⚠️  Sink {sink.name} melewati batas waktu {sink.timeout:g} detik "
+                      f"untuk {job['sholat_name']}")
+            elif call['error'] is not None:
+                with self._stats_lock:
+                    self.stats['failed'] += 1
+                print(f"❌ Sink {sink.name} gagal untuk {job['sholat_name']}: {call['error']}")
+
+    def _worker_loop(self):
+        """
+        Thread function worker: ambil job dari queue lalu jalankan semua sink.
+        """
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            if job is _RETIRE:
+                if self._take_retirement():
+                    break
+                continue  # Pengurangan sudah dijalankan worker lain
+
+            self._run_sinks(job)
+
+            latency = time.monotonic() - job['submitted_at']
+            metrics.DISPATCH_DURATION.observe(latency)
+            metrics.NOTIFICATION_QUEUE_DEPTH.set(self._jobs.qsize())
+            with self._stats_lock:
+                self.stats['dispatched'] += 1
+                self.stats['latency_total'] += latency
+                if latency > self.stats['latency_max']:
+                    self.stats['latency_max'] = latency
+
+            if self._retiring and self._take_retirement():
+                break
+
+    def get_stats(self):
+        """
+        Snapshot statistik dispatcher.
+
+        Returns:
+            dict: Statistik termasuk kedalaman queue saat ini dan latensi rata-rata
+        """
+        with self._stats_lock:
+            stats = dict(self.stats)
+
+        stats['queue_depth'] = self._jobs.qsize()
+        stats['latency_avg'] = (stats['latency_total'] / stats['dispatched']
+                                if stats['dispatched'] else 0.0)
+        return stats
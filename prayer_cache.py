@@ -0,0 +1,233 @@
+# prayer_cache.py
+# File berisi cache LRU untuk hasil perhitungan waktu sholat
+
+"""
+File ini berisi lapisan memoization di depan prayer_times.compute_day_times.
+
+Key cache: (lintang, bujur, elevasi, tanggal, metode, faktor Ashar, zona waktu)
+dengan lintang/bujur dibulatkan ke PRAYER_CACHE_CONFIG['precision'] desimal
+dan elevasi ke puluhan meter. Perhitungan memakai nilai yang sudah
+dibulatkan, sehingga isi cache hanya ditentukan oleh key-nya dan pengguna
+yang berdekatan mendapat hasil yang identik.
+
+Cache berukuran terbatas (LRU) dan bisa disimpan ke/dimuat dari file JSON
+(cache hangat) agar proses baru tidak perlu menghitung ulang. NumPy hanya
+diimport saat cache miss.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from config import PRAYER_CACHE_CONFIG
+
+
+class PrayerTimeCache:
+    """
+    Cache LRU waktu sholat per (lokasi terbulatkan, tanggal, metode, zona waktu).
+
+    Menggunakan:
+    - OrderedDict sebagai daftar LRU (entri terbaru di akhir)
+    - Tuple menit sejak tengah malam sebagai nilai (ringkas dan immutable)
+    - Counter hits, misses dan evictions
+    """
+
+    def __init__(self, max_entries=None, precision=None, warm_path=None):
+        """
+        Args:
+            max_entries (int, optional): Jumlah entri maksimum.
+                Default PRAYER_CACHE_CONFIG['max_entries']
+            precision (int, optional): Desimal pembulatan lintang/bujur.
+                Default PRAYER_CACHE_CONFIG['precision']
+            warm_path (str, optional): File cache hangat (JSON)
+        """
+        self.max_entries = (PRAYER_CACHE_CONFIG['max_entries']
+                            if max_entries is None else max_entries)
+        self.precision = PRAYER_CACHE_CONFIG['precision'] if precision is None else precision
+        self.warm_path = warm_path
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(self, location, date_obj):
+        """
+        Membuat key cache dari lokasi (format LOCATION_CONFIG) dan tanggal.
+
+        Returns:
+            tuple: (lintang, bujur, elevasi, ordinal tanggal, metode, faktor Ashar, zona waktu)
+        """
+        return (
+            round(location['latitude'], self.precision),
+            round(location['longitude'], self.precision),
+            int(round(location.get('elevation', 0), -1)),
+            date_obj.toordinal(),
+            location.get('method', 'Kemenag'),
+            location.get('asr_factor', 1),
+            location['timezone']
+        )
+
+    def _store(self, key, minutes):
+        """
+        Menyimpan entri dan membuang entri paling lama tidak dipakai.
+        Dipanggil dengan lock terpegang.
+        """
+        self._entries[key] = minutes
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def day_minutes(self, location, date_obj):
+        """
+        Waktu sholat satu hari sebagai menit sejak tengah malam.
+
+        Args:
+            location (dict): Lokasi dengan format LOCATION_CONFIG
+            date_obj (date): Tanggal
+
+        Returns:
+            tuple: Menit per sholat (None jika tidak terdefinisi)
+        """
+        key = self.make_key(location, date_obj)
+
+        with self._lock:
+            minutes = self._entries.get(key)
+            if minutes is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return minutes
+            self.misses += 1
+
+        # Hitung di luar lock; perhitungan memakai nilai key yang dibulatkan
+        from prayer_times import compute_day_times
+
+        latitude, longitude, elevation, _, method, asr_factor, timezone = key
+        times = compute_day_times(latitude, longitude, date_obj, timezone,
+                                  elevation, method, asr_factor)
+        minutes = tuple(None if time_pair is None else time_pair[0] * 60 + time_pair[1]
+                        for time_pair in times)
+
+        with self._lock:
+            self._store(key, minutes)
+        return minutes
+
+    def day_times(self, location, date_obj):
+        """
+        Waktu sholat satu hari dalam format DEFAULT_PRAYER_TIMES.
+
+        Args:
+            location (dict): Lokasi dengan format LOCATION_CONFIG
+            date_obj (date): Tanggal
+
+        Returns:
+            list: Waktu dalam format [[jam, menit], ...]; None untuk waktu yang
+                  tidak terdefinisi
+        """
+        return [None if minute is None else [minute // 60, minute % 60]
+                for minute in self.day_minutes(location, date_obj)]
+
+    def get_stats(self):
+        """
+        Snapshot statistik cache.
+
+        Returns:
+            dict: entries, max_entries, hits, misses, evictions, hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def clear(self):
+        """
+        Mengosongkan cache dan counter.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def save(self, path=None):
+        """
+        Menyimpan isi cache ke file JSON (urutan LRU dipertahankan).
+        File ditulis ke file sementara lalu di-rename agar tidak pernah setengah jadi.
+
+        Args:
+            path (str, optional): Path file. Default warm_path
+
+        Returns:
+            int: Jumlah entri yang disimpan
+        """
+        path = self.warm_path if path is None else path
+        if path is None:
+            raise ValueError("Path cache hangat belum ditentukan")
+
+        with self._lock:
+            rows = [list(key) + [list(minutes)] for key, minutes in self._entries.items()]
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'precision': self.precision, 'entries': rows}, f)
+        os.replace(temp_path, path)
+        return len(rows)
+
+    def load(self, path=None):
+        """
+        Memuat cache hangat dari file JSON. Entri dengan presisi berbeda diabaikan.
+
+        Args:
+            path (str, optional): Path file. Default warm_path
+
+        Returns:
+            int: Jumlah entri yang dimuat
+        """
+        path = self.warm_path if path is None else path
+        if path is None or not os.path.exists(path):
+            return 0
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('precision') != self.precision:
+            return 0
+
+        with self._lock:
+            for row in data['entries']:
+                self._store(tuple(row[:-1]), tuple(row[-1]))
+        return len(data['entries'])
+
+
+# Cache bersama untuk semua SholatReminder dalam proses ini
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """
+    Cache bersama sesuai PRAYER_CACHE_CONFIG. Dibuat saat pertama dipakai;
+    jika warm_path diisi, cache dimuat dari file dan disimpan saat proses keluar.
+
+    Returns:
+        PrayerTimeCache: Cache bersama
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            cache = PrayerTimeCache(warm_path=PRAYER_CACHE_CONFIG['warm_path'])
+            if cache.warm_path is not None:
+                import atexit
+
+                cache.load()
+                atexit.register(cache.save)
+            _default_cache = cache
+        return _default_cache
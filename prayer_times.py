@@ -0,0 +1,226 @@
+# prayer_times.py
+# File berisi kalkulator astronomis waktu sholat berbasis NumPy
+
+"""
+File ini berisi perhitungan waktu Subuh, Dzuhur, Ashar, Maghrib dan Isya
+dari posisi matahari untuk lintang, bujur, elevasi dan metode perhitungan
+tertentu. Semua fungsi bekerja dengan array NumPy sehingga satu panggilan
+dapat menghitung satu tahun penuh untuk ribuan lokasi sekaligus
+(tanpa loop Python per hari).
+
+Rumus posisi matahari mengikuti algoritma PrayTimes (praytimes.org).
+"""
+
+import datetime
+
+import numpy as np
+
+# Parameter metode perhitungan
+# - fajr / isha   : sudut depresi matahari (derajat)
+# - isha_minutes  : Isya = Maghrib + menit (menggantikan sudut isha)
+# - ihtiyat       : menit kehati-hatian yang ditambahkan ke setiap waktu
+CALCULATION_METHODS = {
+    'Kemenag': {'fajr': 20.0, 'isha': 18.0, 'ihtiyat': 2},
+    'MWL': {'fajr': 18.0, 'isha': 17.0},
+    'ISNA': {'fajr': 15.0, 'isha': 15.0},
+    'Egypt': {'fajr': 19.5, 'isha': 17.5},
+    'Makkah': {'fajr': 18.5, 'isha_minutes': 90},
+    'Karachi': {'fajr': 18.0, 'isha': 18.0},
+    'JAKIM': {'fajr': 20.0, 'isha': 18.0, 'ihtiyat': 2},
+}
+
+# Faktor bayangan Ashar: 1 = Syafi'i (jumhur), 2 = Hanafi
+ASR_FACTORS = {'Standard': 1, 'Hanafi': 2}
+
+# Nilai untuk waktu yang tidak terdefinisi (misal lintang sangat tinggi)
+UNDEFINED_MINUTES = -1
+
+# Selisih hari Julian terhadap date.toordinal() (JD 2000-01-01 00:00 = 2451544.5)
+_JULIAN_ORDINAL_OFFSET = 1721424.5
+
+
+def _sun_position(julian_day):
+    """
+    Menghitung deklinasi matahari dan equation of time.
+
+    Args:
+        julian_day (ndarray): Hari Julian
+
+    Returns:
+        tuple: (deklinasi dalam radian, equation of time dalam jam)
+    """
+    d = julian_day - 2451545.0
+    g = np.radians(357.529 + 0.98560028 * d)
+    q = 280.459 + 0.98564736 * d
+    ecliptic_lon = np.radians(q + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g))
+    obliquity = np.radians(23.439 - 0.00000036 * d)
+
+    right_ascension = np.degrees(np.arctan2(
+        np.cos(obliquity) * np.sin(ecliptic_lon), np.cos(ecliptic_lon))) / 15.0
+    declination = np.arcsin(np.sin(obliquity) * np.sin(ecliptic_lon))
+
+    equation_of_time = q / 15.0 - right_ascension
+    equation_of_time = (equation_of_time + 12.0) % 24.0 - 12.0
+    return declination, equation_of_time
+
+
+def _noon(julian_day, hours):
+    """
+    Waktu tengah hari matahari (jam, waktu matahari lokal).
+    """
+    _, equation_of_time = _sun_position(julian_day + hours / 24.0)
+    return 12.0 - equation_of_time
+
+
+def _hour_angle_time(julian_day, latitude, angle, hours, before_noon):
+    """
+    Waktu saat matahari berada pada sudut depresi tertentu.
+
+    Args:
+        julian_day (ndarray): Hari Julian
+        latitude (ndarray): Lintang dalam radian
+        angle (ndarray/float): Sudut depresi dalam derajat (positif = di bawah horizon)
+        hours (float/ndarray): Perkiraan waktu (jam) untuk posisi matahari
+        before_noon (bool): True untuk waktu sebelum tengah hari
+
+    Returns:
+        ndarray: Waktu dalam jam (NaN jika matahari tidak mencapai sudut tersebut)
+    """
+    declination, _ = _sun_position(julian_day + hours / 24.0)
+    cos_hour_angle = ((-np.sin(np.radians(angle)) - np.sin(declination) * np.sin(latitude))
+                      / (np.cos(declination) * np.cos(latitude)))
+
+    with np.errstate(invalid='ignore'):
+        hour_angle = np.degrees(np.arccos(cos_hour_angle)) / 15.0
+
+    noon = _noon(julian_day, hours)
+    return noon - hour_angle if before_noon else noon + hour_angle
+
+
+def _asr_time(julian_day, latitude, factor, hours):
+    """
+    Waktu Ashar: panjang bayangan = factor + panjang bayangan saat tengah hari.
+    """
+    declination, _ = _sun_position(julian_day + hours / 24.0)
+    angle = -np.degrees(np.arctan(1.0 / (factor + np.tan(np.abs(latitude - declination)))))
+    return _hour_angle_time(julian_day, latitude, angle, hours, before_noon=False)
+
+
+def compute_prayer_minutes(latitudes, longitudes, dates, timezones,
+                           elevations=0.0, method='Kemenag', asr_factor=1):
+    """
+    Menghitung waktu lima sholat untuk banyak lokasi dan banyak tanggal.
+
+    Args:
+        latitudes (array-like): Lintang lokasi (derajat), panjang L
+        longitudes (array-like): Bujur lokasi (derajat), panjang L
+        dates (iterable): Tanggal (datetime.date), panjang D
+        timezones (array-like/float): Offset zona waktu dalam jam (misal 7 untuk WIB)
+        elevations (array-like/float): Elevasi lokasi dalam meter
+        method (str): Nama metode di CALCULATION_METHODS
+        asr_factor (int): Faktor bayangan Ashar (lihat ASR_FACTORS)
+
+    Returns:
+        ndarray: Array int16 berbentuk (L, D, 5) berisi menit sejak tengah malam
+                 waktu lokal, urutan sesuai SHOLAT_NAMES dan selalu naik dalam
+                 satu hari. UNDEFINED_MINUTES untuk waktu yang tidak dapat
+                 dihitung (matahari tidak terbit/terbenam) atau jatuh di luar
+                 hari lokal.
+    """
+    if method not in CALCULATION_METHODS:
+        raise ValueError(f"Metode perhitungan tidak dikenal: {method}")
+    params = CALCULATION_METHODS[method]
+
+    # Lokasi sebagai kolom (L, 1), tanggal sebagai baris (1, D) untuk broadcasting
+    latitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+    latitude = np.radians(latitudes)[:, None]
+    longitude = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))[:, None]
+    timezone = np.broadcast_to(np.asarray(timezones, dtype=np.float64), latitudes.shape)[:, None]
+    elevation = np.broadcast_to(np.asarray(elevations, dtype=np.float64), latitudes.shape)[:, None]
+
+    ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.float64)
+    julian_day = (ordinals + _JULIAN_ORDINAL_OFFSET)[None, :] - longitude / (15.0 * 24.0)
+
+    # Satu iterasi dengan perkiraan awal waktu (jam) seperti PrayTimes
+    sunrise_angle = 0.833 + 0.0347 * np.sqrt(elevation)
+    fajr = _hour_angle_time(julian_day, latitude, params['fajr'], 5.0, True)
+    sunrise = _hour_angle_time(julian_day, latitude, sunrise_angle, 6.0, True)
+    dhuhr = _noon(julian_day, 12.0)
+    asr = _asr_time(julian_day, latitude, asr_factor, 13.0)
+    sunset = _hour_angle_time(julian_day, latitude, sunrise_angle, 18.0, False)
+
+    if 'isha_minutes' in params:
+        isha = sunset + params['isha_minutes'] / 60.0
+    else:
+        isha = _hour_angle_time(julian_day, latitude, params['isha'], 18.0, False)
+
+    # Penyesuaian lintang tinggi (metode AngleBased): jika Subuh/Isya tidak
+    # terdefinisi atau terlalu jauh, batasi dengan porsi malam angle/60
+    night = 24.0 - (sunset - sunrise)
+    fajr_limit = sunrise - night * params['fajr'] / 60.0
+    fajr = np.where(np.isnan(fajr) | (fajr < fajr_limit), fajr_limit, fajr)
+    if 'isha' in params:
+        isha_limit = sunset + night * params['isha'] / 60.0
+        isha = np.where(np.isnan(isha) | (isha > isha_limit), isha_limit, isha)
+
+    # Konversi waktu matahari lokal ke waktu zona, lalu ke menit
+    times = np.stack((fajr, dhuhr, asr, sunset, isha), axis=-1)
+    times = times + (timezone - longitude / 15.0)[..., None]
+    minutes = np.rint(times * 60.0) + params.get('ihtiyat', 0)
+
+    # Waktu yang jatuh di luar hari lokal (misal Isya lewat tengah malam di
+    # lintang tinggi) tidak dibungkus ke hari yang sama (Isya sebelum
+    # Maghrib), tetapi dianggap tidak terdefinisi
+    undefined = np.isnan(minutes) | (minutes < 0) | (minutes >= 1440)
+    minutes = np.where(undefined, UNDEFINED_MINUTES, minutes)
+
+    # Jaga urutan hari tetap naik: waktu yang tidak lebih akhir dari waktu
+    # terdefinisi sebelumnya juga dianggap tidak terdefinisi
+    previous = np.full(minutes.shape[:-1], -1.0)
+    for slot in range(minutes.shape[-1]):
+        current = minutes[..., slot]
+        disorder = (current != UNDEFINED_MINUTES) & (current <= previous)
+        minutes[..., slot] = np.where(disorder, UNDEFINED_MINUTES, current)
+        previous = np.where(minutes[..., slot] == UNDEFINED_MINUTES, previous, current)
+    return minutes.astype(np.int16)
+
+
+def compute_day_times(latitude, longitude, date, timezone,
+                      elevation=0.0, method='Kemenag', asr_factor=1):
+    """
+    Menghitung waktu sholat satu lokasi untuk satu tanggal.
+
+    Args:
+        latitude (float): Lintang (derajat)
+        longitude (float): Bujur (derajat)
+        date (date): Tanggal
+        timezone (float): Offset zona waktu dalam jam
+        elevation (float): Elevasi dalam meter
+        method (str): Nama metode di CALCULATION_METHODS
+        asr_factor (int): Faktor bayangan Ashar
+
+    Returns:
+        list: Waktu dalam format [[jam, menit], ...] seperti DEFAULT_PRAYER_TIMES;
+              None untuk sholat yang waktunya tidak terdefinisi (misal Maghrib
+              saat matahari tidak terbenam di lintang tinggi)
+    """
+    minutes = compute_prayer_minutes(
+        [latitude], [longitude], [date], timezone, elevation, method, asr_factor
+    )[0, 0]
+
+    return [None if m == UNDEFINED_MINUTES else [int(m) // 60, int(m) % 60] for m in minutes]
+
+
+def year_dates(year):
+    """
+    Daftar semua tanggal dalam satu tahun.
+
+    Args:
+        year (int): Tahun
+
+    Returns:
+        list: Objek date dari 1 Januari sampai 31 Desember
+    """
+    start = datetime.date(year, 1, 1)
+    days = (datetime.date(year + 1, 1, 1) - start).days
+    return [start + datetime.timedelta(days=i) for i in range(days)]
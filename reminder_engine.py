@@ -0,0 +1,481 @@
+# reminder_engine.py
+# File berisi engine reminder multi-subscriber dengan satu thread dispatcher
+
+"""
+File ini berisi implementasi class ReminderEngine yang menampung jadwal
+reminder banyak subscriber dalam satu heap bersama (diurutkan berdasarkan
+waktu fire) dan satu thread dispatcher, sehingga tidak perlu satu thread
+per pengguna.
+
+Penghapusan entri memakai teknik "mark as removed" dari dokumentasi heapq:
+entri lama cukup ditandai tidak aktif dan dibuang saat mencapai puncak heap.
+
+Reminder yang jatuh tempo pada waktu fire yang sama diambil dari heap
+sekaligus. Subscriber yang didaftarkan dengan batch_key yang sama (misal
+satu kota dengan dispatcher yang sama) digabung per (batch_key, payload):
+callback setiap subscriber tetap dipanggil untuk pembukuannya sendiri,
+lalu batch_callback dipanggil sekali untuk semua penerima, sehingga
+notifikasi Maghrib satu kota dirender dan dikirim satu kali.
+
+Journal reminder (FiredJournal) yang dipasang dengan attach_journal
+di-group-commit per tick: semua reminder yang jatuh tempo bersamaan
+dicatat dengan satu fsync sebelum notifikasinya dikirim.
+"""
+
+import contextlib
+import heapq
+import itertools
+import threading
+import time
+
+import metrics
+from clock import get_clock
+from config import REMINDER_CONFIG
+
+# Indeks field dalam entri heap
+# Format entri: [fire_timestamp, urutan, subscriber_id, payload, aktif]
+# payload bebas ditentukan subscriber (misal indeks sholat dalam jadwal)
+_FIRE_TS = 0
+_SUBSCRIBER = 2
+_PAYLOAD = 3
+_ACTIVE = 4
+
+
+class ReminderEngine:
+    """
+    Engine reminder untuk banyak subscriber sekaligus.
+
+    Menggunakan:
+    - Heap bersama yang diurutkan berdasarkan waktu fire
+    - Dictionary subscriber -> callback dan entri miliknya
+    - Satu thread dispatcher untuk semua subscriber
+    """
+
+    def __init__(self, clock=None):
+        """
+        Inisialisasi engine dengan heap dan daftar subscriber kosong.
+
+        Args:
+            clock (SystemClock/VirtualClock, optional): Sumber waktu. Default jam default
+        """
+        self.clock = get_clock() if clock is None else clock
+
+        # Heap berisi entri reminder semua subscriber
+        self._heap = []
+
+        # Format: {subscriber_id: {'callback': fungsi, 'entries': [entri, ...],
+        #                          'batch_key': kunci, 'batch_callback': fungsi}}
+        self._subscribers = {}
+
+        # Counter untuk tie-breaker entri dengan waktu fire yang sama (FIFO)
+        self._sequence = itertools.count()
+
+        # Jumlah entri tidak aktif yang masih tersisa di heap
+        self._inactive_count = 0
+
+        # Condition variable untuk membangunkan dispatcher saat heap berubah
+        self._condition = threading.Condition()
+        self._heap_changed = False
+
+        # Journal yang di-group-commit per tick dispatch (biasanya satu, dipakai
+        # bersama semua subscriber)
+        self._journals = []
+
+        # Flag dan thread dispatcher
+        self.is_running = False
+        self.dispatcher_thread = None
+
+        # Statistik engine (untuk benchmark/diagnostik)
+        self.wakeup_count = 0
+        self.fired_count = 0
+
+    def _push_entries(self, subscriber_id, reminders):
+        """
+        Memasukkan reminder subscriber ke heap. Dipanggil dengan lock terpegang.
+
+        Args:
+            subscriber_id (hashable): ID subscriber
+            reminders (iterable): Iterable tuple (timestamp_fire, payload)
+
+        Returns:
+            list: Entri heap yang dibuat
+        """
+        entries = []
+        for fire_timestamp, payload in reminders:
+            entry = [fire_timestamp, next(self._sequence), subscriber_id, payload, True]
+            heapq.heappush(self._heap, entry)
+            entries.append(entry)
+        return entries
+
+    def _deactivate_entries(self, entries):
+        """
+        Menandai entri sebagai tidak aktif. Dipanggil dengan lock terpegang.
+
+        Args:
+            entries (list): Entri heap milik satu subscriber
+        """
+        for entry in entries:
+            if entry[_ACTIVE]:
+                entry[_ACTIVE] = False
+                self._inactive_count += 1
+
+        # Padatkan heap jika lebih dari separuh isinya sudah tidak aktif
+        if self._inactive_count > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if entry[_ACTIVE]]
+            heapq.heapify(self._heap)
+            self._inactive_count = 0
+
+    def _notify_changed(self):
+        """
+        Membangunkan dispatcher. Dipanggil dengan lock terpegang.
+        """
+        self._heap_changed = True
+        self._condition.notify_all()
+
+    def add_subscriber(self, subscriber_id, reminders, callback, batch_key=None,
+                       batch_callback=None):
+        """
+        Mendaftarkan subscriber beserta reminder-nya.
+        Jika subscriber sudah terdaftar, reminder lamanya diganti.
+
+        Args:
+            subscriber_id (hashable): ID unik subscriber
+            reminders (iterable): Iterable tuple (timestamp_fire, payload)
+            callback (function): Dipanggil dengan (payload, missed) saat reminder tiba;
+                missed bernilai True jika reminder terlewat melebihi toleransi
+            batch_key (hashable, optional): Kunci penggabungan. Reminder subscriber
+                dengan batch_key, waktu fire dan payload yang sama digabung; callback
+                mengembalikan penerima notifikasi (atau None untuk tidak dikirim)
+            batch_callback (function, optional): Wajib jika batch_key diisi. Dipanggil
+                sekali per gabungan dengan (payload, missed, list penerima)
+        """
+        if batch_key is not None and batch_callback is None:
+            raise ValueError("batch_key membutuhkan batch_callback")
+
+        with self._condition:
+            record = self._subscribers.get(subscriber_id)
+            if record is not None:
+                self._deactivate_entries(record['entries'])
+
+            self._subscribers[subscriber_id] = {
+                'callback': callback,
+                'entries': self._push_entries(subscriber_id, reminders),
+                'batch_key': batch_key,
+                'batch_callback': batch_callback
+            }
+            self._notify_changed()
+
+    def update_subscriber(self, subscriber_id, reminders):
+        """
+        Mengganti seluruh reminder milik subscriber yang sudah terdaftar.
+
+        Args:
+            subscriber_id (hashable): ID subscriber
+            reminders (iterable): Iterable tuple (timestamp_fire, payload)
+
+        Returns:
+            bool: True jika subscriber ditemukan
+        """
+        with self._condition:
+            record = self._subscribers.get(subscriber_id)
+            if record is None:
+                return False
+
+            self._deactivate_entries(record['entries'])
+            record['entries'] = self._push_entries(subscriber_id, reminders)
+            self._notify_changed()
+            return True
+
+    def add_reminders(self, subscriber_id, reminders):
+        """
+        Menambahkan reminder ke subscriber yang sudah terdaftar tanpa
+        mengganti reminder yang sudah ada.
+
+        Args:
+            subscriber_id (hashable): ID subscriber
+            reminders (iterable): Iterable tuple (timestamp_fire, payload)
+
+        Returns:
+            bool: True jika subscriber ditemukan
+        """
+        with self._condition:
+            record = self._subscribers.get(subscriber_id)
+            if record is None:
+                return False
+
+            record['entries'].extend(self._push_entries(subscriber_id, reminders))
+            self._notify_changed()
+            return True
+
+    def update_reminder(self, subscriber_id, payload, fire_timestamp):
+        """
+        Mengganti satu reminder milik subscriber tanpa menyentuh reminder lain.
+        Entri lama ditandai tidak aktif dan entri baru di-push ke heap dalam
+        satu critical section, sehingga dispatcher tidak pernah melihat
+        keadaan di antaranya.
+
+        Args:
+            subscriber_id (hashable): ID subscriber
+            payload: Payload reminder yang diganti
+            fire_timestamp (float atau None): Waktu fire baru; None untuk
+                menghapus reminder tersebut saja
+
+        Returns:
+            bool: True jika subscriber ditemukan
+        """
+        with self._condition:
+            record = self._subscribers.get(subscriber_id)
+            if record is None:
+                return False
+
+            entries = record['entries']
+            for position, entry in enumerate(entries):
+                if entry[_PAYLOAD] == payload:
+                    del entries[position]
+                    self._deactivate_entries((entry,))
+                    break
+
+            if fire_timestamp is not None:
+                entries.extend(self._push_entries(subscriber_id, ((fire_timestamp, payload),)))
+
+            self._notify_changed()
+            return True
+
+    def remove_subscriber(self, subscriber_id):
+        """
+        Menghapus subscriber beserta semua reminder yang belum tiba.
+
+        Args:
+            subscriber_id (hashable): ID subscriber
+
+        Returns:
+            bool: True jika subscriber ditemukan
+        """
+        with self._condition:
+            record = self._subscribers.pop(subscriber_id, None)
+            if record is None:
+                return False
+
+            self._deactivate_entries(record['entries'])
+            self._notify_changed()
+            return True
+
+    def attach_journal(self, journal):
+        """
+        Memasang journal subscriber agar di-group-commit per tick dispatch.
+
+        Args:
+            journal (FiredJournal): Journal reminder yang sudah fire
+        """
+        with self._condition:
+            if not any(attached is journal for attached in self._journals):
+                self._journals.append(journal)
+
+    def subscriber_count(self):
+        """
+        Returns:
+            int: Jumlah subscriber terdaftar
+        """
+        return len(self._subscribers)
+
+    def pending_count(self):
+        """
+        Returns:
+            int: Jumlah reminder aktif yang belum tiba
+        """
+        return len(self._heap) - self._inactive_count
+
+    def _pop_due_reminders(self):
+        """
+        Mengambil semua reminder di puncak heap yang waktu fire-nya sama
+        jika waktunya sudah tiba. Entri tidak aktif dibuang; reminder yang
+        terlewat melebihi toleransi tetap dikembalikan dengan tanda missed.
+
+        Returns:
+            tuple atau None: (missed, list (subscriber_id, record, payload))
+                urut heap, atau None jika belum ada yang jatuh tempo
+        """
+        tolerance = REMINDER_CONFIG['reminder_tolerance']
+        due = []
+
+        with self._condition:
+            while self._heap:
+                entry = self._heap[0]
+
+                if not entry[_ACTIVE]:
+                    heapq.heappop(self._heap)
+                    self._inactive_count -= 1
+                    continue
+
+                if due:
+                    if entry[_FIRE_TS] != fire_timestamp:
+                        break
+                else:
+                    fire_timestamp = entry[_FIRE_TS]
+                    late = self.clock.time() - fire_timestamp
+                    if late < 0:
+                        return None
+
+                heapq.heappop(self._heap)
+                record = self._subscribers[entry[_SUBSCRIBER]]
+                record['entries'].remove(entry)
+                due.append((entry[_SUBSCRIBER], record, entry[_PAYLOAD]))
+
+        if not due:
+            return None
+        metrics.FIRE_LATENESS.observe(late, len(due))
+        return late > tolerance, due
+
+    def _run_callback(self, record, payload, missed):
+        """
+        Menjalankan callback subscriber (di luar lock agar subscriber lain
+        tetap bisa menambah/mengubah jadwal).
+
+        Returns:
+            Nilai kembali callback, atau None jika gagal
+        """
+        try:
+            return record['callback'](payload, missed)
+        except Exception as e:
+            print(f"❌ Error saat memproses reminder: {e}")
+            return None
+
+    def _dispatch_due(self, missed, due):
+        """
+        Memproses reminder yang jatuh tempo bersamaan. Reminder subscriber
+        dengan batch_key digabung per (batch_key, payload); sisanya
+        diproses satu per satu seperti biasa.
+
+        Args:
+            missed (bool): True jika terlewat melebihi toleransi
+            due (list): Tuple (subscriber_id, record, payload) urut heap
+        """
+        if missed:
+            metrics.REMINDERS_MISSED.inc(len(due))
+        else:
+            self.fired_count += len(due)
+            metrics.REMINDERS_FIRED.inc(len(due))
+
+        # Gabungan per (batch_key, payload), urutan kemunculan dipertahankan
+        batches = {}
+        for subscriber_id, record, payload in due:
+            # Subscriber yang dihapus/didaftarkan ulang oleh callback sebelumnya dilewati
+            if self._subscribers.get(subscriber_id) is not record:
+                continue
+            if record['batch_key'] is None:
+                self._run_callback(record, payload, missed)
+                continue
+            key = (record['batch_key'], payload)
+            batch = batches.get(key)
+            if batch is None:
+                batches[key] = batch = (record['batch_callback'], [])
+            recipient = self._run_callback(record, payload, missed)
+            if recipient is not None:
+                batch[1].append(recipient)
+
+        for (_, payload), (batch_callback, recipients) in batches.items():
+            if not recipients:
+                continue
+            metrics.REMINDER_BATCH_SIZE.observe(len(recipients))
+            try:
+                batch_callback(payload, missed, recipients)
+            except Exception as e:
+                print(f"❌ Error saat mengirim reminder gabungan: {e}")
+
+    def _wait_for_next_deadline(self):
+        """
+        Menunggu tepat sampai deadline puncak heap (mode 'deadline').
+        Selisih waktu dihitung sekali dari jam dinding lalu ditunggu
+        dengan jam monotonic, sehingga perubahan jam sistem saat tidur
+        tidak memperpanjang atau memperpendek penantian.
+        Penantian berakhir lebih awal jika heap berubah atau engine dihentikan.
+        """
+        with self._condition:
+            self._heap_changed = False
+
+            if not self._heap:
+                # Tidak ada deadline - tidur sampai ada perubahan heap
+                while self.is_running and not self._heap_changed:
+                    self.clock.wait(self._condition)
+                return
+
+            remaining = self._heap[0][_FIRE_TS] - self.clock.time()
+            deadline = self.clock.monotonic() + remaining
+
+            while self.is_running and not self._heap_changed:
+                timeout = deadline - self.clock.monotonic()
+                if timeout <= 0:
+                    break
+                self.clock.wait(self._condition, timeout)
+
+    def _wait_for_next_poll(self):
+        """
+        Menunggu satu interval pengecekan (mode 'polling').
+        """
+        with self._condition:
+            self._heap_changed = False
+            if self.is_running:
+                self.clock.wait(self._condition, REMINDER_CONFIG['check_interval'])
+
+    def _dispatch_loop(self):
+        """
+        Thread function dispatcher: memproses semua reminder yang jatuh tempo
+        lalu tidur sampai deadline atau interval berikutnya.
+        """
+        if REMINDER_CONFIG['scheduler_mode'] == 'polling':
+            wait_next = self._wait_for_next_poll
+        else:
+            wait_next = self._wait_for_next_deadline
+
+        while self.is_running:
+            self.wakeup_count += 1
+
+            due_reminders = self._pop_due_reminders()
+            while due_reminders is not None:
+                start = time.perf_counter()
+                with contextlib.ExitStack() as commit:
+                    for journal in list(self._journals):
+                        commit.enter_context(journal.batch())
+                    self._dispatch_due(*due_reminders)
+                metrics.DUE_DISPATCH_DURATION.observe(time.perf_counter() - start)
+
+                due_reminders = self._pop_due_reminders()
+
+            metrics.ENGINE_PENDING.set(self.pending_count())
+            wait_next()
+
+    def start(self):
+        """
+        Memulai thread dispatcher jika belum berjalan.
+
+        Returns:
+            bool: True jika thread baru dimulai
+        """
+        with self._condition:
+            if self.is_running:
+                return False
+            self.is_running = True
+
+        self.dispatcher_thread = threading.Thread(
+            target=self._dispatch_loop,
+            daemon=True
+        )
+        self.dispatcher_thread.start()
+        return True
+
+    def stop(self, timeout=1):
+        """
+        Menghentikan thread dispatcher.
+
+        Args:
+            timeout (float): Batas waktu menunggu thread selesai (detik)
+        """
+        with self._condition:
+            if not self.is_running:
+                return
+            self.is_running = False
+            self._notify_changed()
+
+        if (self.dispatcher_thread and self.dispatcher_thread.is_alive()
+                and self.dispatcher_thread is not threading.current_thread()):
+            self.dispatcher_thread.join(timeout=timeout)
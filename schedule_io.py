@@ -0,0 +1,479 @@
+# schedule_io.py
+# File berisi export/import jadwal massal secara streaming (JSONL, CSV, iCalendar)
+
+"""
+File ini berisi pipeline generator untuk export dan import jadwal sholat
+dalam jumlah besar (rentang tanggal x banyak lokasi) dengan memori tetap.
+
+Satu record adalah satu waktu sholat:
+    (lokasi, tanggal, nama_sholat, jam, menit)
+
+Alur export : sumber jadwal -> iter_records -> formatter baris -> file
+Alur import : file -> pembaca record mentah -> validasi -> batch -> handler
+
+Tidak ada tahap yang menampung seluruh isi file di memori.
+"""
+
+import contextlib
+import csv
+import datetime
+import functools
+import itertools
+import json
+
+from config import SHOLAT_NAMES
+from timetable_store import UNDEFINED_SLOT
+from utils import validate_time_input
+
+# Format file yang didukung (berdasarkan ekstensi)
+STREAM_FORMATS = ('jsonl', 'csv', 'ics')
+
+# Jumlah record per batch saat import
+DEFAULT_BATCH_SIZE = 10000
+
+# Kolom file CSV (juga key record JSON Lines)
+CSV_FIELDS = ('location', 'date', 'name', 'hour', 'minute')
+
+_ICS_PRODID = '-//Sholat Reminder//Jadwal Sholat//ID'
+
+# Panjang maksimum content line iCalendar (octet, tanpa CRLF; RFC 5545 3.1)
+_ICS_LINE_OCTETS = 75
+
+
+def detect_format(path):
+    """
+    Menentukan format file dari ekstensinya.
+
+    Args:
+        path (str): Path file
+
+    Returns:
+        str: Salah satu STREAM_FORMATS
+    """
+    extension = path.rsplit('.', 1)[-1].lower() if '.' in path else ''
+    if extension not in STREAM_FORMATS:
+        raise ValueError(f"Format file tidak didukung: {path} "
+                         f"(gunakan .{', .'.join(STREAM_FORMATS)})")
+    return extension
+
+
+def date_range(start_date, end_date):
+    """
+    Generator tanggal dari start_date sampai end_date (inklusif).
+    """
+    one_day = datetime.timedelta(days=1)
+    date_obj = start_date
+    while date_obj <= end_date:
+        yield date_obj
+        date_obj += one_day
+
+
+def timetable_sources(path, locations=None):
+    """
+    Sumber jadwal dari timetable biner: satu sumber per lokasi.
+
+    Args:
+        path (str): Path file timetable
+        locations (list, optional): Nama lokasi. Default semua lokasi
+
+    Yields:
+        tuple: (nama_lokasi, fungsi tanggal -> menit per sholat)
+    """
+    from timetable_store import open_timetable
+
+    store = open_timetable(path)
+    if locations is None:
+        locations = (store.location_key(i) for i in range(store.location_count))
+
+    for key in locations:
+        yield key, functools.partial(store.row_minutes, store.location_index(key))
+
+
+def iter_records(sources, start_date, end_date, sholat_names=None):
+    """
+    Generator record untuk rentang tanggal x sumber jadwal.
+    Waktu yang tidak terdefinisi (UNDEFINED_SLOT) dilewati.
+
+    Args:
+        sources (iterable): Tuple (nama_lokasi, fungsi tanggal -> menit per sholat)
+        start_date (date): Tanggal awal
+        end_date (date): Tanggal akhir (inklusif)
+        sholat_names (list, optional): Nama sholat. Default SHOLAT_NAMES
+
+    Yields:
+        tuple: (lokasi, tanggal, nama_sholat, jam, menit)
+    """
+    if sholat_names is None:
+        sholat_names = SHOLAT_NAMES
+
+    for key, minutes_for in sources:
+        for date_obj in date_range(start_date, end_date):
+            for sholat_name, minute in zip(sholat_names, minutes_for(date_obj)):
+                if minute == UNDEFINED_SLOT:
+                    continue
+                yield key, date_obj, sholat_name, minute // 60, minute % 60
+
+
+def _jsonl_lines(records):
+    """
+    Formatter JSON Lines. Lokasi, tanggal dan nama yang berulang
+    diserialisasi sekali lalu dipakai ulang.
+    """
+    dumps = json.dumps
+    names = {}
+    last_key = last_date = None
+
+    for key, date_obj, sholat_name, hour, minute in records:
+        if key is not last_key:
+            key_json, last_key = dumps(key, ensure_ascii=False), key
+        if date_obj is not last_date:
+            date_text, last_date = date_obj.isoformat(), date_obj
+        name_json = names.get(sholat_name)
+        if name_json is None:
+            name_json = names[sholat_name] = dumps(sholat_name, ensure_ascii=False)
+
+        yield (f'{{"location": {key_json}, "date": "{date_text}", '
+               f'"name": {name_json}, "hour": {hour}, "minute": {minute}}}\n')
+
+
+def _csv_rows(records):
+    """
+    Formatter baris CSV (untuk csv.writer).
+    """
+    last_date = None
+    for key, date_obj, sholat_name, hour, minute in records:
+        if date_obj is not last_date:
+            date_text, last_date = date_obj.isoformat(), date_obj
+        yield key, date_text, sholat_name, hour, minute
+
+
+def _ics_escape(text):
+    """
+    Escape teks sesuai RFC 5545 (backslash, titik koma, koma, baris baru).
+    """
+    return (text.replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\n', '\\n'))
+
+
+def _ics_fold(text, used=0):
+    """
+    Melipat content line iCalendar agar tidak lebih dari 75 octet: sisa
+    baris diteruskan setelah CRLF + spasi (RFC 5545 3.1), tanpa memotong
+    karakter UTF-8 multi-byte.
+
+    Args:
+        text (str): Isi baris (atau bagian akhirnya)
+        used (int): Octet yang sudah terpakai di baris sebelum text
+
+    Returns:
+        str: text dengan lipatan
+    """
+    if used + len(text) <= _ICS_LINE_OCTETS and (
+            text.isascii() or used + len(text.encode('utf-8')) <= _ICS_LINE_OCTETS):
+        return text
+
+    parts = []
+    current = []
+    size = used
+    # Baris lanjutan diawali spasi yang ikut dihitung
+    limit = _ICS_LINE_OCTETS
+    for char in text:
+        width = len(char.encode('utf-8'))
+        if size + width > limit:
+            parts.append(''.join(current))
+            current, size, limit = [], 0, _ICS_LINE_OCTETS - 1
+        current.append(char)
+        size += width
+    parts.append(''.join(current))
+    return '\r\n '.join(parts)
+
+
+def _ics_event_parts(key, sholat_name):
+    """
+    Bagian VEVENT yang sama untuk setiap tanggal (lokasi, sholat): akhiran
+    UID setelah tanggal dan baris SUMMARY/LOCATION/END, sudah dilipat.
+    'UID:' + tanggal selalu 12 octet ASCII, sehingga lipatan akhiran UID
+    bisa dihitung sekali.
+
+    Returns:
+        tuple: (akhiran UID, baris sisa event)
+    """
+    key_text = _ics_escape(key)
+    name_text = _ics_escape(sholat_name)
+    uid_tail = _ics_fold(f"-{name_text}-{key_text}@sholat-reminder", len('UID:YYYYMMDD'))
+    rest = (f"{_ics_fold(f'SUMMARY:{name_text}')}\r\n"
+            f"{_ics_fold(f'LOCATION:{key_text}')}\r\n"
+            f"END:VEVENT\r\n")
+    return uid_tail, rest
+
+
+def _ics_lines(records):
+    """
+    Formatter iCalendar: satu VEVENT per waktu sholat (waktu lokal/floating).
+    Baris yang lebih dari 75 octet (lokasi/nama panjang) dilipat.
+    """
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    # lokasi -> nama sholat -> (akhiran UID, baris sisa event)
+    events = {}
+    last_date = None
+
+    yield (f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:{_ICS_PRODID}\r\n"
+           f"CALSCALE:GREGORIAN\r\n")
+
+    for key, date_obj, sholat_name, hour, minute in records:
+        if date_obj is not last_date:
+            date_text, last_date = date_obj.strftime('%Y%m%d'), date_obj
+        by_name = events.get(key)
+        if by_name is None:
+            by_name = events[key] = {}
+        parts = by_name.get(sholat_name)
+        if parts is None:
+            parts = by_name[sholat_name] = _ics_event_parts(key, sholat_name)
+
+        yield (f"BEGIN:VEVENT\r\n"
+               f"UID:{date_text}{parts[0]}\r\n"
+               f"DTSTAMP:{stamp}\r\n"
+               f"DTSTART:{date_text}T{hour:02d}{minute:02d}00\r\n"
+               f"{parts[1]}")
+
+    yield "END:VCALENDAR\r\n"
+
+
+def _counted(records, counter):
+    """
+    Meneruskan record sambil menghitung jumlahnya di counter[0].
+    """
+    for record in records:
+        counter[0] += 1
+        yield record
+
+
+def export_records(records, path, fmt=None):
+    """
+    Menulis record ke file secara streaming.
+
+    Args:
+        records (iterable): Record (lokasi, tanggal, nama_sholat, jam, menit)
+        path (str): Path file tujuan
+        fmt (str, optional): Format file. Default dari ekstensi path
+
+    Returns:
+        int: Jumlah record yang ditulis
+    """
+    if fmt is None:
+        fmt = detect_format(path)
+
+    counter = [0]
+    records = _counted(records, counter)
+
+    # newline='' agar CRLF (CSV/iCalendar) ditulis apa adanya
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if fmt == 'jsonl':
+            f.writelines(_jsonl_lines(records))
+        elif fmt == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            writer.writerows(_csv_rows(records))
+        elif fmt == 'ics':
+            f.writelines(_ics_lines(records))
+        else:
+            raise ValueError(f"Format export tidak dikenal: {fmt}")
+
+    return counter[0]
+
+
+def _read_jsonl(f):
+    """
+    Pembaca JSON Lines; baris yang bukan JSON valid menghasilkan None
+    (ditolak saat validasi).
+    """
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            yield None
+
+
+def _ics_unescape(text):
+    """
+    Kebalikan dari _ics_escape.
+    """
+    return (text.replace('\\n', '\n').replace('\\,', ',')
+            .replace('\\;', ';').replace('\\\\', '\\'))
+
+
+def _read_ics(f):
+    """
+    Pembaca VEVENT iCalendar (dengan unfolding baris lanjutan).
+    """
+    event = None
+    pending = None
+
+    # Baris tambahan kosong di akhir untuk mengosongkan baris tertunda
+    for line in itertools.chain(f, ('',)):
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and pending is not None:
+            pending += line[1:]
+            continue
+
+        current, pending = pending, line
+        if current is None:
+            continue
+
+        field, _, value = current.partition(':')
+        field = field.split(';', 1)[0].upper()
+
+        if field == 'BEGIN' and value == 'VEVENT':
+            event = {}
+        elif field == 'END' and value == 'VEVENT' and event is not None:
+            start = event.get('DTSTART', '')
+            yield {
+                'location': _ics_unescape(event.get('LOCATION', '')),
+                'date': f"{start[0:4]}-{start[4:6]}-{start[6:8]}",
+                'name': _ics_unescape(event.get('SUMMARY', '')),
+                'hour': start[9:11],
+                'minute': start[11:13]
+            }
+            event = None
+        elif event is not None:
+            event[field] = value
+
+
+def iter_file_records(path, fmt=None):
+    """
+    Generator record mentah (dict) dari file, tanpa validasi.
+
+    Args:
+        path (str): Path file
+        fmt (str, optional): Format file. Default dari ekstensi path
+
+    Yields:
+        dict: Record dengan key CSV_FIELDS
+    """
+    if fmt is None:
+        fmt = detect_format(path)
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if fmt == 'jsonl':
+            yield from _read_jsonl(f)
+        elif fmt == 'csv':
+            yield from csv.DictReader(f)
+        elif fmt == 'ics':
+            yield from _read_ics(f)
+        else:
+            raise ValueError(f"Format import tidak dikenal: {fmt}")
+
+
+def validate_record(raw):
+    """
+    Memvalidasi dan menormalkan satu record mentah.
+
+    Args:
+        raw (dict): Record dengan key CSV_FIELDS
+
+    Returns:
+        tuple: (lokasi, tanggal, nama_sholat, jam, menit)
+
+    Raises:
+        ValueError: Jika record tidak valid
+    """
+    try:
+        name = raw['name']
+        location = raw['location']
+        date_obj = datetime.date.fromisoformat(raw['date'])
+        hour, minute = raw['hour'], raw['minute']
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Field tidak lengkap: {e}")
+
+    if not name:
+        raise ValueError("Nama sholat kosong")
+
+    is_valid, message = validate_time_input(hour, minute)
+    if not is_valid:
+        raise ValueError(message)
+
+    return location, date_obj, name, int(hour), int(minute)
+
+
+def iter_batches(records, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Mengelompokkan record menjadi list berukuran batch_size.
+    """
+    iterator = iter(records)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def import_records(path, handler, fmt=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Membaca, memvalidasi dan menyerahkan record ke handler per batch.
+    Record yang tidak valid dilewati dan dihitung.
+
+    Args:
+        path (str): Path file
+        handler (function): Dipanggil dengan list record tervalidasi per batch
+        fmt (str, optional): Format file. Default dari ekstensi path
+        batch_size (int): Jumlah record per batch
+
+    Returns:
+        dict: Statistik {'loaded', 'invalid', 'batches', 'first_error'}
+    """
+    stats = {'loaded': 0, 'invalid': 0, 'batches': 0, 'first_error': None}
+
+    def validated(raw_records):
+        for line_number, raw in enumerate(raw_records, 1):
+            try:
+                yield validate_record(raw)
+            except ValueError as e:
+                stats['invalid'] += 1
+                if stats['first_error'] is None:
+                    stats['first_error'] = f"record ke-{line_number}: {e}"
+
+    for batch in iter_batches(validated(iter_file_records(path, fmt)), batch_size):
+        handler(batch)
+        stats['loaded'] += len(batch)
+        stats['batches'] += 1
+
+    return stats
+
+
+def load_day_prayers(path, date_obj, location=None, fmt=None):
+    """
+    Mengambil jadwal satu hari (dan satu lokasi) dari file export.
+
+    Args:
+        path (str): Path file
+        date_obj (date): Tanggal yang dicari
+        location (str, optional): Nama lokasi. Default lokasi pertama yang
+            memiliki tanggal tersebut
+        fmt (str, optional): Format file. Default dari ekstensi path
+
+    Returns:
+        list: Waktu sholat dalam format [{'name', 'hour', 'minute'}, ...]
+    """
+    prayers = []
+
+    # Record satu lokasi tersimpan urut tanggal: setelah tanggal yang
+    # dicari lewat untuk lokasi tersebut, sisa file tidak perlu dibaca
+    with contextlib.closing(iter_file_records(path, fmt)) as raw_records:
+        for raw in raw_records:
+            try:
+                record_location, record_date, name, hour, minute = validate_record(raw)
+            except ValueError:
+                continue
+            if location is not None and record_location != location:
+                continue
+            if record_date != date_obj:
+                if location is not None and record_date > date_obj:
+                    break
+                continue
+            location = record_location
+            prayers.append({'name': name, 'hour': hour, 'minute': minute})
+
+    return prayers
@@ -5,32 +5,51 @@
 File ini berisi implementasi class SholatReminder yang mengelola
 seluruh logika bisnis program reminder sholat menggunakan 
 struktur data Array dan Queue.
+
+Setiap SholatReminder adalah tampilan per-subscriber di atas
+ReminderEngine; dispatch reminder dilakukan oleh thread milik engine.
+
+Queue menjangkau horizon beberapa hari (REMINDER_CONFIG['horizon_days']).
+Jadwal hari berikutnya dibuat lazy oleh generator; saat tengah malam
+hari yang lewat dibuang dan satu hari baru ditambahkan, sehingga proses
+bisa berjalan berbulan-bulan dengan memori tetap.
 """
 
+import bisect
 import datetime
-import time
 import threading
+import time
 from collections import deque
 
 # Import dari file-file lain dalam proyek
 from config import (
     SHOLAT_NAMES, 
     DEFAULT_PRAYER_TIMES, 
-    REMINDER_CONFIG, 
-    MESSAGES
+    LOCATION_CONFIG,
+    TIMETABLE_CONFIG,
+    REMINDER_CONFIG,
+    METRICS_CONFIG,
+    JOURNAL_CONFIG,
+    MESSAGES,
+    ensure_config_valid
 )
 from utils import (
     format_time,
     format_date,
     calculate_time_difference,
-    play_reminder_sound,
     print_header,
     print_separator,
-    create_datetime_from_time,
-    is_time_in_range,
-    format_prayer_notification,
-    get_current_time_info
+    format_prayer_notification
 )
+import metrics
+from clock import get_clock
+from day_schedule import DaySchedule
+from zones import get_zone, local_date, midnight_epoch, utc_offset_hours
+from reminder_engine import ReminderEngine
+from notification_dispatch import NotificationDispatcher
+
+# Payload penanda pergantian hari (tengah malam) di engine
+_ROLLOVER = (0, -1)
 
 class SholatReminder:
     """
@@ -39,60 +58,374 @@ class SholatReminder:
     Menggunakan:
     - Array untuk menyimpan jadwal sholat
     - Queue untuk mengelola antrian reminder
-    - Threading untuk monitoring real-time
+    - ReminderEngine untuk monitoring real-time
     """
     
-    def __init__(self):
+    def __init__(self, engine=None, subscriber_id=None, location=None, timetable=None,
+                 dispatcher=None, quiet=False, clock=None, journal=None, zone=None,
+                 coalesce=None):
         """
         Inisialisasi objek SholatReminder.
         Menyiapkan array jadwal dan queue reminder.
+        
+        Args:
+            engine (ReminderEngine, optional): Engine bersama. Default engine privat
+            subscriber_id (hashable, optional): ID subscriber di engine. Default id(self)
+            location (dict, optional): Lokasi dengan format LOCATION_CONFIG.
+                Default LOCATION_CONFIG jika lintangnya diisi
+            timetable (dict, optional): {'path': file timetable, 'location': nama lokasi}.
+                Default TIMETABLE_CONFIG jika path-nya diisi
+            dispatcher (NotificationDispatcher, optional): Pool notifikasi bersama.
+                Default dispatcher privat dari DISPATCH_CONFIG
+            quiet (bool): True untuk penggunaan non-interaktif: konstruksi dan build
+                queue tanpa output, dan tanpa status queue di console setiap reminder tiba
+                (notifikasi tetap dikirim lewat dispatcher)
+            clock (SystemClock/VirtualClock, optional): Sumber waktu. Default jam
+                milik engine yang diberikan, atau jam default
+            journal (FiredJournal/str/bool, optional): Journal reminder yang sudah
+                fire, atau path-nya (dipakai bersama semua subscriber di path yang
+                sama). Default JOURNAL_CONFIG jika path-nya diisi; False untuk tanpa journal
+            zone (str, optional): Zona waktu IANA subscriber, misal 'Asia/Makassar'.
+                Default field 'zone' lokasi (LOCATION_CONFIG); None = waktu lokal sistem
+            coalesce (bool, optional): Gabungkan notifikasi dengan subscriber lain di
+                engine bersama yang memakai lokasi, zona dan dispatcher yang sama.
+                Default REMINDER_CONFIG['coalesce']
         """
+        ensure_config_valid()
+        
+        # Sumber waktu; harus sama dengan jam engine agar jadwal dan dispatch konsisten
+        if clock is None:
+            clock = engine.clock if engine is not None else get_clock()
+        self.clock = clock
+        self.quiet = quiet
+        
         # Array untuk menyimpan nama-nama sholat (dari config)
         self.sholat_names = SHOLAT_NAMES.copy()
         
         # Array untuk menyimpan waktu default (dari config)
         self.default_times = [time_pair.copy() for time_pair in DEFAULT_PRAYER_TIMES]
         
-        # Array untuk menyimpan jadwal sholat hari ini
-        # Format: [(nama_sholat, datetime_object), ...]
-        self.today_schedule = []
+        # Lokasi untuk perhitungan astronomis (None = pakai waktu default)
+        if location is None and LOCATION_CONFIG['latitude'] is not None:
+            location = LOCATION_CONFIG
+        self.location = dict(location) if location is not None else None
+        
+        # Timetable biner sebagai sumber jadwal (prioritas di atas lokasi)
+        if timetable is None and TIMETABLE_CONFIG['path'] is not None:
+            timetable = TIMETABLE_CONFIG
+        self.timetable = dict(timetable) if timetable is not None else None
+        
+        # Tahun di luar timetable yang sudah diperingatkan (sekali per tahun)
+        self._timetable_warned = set()
+        
+        # Zona waktu jadwal: waktu sholat adalah waktu dinding di zona ini,
+        # waktu fire-nya epoch UTC (None = waktu lokal sistem)
+        if zone is None:
+            zone = (self.location or LOCATION_CONFIG).get('zone')
+        self.zone = get_zone(zone)
+        
+        # Journal reminder yang sudah fire (None = tanpa journal)
+        if journal is None and JOURNAL_CONFIG['path'] is not None:
+            journal = JOURNAL_CONFIG['path']
+        if isinstance(journal, str):
+            from fired_journal import open_journal
+            
+            journal = open_journal(journal)
+        self.journal = journal or None
+        
+        # Kunci subscriber di journal bersama (None = subscriber default;
+        # id(self) tidak dipakai karena berubah setiap restart)
+        self._journal_subscriber = subscriber_id
+        
+        # Jadwal sholat hari ini: array menit + indeks nama (DaySchedule)
+        # Diakses seperti array tuple (nama_sholat, datetime_object)
+        self.today_schedule = DaySchedule(self.local_today(), zone=self.zone)
+        
+        # Horizon: jadwal hari ini dan hari-hari berikutnya yang sudah dibuat
+        # (horizon[0] selalu today_schedule, tanggal berurutan)
+        self.horizon_days = REMINDER_CONFIG['horizon_days']
+        self.horizon = deque([self.today_schedule])
+        
+        # Generator jadwal hari setelah hari terakhir di horizon
+        self._day_source = None
         
         # Queue untuk menyimpan reminder yang akan datang
+        # Format: (ordinal tanggal, indeks sholat), urut berdasarkan waktu
         # Menggunakan deque untuk operasi queue yang efisien
         self.reminder_queue = deque()
         
-        # Flag untuk mengontrol thread monitoring
+        # Lock untuk queue karena di-dequeue oleh thread dispatcher engine
+        self._queue_lock = threading.Lock()
+        
+        # Flag apakah reminder subscriber ini aktif di engine
         self.is_running = False
         
-        # Thread object untuk monitoring
-        self.monitor_thread = None
+        # Snapshot status yang di-cache: (versi, timestamp kedaluwarsa, status).
+        # Versi naik setiap jadwal/queue berubah (lihat _invalidate_status)
+        self._status_version = 0
+        self._status_cache = None
+        
+        # Engine tempat reminder didaftarkan (privat jika tidak diberikan)
+        self._owns_engine = engine is None
+        self.engine = ReminderEngine(clock=self.clock) if engine is None else engine
+        self.subscriber_id = id(self) if subscriber_id is None else subscriber_id
+        
+        # Pool worker notifikasi (privat jika tidak diberikan)
+        self._owns_dispatcher = dispatcher is None
+        self.dispatcher = NotificationDispatcher() if dispatcher is None else dispatcher
+        
+        # Kunci penggabungan reminder di engine bersama: subscriber dengan
+        # sumber jadwal, zona dan dispatcher yang sama menerima notifikasi
+        # yang sama pada menit yang sama (None = tidak digabung)
+        if coalesce is None:
+            coalesce = REMINDER_CONFIG['coalesce']
+        self.batch_key = None
+        if coalesce and not self._owns_engine:
+            self.batch_key = (self._source_key(), getattr(self.zone, 'key', None),
+                              id(self.dispatcher))
         
         # Inisialisasi jadwal hari ini
-        self.initialize_today_schedule()
+        self.initialize_today_schedule(display=not quiet)
+    
+    def get_prayer_times(self, date_obj):
+        """
+        Sumber jadwal: waktu sholat [jam, menit] untuk tanggal tertentu.
+        Urutan prioritas: timetable biner (jika berisi tahun tanggal tersebut),
+        perhitungan astronomis dari lokasi (lewat cache bersama), lalu waktu
+        default.
+        
+        Args:
+            date_obj (date): Tanggal jadwal
+        
+        Returns:
+            list: Waktu dalam format [[jam, menit], ...] sesuai urutan sholat_names
+        """
+        if self.timetable is not None:
+            from timetable_store import open_timetable
+            
+            store = open_timetable(self.timetable['path'])
+            if store.covers(date_obj):
+                return store.prayer_times(self.timetable['location'], date_obj)
+            
+            # Timetable tahun lain: jangan pakai baris tanggal yang sama dari
+            # tahun tersebut, hitung dari lokasi (atau waktu default)
+            if not self.quiet and date_obj.year not in self._timetable_warned:
+                self._timetable_warned.add(date_obj.year)
+                print(f"⚠️ Timetable {self.timetable['path']} untuk tahun {store.year}, "
+                      f"jadwal {date_obj.year} memakai "
+                      f"{'perhitungan lokasi' if self.location is not None else 'waktu default'}")
+        
+        if self.location is None:
+            return self.default_times
+        
+        # Zona ber-DST: offset untuk perhitungan mengikuti tanggalnya
+        location = self.location
+        offset = utc_offset_hours(self.zone, date_obj)
+        if offset is not None and offset != location['timezone']:
+            location = dict(location, timezone=offset)
+        
+        # Lokasi berdekatan berbagi hasil lewat cache; NumPy hanya
+        # diimport saat cache miss
+        from prayer_cache import get_default_cache
+        
+        return get_default_cache().day_times(location, date_obj)
     
-    def initialize_today_schedule(self):
+    def _source_key(self):
+        """
+        Identitas sumber jadwal (timetable, lokasi astronomis atau waktu default).
+        
+        Returns:
+            tuple: Kunci yang sama untuk subscriber dengan jadwal dasar yang sama
+        """
+        if self.timetable is not None:
+            return ('timetable', self.timetable['path'], self.timetable['location'])
+        if self.location is not None:
+            return ('location', self.location['latitude'], self.location['longitude'],
+                    self.location.get('method'), self.location.get('asr_factor'))
+        return ('default',)
+    
+    def local_today(self):
+        """
+        Tanggal hari ini di zona waktu jadwal.
+        
+        Returns:
+            date: Tanggal lokal subscriber
+        """
+        return local_date(self.zone, self.clock.time())
+    
+    def initialize_today_schedule(self, display=True):
         """
         Menginisialisasi array jadwal sholat untuk hari ini.
-        Mengonversi waktu default menjadi objek datetime.
+        Mengonversi waktu dari sumber jadwal menjadi objek datetime.
+        
+        Args:
+            display (bool): False untuk melewati pesan dan tampilan jadwal
         """
-        print(MESSAGES['initialization'])
+        if display:
+            print(MESSAGES['initialization'])
+        
+        # Mengisi array jadwal (menit sejak tengah malam) dari sumber jadwal
+        self._reset_horizon(next(self._generate_days(self.local_today())))
         
-        today = datetime.date.today()
-        self.today_schedule = []  # Reset array jadwal
+        if display:
+            print(MESSAGES['init_success'])
+            self.display_schedule()
+    
+    def _generate_days(self, start_date):
+        """
+        Generator jadwal harian mulai dari tanggal tertentu (tanpa batas).
+        Jadwal tiap hari baru dibuat saat diminta.
+        
+        Args:
+            start_date (date): Tanggal pertama
+        
+        Yields:
+            DaySchedule: Jadwal hari berikutnya
+        """
+        date_obj = start_date
+        while True:
+            yield self._build_day(date_obj)
+            date_obj += datetime.timedelta(days=1)
+    
+    def _build_day(self, date_obj):
+        """
+        Membuat jadwal satu hari dari sumber jadwal. Sholat yang waktunya
+        tidak terdefinisi (lintang tinggi: matahari tidak terbit/terbenam)
+        dilewati, bukan membuat konstruksi gagal.
+        
+        Args:
+            date_obj (date): Tanggal jadwal
+        
+        Returns:
+            DaySchedule: Jadwal hari tersebut
+        """
+        prayer_times = self.get_prayer_times(date_obj)[:len(self.sholat_names)]
+        if None not in prayer_times:
+            return DaySchedule.from_times(date_obj, prayer_times, self.sholat_names, self.zone)
+        
+        defined = [(name, time_pair) for name, time_pair in zip(self.sholat_names, prayer_times)
+                   if time_pair is not None]
+        return DaySchedule.from_times(
+            date_obj,
+            [time_pair for _, time_pair in defined],
+            [name for name, _ in defined],
+            self.zone
+        )
+    
+    def _reset_horizon(self, schedule):
+        """
+        Menjadikan jadwal tertentu sebagai hari ini dan mengosongkan horizon.
+        Hari-hari berikutnya dibuat lagi dari sumber jadwal.
         
-        # Mengisi array jadwal dengan iterasi melalui waktu default
-        for i in range(len(self.sholat_names)):
-            sholat_name = self.sholat_names[i]
-            hour, minute = self.default_times[i]
+        Args:
+            schedule (DaySchedule): Jadwal hari ini
+        """
+        self.today_schedule = schedule
+        self.horizon = deque([schedule])
+        self._day_source = self._generate_days(schedule.date + datetime.timedelta(days=1))
+        self._invalidate_status()
+    
+    def _drop_past_days(self, today):
+        """
+        Membuang hari yang sudah lewat dari horizon dan queue.
+        Dipanggil dengan _queue_lock terpegang.
+        
+        Args:
+            today (date): Tanggal hari ini
+        
+        Returns:
+            list: Entri queue yang dibuang
+        """
+        while self.horizon and self.horizon[0].date < today:
+            self.horizon.popleft()
+        
+        if not self.horizon:
+            # Lama tidak aktif (misal komputer sleep) - lompat ke hari ini
+            self._day_source = self._generate_days(today)
+        
+        # Queue urut berdasarkan waktu, jadi entri hari lama ada di depan
+        first_ordinal = today.toordinal()
+        dropped = []
+        while self.reminder_queue and self.reminder_queue[0][0] < first_ordinal:
+            dropped.append(self.reminder_queue.popleft())
+        return dropped
+    
+    def _extend_horizon(self, now_timestamp):
+        """
+        Menambah hari dari generator sampai horizon berisi horizon_days hari.
+        Reminder hari baru selalu lebih akhir dari isi queue, sehingga cukup
+        di-append. Dipanggil dengan _queue_lock terpegang.
+        
+        Args:
+            now_timestamp (float): Timestamp saat ini
+        
+        Returns:
+            list: Reminder baru dalam format engine (timestamp_fire, entri)
+        """
+        reminders = []
+        while len(self.horizon) < self.horizon_days:
+            schedule = next(self._day_source)
+            self.horizon.append(schedule)
             
-            # Membuat objek datetime untuk waktu sholat
-            sholat_time = create_datetime_from_time(hour, minute, today)
+            ordinal = schedule.date.toordinal()
+            for sholat_index in schedule.upcoming_indexes(now_timestamp):
+                entry = (ordinal, sholat_index)
+                self.reminder_queue.append(entry)
+                reminders.append((schedule.timestamp(sholat_index), entry))
+        
+        self.today_schedule = self.horizon[0]
+        return reminders
+    
+    def _entry_schedule(self, entry):
+        """
+        Jadwal harian tempat entri queue berada.
+        
+        Args:
+            entry (tuple): (ordinal tanggal, indeks sholat)
+        
+        Returns:
+            DaySchedule: Jadwal hari tersebut
+        """
+        return self.horizon[entry[0] - self.horizon[0].date.toordinal()]
+    
+    def _entry_timestamp(self, entry):
+        """
+        Timestamp fire untuk entri queue.
+        """
+        return self._entry_schedule(entry).timestamp(entry[1])
+    
+    def _next_midnight(self):
+        """
+        Epoch tengah malam berikutnya di zona jadwal (waktu fire penanda
+        pergantian hari).
+        """
+        next_day = self.today_schedule.date + datetime.timedelta(days=1)
+        return midnight_epoch(self.zone, next_day)
+    
+    def _roll_over(self, today=None):
+        """
+        Pergantian hari: buang hari yang lewat lalu tambahkan hari baru di
+        ujung horizon. Hanya reminder hari baru yang di-push ke engine.
+        
+        Args:
+            today (date, optional): Tanggal hari ini. Default dari self.clock
+        """
+        if today is None:
+            today = self.local_today()
+        
+        with self._queue_lock:
+            for entry in self._drop_past_days(today):
+                self.engine.update_reminder(self.subscriber_id, entry, None)
             
-            # Menyimpan dalam array sebagai tuple (nama, waktu)
-            self.today_schedule.append((sholat_name, sholat_time))
+            self.engine.add_reminders(self.subscriber_id, self._extend_horizon(self.clock.time()))
+            self.engine.update_reminder(self.subscriber_id, _ROLLOVER, self._next_midnight())
+            self._invalidate_status()
+        
+        if self.journal is not None:
+            self.journal.mark_alive(self.clock.time(), self._journal_subscriber)
         
-        print(MESSAGES['init_success'])
-        self.display_schedule()
+        if not self.quiet:
+            print(f"🌅 Hari berganti, jadwal {format_date(self.today_schedule.date)} aktif")
     
     def display_schedule(self):
         """
@@ -122,27 +455,28 @@ class SholatReminder:
         """
         # Validasi indeks array
         if not (0 <= sholat_index < len(self.today_schedule)):
-            print("❌ Indeks sholat tidak valid!")
+            if not self.quiet:
+                print("❌ Indeks sholat tidak valid!")
             return False
         
         try:
-            today = datetime.date.today()
-            new_time = create_datetime_from_time(hour, minute, today)
-            
             # Update array pada indeks tertentu
-            sholat_name = self.today_schedule[sholat_index][0]
-            self.today_schedule[sholat_index] = (sholat_name, new_time)
+            sholat_name = self.today_schedule.name(sholat_index)
+            self.today_schedule.set_time(sholat_index, hour, minute)
+            self._invalidate_status()
             
-            print(f"✅ Waktu {sholat_name} berhasil diupdate menjadi {hour:02d}:{minute:02d}")
+            if not self.quiet:
+                print(f"✅ Waktu {sholat_name} berhasil diupdate menjadi {hour:02d}:{minute:02d}")
             
-            # Rebuild queue jika sistem sedang berjalan
+            # Perbarui queue secara inkremental jika sistem sedang berjalan
             if self.is_running:
-                self.build_reminder_queue()
+                self._reschedule_reminder(sholat_index)
             
             return True
         
         except Exception as e:
-            print(f"❌ Error saat update waktu: {e}")
+            if not self.quiet:
+                print(f"❌ Error saat update waktu: {e}")
             return False
     
     def build_reminder_queue(self):
@@ -150,38 +484,166 @@ class SholatReminder:
         Membangun queue reminder dari array jadwal sholat.
         Queue diurutkan berdasarkan waktu (FIFO untuk waktu yang sama).
         """
-        print(MESSAGES['building_queue'])
+        if not self.quiet:
+            print(MESSAGES['building_queue'])
         
-        # Kosongkan queue yang lama
-        self.reminder_queue.clear()
+        build_start = time.perf_counter()
+        queue_size = self._fill_reminder_queue(self.clock.time())
+        metrics.QUEUE_REBUILDS.inc()
+        metrics.QUEUE_BUILD_DURATION.observe(time.perf_counter() - build_start)
+        metrics.REMINDER_QUEUE_SIZE.set(queue_size)
         
-        current_time = get_current_time_info()['datetime']
-        upcoming_reminders = []
+        if not self.quiet:
+            print(f"{MESSAGES['queue_built']} {queue_size} sholat yang akan datang")
+            if queue_size > 0:
+                self.display_queue()
         
-        # Iterasi melalui array jadwal untuk mencari sholat yang belum lewat
-        for i in range(len(self.today_schedule)):
-            sholat_name, sholat_time = self.today_schedule[i]
+        return queue_size > 0
+    
+    def refresh_schedule(self):
+        """
+        Memajukan queue reminder yang tidak berjalan di engine (misal reminder
+        per lokasi yang hanya dibaca oleh HTTP API): hari dan sholat yang
+        sudah lewat dibuang. Tanpa output dan tanpa metrik queue, karena
+        queue ini tidak dimonitor.
+        
+        Returns:
+            bool: True jika queue dibangun ulang (reminder tidak berjalan)
+        """
+        if self.is_running:
+            return False
+        self._fill_reminder_queue(self.clock.time())
+        return True
+    
+    def _fill_reminder_queue(self, now):
+        """
+        Isi build_reminder_queue tanpa output dan metrik.
+        
+        Returns:
+            int: Panjang queue
+        """
+        # Ganti isi queue di bawah lock agar thread dispatcher
+        # tidak melihat queue setengah jadi
+        with self._queue_lock:
+            self._drop_past_days(self.local_today())
+            self.reminder_queue.clear()
+            
+            # Enqueue sholat yang belum lewat per hari di horizon; indeks
+            # per hari sudah diurutkan berdasarkan waktu (perbandingan menit).
+            # Reminder yang sudah tercatat di journal tidak di-enqueue lagi
+            for schedule in self.horizon:
+                ordinal = schedule.date.toordinal()
+                self.reminder_queue.extend(
+                    (ordinal, sholat_index)
+                    for sholat_index in schedule.upcoming_indexes(now)
+                    if not self._is_processed(ordinal, sholat_index)
+                )
             
-            # Hanya masukkan sholat yang waktunya belum lewat
-            if sholat_time > current_time:
-                # Hitung selisih waktu untuk sorting
-                time_diff = (sholat_time - current_time).total_seconds()
-                upcoming_reminders.append((time_diff, sholat_name, sholat_time))
+            # Lengkapi horizon dengan hari berikutnya dari generator
+            self._extend_horizon(now)
+            self._invalidate_status()
+            
+            # Sinkronkan reminder subscriber ini di engine
+            if self.is_running:
+                self.engine.update_subscriber(self.subscriber_id, self._engine_reminders())
+            return len(self.reminder_queue)
+    
+    def _reschedule_reminder(self, sholat_index, schedule=None):
+        """
+        Memindahkan satu reminder ke posisi barunya tanpa rebuild queue.
+        Entri lama dihapus lalu entri baru disisipkan dengan bisect (queue)
+        dan heap push (engine); reminder lain tidak disentuh.
+        
+        Args:
+            sholat_index (int): Indeks sholat yang waktunya berubah
+            schedule (DaySchedule, optional): Hari dalam horizon. Default hari ini
+        """
+        with self._queue_lock:
+            self._move_reminder(sholat_index, schedule or self.today_schedule)
+    
+    def _move_reminder(self, sholat_index, schedule):
+        """
+        Isi _reschedule_reminder. Dipanggil dengan _queue_lock terpegang.
+        """
+        entry = (schedule.date.toordinal(), sholat_index)
+        fire_timestamp = schedule.timestamp(sholat_index)
+        if fire_timestamp <= self.clock.time():
+            fire_timestamp = None  # Waktu baru sudah lewat - cukup dihapus
         
-        # Sort berdasarkan waktu (ascending) - yang terdekat di awal
-        upcoming_reminders.sort(key=lambda x: x[0])
+        try:
+            self.reminder_queue.remove(entry)
+        except ValueError:
+            pass
         
-        # Enqueue reminder ke dalam queue sesuai urutan waktu
-        for _, sholat_name, sholat_time in upcoming_reminders:
-            self.reminder_queue.append((sholat_name, sholat_time))
+        if fire_timestamp is not None:
+            bisect.insort(self.reminder_queue, entry, key=self._entry_timestamp)
         
-        queue_size = len(self.reminder_queue)
-        print(f"{MESSAGES['queue_built']} {queue_size} sholat yang akan datang")
+        self.engine.update_reminder(self.subscriber_id, entry, fire_timestamp)
+        self._invalidate_status()
+    
+    def reload_default_times(self, sholat_indexes):
+        """
+        Menerapkan perubahan DEFAULT_PRAYER_TIMES (hot-reload) tanpa rebuild
+        queue: hanya sholat yang berubah yang dijadwalkan ulang, di setiap
+        hari dalam horizon. Sholat yang sudah lewat tidak diubah (tidak
+        dikirim ulang). Subscriber dengan sumber jadwal timetable atau
+        lokasi tidak terpengaruh.
         
-        if queue_size > 0:
-            self.display_queue()
+        Args:
+            sholat_indexes (iterable): Indeks sholat yang waktunya berubah
         
-        return queue_size > 0
+        Returns:
+            int: Jumlah reminder yang dijadwalkan ulang
+        """
+        if self.timetable is not None or self.location is not None:
+            return 0
+        
+        rescheduled = 0
+        with self._queue_lock:
+            now = self.clock.time()
+            for sholat_index in sholat_indexes:
+                hour, minute = DEFAULT_PRAYER_TIMES[sholat_index]
+                
+                # Hari berikutnya yang belum dibuat generator memakai waktu baru
+                self.default_times[sholat_index] = [hour, minute]
+                
+                for schedule in self.horizon:
+                    if schedule.timestamp(sholat_index) <= now:
+                        continue
+                    schedule.set_time(sholat_index, hour, minute)
+                    if self.is_running:
+                        self._move_reminder(sholat_index, schedule)
+                    rescheduled += 1
+            self._invalidate_status()
+        return rescheduled
+    
+    def set_horizon_days(self, days):
+        """
+        Mengubah jumlah hari horizon (hot-reload). Horizon yang membesar
+        langsung dilengkapi; jika mengecil, hari yang berlebih habis sendiri
+        saat pergantian hari.
+        
+        Args:
+            days (int): Jumlah hari horizon baru
+        """
+        with self._queue_lock:
+            self.horizon_days = days
+            if self.is_running:
+                self.engine.add_reminders(self.subscriber_id,
+                                          self._extend_horizon(self.clock.time()))
+            self._invalidate_status()
+    
+    def _engine_reminders(self):
+        """
+        Reminder dalam queue dalam format engine: (timestamp_fire, entri),
+        ditambah penanda pergantian hari di tengah malam berikutnya.
+        
+        Returns:
+            list: Reminder untuk ReminderEngine
+        """
+        reminders = [(self._entry_timestamp(entry), entry) for entry in self.reminder_queue]
+        reminders.append((self._next_midnight(), _ROLLOVER))
+        return reminders
     
     def display_queue(self):
         """
@@ -195,11 +657,18 @@ class SholatReminder:
         print_header("📋 QUEUE REMINDER SHOLAT", 'queue')
         
         # Konversi queue ke list untuk ditampilkan tanpa mengubah queue
-        temp_queue = list(self.reminder_queue)
+        with self._queue_lock:
+            temp_queue = [(self._entry_schedule(entry), entry[1]) for entry in self.reminder_queue]
         
-        for i, (sholat_name, sholat_time) in enumerate(temp_queue):
+        today = self.local_today()
+        for i, (schedule, sholat_index) in enumerate(temp_queue):
+            sholat_name, sholat_time = schedule[sholat_index]
             formatted_time = format_time(sholat_time)
             
+            # Reminder hari berikutnya ditampilkan beserta tanggalnya
+            if schedule.date != today:
+                formatted_time = f"{format_date(sholat_time)} {formatted_time}"
+            
             # Tampilkan status khusus untuk reminder berikutnya
             if i == 0:
                 status = "⏰ BERIKUTNYA"
@@ -213,18 +682,38 @@ class SholatReminder:
     def get_next_prayer_info(self):
         """
         Mendapatkan informasi sholat berikutnya dari head queue.
+        Diambil dari snapshot status yang di-cache (lihat status_snapshot).
         
         Returns:
             dict atau None: Informasi sholat berikutnya
         """
-        if not self.reminder_queue:
-            return None
+        return self.status_snapshot()['next_prayer']
+    
+    def _compute_next_prayer_info(self, now_timestamp):
+        """
+        Menghitung informasi sholat berikutnya dari head queue.
+        
+        Args:
+            now_timestamp (float): Timestamp saat ini
+        
+        Returns:
+            dict atau None: Informasi sholat berikutnya
+        """
+        # Peek queue tanpa dequeue (di bawah lock karena queue bisa sedang diubah)
+        with self._queue_lock:
+            if not self.reminder_queue:
+                return None
+            next_entry = self.reminder_queue[0]
+            next_schedule = self._entry_schedule(next_entry)
         
-        # Peek queue tanpa dequeue
-        next_sholat_name, next_sholat_time = self.reminder_queue[0]
+        next_sholat_name, next_sholat_time = next_schedule[next_entry[1]]
         
-        # Hitung countdown
-        time_info = calculate_time_difference(next_sholat_time)
+        # Hitung countdown dari epoch UTC (benar untuk zona mana pun)
+        utc = datetime.timezone.utc
+        time_info = calculate_time_difference(
+            datetime.datetime.fromtimestamp(next_schedule.timestamp(next_entry[1]), utc),
+            datetime.datetime.fromtimestamp(now_timestamp, utc)
+        )
         
         return {
             'name': next_sholat_name,
@@ -233,55 +722,204 @@ class SholatReminder:
             'is_past': time_info['is_past']
         }
     
-    def process_prayer_reminder(self, sholat_name, sholat_time):
+    def process_prayer_reminder(self, sholat_name, sholat_time, recipients=None):
         """
         Memproses reminder sholat yang telah tiba.
+        Notifikasi hanya dimasukkan ke queue dispatcher; sink (console,
+        suara, file, webhook) dijalankan oleh pool worker.
         
         Args:
             sholat_name (str): Nama sholat
             sholat_time (datetime): Waktu sholat
+            recipients (list, optional): Subscriber penerima notifikasi gabungan
         """
-        # Format dan tampilkan notifikasi
+        start = time.perf_counter()
+        
+        # Format notifikasi lalu serahkan ke pool worker
         notification = format_prayer_notification(sholat_name, sholat_time)
-        print(notification)
+        self.dispatcher.submit(sholat_name, sholat_time, notification, recipients)
         
-        # Mainkan suara reminder
-        play_reminder_sound()
+        metrics.PROCESS_DURATION.observe(time.perf_counter() - start)
         
-        print(f"✅ Reminder {sholat_name} telah diproses dan dihapus dari queue")
+        if not self.quiet:
+            print(f"✅ Reminder {sholat_name} telah diproses dan dihapus dari queue")
     
-    def monitor_prayer_times(self):
+    @property
+    def monitor_thread(self):
         """
-        Thread function untuk memantau waktu sholat secara real-time.
-        Menggunakan queue untuk mengelola reminder yang akan datang.
+        Thread dispatcher engine yang memantau reminder subscriber ini.
+        """
+        return self.engine.dispatcher_thread
+    
+    def _handle_fired_reminder(self, entry, missed):
         """
-        print(MESSAGES['monitoring_start'])
+        Callback dari engine saat reminder subscriber ini tiba.
+        Menghapus reminder dari queue lalu memprosesnya.
         
-        while self.is_running:
-            # Periksa apakah queue masih berisi reminder
-            if self.reminder_queue:
-                # Peek head queue tanpa dequeue
-                next_sholat_name, next_sholat_time = self.reminder_queue[0]
-                
-                # Cek apakah waktu sholat sudah tiba dengan toleransi
-                if is_time_in_range(next_sholat_time):
-                    # Dequeue reminder yang sudah tiba
-                    completed_reminder = self.reminder_queue.popleft()
-                    sholat_name, sholat_time = completed_reminder
-                    
-                    # Proses reminder
-                    self.process_prayer_reminder(sholat_name, sholat_time)
-                    
-                    # Tampilkan status queue yang tersisa
-                    if self.reminder_queue:
-                        remaining = len(self.reminder_queue)
-                        print(f"📋 Sisa {remaining} reminder dalam queue")
-                        self.display_queue()
-                    else:
-                        print(MESSAGES['all_prayers_done'])
+        Args:
+            entry (tuple): (ordinal tanggal, indeks sholat) atau penanda
+                pergantian hari _ROLLOVER
+            missed (bool): True jika reminder terlewat melebihi toleransi
+        
+        Returns:
+            hashable atau None: subscriber_id jika reminder ini ikut notifikasi
+                gabungan (batch_key diisi), selain itu None
+        """
+        if entry == _ROLLOVER:
+            self._roll_over()
+            return None
+        
+        # Dequeue reminder yang sudah tiba
+        with self._queue_lock:
+            try:
+                self.reminder_queue.remove(entry)
+            except ValueError:
+                pass
+            self._invalidate_status()
+            schedule = self._entry_schedule(entry)
+            today_ordinal = self.today_schedule.date.toordinal()
+            remaining = sum(1 for queued in self.reminder_queue if queued[0] == today_ordinal)
+        
+        # Catat di journal sebelum notifikasi dikirim: crash setelah titik
+        # ini tidak membuat reminder dikirim ulang saat restart
+        if self.journal is not None:
+            if self.journal.is_processed(entry[0], entry[1], self._journal_subscriber):
+                return None
+            self.journal.record(entry[0], entry[1], 'missed' if missed else 'fired',
+                                self.clock.time(), self._journal_subscriber)
+        
+        sholat_name, sholat_time = schedule[entry[1]]
+        recipient = None
+        
+        if missed:
+            # Sudah lewat melebihi toleransi (misal komputer sleep)
+            if not self.quiet:
+                print(f"⚠️  Reminder {sholat_name} terlewat dan dilewati")
+        elif self.batch_key is not None:
+            # Notifikasi dikirim sekali untuk semua penerima (_process_batch)
+            recipient = self.subscriber_id
+        else:
+            # Proses reminder (setelah group commit journal tick ini)
+            self._process_after_commit(sholat_name, sholat_time)
+        
+        # Tampilkan status queue yang tersisa untuk hari ini
+        if not self.quiet:
+            if remaining:
+                print(f"📋 Sisa {remaining} reminder hari ini dalam queue")
+                self.display_queue()
+            else:
+                print(MESSAGES['all_prayers_done'])
+        return recipient
+    
+    def _process_batch(self, entry, missed, recipients):
+        """
+        Callback gabungan dari engine: satu notifikasi untuk semua subscriber
+        dengan batch_key yang sama (jadwalnya identik, jadi jadwal subscriber
+        ini mewakili semuanya).
+        
+        Args:
+            entry (tuple): (ordinal tanggal, indeks sholat)
+            missed (bool): Selalu False (reminder terlewat tidak dikirim)
+            recipients (list): subscriber_id penerima
+        """
+        sholat_name, sholat_time = self._entry_schedule(entry)[entry[1]]
+        self._process_after_commit(sholat_name, sholat_time, recipients)
+    
+    def _process_after_commit(self, sholat_name, sholat_time, recipients=None):
+        """
+        Mengirim notifikasi setelah catatan journal-nya ter-commit. Di dalam
+        tick engine, journal di-group-commit (satu fsync untuk semua reminder
+        yang jatuh tempo bersamaan) lalu notifikasi dikirim berurutan.
+        """
+        if self.journal is None:
+            self.process_prayer_reminder(sholat_name, sholat_time, recipients)
+            return
+        self.journal.after_commit(
+            lambda: self.process_prayer_reminder(sholat_name, sholat_time, recipients))
+    
+    def _is_processed(self, ordinal, sholat_index):
+        """
+        True jika reminder sudah tercatat di journal (fire, dilewati atau dikejar).
+        """
+        return (self.journal is not None
+                and self.journal.is_processed(ordinal, sholat_index, self._journal_subscriber))
+    
+    def _missed_while_down(self, now_timestamp):
+        """
+        Reminder yang jatuh tempo selama program mati: setelah kejadian
+        terakhir di journal (paling lama JOURNAL_CONFIG['catchup_window']
+        detik lalu) dan belum tercatat.
+        
+        Args:
+            now_timestamp (float): Timestamp saat ini
+        
+        Returns:
+            list: Tuple (timestamp, ordinal tanggal, indeks sholat, DaySchedule), urut waktu
+        """
+        last_seen = None if self.journal is None else \
+            self.journal.last_seen_for(self._journal_subscriber)
+        if last_seen is None:
+            return []  # Subscriber baru: belum ada riwayat untuk dikejar
+        
+        since = max(last_seen, now_timestamp - JOURNAL_CONFIG['catchup_window'])
+        date_obj = local_date(self.zone, since)
+        today = self.today_schedule.date
+        missed = []
+        
+        while date_obj <= today:
+            if date_obj == today:
+                schedule = self.today_schedule
+            else:
+                schedule = self._build_day(date_obj)
             
-            # Sleep sesuai interval konfigurasi
-            time.sleep(REMINDER_CONFIG['check_interval'])
+            ordinal = date_obj.toordinal()
+            for sholat_index in range(len(schedule)):
+                fire_timestamp = schedule.timestamp(sholat_index)
+                if (since <= fire_timestamp <= now_timestamp
+                        and not self._is_processed(ordinal, sholat_index)):
+                    missed.append((fire_timestamp, ordinal, sholat_index, schedule))
+            date_obj += datetime.timedelta(days=1)
+        
+        missed.sort(key=lambda item: item[0])
+        return missed
+    
+    def _catch_up(self):
+        """
+        Memproses reminder yang terlewat selama program mati sesuai
+        JOURNAL_CONFIG['catchup'], lalu mencatat bahwa program hidup.
+        
+        Returns:
+            int: Jumlah reminder yang dikirim terlambat
+        """
+        if self.journal is None:
+            return 0
+        
+        now = self.clock.time()
+        missed = self._missed_while_down(now)
+        policy = JOURNAL_CONFIG['catchup']
+        sent = 0
+        
+        # Satu group commit untuk semua catatan catch-up subscriber ini
+        with self.journal.batch():
+            for position, (_, ordinal, sholat_index, schedule) in enumerate(missed):
+                sholat_name, sholat_time = schedule[sholat_index]
+                if policy == 'fire' or (policy == 'latest' and position == len(missed) - 1):
+                    self.journal.record(ordinal, sholat_index, 'caught_up', now,
+                                        self._journal_subscriber)
+                    if not self.quiet:
+                        print(f"⏪ Reminder {sholat_name} {format_time(sholat_time)} terlewat "
+                              f"saat program mati, dikirim sekarang")
+                    self._process_after_commit(sholat_name, sholat_time)
+                    sent += 1
+                else:
+                    self.journal.record(ordinal, sholat_index, 'missed', now,
+                                        self._journal_subscriber)
+                    if not self.quiet:
+                        print(f"⚠️  Reminder {sholat_name} {format_time(sholat_time)} terlewat "
+                              f"saat program mati dan dilewati")
+            
+            self.journal.mark_alive(now, self._journal_subscriber)
+        return sent
     
     def start_reminder(self):
         """
@@ -291,27 +929,49 @@ class SholatReminder:
             bool: True jika berhasil dimulai
         """
         if self.is_running:
-            print(MESSAGES['already_running'])
+            if not self.quiet:
+                print(MESSAGES['already_running'])
             return False
         
-        print_header("🚀 MEMULAI SISTEM REMINDER SHOLAT", 'menu')
+        if not self.quiet:
+            print_header("🚀 MEMULAI SISTEM REMINDER SHOLAT", 'menu')
         
         # Build queue dari array jadwal
         if not self.build_reminder_queue():
-            print(MESSAGES['no_reminders'])
-            print("💡 Mungkin semua waktu sholat sudah terlewat")
+            if not self.quiet:
+                print(MESSAGES['no_reminders'])
+                print("💡 Mungkin semua waktu sholat sudah terlewat")
             return False
         
-        # Start monitoring thread
+        # Endpoint metrik untuk penggunaan headless (jika port dikonfigurasi)
+        if METRICS_CONFIG['http_port'] is not None:
+            try:
+                metrics.start_http_server()
+            except OSError as e:
+                if not self.quiet:
+                    print(f"⚠️  Endpoint metrik gagal dijalankan: {e}")
+        
+        # Daftarkan reminder ke engine lalu pastikan dispatcher berjalan
+        self.dispatcher.start()
+        self._catch_up()
+        if self.journal is not None:
+            self.engine.attach_journal(self.journal)
         self.is_running = True
-        self.monitor_thread = threading.Thread(
-            target=self.monitor_prayer_times,
-            daemon=True
+        self._invalidate_status()
+        self.engine.add_subscriber(
+            self.subscriber_id,
+            self._engine_reminders(),
+            self._handle_fired_reminder,
+            self.batch_key,
+            self._process_batch if self.batch_key is not None else None
         )
-        self.monitor_thread.start()
+        started = self.engine.start()
         
-        print(MESSAGES['system_active'])
-        print("💡 Tekan Ctrl+C untuk menghentikan")
+        if not self.quiet:
+            if started:
+                print(MESSAGES['monitoring_start'])
+            print(MESSAGES['system_active'])
+            print("💡 Tekan Ctrl+C untuk menghentikan")
         
         return True
     
@@ -323,34 +983,116 @@ class SholatReminder:
             return
         
         self.is_running = False
+        self._invalidate_status()
+        self.engine.remove_subscriber(self.subscriber_id)
+        
+        if self.journal is not None:
+            self.journal.mark_alive(self.clock.time(), self._journal_subscriber)
         
-        # Tunggu thread selesai dengan timeout
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=1)
+        # Engine privat ikut dihentikan (thread ditunggu dengan timeout)
+        if self._owns_engine:
+            self.engine.stop(timeout=1)
+        if self._owns_dispatcher:
+            self.dispatcher.stop(timeout=1)
         
-        print(MESSAGES['system_stopped'])
+        if not self.quiet:
+            print(MESSAGES['system_stopped'])
+    
+    def _invalidate_status(self):
+        """
+        Menandai snapshot status kedaluwarsa. Dipanggil setiap jadwal,
+        queue atau status berjalan berubah.
+        """
+        self._status_version += 1
+    
+    def status_snapshot(self):
+        """
+        Snapshot status jadwal yang di-cache sampai batas menit berikutnya
+        atau sampai jadwal/queue berubah. Waktu sholat selalu jatuh di awal
+        menit, sehingga countdown, sholat berikutnya dan jumlah sholat yang
+        lewat tidak berubah di dalam satu menit. Objek yang sama
+        dikembalikan selama snapshot masih berlaku (bisa dipakai sebagai
+        kunci cache respons). Statistik yang terus berubah (metrik, cache
+        perhitungan, journal) tidak ikut; lihat get_system_status.
+        
+        Returns:
+            dict: Status jadwal (dipakai bersama, jangan diubah)
+        """
+        now = self.clock.time()
+        cached = self._status_cache
+        if cached is not None and cached[0] == self._status_version and now < cached[1]:
+            return cached[2]
+        
+        # Versi dibaca sebelum menghitung: perubahan di tengah perhitungan
+        # membuat snapshot ini langsung kedaluwarsa pada panggilan berikutnya
+        version = self._status_version
+        status = self._compute_system_status(now)
+        self._status_cache = (version, (now // 60 + 1) * 60, status)
+        return status
+    
+    def cached_status(self):
+        """
+        Snapshot status yang masih berlaku tanpa menghitung ulang (cukup
+        perbandingan versi dan batas menit; aman dipanggil dari event loop).
+        
+        Returns:
+            dict atau None: Snapshot yang sama dengan status_snapshot, atau
+                None jika sudah kedaluwarsa
+        """
+        cached = self._status_cache
+        if (cached is not None and cached[0] == self._status_version
+                and self.clock.time() < cached[1]):
+            return cached[2]
+        return None
     
     def get_system_status(self):
         """
         Mendapatkan status sistem reminder.
+        Bagian jadwal diambil dari snapshot yang di-cache (status_snapshot);
+        statistik 'prayer_cache', 'journal' dan 'metrics' dibaca saat
+        dipanggil sehingga selalu terkini.
         
         Returns:
-            dict: Informasi status sistem
+            dict: Informasi status sistem (dict baru setiap panggilan)
+        """
+        status = dict(self.status_snapshot())
+        
+        # Statistik cache perhitungan jika jadwal dihitung dari lokasi
+        if self.location is not None and self.timetable is None:
+            from prayer_cache import get_default_cache
+            
+            status['prayer_cache'] = get_default_cache().get_stats()
+        
+        # Statistik journal reminder (entri, baris sejak snapshot, recovery)
+        if self.journal is not None:
+            status['journal'] = self.journal.get_stats()
+        
+        # Metrik pipeline (keterlambatan fire, durasi dispatch, rebuild, ...)
+        status['metrics'] = metrics.REGISTRY.snapshot()
+        
+        return status
+    
+    def _compute_system_status(self, now_timestamp):
+        """
+        Menghitung status jadwal reminder (isi status_snapshot).
+        
+        Args:
+            now_timestamp (float): Timestamp saat ini
+        
+        Returns:
+            dict: Status jadwal
         """
         status = {
             'is_running': self.is_running,
             'queue_size': len(self.reminder_queue),
             'total_prayers': len(self.today_schedule),
-            'next_prayer': self.get_next_prayer_info()
+            'horizon_days': len(self.horizon),
+            'zone': self.zone.key if self.zone is not None else None,
+            'next_prayer': self._compute_next_prayer_info(now_timestamp)
         }
         
-        # Hitung berapa sholat yang sudah lewat
-        current_time = get_current_time_info()['datetime']
-        passed_prayers = 0
-        
-        for _, sholat_time in self.today_schedule:
-            if sholat_time <= current_time:
-                passed_prayers += 1
+        # Hitung berapa sholat yang sudah lewat (bisect pada menit terurut)
+        passed_prayers = self.today_schedule.passed_count(now_timestamp)
         
         status['passed_prayers'] = passed_prayers
         status['remaining_prayers'] = status['total_prayers'] - passed_prayers
@@ -361,16 +1103,18 @@ class SholatReminder:
         """
         Reset jadwal ke pengaturan default.
         """
-        print("🔄 Mereset jadwal ke pengaturan default...")
+        if not self.quiet:
+            print("🔄 Mereset jadwal ke pengaturan default...")
         
         # Stop reminder jika sedang berjalan
         if self.is_running:
             self.stop_reminder()
         
         # Reset ke waktu default
-        self.initialize_today_schedule()
+        self.initialize_today_schedule(display=not self.quiet)
         
-        print("✅ Jadwal berhasil direset")
+        if not self.quiet:
+            print("✅ Jadwal berhasil direset")
     
     def export_schedule(self):
         """
@@ -380,9 +1124,11 @@ class SholatReminder:
             dict: Data jadwal yang bisa diserialisasi
         """
         schedule_data = {
-            'date': get_current_time_info()['formatted_date'],
+            'date': format_date(self.today_schedule.date),
             'prayers': []
         }
+        if self.zone is not None:
+            schedule_data['zone'] = self.zone.key
         
         for i, (sholat_name, sholat_time) in enumerate(self.today_schedule):
             schedule_data['prayers'].append({
@@ -395,45 +1141,114 @@ class SholatReminder:
         
         return schedule_data
     
+    def export_schedule_range(self, path, days, start_date=None):
+        """
+        Export jadwal beberapa hari secara streaming (JSONL, CSV atau iCalendar).
+        Jadwal setiap hari diambil dari sumber jadwal saat ditulis.
+        
+        Args:
+            path (str): Path file tujuan (format dari ekstensi)
+            days (int): Jumlah hari
+            start_date (date, optional): Tanggal awal. Default hari ini
+        
+        Returns:
+            int: Jumlah record yang ditulis
+        """
+        from schedule_io import export_records, iter_records
+        
+        if start_date is None:
+            start_date = self.local_today()
+        end_date = start_date + datetime.timedelta(days=days - 1)
+        
+        location = self.timetable['location'] if self.timetable is not None else 'default'
+        
+        from timetable_store import UNDEFINED_SLOT
+        
+        def minutes_for(date_obj):
+            return [UNDEFINED_SLOT if time_pair is None else time_pair[0] * 60 + time_pair[1]
+                    for time_pair in self.get_prayer_times(date_obj)]
+        
+        records = iter_records([(location, minutes_for)], start_date, end_date, self.sholat_names)
+        return export_records(records, path)
+    
     def import_schedule(self, schedule_data):
         """
         Import jadwal sholat dari data yang disimpan.
         
         Args:
-            schedule_data (dict): Data jadwal untuk diimport
+            schedule_data (dict): Data jadwal untuk diimport. Berisi 'prayers'
+                (hasil export_schedule), 'timetable' dan 'location' untuk
+                memuat baris hari ini langsung dari timetable biner, atau
+                'records' dan 'location' (opsional) untuk membaca jadwal hari
+                ini dari file JSONL/CSV/iCalendar secara streaming
         
         Returns:
             bool: True jika berhasil diimport
         """
         try:
-            if 'prayers' not in schedule_data:
+            if 'timetable' in schedule_data:
+                # Baca baris hari ini langsung dari timetable (mmap, tanpa parsing)
+                from timetable_store import open_timetable
+                
+                timetable = {
+                    'path': schedule_data['timetable'],
+                    'location': schedule_data['location']
+                }
+                store = open_timetable(timetable['path'])
+                row = store.prayer_times(timetable['location'], self.local_today())
+                prayers = [
+                    {'name': name, 'hour': time_pair[0], 'minute': time_pair[1]}
+                    for name, time_pair in zip(self.sholat_names, row)
+                    if time_pair is not None
+                ]
+            elif 'records' in schedule_data:
+                # File export massal dibaca per batch, hanya hari ini yang diambil
+                from schedule_io import load_day_prayers
+                
+                timetable = None
+                prayers = load_day_prayers(
+                    schedule_data['records'],
+                    self.local_today(),
+                    schedule_data.get('location')
+                )
+                if not prayers:
+                    raise ValueError("Tidak ada jadwal hari ini di dalam file")
+            elif 'prayers' in schedule_data:
+                timetable = None
+                prayers = schedule_data['prayers']
+            else:
                 raise ValueError("Format data tidak valid")
             
             # Stop reminder jika sedang berjalan
             if self.is_running:
                 self.stop_reminder()
             
-            # Clear schedule lama
-            self.today_schedule = []
+            # Jadwal baru menggantikan jadwal lama
+            schedule = DaySchedule(self.local_today(), zone=self.zone)
             
             # Import setiap waktu sholat
-            for prayer_data in schedule_data['prayers']:
+            for prayer_data in prayers:
                 sholat_name = prayer_data['name']
                 hour = prayer_data['hour']
                 minute = prayer_data['minute']
                 
-                today = datetime.date.today()
-                sholat_time = create_datetime_from_time(hour, minute, today)
-                
-                self.today_schedule.append((sholat_name, sholat_time))
+                schedule.append(sholat_name, hour, minute)
             
-            print("✅ Jadwal berhasil diimport")
-            self.display_schedule()
+            if timetable is not None:
+                self.timetable = timetable
+            
+            # Hari berikutnya dibuat lagi dari sumber jadwal (lazy)
+            self._reset_horizon(schedule)
+            
+            if not self.quiet:
+                print("✅ Jadwal berhasil diimport")
+                self.display_schedule()
             
             return True
         
         except Exception as e:
-            print(f"❌ Error saat import jadwal: {e}")
+            if not self.quiet:
+                print(f"❌ Error saat import jadwal: {e}")
             # Kembalikan ke schedule default jika import gagal
-            self.initialize_today_schedule()
+            self.initialize_today_schedule(display=not self.quiet)
             return False
\ No newline at end of file
@@ -0,0 +1,101 @@
+# tests/conftest.py
+# Fixture bersama untuk test: path repo, jam virtual dan pembersihan engine
+
+"""
+Test memakai VirtualClock agar jadwal bisa dimajukan tanpa menunggu waktu
+nyata. Reminder dibuat tanpa lokasi (waktu default config.py) dan dengan
+dispatcher tanpa sink; notifikasi yang dikirim dicatat lewat fixture
+`fired`.
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import VirtualClock
+from notification_dispatch import NotificationDispatcher
+from reminder_engine import ReminderEngine
+from sholat_reminder import SholatReminder
+
+START = datetime.datetime(2025, 3, 1)
+
+
+def at(day, hour, minute=0):
+    """
+    Waktu lokal pada hari ke-day sejak START.
+    """
+    return START + datetime.timedelta(days=day, hours=hour, minutes=minute)
+
+
+@pytest.fixture
+def clock():
+    """
+    Jam virtual mulai 1 Maret 2025 00:00, berhenti di waktu awal sampai
+    dimajukan dengan run_until.
+    """
+    return VirtualClock(start=START, limit=START)
+
+
+@pytest.fixture
+def harness(clock):
+    """
+    Membuat engine, dispatcher tanpa sink dan reminder yang mencatat setiap
+    notifikasi ke harness.fired; semuanya dihentikan di akhir test.
+    """
+    state = Harness(clock)
+    yield state
+    state.shutdown()
+
+
+class Harness:
+    def __init__(self, clock):
+        self.clock = clock
+        self.fired = []
+        self.engines = []
+        self.dispatcher = NotificationDispatcher(sinks=[], workers=1)
+
+    def engine(self):
+        engine = ReminderEngine(clock=self.clock)
+        self.engines.append(engine)
+        return engine
+
+    def reminder(self, engine, subscriber_id, **options):
+        """
+        SholatReminder di engine bersama; process_prayer_reminder diganti
+        pencatat (subscriber_id, nama sholat, penerima gabungan).
+        """
+        options.setdefault('journal', False)
+        options.setdefault('coalesce', False)
+        reminder = SholatReminder(engine=engine, subscriber_id=subscriber_id,
+                                  dispatcher=self.dispatcher, quiet=True,
+                                  clock=self.clock, **options)
+
+        def record(sholat_name, sholat_time, recipients=None):
+            self.fired.append((subscriber_id, sholat_name, recipients))
+        reminder.process_prayer_reminder = record
+        return reminder
+
+    def advance_to(self, moment):
+        """
+        Memajukan jam tanpa engine yang berjalan (misal sebelum start atau
+        selama "program mati").
+        """
+        self.clock.run_until(moment)
+        self.clock.advance(self.clock._to_timestamp(moment) - self.clock.time())
+
+    def run_until(self, moment):
+        """
+        Memajukan jam sampai moment lalu menunggu engine memproses semua
+        reminder yang jatuh tempo sebelumnya.
+        """
+        self.clock.run_until(moment)
+        assert self.clock.limit_reached.wait(10), "engine tidak mencapai batas waktu"
+
+    def shutdown(self):
+        for engine in self.engines:
+            engine.stop()
+        self.dispatcher.stop()
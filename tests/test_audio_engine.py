@@ -0,0 +1,147 @@
+# tests/test_audio_engine.py
+# Test mesin audio: decode WAV, cache klip dan pemutaran non-blocking
+
+import os
+import struct
+import time
+import wave
+
+import pytest
+
+import audio_engine
+import metrics
+from audio_engine import AudioEngine, FileBackend, NullBackend, decode_wav, load_clip
+
+FRAME_RATE = 8000
+
+
+def pcm_frames(count, channels=2):
+    return b''.join(struct.pack('<' + 'h' * channels, *([i % 3000 - 1500] * channels))
+                    for i in range(count))
+
+
+def write_wav(path, frames, channels=2):
+    with wave.open(str(path), 'wb') as output:
+        output.setnchannels(channels)
+        output.setsampwidth(2)
+        output.setframerate(FRAME_RATE)
+        output.writeframes(frames)
+    return str(path)
+
+
+def riff(*chunks):
+    body = b'WAVE' + b''.join(chunks)
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+def chunk(chunk_id, data, declared=None):
+    size = len(data) if declared is None else declared
+    return chunk_id + struct.pack('<I', size) + data + (b'\0' if len(data) & 1 else b'')
+
+
+def fmt_chunk(format_tag=1, channels=1, bits=16):
+    block_align = channels * bits // 8
+    return chunk(b'fmt ', struct.pack('<HHIIHH', format_tag, channels, FRAME_RATE,
+                                      FRAME_RATE * block_align, block_align, bits))
+
+
+@pytest.fixture(autouse=True)
+def empty_clip_cache():
+    audio_engine.clear_clip_cache()
+    yield
+    audio_engine.clear_clip_cache()
+
+
+def test_decode_wav_generated_file(tmp_path):
+    frames = pcm_frames(4000)
+    clip = decode_wav(write_wav(tmp_path / 'adzan.wav', frames))
+
+    assert (clip.channels, clip.sample_width, clip.frame_rate) == (2, 2, FRAME_RATE)
+    assert clip.frame_count == 4000
+    assert clip.duration == pytest.approx(0.5)
+    assert clip.frames.tobytes() == frames
+    # Sampel adalah view ke buffer file, bukan salinan
+    assert clip.frames.obj is clip.buffer
+    chunks = list(clip.chunks(100))
+    assert [len(c) for c in chunks] == [800 * 4] * 5
+
+
+def test_decode_wav_skips_odd_chunks_and_keeps_truncated_data(tmp_path):
+    frames = pcm_frames(10, channels=1)
+    path = tmp_path / 'chime.wav'
+    # Chunk LIST ganjil (padding) sebelum data; data mengaku lebih panjang
+    # dari isi file dan berakhir di tengah frame (tanpa byte padding)
+    data = chunk(b'data', frames + b'\x01', declared=100)
+    path.write_bytes(riff(fmt_chunk(), chunk(b'LIST', b'abc'), data[:-1]))
+
+    clip = decode_wav(str(path))
+
+    assert clip.frames.tobytes() == frames
+
+
+@pytest.mark.parametrize('content', [
+    b'bukan wav',
+    riff(fmt_chunk(format_tag=3, bits=32), chunk(b'data', b'\0' * 8)),
+    riff(chunk(b'data', b'\0' * 8)),
+])
+def test_decode_wav_rejects_unsupported_files(tmp_path, content):
+    path = tmp_path / 'rusak.wav'
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        decode_wav(str(path))
+
+
+def test_load_clip_caches_until_file_changes(tmp_path):
+    path = write_wav(tmp_path / 'adzan.wav', pcm_frames(100))
+    decodes = metrics.AUDIO_CLIP_DECODES.value
+
+    clip = load_clip(path)
+    assert load_clip(path) is clip
+    assert metrics.AUDIO_CLIP_DECODES.value == decodes + 1
+
+    write_wav(tmp_path / 'adzan.wav', pcm_frames(200))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert load_clip(path).frame_count == 200
+    assert metrics.AUDIO_CLIP_DECODES.value == decodes + 2
+
+
+def test_engine_plays_without_blocking_and_falls_back(tmp_path):
+    frames = pcm_frames(800)
+    path = write_wav(tmp_path / 'adzan.wav', frames)
+    output = str(tmp_path / 'keluar.wav')
+    engine = AudioEngine(files={'Subuh': path}, backend=FileBackend(output), chunk_ms=10)
+    try:
+        assert engine.preload() == 1
+        start = time.monotonic()
+        assert engine.play('Subuh')
+        assert time.monotonic() - start < 0.1
+        assert not engine.play('Dzuhur')   # Tanpa file: pemanggil memakai beep
+
+        deadline = time.monotonic() + 5
+        while engine.get_stats()['played'] < 1:
+            assert time.monotonic() < deadline, "klip tidak diputar"
+            time.sleep(0.001)
+    finally:
+        engine.stop()
+
+    assert decode_wav(output).frames.tobytes() == frames
+    assert engine.get_stats()['last_first_sample'] is not None
+
+
+def test_engine_default_file_and_null_backend(tmp_path):
+    path = write_wav(tmp_path / 'chime.wav', pcm_frames(80))
+    backend = NullBackend()
+    engine = AudioEngine(files={'default': path}, backend=backend)
+    try:
+        assert engine.path_for('Isya') == path
+        assert engine.play('Isya')
+        deadline = time.monotonic() + 5
+        while backend.clips < 1:
+            assert time.monotonic() < deadline, "klip tidak diputar"
+            time.sleep(0.001)
+    finally:
+        engine.stop()
+
+    assert backend.bytes == 80 * 4
@@ -0,0 +1,24 @@
+# tests/test_coalesce.py
+# Test penggabungan reminder yang jatuh tempo bersamaan antar subscriber
+
+from config import SHOLAT_NAMES
+
+from conftest import at
+
+
+def test_same_instant_reminders_coalesce_into_one_batch(harness):
+    engine = harness.engine()
+    coalesced = [harness.reminder(engine, subscriber, coalesce=True)
+                 for subscriber in ('a', 'b', 'c')]
+    alone = harness.reminder(engine, 'd', coalesce=False)
+    harness.advance_to(at(0, 1))
+    for reminder in coalesced + [alone]:
+        assert reminder.start_reminder()
+
+    harness.run_until(at(0, 23))
+
+    batches = [(name, sorted(recipients)) for _, name, recipients in harness.fired
+               if recipients is not None]
+    assert batches == [(name, ['a', 'b', 'c']) for name in SHOLAT_NAMES]
+    assert [(subscriber, name) for subscriber, name, recipients in harness.fired
+            if recipients is None] == [('d', name) for name in SHOLAT_NAMES]
@@ -0,0 +1,108 @@
+# tests/test_config_reload.py
+# Test hot-reload konfigurasi: kunci live diterapkan, kunci startup dikembalikan, file invalid ditolak
+
+import copy
+import json
+import os
+
+import pytest
+
+import config
+from config_reload import SECTIONS, ConfigWatcher, _swap
+
+from conftest import at
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """
+    Path file konfigurasi JSON; semua bagian config.py dikembalikan ke
+    nilai semula setelah test.
+    """
+    saved = {name: copy.deepcopy(getattr(config, name)) for name in SECTIONS.values()}
+    yield str(tmp_path / 'sholat.json')
+    for name, value in saved.items():
+        _swap(name, value)
+
+
+def write_config(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    # Tanda tangan file (mtime) selalu berubah walaupun ditulis dalam tick yang sama
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+def started_reminder(harness):
+    reminder = harness.reminder(harness.engine(), 'a')
+    harness.advance_to(at(0, 6))
+    assert reminder.start_reminder()
+    return reminder
+
+
+def test_live_keys_are_applied_without_restart(harness, config_file, capsys):
+    write_config(config_file, {'reminder': {'reminder_tolerance': 90}})
+    watcher = ConfigWatcher(config_file, interval=60)
+    assert watcher.load()
+    assert config.REMINDER_CONFIG['reminder_tolerance'] == 90
+
+    reminder = started_reminder(harness)
+    watcher.add(reminder)
+    queue_before = len(reminder.reminder_queue)
+    write_config(config_file, {
+        'prayer_times': {'Dzuhur': '11:05'},
+        'reminder': {'reminder_tolerance': 120},
+        'messages': {'prayer_reminder': "Segera sholat"}
+    })
+
+    assert watcher.check()
+    assert not watcher.check()
+    assert config.DEFAULT_PRAYER_TIMES[config.SHOLAT_NAMES.index('Dzuhur')] == [11, 5]
+    assert config.REMINDER_CONFIG['reminder_tolerance'] == 120
+    assert config.MESSAGES['prayer_reminder'] == "Segera sholat"
+    # Queue tidak dibuang; hanya Dzuhur yang dijadwalkan ulang
+    assert reminder.get_next_prayer_info()['time'] == '11:05'
+    assert len(reminder.reminder_queue) == queue_before
+    assert watcher.get_stats()['reloads'] == 1
+    assert "Konfigurasi dimuat ulang" in capsys.readouterr().out
+
+
+def test_startup_only_keys_are_reverted(harness, config_file, capsys):
+    write_config(config_file, {})
+    watcher = ConfigWatcher(config_file, interval=60)
+    watcher.load()
+    watcher.add(started_reminder(harness))
+    coalesce = config.REMINDER_CONFIG['coalesce']
+    journal_path = config.JOURNAL_CONFIG['path']
+    location = copy.deepcopy(config.LOCATION_CONFIG)
+
+    write_config(config_file, {
+        'reminder': {'coalesce': not coalesce, 'reminder_tolerance': 75},
+        'journal': {'path': 'lain.log'},
+        'location': {'latitude': -6.2, 'longitude': 106.8}
+    })
+
+    assert watcher.check()
+    assert config.REMINDER_CONFIG['reminder_tolerance'] == 75
+    assert config.REMINDER_CONFIG['coalesce'] == coalesce
+    assert config.JOURNAL_CONFIG['path'] == journal_path
+    assert config.LOCATION_CONFIG == location
+    output = capsys.readouterr().out
+    assert "reminder.coalesce baru berlaku setelah restart" in output
+    assert "[location] baru berlaku setelah restart" in output
+
+
+def test_invalid_file_keeps_current_config(harness, config_file):
+    write_config(config_file, {'reminder': {'reminder_tolerance': 90}})
+    watcher = ConfigWatcher(config_file, interval=60)
+    watcher.load()
+    times = copy.deepcopy(config.DEFAULT_PRAYER_TIMES)
+
+    write_config(config_file, {'prayer_times': {'Ashar': '25:99'}})
+    assert not watcher.check()
+    write_config(config_file, {'tidak_ada': {}})
+    assert not watcher.check()
+
+    assert config.DEFAULT_PRAYER_TIMES == times
+    assert config.REMINDER_CONFIG['reminder_tolerance'] == 90
+    assert watcher.get_stats()['failures'] == 2
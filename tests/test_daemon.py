@@ -0,0 +1,99 @@
+# tests/test_daemon.py
+# Test daemon Unix socket: query, update, socket sisa dan kegagalan start
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from conftest import at
+from daemon import ReminderDaemon
+from daemon_client import DaemonClient
+
+
+@pytest.fixture
+def socket_path():
+    # Path Unix socket dibatasi ~100 byte; tmp_path pytest bisa terlalu panjang
+    directory = tempfile.mkdtemp(prefix='sholat-')
+    yield os.path.join(directory, 'daemon.sock')
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def serve(daemon):
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_listening(daemon, thread):
+    # Socket sudah di-bind sebelum reminder dimulai
+    while not daemon.reminder.is_running:
+        assert thread.is_alive(), "daemon berhenti sebelum mendengarkan"
+        thread.join(0.01)
+
+
+def test_queries_and_update_over_socket(harness, socket_path):
+    reminder = harness.reminder(harness.engine(), 'a')
+    harness.advance_to(at(0, 12, 0))
+    daemon = ReminderDaemon(reminder, socket_path)
+    thread = serve(daemon)
+    wait_listening(daemon, thread)
+
+    try:
+        with DaemonClient(socket_path) as client:
+            assert client.request('ping') == 'pong'
+            assert client.request('next')['name'] == 'Ashar'
+            status = client.request('status')
+            assert status['is_running']
+            assert 'metrics' in status
+
+            assert client.request('update 2 14 0')['time'] == '14:00'
+            with pytest.raises(RuntimeError):
+                client.request('update dua')
+            with pytest.raises(RuntimeError):
+                client.request('tidak-ada')
+
+        # Respons 'next' dipakai ulang selama snapshot sama
+        assert daemon.handle_command('next') is daemon.handle_command('next')
+        assert oct(os.stat(socket_path).st_mode & 0o777) == oct(0o600)
+    finally:
+        daemon.stop()
+        thread.join(5)
+
+    assert not reminder.is_running
+    assert not os.path.exists(socket_path)
+
+
+def test_stale_socket_is_replaced_and_live_socket_refused(harness, socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    reminder = harness.reminder(harness.engine(), 'a')
+    harness.advance_to(at(0, 12, 0))
+    daemon = ReminderDaemon(reminder, socket_path)
+    thread = serve(daemon)
+    wait_listening(daemon, thread)
+    try:
+        with DaemonClient(socket_path) as client:
+            assert client.request('ping') == 'pong'
+
+        other = ReminderDaemon(harness.reminder(harness.engine(), 'b'), socket_path)
+        with pytest.raises(RuntimeError):
+            other.serve_forever()
+    finally:
+        daemon.stop()
+        thread.join(5)
+
+
+def test_startup_fails_when_reminder_cannot_start(harness, socket_path):
+    reminder = harness.reminder(harness.engine(), 'a')
+    reminder.start_reminder = lambda: False
+    daemon = ReminderDaemon(reminder, socket_path)
+
+    with pytest.raises(RuntimeError):
+        daemon.serve_forever()
+    assert not os.path.exists(socket_path)
@@ -0,0 +1,173 @@
+# tests/test_fanout_sinks.py
+# Test sink fan-out terhadap mock_fanout_server: retry/backoff dan daftar penerima
+
+import asyncio
+import datetime
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'benchmarks'))
+
+import mock_fanout_server
+from fanout_sinks import FanoutQueueSink, FanoutWebhookSink
+
+SHOLAT_TIME = datetime.datetime(2025, 3, 1, 18, 57)
+RECIPIENTS = [f"user-{i}" for i in range(25)]
+
+
+class FailFirst:
+    """
+    Opsi mock server: `failures` batch pertama ditolak (503/ERR), sisanya
+    diterima. Dibaca handler sekali per batch sebagai fail_rate.
+    """
+
+    latency_ms = 0
+
+    def __init__(self, failures):
+        self.failures = failures
+
+    @property
+    def fail_rate(self):
+        if self.failures > 0:
+            self.failures -= 1
+            return 1.0
+        return 0.0
+
+
+class MockServer:
+    """
+    mock_fanout_server di thread event loop sendiri, pada port acak.
+    """
+
+    def __init__(self, options):
+        self.options = options
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self.ready.wait(5)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.http = self.loop.run_until_complete(asyncio.start_server(
+            lambda r, w: mock_fanout_server.handle_http(r, w, self.options), '127.0.0.1', 0))
+        self.queue = self.loop.run_until_complete(asyncio.start_server(
+            lambda r, w: mock_fanout_server.handle_queue(r, w, self.options), '127.0.0.1', 0))
+        self.ready.set()
+        self.loop.run_forever()
+
+        # Handler koneksi yang masih menunggu dibatalkan sebelum loop ditutup
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+
+    def url(self, kind):
+        if kind == 'webhook':
+            return f"http://127.0.0.1:{self.http.sockets[0].getsockname()[1]}/notify"
+        return f"tcp://127.0.0.1:{self.queue.sockets[0].getsockname()[1]}"
+
+    def stop(self):
+        self.http.close()
+        self.queue.close()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+
+
+@pytest.fixture
+def server():
+    servers = []
+
+    def start(failures=0):
+        for key in mock_fanout_server.COUNTS:
+            mock_fanout_server.COUNTS[key] = 0
+        servers.append(MockServer(FailFirst(failures)))
+        return servers[-1]
+
+    yield start
+    for running in servers:
+        running.stop()
+
+
+def make_sink(kind, url, **options):
+    sink_class = FanoutWebhookSink if kind == 'webhook' else FanoutQueueSink
+    sink = sink_class(url, RECIPIENTS, batch_size=10, connections=1, timeout=5, **options)
+    sink.backoff = 0.001
+    sink.backoff_max = 0.01
+    return sink
+
+
+def make_job(recipients=None):
+    return {
+        'sholat_name': 'Isya',
+        'sholat_time': SHOLAT_TIME,
+        'message': "Waktu Isya",
+        'recipients': recipients,
+        'submitted_at': time.monotonic()
+    }
+
+
+def wait_settled(sink, expected, seconds=5):
+    deadline = time.monotonic() + seconds
+    while True:
+        stats = sink.get_stats()
+        if stats['delivered'] + stats['failed'] >= expected:
+            return stats
+        assert time.monotonic() < deadline, f"delivery belum selesai: {stats}"
+        time.sleep(0.001)
+
+
+@pytest.mark.parametrize('kind', ['webhook', 'queue'])
+def test_rejected_batches_are_retried_until_delivered(server, kind):
+    mock = server(failures=2)
+    sink = make_sink(kind, mock.url(kind), max_retries=3)
+    try:
+        sink.send(make_job(), timeout=1)
+        stats = wait_settled(sink, len(RECIPIENTS))
+    finally:
+        sink.close()
+
+    assert stats['delivered'] == len(RECIPIENTS)
+    assert stats['failed'] == 0
+    assert stats['retries'] == 2
+    assert mock_fanout_server.COUNTS['rejected'] == 2
+    assert mock_fanout_server.COUNTS['deliveries'] == len(RECIPIENTS)
+
+
+@pytest.mark.parametrize('kind', ['webhook', 'queue'])
+def test_batch_fails_after_max_retries(server, kind):
+    mock = server(failures=100)
+    sink = make_sink(kind, mock.url(kind), max_retries=2)
+    try:
+        # Satu batch saja: batch_size lebih besar dari jumlah penerima
+        sink.batch_size = len(RECIPIENTS)
+        sink.send(make_job(), timeout=1)
+        stats = wait_settled(sink, len(RECIPIENTS))
+    finally:
+        sink.close()
+
+    assert stats['failed'] == len(RECIPIENTS)
+    assert stats['retries'] == 2
+    assert mock_fanout_server.COUNTS['rejected'] == 3
+    assert mock_fanout_server.COUNTS['deliveries'] == 0
+
+
+@pytest.mark.parametrize('kind', ['webhook', 'queue'])
+def test_coalesced_subscribers_do_not_replace_sink_recipients(server, kind):
+    mock = server()
+    sink = make_sink(kind, mock.url(kind))
+    try:
+        sink.send(make_job(recipients=['subscriber-a', 'subscriber-b']), timeout=1)
+        stats = wait_settled(sink, len(RECIPIENTS))
+    finally:
+        sink.close()
+
+    assert stats['delivered'] == len(RECIPIENTS)
+    assert stats['batches'] == 3
+    assert mock_fanout_server.COUNTS['deliveries'] == len(RECIPIENTS)
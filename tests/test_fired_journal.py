@@ -0,0 +1,162 @@
+# tests/test_fired_journal.py
+# Test journal reminder: replay, catch-up dan restart beberapa subscriber
+
+import datetime
+
+import pytest
+
+import fired_journal
+from fired_journal import FiredJournal
+
+from conftest import START
+
+
+@pytest.fixture(autouse=True)
+def fresh_journals():
+    """
+    Registry open_journal dikosongkan agar setiap test (dan setiap
+    "restart" di dalam test) membaca journal dari disk.
+    """
+    yield
+    crash()
+
+
+def crash():
+    """
+    Mensimulasikan proses mati: journal ditutup tanpa penanda stop, lalu
+    registry dikosongkan sehingga pembukaan berikutnya memulihkan dari disk.
+    """
+    for journal in fired_journal._open_journals.values():
+        journal.close()
+    fired_journal._open_journals.clear()
+
+
+def test_replay_restores_entries_and_last_seen(tmp_path):
+    path = str(tmp_path / 'fired.journal')
+    journal = FiredJournal(path, snapshot_every=3, fsync=False)
+    for index in range(5):
+        journal.record(739000, index, 'fired', 1000.0 + index)
+    journal.mark_alive(2000.0)
+    journal.close()
+
+    # Baris terakhir terpotong (crash saat menulis) dibuang
+    with open(path, 'ab') as f:
+        f.write(b'F 739001 0 30')
+
+    recovered = FiredJournal(path, snapshot_every=3, fsync=False)
+    assert all(recovered.is_processed(739000, index) for index in range(5))
+    assert not recovered.is_processed(739001, 0)
+    assert recovered.last_seen == 2000.0
+    recovered.close()
+
+
+def test_replay_reads_old_lines_as_default_subscriber(tmp_path):
+    path = str(tmp_path / 'fired.journal')
+    with open(path, 'wb') as f:
+        f.write(b'F 739000 1 1000.000\nF a%20b 739000 2 1500.000\n')
+
+    journal = FiredJournal(path, fsync=False)
+    assert journal.is_processed(739000, 1)
+    assert not journal.is_processed(739000, 1, 'a b')
+    assert journal.is_processed(739000, 2, 'a b')
+    assert journal.last_seen_for() == 1000.0
+    assert journal.last_seen_for('a b') == 1500.0
+    assert journal.last_seen_for('c') is None
+    journal.close()
+
+
+def test_subscribers_share_one_journal_object_and_file(harness, tmp_path):
+    path = str(tmp_path / 'fired.journal')
+    engine = harness.engine()
+    reminders = [harness.reminder(engine, subscriber, journal=path)
+                 for subscriber in ('a', 'b/../c', None)]
+
+    assert all(reminder.journal is reminders[0].journal for reminder in reminders)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['fired.journal']
+
+
+def test_coalesced_tick_is_one_group_commit(harness, tmp_path, monkeypatch):
+    path = str(tmp_path / 'fired.journal')
+    engine = harness.engine()
+    reminders = [harness.reminder(engine, subscriber, journal=path, coalesce=True)
+                 for subscriber in range(50)]
+    journal = reminders[0].journal
+    dzuhur = reminders[0].sholat_names.index('Dzuhur')
+    dzuhur_at = reminders[0].today_schedule.timestamp(dzuhur)
+
+    harness.advance_to(dzuhur_at - 60)
+    for reminder in reminders:
+        assert reminder.start_reminder()
+
+    fsyncs = []
+    monkeypatch.setattr(fired_journal.os, 'fsync', fsyncs.append)
+    harness.run_until(dzuhur_at + 1)
+
+    # 50 baris 'F' ditulis dengan satu fsync, notifikasi dikirim sesudahnya
+    assert len(fsyncs) == 1
+    assert all(journal.is_processed(reminders[0].today_schedule.date.toordinal(), dzuhur,
+                                    subscriber) for subscriber in range(50))
+    assert [(name, len(recipients)) for _, name, recipients in harness.fired] == \
+        [('Dzuhur', 50)]
+
+
+@pytest.mark.parametrize('crash_offset', [30, -10])
+def test_restart_within_tolerance_fires_each_subscriber_once(harness, tmp_path, crash_offset):
+    """
+    Dua subscriber memakai path journal yang sama dan mati crash_offset
+    detik setelah (30) atau sebelum (-10) Dzuhur, lalu dijalankan ulang
+    30 detik setelah Dzuhur (masih dalam toleransi). Masing-masing harus
+    menerima Dzuhur tepat sekali: dari fire biasa atau dari catch-up.
+    """
+    path = str(tmp_path / 'fired.journal')
+    subscribers = ['a', 'b']
+
+    engine = harness.engine()
+    reminders = [harness.reminder(engine, subscriber, journal=path)
+                 for subscriber in subscribers]
+    dzuhur = reminders[0].sholat_names.index('Dzuhur')
+    dzuhur_at = reminders[0].today_schedule.timestamp(dzuhur)
+
+    harness.advance_to(dzuhur_at - 60)
+    for reminder in reminders:
+        assert reminder.start_reminder()
+    harness.run_until(dzuhur_at + crash_offset)
+    engine.stop()
+    crash()
+
+    harness.advance_to(dzuhur_at + 30)
+    engine = harness.engine()
+    reminders = [harness.reminder(engine, subscriber, journal=path)
+                 for subscriber in subscribers]
+    for reminder in reminders:
+        assert reminder.start_reminder()
+    harness.run_until(dzuhur_at + 600)
+
+    for subscriber in subscribers:
+        assert harness.fired.count((subscriber, 'Dzuhur', None)) == 1
+
+
+def test_catch_up_skips_all_but_latest_missed(harness, tmp_path, monkeypatch):
+    monkeypatch.setitem(fired_journal.JOURNAL_CONFIG, 'catchup_window', 86400)
+    path = str(tmp_path / 'fired.journal')
+
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'a', journal=path)
+    assert reminder.start_reminder()
+    harness.run_until(START + datetime.timedelta(hours=1))
+    engine.stop()
+    crash()
+
+    # Mati sampai setelah Ashar: Subuh, Dzuhur dan Ashar terlewat
+    ashar = reminder.sholat_names.index('Ashar')
+    harness.advance_to(reminder.today_schedule.timestamp(ashar) + 120)
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'a', journal=path)
+    assert reminder.start_reminder()
+
+    assert harness.fired == [('a', 'Ashar', None)]
+    ordinal = reminder.today_schedule.date.toordinal()
+    statuses = [reminder.journal.entries.get(('a', ordinal, index))
+                for index in range(ashar + 1)]
+    assert statuses[-1] == 'caught_up'
+    assert set(statuses[:-1]) == {'missed'}
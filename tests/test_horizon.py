@@ -0,0 +1,27 @@
+# tests/test_horizon.py
+# Test horizon multi-hari dan pergantian hari tengah malam
+
+import metrics
+from config import REMINDER_CONFIG, SHOLAT_NAMES
+
+from conftest import START, at
+
+
+def test_midnight_rollover_extends_horizon(harness):
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'a')
+    harness.advance_to(at(0, 20))
+    assert reminder.start_reminder()
+    rebuilds = metrics.QUEUE_REBUILDS.value
+
+    # Setelah Isya: queue sudah berisi jadwal besok dari horizon
+    tomorrow = START.date().toordinal() + 1
+    assert reminder.reminder_queue[0] == (tomorrow, 0)
+
+    harness.run_until(at(2, 1))
+    assert [name for _, name, _ in harness.fired] == SHOLAT_NAMES
+    assert reminder.today_schedule.date == at(2, 0).date()
+    assert [schedule.date for schedule in reminder.horizon] == \
+        [at(2 + day, 0).date() for day in range(REMINDER_CONFIG['horizon_days'])]
+    assert reminder.reminder_queue[0] == (tomorrow + 1, 0)
+    assert metrics.QUEUE_REBUILDS.value == rebuilds
@@ -0,0 +1,105 @@
+# tests/test_http_api.py
+# Test HTTP API: ETag/304, cache di event loop dan error parameter
+
+import metrics
+from http_api import CachedResponse, ScheduleAPI, _HTTPProtocol, etag_matches
+
+from conftest import at
+
+
+class FakeTransport:
+    def __init__(self):
+        self.written = b""
+        self.closed = False
+
+    def write(self, data):
+        self.written += data
+
+    def is_closing(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+def request(api, raw):
+    protocol = _HTTPProtocol(api)
+    transport = FakeTransport()
+    protocol.connection_made(transport)
+    protocol.data_received(raw)
+    return transport.written
+
+
+def status_line(response):
+    return response.split(b"\r\n", 1)[0]
+
+
+def test_etag_matches_list_weak_and_wildcard():
+    assert etag_matches(b'"abc"', b'"abc"')
+    assert etag_matches(b'W/"x", "abc"', b'"abc"')
+    assert etag_matches(b'W/"abc"', b'"abc"')
+    assert etag_matches(b'*', b'"abc"')
+    assert not etag_matches(b'"abcd"', b'"abc"')
+    assert not etag_matches(b'"ab"', b'"abc"')
+
+
+def test_matching_if_none_match_returns_304(harness):
+    reminder = harness.reminder(harness.engine(), 'a')
+    harness.advance_to(at(0, 6))
+    assert reminder.start_reminder()
+    api = ScheduleAPI(reminder=reminder)
+
+    # Respons dihitung sekali (seperti di executor), lalu dilayani dari cache
+    cached = api.lookup('/next', '')
+    assert isinstance(cached, CachedResponse)
+
+    response = request(api, b"GET /next HTTP/1.1\r\n\r\n")
+    assert status_line(response) == b"HTTP/1.1 200 OK"
+    assert response.endswith(cached.body)
+
+    response = request(api, b'GET /next HTTP/1.1\r\nIf-None-Match: W/"0", %s\r\n\r\n'
+                       % cached.etag)
+    assert status_line(response) == b"HTTP/1.1 304 Not Modified"
+    assert response.endswith(b"\r\n\r\n")
+
+    response = request(api, b'GET /next HTTP/1.1\r\nIf-None-Match: %s\r\n\r\n'
+                       % cached.etag[:-2] + b'"')
+    assert status_line(response) == b"HTTP/1.1 200 OK"
+
+
+def test_expired_snapshot_left_to_executor(harness):
+    reminder = harness.reminder(harness.engine(), 'a')
+    harness.advance_to(at(0, 6))
+    assert reminder.start_reminder()
+    api = ScheduleAPI(reminder=reminder)
+
+    api.lookup('/next', '')
+    assert isinstance(api.lookup_cached('/next', ''), CachedResponse)
+
+    # Menit berikutnya: event loop tidak menghitung ulang status
+    harness.advance_to(at(0, 6, 1))
+    assert api.lookup_cached('/next', '') is None
+    assert reminder.cached_status() is None
+
+
+def test_location_reminders_do_not_touch_queue_metrics(harness):
+    reminder = harness.reminder(harness.engine(), 'a')
+    harness.advance_to(at(0, 6))
+    api = ScheduleAPI(reminder=reminder)
+    rebuilds = metrics.QUEUE_REBUILDS.value
+
+    response = api.lookup('/next', 'lat=-6.2&lon=106.8&tz=7')
+    assert isinstance(response, CachedResponse)
+    harness.advance_to(at(0, 23))
+    assert isinstance(api.lookup('/next', 'lat=-6.2&lon=106.8&tz=7'), CachedResponse)
+    assert metrics.QUEUE_REBUILDS.value == rebuilds
+
+
+def test_invalid_parameters_map_to_400(harness):
+    api = ScheduleAPI(reminder=harness.reminder(harness.engine(), 'a'))
+
+    for query in ('lat=abc&lon=1', 'lat=95&lon=1', 'lat=1&lon=2&zone=Mars/Olympus'):
+        head, _ = api.lookup('/next', query)
+        assert status_line(head) == b"HTTP/1.1 400 Bad Request"
+    head, _ = api.lookup('/nope', '')
+    assert status_line(head) == b"HTTP/1.1 404 Not Found"
@@ -0,0 +1,63 @@
+# tests/test_metrics.py
+# Test metrik: bucket histogram, kuantil, format Prometheus dan endpoint HTTP
+
+import urllib.request
+
+import pytest
+
+import metrics
+from metrics import Histogram, MetricsRegistry
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram('test_seconds', "Durasi test", (0.01, 0.1, 1))
+    for value in (0.005, 0.01, 0.05, 0.5):
+        histogram.observe(value)
+    histogram.observe(2, count=4)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 8
+    assert snapshot['avg'] == pytest.approx((0.005 + 0.01 + 0.05 + 0.5 + 8) / 8)
+    # Batas bucket inklusif: 0.01 masuk bucket le=0.01
+    assert histogram.quantile(0.25) == 0.01
+    assert snapshot['p50'] == 1
+    assert snapshot['p95'] == float('inf')
+    assert Histogram('kosong', "").quantile(0.5) is None
+
+
+def test_registry_renders_cumulative_prometheus_text():
+    registry = MetricsRegistry()
+    counter = registry.counter('test_total', "Jumlah test")
+    assert registry.counter('test_total', "Nama sama") is counter
+    counter.inc(3)
+    histogram = registry.histogram('test_seconds', "Durasi test", (0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE test_total counter" in lines
+    assert "test_total 3" in lines
+    assert 'test_seconds_bucket{le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{le="1"} 2' in lines
+    assert 'test_seconds_bucket{le="+Inf"} 3' in lines
+    assert "test_seconds_count 3" in lines
+    assert registry.snapshot()['test_total'] == 3
+
+
+def test_http_endpoint_serves_registry():
+    before = metrics.QUEUE_REBUILDS.value
+    metrics.QUEUE_REBUILDS.inc()
+    server = metrics.start_http_server(port=0, host='127.0.0.1')
+    try:
+        assert metrics.start_http_server() is server
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode('utf-8')
+            content_type = response.headers['Content-Type']
+    finally:
+        metrics.stop_http_server()
+
+    assert content_type.startswith('text/plain; version=0.0.4')
+    assert f"{metrics.QUEUE_REBUILDS.name} {before + 1}" in body.splitlines()
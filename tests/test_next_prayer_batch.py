@@ -0,0 +1,93 @@
+# tests/test_next_prayer_batch.py
+# Test NextPrayerIndex: hari Jakarta, Isya -> Subuh lintas 28 Februari dan tahun, zona DST
+
+import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from config import DEFAULT_PRAYER_TIMES, SHOLAT_NAMES
+from next_prayer_batch import DAYS_PER_YEAR, NextPrayerIndex
+
+WIB = datetime.timezone(datetime.timedelta(hours=7))
+LONDON = ZoneInfo('Europe/London')
+SUBUH = SHOLAT_NAMES.index('Subuh')
+ASHAR = SHOLAT_NAMES.index('Ashar')
+
+# Subuh berbeda setiap slot hari (200 + slot) agar hari yang salah terlihat;
+# sholat lain memakai waktu default config.py
+BASE_MINUTES = [hour * 60 + minute for hour, minute in DEFAULT_PRAYER_TIMES]
+
+
+def make_minutes(locations=1):
+    minutes = np.tile(np.array(BASE_MINUTES, dtype=np.int16), (locations, DAYS_PER_YEAR, 1))
+    minutes[:, :, SUBUH] = 200 + np.arange(DAYS_PER_YEAR)
+    return minutes
+
+
+def lookup_one(index, moment, location=0):
+    result = index.lookup([location], [moment.timestamp()])
+    return {name: values[0] for name, values in result.items()}
+
+
+def test_jakarta_day_returns_next_prayer_and_countdown():
+    index = NextPrayerIndex(make_minutes(), timezones=7)
+    now = datetime.datetime(2025, 3, 1, 12, 0, tzinfo=WIB)
+
+    result = lookup_one(index, now)
+
+    ashar = datetime.datetime(2025, 3, 1, 15, 12, tzinfo=WIB)
+    assert result['prayer_index'] == ASHAR
+    assert result['timestamp'] == ashar.timestamp()
+    assert result['seconds_remaining'] == 3 * 3600 + 12 * 60
+    assert not result['next_day']
+
+
+@pytest.mark.parametrize('after_isya, subuh_date, slot', [
+    (datetime.datetime(2025, 2, 28, 20, 0), datetime.date(2025, 3, 1), 60),
+    (datetime.datetime(2024, 2, 28, 20, 0), datetime.date(2024, 2, 29), 59),
+    (datetime.datetime(2025, 12, 31, 20, 0), datetime.date(2026, 1, 1), 0),
+])
+def test_isya_wraps_to_next_day_subuh(after_isya, subuh_date, slot):
+    index = NextPrayerIndex(make_minutes(), timezones=7)
+
+    result = lookup_one(index, after_isya.replace(tzinfo=WIB))
+
+    subuh_minute = 200 + slot
+    subuh = datetime.datetime.combine(subuh_date, datetime.time(subuh_minute // 60,
+                                                                subuh_minute % 60), WIB)
+    assert result['prayer_index'] == SUBUH
+    assert result['next_day']
+    assert result['minute'] == subuh_minute
+    assert result['timestamp'] == subuh.timestamp()
+
+
+@pytest.mark.parametrize('now', [
+    # Sebelum, pada hari transisi (menit dinding setelah lompatan) dan setelah BST
+    datetime.datetime(2025, 3, 29, 20, 0),
+    datetime.datetime(2025, 3, 30, 3, 0),
+    datetime.datetime(2025, 7, 1, 12, 0),
+    datetime.datetime(2025, 10, 26, 1, 30),
+])
+def test_zone_with_dst_follows_wall_clock(now):
+    index = NextPrayerIndex(make_minutes(2), timezones=[7, 0], zones=[None, 'Europe/London'])
+    now = now.replace(tzinfo=LONDON)
+
+    result = lookup_one(index, now, location=1)
+
+    fire = datetime.datetime.fromtimestamp(result['timestamp'], LONDON)
+    assert fire > now
+    assert fire.hour * 60 + fire.minute == result['minute']
+    assert result['seconds_remaining'] == result['timestamp'] - now.timestamp()
+    # Tidak ada sholat terlewat di antara sekarang dan hasil
+    wall_minute = now.hour * 60 + now.minute
+    if fire.date() == now.date():
+        assert not result['next_day']
+        assert all(minute <= wall_minute or minute >= result['minute']
+                   for minute in BASE_MINUTES[1:])
+
+
+def test_zone_count_must_match_locations():
+    with pytest.raises(ValueError):
+        NextPrayerIndex(make_minutes(2), zones=['Europe/London'])
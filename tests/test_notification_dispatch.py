@@ -0,0 +1,112 @@
+# tests/test_notification_dispatch.py
+# Test pool dispatch notifikasi: submit tanpa menunggu, timeout dan sink sibuk
+
+import datetime
+import threading
+import time
+
+import metrics
+import utils
+from notification_dispatch import NotificationDispatcher, NotificationSink
+
+SHOLAT_TIME = datetime.datetime(2025, 3, 1, 18, 0)
+
+
+class BlockingSink(NotificationSink):
+    """
+    Sink yang tertahan sampai release di-set.
+    """
+
+    name = 'blocking'
+
+    def __init__(self, timeout):
+        super().__init__(timeout)
+        self.release = threading.Event()
+        self.sent = 0
+
+    def send(self, job, timeout):
+        self.release.wait(5)
+        self.sent += 1
+
+
+class RecordingSink(NotificationSink):
+    name = 'recording'
+
+    def __init__(self):
+        super().__init__(1)
+        self.messages = []
+
+    def send(self, job, timeout):
+        self.messages.append(job['message'])
+
+
+def wait_for(condition, seconds=5):
+    deadline = time.monotonic() + seconds
+    while not condition():
+        assert time.monotonic() < deadline, "kondisi tidak tercapai"
+        time.sleep(0.001)
+
+
+def test_submit_drops_immediately_when_queue_full():
+    dispatcher = NotificationDispatcher(sinks=[RecordingSink()], workers=1, queue_size=2)
+    dropped = metrics.NOTIFICATIONS_DROPPED.value
+
+    # Worker belum dijalankan: queue penuh setelah dua job
+    start = time.monotonic()
+    results = [dispatcher.submit('Maghrib', SHOLAT_TIME, str(i)) for i in range(5)]
+    assert time.monotonic() - start < 0.1
+    assert results == [True, True, False, False, False]
+    assert dispatcher.get_stats()['dropped'] == 3
+    assert metrics.NOTIFICATIONS_DROPPED.value == dropped + 3
+
+    dispatcher.start()
+    dispatcher.stop()
+    assert dispatcher.sinks[0].messages == ['0', '1']
+
+
+def test_slow_sink_times_out_without_holding_other_sinks():
+    slow = BlockingSink(timeout=0.05)
+    fast = RecordingSink()
+    dispatcher = NotificationDispatcher(sinks=[slow, fast], workers=1, queue_size=10)
+    dispatcher.start()
+    try:
+        dispatcher.submit('Subuh', SHOLAT_TIME, 'a')
+        wait_for(lambda: dispatcher.get_stats()['dispatched'] == 1)
+        stats = dispatcher.get_stats()
+        assert stats['timeouts'] == 1
+        assert stats['busy'] == 0
+        assert fast.messages == ['a']
+    finally:
+        slow.release.set()
+        dispatcher.stop()
+
+
+def test_busy_sink_counted_separately_from_timeouts():
+    slow = BlockingSink(timeout=0.02)
+    dispatcher = NotificationDispatcher(sinks=[slow], workers=1, queue_size=10)
+    busy = metrics.SINK_BUSY.value
+    dispatcher.start()
+    try:
+        # Job pertama menahan satu-satunya thread runner, job kedua menunggu
+        # di runner, job ketiga menemukan runner penuh
+        for name in ('Subuh', 'Dzuhur', 'Ashar'):
+            dispatcher.submit(name, SHOLAT_TIME, name)
+        wait_for(lambda: dispatcher.get_stats()['dispatched'] == 3)
+        stats = dispatcher.get_stats()
+        assert stats['timeouts'] == 2
+        assert stats['busy'] == 1
+        assert metrics.SINK_BUSY.value == busy + 1
+    finally:
+        slow.release.set()
+        dispatcher.stop()
+
+
+def test_sound_delay_clamped_to_timeout(monkeypatch):
+    monkeypatch.setitem(utils.REMINDER_CONFIG, 'sound_enabled', True)
+    monkeypatch.setitem(utils.REMINDER_CONFIG, 'sound_repeat', 3)
+    monkeypatch.setitem(utils.REMINDER_CONFIG, 'sound_delay', 10)
+    monkeypatch.setattr(utils, '_get_sound_backend', lambda: lambda: None)
+
+    start = time.monotonic()
+    utils.play_reminder_sound(timeout=0.05)
+    assert time.monotonic() - start < 1
@@ -0,0 +1,57 @@
+# tests/test_prayer_cache.py
+# Test cache LRU waktu sholat: key terbulatkan, eviction dan cache hangat
+
+import datetime
+
+from prayer_cache import PrayerTimeCache
+from prayer_times import compute_day_times
+
+DAY = datetime.date(2025, 3, 1)
+JAKARTA = {'latitude': -6.1754, 'longitude': 106.8272, 'timezone': 7}
+# ~300 m dari JAKARTA: key yang sama pada presisi 2 desimal
+NEARBY = {'latitude': -6.1771, 'longitude': 106.8251, 'timezone': 7}
+BANDUNG = {'latitude': -6.9175, 'longitude': 107.6191, 'timezone': 7}
+
+
+def test_nearby_locations_share_one_computation():
+    cache = PrayerTimeCache(max_entries=8, precision=2)
+
+    times = cache.day_times(JAKARTA, DAY)
+    assert cache.day_times(NEARBY, DAY) == times
+    assert times == compute_day_times(-6.18, 106.83, DAY, 7)
+
+    stats = cache.get_stats()
+    assert (stats['entries'], stats['hits'], stats['misses']) == (1, 1, 1)
+    assert stats['hit_rate'] == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrayerTimeCache(max_entries=2, precision=2)
+    next_day = DAY + datetime.timedelta(days=1)
+
+    cache.day_minutes(JAKARTA, DAY)
+    cache.day_minutes(BANDUNG, DAY)
+    cache.day_minutes(JAKARTA, DAY)        # Jakarta jadi yang terbaru
+    cache.day_minutes(JAKARTA, next_day)   # Bandung dibuang
+
+    assert cache.get_stats()['evictions'] == 1
+    cache.day_minutes(JAKARTA, DAY)
+    assert cache.get_stats()['misses'] == 3
+    cache.day_minutes(BANDUNG, DAY)
+    assert cache.get_stats()['misses'] == 4
+
+
+def test_warm_cache_round_trip(tmp_path):
+    path = str(tmp_path / 'prayer_cache.json')
+    cache = PrayerTimeCache(max_entries=8, precision=2, warm_path=path)
+    minutes = cache.day_minutes(JAKARTA, DAY)
+    assert cache.save() == 1
+
+    warm = PrayerTimeCache(max_entries=8, precision=2, warm_path=path)
+    assert warm.load() == 1
+    assert warm.day_minutes(NEARBY, DAY) == minutes
+    assert warm.get_stats()['misses'] == 0
+
+    # Presisi berbeda: key tidak cocok, file diabaikan
+    assert PrayerTimeCache(precision=3, warm_path=path).load() == 0
+    assert PrayerTimeCache(precision=2, warm_path=str(tmp_path / 'tidak_ada.json')).load() == 0
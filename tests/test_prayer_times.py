@@ -0,0 +1,66 @@
+# tests/test_prayer_times.py
+# Test kalkulator waktu sholat: hari Jakarta, pergantian hari lintas 28 Februari dan tahun
+
+import datetime
+
+import numpy as np
+import pytest
+
+from prayer_times import UNDEFINED_MINUTES, compute_day_times, compute_prayer_minutes, year_dates
+
+JAKARTA = (-6.1754, 106.8272)
+
+# Jadwal Kemenag DKI Jakarta 1 Maret 2025 (dibulatkan ke menit)
+JAKARTA_2025_03_01 = [[4, 40], [12, 7], [15, 12], [18, 14], [19, 23]]
+
+
+def test_jakarta_day_matches_published_schedule():
+    times = compute_day_times(*JAKARTA, datetime.date(2025, 3, 1), 7)
+
+    for (hour, minute), (expected_hour, expected_minute) in zip(times, JAKARTA_2025_03_01):
+        assert abs((hour * 60 + minute) - (expected_hour * 60 + expected_minute)) <= 3
+
+
+@pytest.mark.parametrize('first, last', [
+    (datetime.date(2025, 2, 27), datetime.date(2025, 3, 2)),
+    (datetime.date(2024, 2, 27), datetime.date(2024, 3, 2)),
+    (datetime.date(2025, 12, 30), datetime.date(2026, 1, 2)),
+])
+def test_isya_to_next_subuh_across_month_and_year(first, last):
+    dates = [first + datetime.timedelta(days=i) for i in range((last - first).days + 1)]
+    minutes = compute_prayer_minutes([JAKARTA[0]], [JAKARTA[1]], dates, 7)[0]
+
+    # Vektor sama dengan perhitungan per hari
+    for date_obj, row in zip(dates, minutes):
+        single = compute_day_times(*JAKARTA, date_obj, 7)
+        assert [[m // 60, m % 60] for m in row.tolist()] == single
+
+    # Setiap hari naik; Subuh besok setelah Isya hari ini (lewat tengah malam)
+    assert (np.diff(minutes, axis=1) > 0).all()
+    for today, tomorrow in zip(minutes[:-1], minutes[1:]):
+        assert tomorrow[0] + 1440 > today[-1]
+        assert abs(int(tomorrow[0]) - int(today[0])) <= 2
+
+
+def test_year_dates_follow_leap_years():
+    assert len(year_dates(2025)) == 365
+    dates_2024 = year_dates(2024)
+    assert len(dates_2024) == 366
+    assert dates_2024[59] == datetime.date(2024, 2, 29)
+    assert year_dates(2025)[-1] == datetime.date(2025, 12, 31)
+
+
+def test_high_latitude_undefined_times_keep_day_order():
+    # Tromsø saat matahari tidak terbenam: Maghrib dan Isya tidak terdefinisi
+    minutes = compute_prayer_minutes([69.65], [18.96], [datetime.date(2025, 6, 21)], 2,
+                                     method='MWL')[0, 0]
+    defined = minutes[minutes != UNDEFINED_MINUTES]
+
+    assert minutes[3] == UNDEFINED_MINUTES
+    assert (np.diff(defined) > 0).all()
+    assert compute_day_times(69.65, 18.96, datetime.date(2025, 6, 21), 2, method='MWL')[3] is None
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        compute_prayer_minutes([0], [0], [datetime.date(2025, 1, 1)], 0, method='Tidak ada')
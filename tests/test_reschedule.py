@@ -0,0 +1,47 @@
+# tests/test_reschedule.py
+# Test update waktu sholat: satu reminder dipindah tanpa rebuild queue
+
+import metrics
+from config import SHOLAT_NAMES
+
+from conftest import at
+
+DZUHUR = SHOLAT_NAMES.index('Dzuhur')
+
+
+def test_update_moves_one_reminder_without_rebuild(harness):
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'a')
+    harness.advance_to(at(0, 6))
+    assert reminder.start_reminder()
+
+    rebuilds = metrics.QUEUE_REBUILDS.value
+    pending = engine.pending_count()
+    queue = list(reminder.reminder_queue)
+
+    # Dzuhur dipindah ke setelah Ashar: hanya entri Dzuhur yang bergeser
+    assert reminder.update_sholat_time(DZUHUR, 16, 0)
+    assert metrics.QUEUE_REBUILDS.value == rebuilds
+    assert engine.pending_count() == pending
+    today = reminder.today_schedule.date.toordinal()
+    assert [entry for entry in reminder.reminder_queue if entry[0] == today] == \
+        [(today, 2), (today, DZUHUR), (today, 3), (today, 4)]
+    assert sorted(reminder.reminder_queue) == sorted(queue)
+
+    harness.run_until(at(0, 16, 1))
+    assert [name for _, name, _ in harness.fired] == ['Ashar', 'Dzuhur']
+
+
+def test_update_to_past_time_drops_reminder(harness):
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'a')
+    harness.advance_to(at(0, 6))
+    assert reminder.start_reminder()
+
+    assert reminder.update_sholat_time(DZUHUR, 5, 0)
+    today = reminder.today_schedule.date.toordinal()
+    assert (today, DZUHUR) not in reminder.reminder_queue
+
+    harness.run_until(at(0, 16))
+    assert [name for _, name, _ in harness.fired] == ['Ashar']
+
@@ -0,0 +1,81 @@
+# tests/test_schedule_io.py
+# Test export/import streaming: round-trip JSONL/CSV/iCalendar, lipatan baris ICS, load_day_prayers
+
+import datetime
+
+import pytest
+
+import schedule_io
+from config import SHOLAT_NAMES
+
+START = datetime.date(2025, 2, 27)
+END = datetime.date(2025, 3, 2)
+LONG_LOCATION = "Kabupaten Kepulauan Seribu; Jakarta, Indonesia — Pulau Pramuka " * 2
+
+
+def minutes_for(offset):
+    def minutes(date_obj):
+        return tuple(270 + offset + date_obj.day + i * 180 for i in range(len(SHOLAT_NAMES)))
+    return minutes
+
+
+def sources():
+    return [('Jakarta', minutes_for(0)), (LONG_LOCATION, minutes_for(60))]
+
+
+def expected_records():
+    return list(schedule_io.iter_records(sources(), START, END))
+
+
+@pytest.mark.parametrize('fmt', schedule_io.STREAM_FORMATS)
+def test_export_import_round_trip(tmp_path, fmt):
+    path = str(tmp_path / f'jadwal.{fmt}')
+    records = expected_records()
+
+    assert schedule_io.export_records(iter(records), path) == len(records)
+
+    loaded = []
+    stats = schedule_io.import_records(path, loaded.extend, batch_size=7)
+    assert loaded == records
+    assert stats['invalid'] == 0
+    assert stats['batches'] == -(-len(records) // 7)
+
+
+def test_ics_lines_are_folded_at_75_octets(tmp_path):
+    path = str(tmp_path / 'jadwal.ics')
+    schedule_io.export_records(schedule_io.iter_records(sources(), START, START), path)
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    lines = raw.split(b"\r\n")
+    assert all(len(line) <= 75 for line in lines)
+    assert any(line.startswith(b" ") for line in lines)
+    # Setiap baris tetap UTF-8 utuh (karakter multi-byte tidak terpotong)
+    for line in lines:
+        line.decode('utf-8')
+
+
+def test_load_day_prayers_stops_after_target_date(tmp_path, monkeypatch):
+    path = str(tmp_path / 'jadwal.jsonl')
+    schedule_io.export_records(schedule_io.iter_records(sources(), START, END), path)
+
+    read = []
+    validate = schedule_io.validate_record
+
+    def counting(raw):
+        read.append(raw)
+        return validate(raw)
+
+    monkeypatch.setattr(schedule_io, 'validate_record', counting)
+    prayers = schedule_io.load_day_prayers(path, datetime.date(2025, 2, 28))
+
+    assert [p['name'] for p in prayers] == list(SHOLAT_NAMES)
+    assert prayers[0] == {'name': SHOLAT_NAMES[0], 'hour': (270 + 28) // 60,
+                          'minute': (270 + 28) % 60}
+    # Lokasi pertama: 27 dan 28 Februari, lalu satu record 1 Maret
+    assert len(read) == 2 * len(SHOLAT_NAMES) + 1
+
+    read.clear()
+    prayers = schedule_io.load_day_prayers(path, datetime.date(2025, 3, 2), LONG_LOCATION)
+    assert prayers[0]['hour'] == (270 + 60 + 2) // 60
+    assert len(prayers) == len(SHOLAT_NAMES)
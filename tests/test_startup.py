@@ -0,0 +1,22 @@
+# tests/test_startup.py
+# Test mode quiet: reminder non-interaktif tidak menulis ke stdout
+
+from config import SHOLAT_NAMES
+
+from conftest import at
+
+
+def test_quiet_reminder_lifecycle_prints_nothing(harness, capsys):
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'a')
+    harness.advance_to(at(0, 6))
+
+    assert reminder.start_reminder()
+    assert not reminder.start_reminder()
+    assert reminder.update_sholat_time(SHOLAT_NAMES.index('Dzuhur'), 12, 30)
+    assert not reminder.update_sholat_time(99, 12, 30)
+    assert reminder.import_schedule(reminder.export_schedule())
+    reminder.stop_reminder()
+    reminder.reset_schedule()
+
+    assert capsys.readouterr().out == ''
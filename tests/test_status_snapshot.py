@@ -0,0 +1,57 @@
+# tests/test_status_snapshot.py
+# Test snapshot status yang di-cache per menit
+
+import datetime
+
+import metrics
+
+from config import SHOLAT_NAMES
+
+from conftest import at
+
+DZUHUR = SHOLAT_NAMES.index('Dzuhur')
+
+
+def test_status_snapshot_reused_until_minute_boundary_or_change(harness):
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'a')
+    harness.advance_to(at(0, 6, 0))
+    assert reminder.start_reminder()
+
+    status = reminder.status_snapshot()
+    assert reminder.status_snapshot() is status
+    harness.advance_to(at(0, 6, 0) + datetime.timedelta(seconds=59))
+    assert reminder.status_snapshot() is status
+
+    # Batas menit: countdown berubah
+    harness.advance_to(at(0, 6, 1))
+    next_minute = reminder.status_snapshot()
+    assert next_minute is not status
+    assert next_minute['next_prayer']['countdown'] != status['next_prayer']['countdown']
+
+    # Perubahan jadwal membatalkan snapshot di dalam menit yang sama
+    assert reminder.update_sholat_time(DZUHUR, 11, 0)
+    updated = reminder.status_snapshot()
+    assert updated is not next_minute
+    assert updated['next_prayer']['time'] == '11:00'
+
+    reminder.stop_reminder()
+    assert not reminder.get_system_status()['is_running']
+
+
+def test_system_status_reads_metrics_live(harness):
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'a')
+    harness.advance_to(at(0, 6, 0))
+    reminder.build_reminder_queue()
+
+    before = reminder.get_system_status()
+    metrics.QUEUE_REBUILDS.inc()
+    after = reminder.get_system_status()
+
+    # Snapshot jadwal sama, metrik dibaca ulang
+    assert after is not before
+    assert after['next_prayer'] is before['next_prayer']
+    assert 'metrics' not in reminder.status_snapshot()
+    rebuilds = metrics.QUEUE_REBUILDS.name
+    assert after['metrics'][rebuilds] == before['metrics'][rebuilds] + 1
@@ -0,0 +1,45 @@
+# tests/test_timetable_build.py
+# Test pembuatan timetable massal: isi sama dengan build_timetable, dengan dan tanpa os.pwrite
+
+import datetime
+import os
+
+import pytest
+
+import timetable_build
+from timetable_store import build_timetable, open_timetable
+
+LOCATIONS = [
+    {'key': 'jakarta', 'latitude': -6.2, 'longitude': 106.8, 'timezone': 7, 'elevation': 0},
+    {'key': 'makassar', 'latitude': -5.14, 'longitude': 119.42, 'timezone': 8, 'elevation': 0},
+    {'key': 'jayapura', 'latitude': -2.53, 'longitude': 140.72, 'timezone': 9, 'elevation': 0},
+]
+
+
+@pytest.mark.parametrize('pwrite', [True, False])
+def test_sharded_build_matches_single_build(tmp_path, monkeypatch, pwrite):
+    if not pwrite:
+        # Platform tanpa os.pwrite (Windows): seek + write
+        monkeypatch.delattr(os, 'pwrite', raising=False)
+    reference = str(tmp_path / 'reference.ptt')
+    build_timetable(reference, LOCATIONS, 2025)
+
+    paths = timetable_build.build_timetables(str(tmp_path / 'jadwal_{year}.ptt'), LOCATIONS,
+                                             [2025, 2026], workers=1, shard_size=2)
+
+    assert paths == [str(tmp_path / 'jadwal_2025.ptt'), str(tmp_path / 'jadwal_2026.ptt')]
+    with open(reference, 'rb') as f, open(paths[0], 'rb') as g:
+        assert f.read() == g.read()
+    store = open_timetable(paths[1])
+    try:
+        assert store.year == 2026
+        assert store.location_key(2) == 'jayapura'
+        assert store.row_minutes('makassar', datetime.date(2026, 1, 1))
+    finally:
+        store.close()
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_output_pattern_needs_year_for_several_years(tmp_path):
+    with pytest.raises(ValueError):
+        timetable_build.build_timetables(str(tmp_path / 'jadwal.ptt'), LOCATIONS, [2025, 2026])
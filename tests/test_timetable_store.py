@@ -0,0 +1,92 @@
+# tests/test_timetable_store.py
+# Test timetable biner: baca baris, pemeriksaan tahun dan buka ulang setelah dibuat ulang
+
+import datetime
+import os
+
+import pytest
+
+from timetable_store import (UNDEFINED_SLOT, day_index, open_timetable, write_timetable,
+                             year_slot_dates)
+
+KEYS = ['Jakarta', 'Makassar']
+
+
+def rows(base):
+    """
+    Baris per lokasi: menit = base + lokasi * 1000 + slot hari (Subuh),
+    Isya tidak terdefinisi pada slot 0.
+    """
+    for location in range(len(KEYS)):
+        data = []
+        for slot in range(366):
+            isya = UNDEFINED_SLOT if slot == 0 else 1100
+            data.extend([base + location * 1000 + slot, 700, 900, 1000, isya])
+        yield b''.join(value.to_bytes(2, 'little') for value in data)
+
+
+def test_row_lookup_by_key_and_day(tmp_path):
+    path = str(tmp_path / 'jadwal.ptt')
+    write_timetable(path, KEYS, rows(0), year=2024)
+    store = open_timetable(path)
+
+    assert store.location_count == 2
+    assert store.location_index('Makassar') == 1
+    assert store.row_minutes('Makassar', datetime.date(2024, 2, 29))[0] == 1000 + 59
+    assert store.prayer_times(0, datetime.date(2024, 1, 1))[4] is None
+    assert store.as_array().shape == (2, 366, 5)
+    with pytest.raises(KeyError):
+        store.location_index('Bandung')
+
+
+def test_year_is_checked(tmp_path):
+    path = str(tmp_path / 'jadwal.ptt')
+    write_timetable(path, KEYS, rows(0), year=2025)
+    store = open_timetable(path)
+
+    assert store.covers(datetime.date(2025, 12, 31))
+    assert not store.covers(datetime.date(2026, 1, 1))
+    with pytest.raises(ValueError):
+        store.row_minutes(0, datetime.date(2026, 1, 1))
+
+    # Tahun 0: berlaku untuk semua tahun
+    any_year = str(tmp_path / 'semua.ptt')
+    write_timetable(any_year, KEYS, rows(0), year=0)
+    assert open_timetable(any_year).row_minutes(0, datetime.date(2031, 3, 1))[0] == 60
+
+
+def test_rebuilt_file_is_reopened(tmp_path):
+    path = str(tmp_path / 'jadwal.ptt')
+    write_timetable(path, KEYS, rows(0), year=2025)
+    first = open_timetable(path)
+    assert open_timetable(path) is first
+
+    write_timetable(path, KEYS, rows(100), year=2025)
+    # Pastikan mtime berbeda walaupun ditulis ulang dalam tick yang sama
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = open_timetable(path)
+    assert second is not first
+    assert second.row_minutes(0, datetime.date(2025, 1, 1))[0] == 100
+    # Store lama tetap bisa dibaca (mungkin masih dipakai)
+    assert first.row_minutes(0, datetime.date(2025, 1, 1))[0] == 0
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = str(tmp_path / 'jadwal.ptt')
+    write_timetable(path, KEYS, rows(0), year=2025)
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 2)
+
+    with pytest.raises(ValueError):
+        open_timetable(path)
+
+
+def test_leap_layout_slots():
+    assert day_index(datetime.date(2025, 3, 1)) == 60
+    assert day_index(datetime.date(2024, 12, 31)) == 365
+    dates = year_slot_dates(2025)
+    assert len(dates) == 366
+    # Slot 29 Februari di tahun non-kabisat diisi 28 Februari
+    assert dates[59] == datetime.date(2025, 2, 28)
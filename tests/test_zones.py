@@ -0,0 +1,65 @@
+# tests/test_zones.py
+# Test zona waktu: hari transisi DST, waktu yang tidak ada dan reminder di zona ber-DST
+
+import datetime
+
+import pytest
+
+from zones import day_epochs, get_zone, local_date, midnight_epoch, utc_offset_hours, wall_epoch
+
+LONDON = get_zone('Europe/London')
+SPRING = datetime.date(2025, 3, 30)   # 01:00 GMT -> 02:00 BST
+AUTUMN = datetime.date(2025, 10, 26)  # 02:00 BST -> 01:00 GMT
+
+
+def london(date_obj, hour, minute=0):
+    return datetime.datetime(date_obj.year, date_obj.month, date_obj.day, hour, minute,
+                             tzinfo=LONDON)
+
+
+@pytest.mark.parametrize('date_obj, hours', [
+    (datetime.date(2025, 3, 29), 24),
+    (SPRING, 23),
+    (AUTUMN, 25),
+])
+def test_day_epochs_follow_transition_days(date_obj, hours):
+    minutes = [4 * 60 + 34, 12 * 60, 18 * 60 + 57]
+    epochs = day_epochs(LONDON, date_obj, minutes)
+
+    assert epochs == [int(london(date_obj, m // 60, m % 60).timestamp()) for m in minutes]
+    next_midnight = midnight_epoch(LONDON, date_obj + datetime.timedelta(days=1))
+    assert next_midnight - midnight_epoch(LONDON, date_obj) == hours * 3600
+
+
+def test_nonexistent_time_uses_offset_before_transition():
+    # 01:30 tidak ada pada 30 Maret; dipetakan dengan offset GMT
+    expected = datetime.datetime(2025, 3, 30, 1, 30, tzinfo=datetime.timezone.utc)
+    assert wall_epoch(LONDON, SPRING, 90) == int(expected.timestamp())
+
+
+def test_offset_and_local_date():
+    assert utc_offset_hours(LONDON, datetime.date(2025, 1, 15)) == 0
+    assert utc_offset_hours(LONDON, datetime.date(2025, 7, 15)) == 1
+    assert utc_offset_hours(None, datetime.date(2025, 7, 15)) is None
+    assert utc_offset_hours(get_zone('Asia/Makassar'), datetime.date(2025, 7, 15)) == 8
+
+    # 23:30 UTC 31 Juli = 00:30 BST 1 Agustus
+    late = datetime.datetime(2025, 7, 31, 23, 30, tzinfo=datetime.timezone.utc).timestamp()
+    assert local_date(LONDON, late) == datetime.date(2025, 8, 1)
+
+    with pytest.raises(ValueError):
+        get_zone('Asia/Tidak_Ada')
+
+
+def test_reminder_fires_at_wall_clock_time_after_spring_forward(harness):
+    engine = harness.engine()
+    reminder = harness.reminder(engine, 'london', zone='Europe/London')
+    harness.advance_to(london(SPRING - datetime.timedelta(days=1), 20))
+    assert reminder.start_reminder()
+
+    # Subuh default 04:34 waktu dinding, yaitu 03:34 UTC setelah BST mulai
+    subuh = london(SPRING, 4, 34)
+    harness.run_until(subuh - datetime.timedelta(seconds=1))
+    assert harness.fired == []
+    harness.run_until(subuh + datetime.timedelta(seconds=1))
+    assert harness.fired == [('london', 'Subuh', None)]
@@ -0,0 +1,209 @@
+# timetable_build.py
+# File berisi pembuatan timetable massal (banyak kota dan tahun) secara paralel
+
+"""
+File ini membuat timetable biner (timetable_store, satu file .ptt per tahun)
+untuk banyak lokasi sekaligus, misal seluruh kabupaten/kota di Indonesia
+untuk beberapa tahun, memakai semua core CPU.
+
+Perhitungan sama dengan sumber jadwal SholatReminder (prayer_times lewat
+timetable_store.location_slots). Lokasi dibagi menjadi shard
+(TIMETABLE_BUILD_CONFIG['shard_size'] lokasi), dan setiap (tahun, shard)
+menjadi satu tugas di ProcessPoolExecutor. File tujuan dibuat lebih dulu
+dengan area data berukuran penuh; worker menulis hasilnya langsung ke
+offset shard-nya dengan os.pwrite (seek + write pada handle milik tugas
+itu sendiri di platform tanpa os.pwrite, misal Windows), sehingga yang
+dikirim balik ke proses utama hanya jumlah lokasi, bukan array hasil
+perhitungan.
+
+File ditulis ke path sementara lalu di-rename setelah semua shard selesai,
+sehingga pembaca tidak pernah melihat timetable setengah jadi.
+
+Contoh:
+    python timetable_build.py kota.csv --years 2025 2026 --output jadwal_{year}.ptt
+    python timetable_build.py kota.json --years 2025 --workers 4
+
+File lokasi: CSV dengan kolom key,latitude,longitude,timezone[,elevation]
+atau JSON berisi list dict dengan field yang sama.
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import json
+import os
+import time
+
+from config import LOCATION_CONFIG, SHOLAT_NAMES, TIMETABLE_BUILD_CONFIG
+from timetable_store import DAYS_PER_YEAR, create_timetable, location_slots
+
+
+def read_locations(path):
+    """
+    Membaca daftar lokasi dari file CSV atau JSON.
+
+    Args:
+        path (str): Path file lokasi
+
+    Returns:
+        list: Dict berisi 'key', 'latitude', 'longitude', 'timezone', 'elevation'
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.json'):
+            rows = json.load(f)
+        else:
+            rows = list(csv.DictReader(f))
+
+    locations = []
+    for row in rows:
+        locations.append({
+            'key': str(row['key']),
+            'latitude': float(row['latitude']),
+            'longitude': float(row['longitude']),
+            'timezone': float(row.get('timezone') or LOCATION_CONFIG['timezone']),
+            'elevation': float(row.get('elevation') or 0)
+        })
+    return locations
+
+
+def _write_at(path, offset, data):
+    """
+    Menulis data ke file pada offset tertentu tanpa mengubah bagian lain.
+    Memakai os.pwrite jika tersedia; selain itu seek + write pada handle
+    yang dibuka khusus untuk penulisan ini (area shard tidak tumpang
+    tindih, jadi aman dari proses lain).
+
+    Args:
+        path (str): File tujuan (sudah ada)
+        offset (int): Offset byte
+        data (memoryview): Data yang ditulis
+    """
+    if not hasattr(os, 'pwrite'):
+        with open(path, 'r+b') as f:
+            f.seek(offset)
+            f.write(data)
+        return
+
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        while data:
+            written = os.pwrite(fd, data, offset)
+            data = data[written:]
+            offset += written
+    finally:
+        os.close(fd)
+
+
+def _build_shard(path, data_offset, first, locations, year, method, asr_factor):
+    """
+    Tugas worker: menghitung satu shard lokasi lalu menulisnya langsung
+    ke file timetable pada offset shard tersebut.
+
+    Args:
+        path (str): File timetable (sudah dibuat oleh create_timetable)
+        data_offset (int): Offset awal data di file
+        first (int): Indeks lokasi pertama shard ini
+        locations (list): Lokasi dalam shard
+        year (int): Tahun
+        method (str): Metode perhitungan
+        asr_factor (int): Faktor bayangan Ashar
+
+    Returns:
+        int: Jumlah lokasi yang ditulis
+    """
+    slots = location_slots(locations, year, method, asr_factor)
+    location_size = DAYS_PER_YEAR * slots.shape[2] * 2
+
+    _write_at(path, data_offset + first * location_size, memoryview(slots).cast('B'))
+    return len(locations)
+
+
+def build_timetables(output, locations, years, workers=None, shard_size=None,
+                     method=None, asr_factor=None):
+    """
+    Membuat satu timetable per tahun untuk semua lokasi secara paralel.
+
+    Args:
+        output (str): Pola path tujuan dengan '{year}', misal 'jadwal_{year}.ptt'
+        locations (list): Dict berisi 'key', 'latitude', 'longitude',
+            'timezone' dan opsional 'elevation'
+        years (iterable): Tahun-tahun yang dibuat
+        workers (int, optional): Jumlah proses. Default TIMETABLE_BUILD_CONFIG['workers']
+            (None = jumlah core); 1 = dihitung di proses ini tanpa pool
+        shard_size (int, optional): Lokasi per tugas. Default TIMETABLE_BUILD_CONFIG['shard_size']
+        method (str, optional): Metode perhitungan. Default LOCATION_CONFIG['method']
+        asr_factor (int, optional): Faktor bayangan Ashar. Default LOCATION_CONFIG['asr_factor']
+
+    Returns:
+        list: Path timetable yang dibuat, urut sesuai years
+    """
+    years = list(years)
+    if '{year}' not in output and len(years) > 1:
+        raise ValueError("Pola output harus berisi '{year}' untuk lebih dari satu tahun")
+    if workers is None:
+        workers = TIMETABLE_BUILD_CONFIG['workers'] or os.cpu_count() or 1
+    if shard_size is None:
+        shard_size = TIMETABLE_BUILD_CONFIG['shard_size']
+    if method is None:
+        method = LOCATION_CONFIG['method']
+    if asr_factor is None:
+        asr_factor = LOCATION_CONFIG['asr_factor']
+
+    keys = [loc['key'] for loc in locations]
+    paths = [output.format(year=year) for year in years]
+
+    # File tujuan dibuat lebih dulu; worker hanya mengisi area datanya
+    tasks = []
+    for year, path in zip(years, paths):
+        temp_path = path + '.tmp'
+        data_offset = create_timetable(temp_path, keys, year, len(SHOLAT_NAMES))
+        for first in range(0, len(locations), shard_size):
+            tasks.append((temp_path, data_offset, first,
+                          locations[first:first + shard_size], year, method, asr_factor))
+
+    try:
+        if workers == 1:
+            for task in tasks:
+                _build_shard(*task)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_build_shard, *task) for task in tasks]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+    except BaseException:
+        for path in paths:
+            if os.path.exists(path + '.tmp'):
+                os.unlink(path + '.tmp')
+        raise
+
+    for path in paths:
+        os.replace(path + '.tmp', path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pembuatan timetable massal paralel")
+    parser.add_argument('locations', help="File lokasi (CSV atau JSON)")
+    parser.add_argument('--years', type=int, nargs='+', required=True)
+    parser.add_argument('--output', default='jadwal_{year}.ptt',
+                        help="Pola path tujuan (default jadwal_{year}.ptt)")
+    parser.add_argument('--workers', type=int,
+                        help="Jumlah proses (default TIMETABLE_BUILD_CONFIG['workers'])")
+    parser.add_argument('--shard-size', type=int)
+    parser.add_argument('--method', help="Metode perhitungan (default LOCATION_CONFIG)")
+    parser.add_argument('--asr', type=int, help="Faktor bayangan Ashar (default LOCATION_CONFIG)")
+    args = parser.parse_args()
+
+    locations = read_locations(args.locations)
+    start = time.perf_counter()
+    paths = build_timetables(args.output, locations, args.years, args.workers,
+                             args.shard_size, args.method, args.asr)
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {len(locations)} lokasi x {len(args.years)} tahun dalam {elapsed:.1f} s")
+    for path in paths:
+        print(f"📁 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+# timetable_store.py
+# File berisi format biner timetable tahunan yang dibaca dengan mmap
+
+"""
+File ini berisi penyimpanan jadwal sholat tahunan dalam format biner
+yang ringkas. Setiap lokasi menyimpan 366 hari x 5 waktu sholat sebagai
+uint16 (menit sejak tengah malam), sehingga baris (lokasi, hari) dapat
+dibaca langsung dengan offset tanpa men-deserialisasi seluruh file.
+
+Struktur file (little-endian):
+    header   : magic 'SHTT', versi, jumlah sholat, jumlah hari, tahun, jumlah lokasi
+    lokasi   : nama lokasi, masing-masing LOCATION_KEY_SIZE byte (UTF-8, padding nol)
+    data     : uint16[jumlah_lokasi][366][jumlah_sholat]
+
+Hari diindeks dengan tata letak tahun kabisat (1 Jan = 0, 29 Feb = 59,
+31 Des = 365) sehingga indeks tanggal yang sama selalu tetap.
+"""
+
+import datetime
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+# Ekstensi file timetable biner
+TIMETABLE_EXTENSION = '.ptt'
+
+TIMETABLE_MAGIC = b'SHTT'
+TIMETABLE_VERSION = 1
+DAYS_PER_YEAR = 366
+LOCATION_KEY_SIZE = 32
+
+# Nilai menit untuk waktu yang tidak terdefinisi
+UNDEFINED_SLOT = 0xFFFF
+
+# Format header: magic, versi, jumlah sholat, jumlah hari, tahun, jumlah lokasi
+_HEADER = struct.Struct('<4sHHHHI')
+
+# Indeks hari pertama setiap bulan dalam tata letak tahun kabisat
+_MONTH_OFFSETS = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
+
+def day_index(date_obj):
+    """
+    Indeks hari (0-365) dalam tata letak tahun kabisat.
+
+    Args:
+        date_obj (date): Tanggal
+
+    Returns:
+        int: Indeks hari
+    """
+    return _MONTH_OFFSETS[date_obj.month - 1] + date_obj.day - 1
+
+
+def _encode_key(key):
+    """
+    Mengubah nama lokasi menjadi field berukuran tetap.
+    """
+    encoded = key.encode('utf-8')
+    if len(encoded) > LOCATION_KEY_SIZE:
+        raise ValueError(f"Nama lokasi terlalu panjang (maks {LOCATION_KEY_SIZE} byte): {key}")
+    return encoded.ljust(LOCATION_KEY_SIZE, b'\0')
+
+
+def _write_header(f, keys, year, prayer_count):
+    """
+    Menulis header dan tabel nama lokasi.
+
+    Returns:
+        int: Offset awal data (bytes)
+    """
+    f.write(_HEADER.pack(TIMETABLE_MAGIC, TIMETABLE_VERSION,
+                         prayer_count, DAYS_PER_YEAR, year, len(keys)))
+    for key in keys:
+        f.write(_encode_key(key))
+    return _HEADER.size + len(keys) * LOCATION_KEY_SIZE
+
+
+def write_timetable(path, keys, rows, year=0, prayer_count=5):
+    """
+    Menulis file timetable biner.
+
+    Args:
+        path (str): Path file tujuan
+        keys (list): Nama lokasi sesuai urutan data
+        rows (iterable): Untuk setiap lokasi, iterable berisi
+            366 x prayer_count menit (urutan hari lalu sholat), atau
+            bytes berisi uint16 little-endian dengan urutan yang sama
+        year (int): Tahun sumber data (informasi saja)
+        prayer_count (int): Jumlah waktu sholat per hari
+    """
+    expected = DAYS_PER_YEAR * prayer_count
+
+    # Ditulis ke file sementara lalu di-rename: store yang masih memetakan
+    # file lama (open_timetable) tidak melihat isi setengah jadi atau file
+    # yang memendek di bawah mmap-nya
+    temp_path = path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            _write_header(f, keys, year, prayer_count)
+
+            written = 0
+            for location_rows in rows:
+                if isinstance(location_rows, (bytes, bytearray, memoryview)):
+                    data = location_rows
+                else:
+                    data = array('H', location_rows)
+                    if sys.byteorder == 'big':
+                        data.byteswap()
+
+                if len(memoryview(data).cast('B')) != expected * 2:
+                    raise ValueError(f"Data lokasi harus berisi {expected} nilai uint16")
+                f.write(data)
+                written += 1
+
+        if written != len(keys):
+            raise ValueError(f"Jumlah data lokasi ({written}) tidak sama dengan "
+                             f"jumlah nama ({len(keys)})")
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    os.replace(temp_path, path)
+
+
+def year_slot_dates(year):
+    """
+    Tanggal untuk setiap slot hari (366) dari tahun tertentu.
+    Pada tahun non-kabisat, slot 29 Februari diisi dengan 28 Februari.
+
+    Args:
+        year (int): Tahun
+
+    Returns:
+        list: 366 objek date
+    """
+    dates = []
+    for slot in range(DAYS_PER_YEAR):
+        leap_date = datetime.date(2000, 1, 1) + datetime.timedelta(days=slot)
+        try:
+            dates.append(leap_date.replace(year=year))
+        except ValueError:
+            dates.append(datetime.date(year, 2, 28))
+    return dates
+
+
+def create_timetable(path, keys, year=0, prayer_count=5):
+    """
+    Membuat file timetable dengan header, nama lokasi dan area data
+    berukuran penuh (berisi nol) yang diisi kemudian per blok lokasi,
+    misal oleh beberapa proses sekaligus (lihat timetable_build).
+
+    Args:
+        path (str): Path file tujuan
+        keys (list): Nama lokasi sesuai urutan data
+        year (int): Tahun sumber data (informasi saja)
+        prayer_count (int): Jumlah waktu sholat per hari
+
+    Returns:
+        int: Offset awal data (bytes); data lokasi ke-i dimulai di
+            offset + i * 366 * prayer_count * 2
+    """
+    with open(path, 'wb') as f:
+        data_offset = _write_header(f, keys, year, prayer_count)
+        f.truncate(data_offset + len(keys) * DAYS_PER_YEAR * prayer_count * 2)
+    return data_offset
+
+
+def location_slots(locations, year, method='Kemenag', asr_factor=1):
+    """
+    Menghitung isi data timetable satu tahun untuk banyak lokasi
+    memakai prayer_times (butuh NumPy).
+
+    Args:
+        locations (list): Dict berisi 'latitude', 'longitude', 'timezone'
+            dan opsional 'elevation'
+        year (int): Tahun
+        method (str): Metode perhitungan
+        asr_factor (int): Faktor bayangan Ashar
+
+    Returns:
+        ndarray: Array uint16 little-endian berbentuk (lokasi, 366, sholat),
+            UNDEFINED_SLOT untuk waktu yang tidak terdefinisi
+    """
+    import numpy as np
+    from prayer_times import compute_prayer_minutes, UNDEFINED_MINUTES
+
+    minutes = compute_prayer_minutes(
+        [loc['latitude'] for loc in locations],
+        [loc['longitude'] for loc in locations],
+        year_slot_dates(year),
+        [loc['timezone'] for loc in locations],
+        [loc.get('elevation', 0) for loc in locations],
+        method,
+        asr_factor
+    )
+    return np.where(minutes == UNDEFINED_MINUTES, UNDEFINED_SLOT, minutes).astype('<u2')
+
+
+def build_timetable(path, locations, year, method='Kemenag', asr_factor=1):
+    """
+    Menghitung dan menulis timetable satu tahun untuk banyak lokasi
+    memakai prayer_times (butuh NumPy). Untuk banyak lokasi/tahun
+    sekaligus di beberapa core, lihat timetable_build.build_timetables.
+
+    Args:
+        path (str): Path file tujuan
+        locations (list): Dict berisi 'key', 'latitude', 'longitude',
+            'timezone' dan opsional 'elevation'
+        year (int): Tahun
+        method (str): Metode perhitungan
+        asr_factor (int): Faktor bayangan Ashar
+    """
+    slots = location_slots(locations, year, method, asr_factor)
+
+    write_timetable(
+        path,
+        [loc['key'] for loc in locations],
+        (slots[i].tobytes() for i in range(len(locations))),
+        year,
+        slots.shape[2]
+    )
+
+
+class TimetableStore:
+    """
+    Pembaca timetable biner berbasis mmap.
+    Baris (lokasi, hari) dibaca langsung dari offset-nya dengan O(1).
+    """
+
+    def __init__(self, path):
+        """
+        Membuka file timetable dan memvalidasi header.
+
+        Args:
+            path (str): Path file timetable
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.prayer_count, self.days,
+         self.year, self.location_count) = _HEADER.unpack_from(self._mmap, 0)
+
+        if magic != TIMETABLE_MAGIC or version != TIMETABLE_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Bukan file timetable yang valid: {path}")
+
+        self._keys_offset = _HEADER.size
+        self._data_offset = self._keys_offset + self.location_count * LOCATION_KEY_SIZE
+        self._row = struct.Struct(f'<{self.prayer_count}H')
+        self._row_size = self.prayer_count * 2
+        self._location_row_size = self.days * self._row_size
+
+        expected_size = self._data_offset + self.location_count * self._location_row_size
+        if len(self._mmap) < expected_size:
+            self._mmap.close()
+            raise ValueError(f"File timetable terpotong: {path}")
+
+        # Cache nama -> indeks untuk lokasi yang sudah pernah dicari
+        self._index = {}
+
+    def location_key(self, location_index):
+        """
+        Nama lokasi berdasarkan indeks.
+
+        Args:
+            location_index (int): Indeks lokasi
+
+        Returns:
+            str: Nama lokasi
+        """
+        offset = self._keys_offset + location_index * LOCATION_KEY_SIZE
+        return self._mmap[offset:offset + LOCATION_KEY_SIZE].rstrip(b'\0').decode('utf-8')
+
+    def location_index(self, key):
+        """
+        Indeks lokasi berdasarkan nama. Tabel nama dicari langsung di mmap
+        (tanpa membangun dictionary seluruh lokasi), hasilnya di-cache.
+
+        Args:
+            key (str): Nama lokasi
+
+        Returns:
+            int: Indeks lokasi
+        """
+        index = self._index.get(key)
+        if index is not None:
+            return index
+
+        encoded = _encode_key(key)
+        position = self._mmap.find(encoded, self._keys_offset, self._data_offset)
+        while position != -1:
+            # Pastikan cocok di awal field, bukan di tengah nama lain
+            if (position - self._keys_offset) % LOCATION_KEY_SIZE == 0:
+                index = (position - self._keys_offset) // LOCATION_KEY_SIZE
+                self._index[key] = index
+                return index
+            position = self._mmap.find(encoded, position + 1, self._data_offset)
+
+        raise KeyError(f"Lokasi tidak ditemukan dalam timetable: {key}")
+
+    def covers(self, date_obj):
+        """
+        Apakah timetable berisi jadwal untuk tanggal tersebut.
+        Tahun 0 di header berarti timetable berlaku untuk semua tahun.
+
+        Args:
+            date_obj (date): Tanggal
+
+        Returns:
+            bool: True jika tahun tanggal sama dengan tahun timetable
+        """
+        return self.year == 0 or date_obj.year == self.year
+
+    def row_minutes(self, location, date_obj):
+        """
+        Menit sejak tengah malam untuk semua sholat pada (lokasi, tanggal).
+
+        Args:
+            location (int/str): Indeks atau nama lokasi
+            date_obj (date): Tanggal
+
+        Returns:
+            tuple: Menit per sholat (UNDEFINED_SLOT jika tidak terdefinisi)
+        """
+        if not self.covers(date_obj):
+            raise ValueError(f"Timetable {self.path} berisi tahun {self.year}, "
+                             f"bukan {date_obj.year}")
+        if not isinstance(location, int):
+            location = self.location_index(location)
+        if not (0 <= location < self.location_count):
+            raise IndexError(f"Indeks lokasi di luar jangkauan: {location}")
+
+        offset = (self._data_offset + location * self._location_row_size
+                  + day_index(date_obj) * self._row_size)
+        return self._row.unpack_from(self._mmap, offset)
+
+    def prayer_times(self, location, date_obj):
+        """
+        Waktu sholat (lokasi, tanggal) dalam format DEFAULT_PRAYER_TIMES.
+
+        Args:
+            location (int/str): Indeks atau nama lokasi
+            date_obj (date): Tanggal
+
+        Returns:
+            list: Waktu dalam format [[jam, menit], ...]; None untuk waktu yang
+                  tidak terdefinisi
+        """
+        minutes = self.row_minutes(location, date_obj)
+        return [None if m == UNDEFINED_SLOT else [m // 60, m % 60] for m in minutes]
+
+    def as_array(self):
+        """
+        Seluruh data sebagai array NumPy tanpa salinan (view di atas mmap).
+        Selama view masih dipakai, store tidak bisa ditutup.
+
+        Returns:
+            ndarray: Array uint16 berbentuk (lokasi, hari, sholat)
+        """
+        import numpy as np
+
+        return np.frombuffer(
+            self._mmap,
+            dtype='<u2',
+            count=self.location_count * self.days * self.prayer_count,
+            offset=self._data_offset
+        ).reshape(self.location_count, self.days, self.prayer_count)
+
+    def close(self):
+        """
+        Menutup mmap.
+        """
+        self._mmap.close()
+
+
+# Cache store yang sudah dibuka, dipakai bersama oleh semua SholatReminder:
+# path -> ((mtime_ns, ukuran), TimetableStore)
+_open_stores = {}
+
+
+def open_timetable(path):
+    """
+    Membuka timetable (atau memakai ulang yang sudah terbuka). File yang
+    dibuat ulang di disk (mtime atau ukuran berubah) dibuka ulang; store
+    lama tidak ditutup karena bisa masih dipakai (misal view as_array).
+
+    Args:
+        path (str): Path file timetable
+
+    Returns:
+        TimetableStore: Store yang siap dibaca
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _open_stores.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    store = TimetableStore(path)
+    _open_stores[path] = (signature, store)
+    return store
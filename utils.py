@@ -8,9 +8,14 @@ formatting, validasi, dan notifikasi.
 """
 
 import datetime
+import sys
 import time
-import winsound  # Untuk Windows, bisa diganti dengan alternatif cross-platform
 from config import REMINDER_CONFIG, DISPLAY_CONFIG, MESSAGES
+from clock import get_clock
+import metrics
+
+# Backend suara yang dipilih saat pertama kali dibutuhkan (lihat _get_sound_backend)
+_sound_backend = None
 
 def format_time(dt_object, format_string=None):
     """
@@ -50,13 +55,13 @@ def calculate_time_difference(target_time, current_time=None):
     
     Args:
         target_time (datetime): Waktu target
-        current_time (datetime, optional): Waktu sekarang. Default datetime.now()
+        current_time (datetime, optional): Waktu sekarang. Default dari jam default
     
     Returns:
         dict: Dictionary berisi informasi selisih waktu
     """
     if current_time is None:
-        current_time = datetime.datetime.now()
+        current_time = get_clock().now()
     
     time_diff = target_time - current_time
     total_seconds = int(time_diff.total_seconds())
@@ -129,40 +134,81 @@ def validate_sholat_index(index, max_index):
     except (ValueError, TypeError):
         return False, "Indeks harus berupa angka"
 
-def play_reminder_sound():
+def _get_sound_backend():
+    """
+    Memilih backend suara saat pertama kali dibutuhkan, bukan saat import.
+    Windows memakai winsound; sistem lain memakai karakter bell (\\a)
+    yang ditulis langsung ke terminal tanpa membuat proses shell.
+    
+    Returns:
+        function: Fungsi tanpa argumen yang membunyikan satu beep
+    """
+    global _sound_backend
+    
+    if _sound_backend is None:
+        try:
+            import winsound
+            
+            def beep():
+                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+        
+        except ImportError:
+            def beep():
+                if sys.stdout.isatty():
+                    sys.stdout.write('\a')  # ASCII bell character
+                    sys.stdout.flush()
+                else:
+                    # Tanpa terminal - tampilkan bell visual
+                    print(f"{DISPLAY_CONFIG['bell_emoji']} TING! TING!")
+        
+        _sound_backend = beep
+    
+    return _sound_backend
+
+def play_reminder_sound(timeout=None):
     """
     Memainkan suara reminder sesuai konfigurasi.
     Mendukung berbagai platform dengan fallback.
+    
+    Args:
+        timeout (float, optional): Batas waktu total dalam detik. Pengulangan
+            suara dihentikan jika batas waktu terlampaui
     """
     if not REMINDER_CONFIG['sound_enabled']:
         return
     
+    start = time.monotonic()
+    deadline = None if timeout is None else start + timeout
+    beep = _get_sound_backend()
+    
     try:
-        # Untuk Windows - menggunakan winsound
         for _ in range(REMINDER_CONFIG['sound_repeat']):
-            winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            beep()
             if REMINDER_CONFIG['sound_repeat'] > 1:
-                time.sleep(REMINDER_CONFIG['sound_delay'])
-    
-    except ImportError:
-        # Fallback untuk sistem lain
-        try:
-            # Coba menggunakan system bell
-            import os
-            for _ in range(REMINDER_CONFIG['sound_repeat']):
-                os.system('echo \a')  # ASCII bell character
-                if REMINDER_CONFIG['sound_repeat'] > 1:
-                    time.sleep(REMINDER_CONFIG['sound_delay'])
-        except:
-            # Fallback terakhir - print visual bell
-            print(f"{DISPLAY_CONFIG['bell_emoji']} TING! TING!")
+                # Jeda tidak boleh melewati batas waktu sink
+                delay = REMINDER_CONFIG['sound_delay']
+                if deadline is not None:
+                    delay = min(delay, deadline - time.monotonic())
+                if delay > 0:
+                    time.sleep(delay)
+    
+    except Exception:
+        # Fallback terakhir - print visual bell
+        print(f"{DISPLAY_CONFIG['bell_emoji']} TING! TING!")
+    
+    metrics.SOUND_DURATION.observe(time.monotonic() - start)
 
-def print_separator(separator_type='default'):
+def get_separator(separator_type='default'):
     """
-    Mencetak separator sesuai tipe.
+    Mendapatkan string separator sesuai tipe.
     
     Args:
         separator_type (str): Tipe separator ('default', 'menu', 'schedule', 'queue')
+    
+    Returns:
+        str: String separator
     """
     separators = {
         'default': "=" * DISPLAY_CONFIG['separator_length'],
@@ -171,7 +217,16 @@ def print_separator(separator_type='default'):
         'queue': DISPLAY_CONFIG['queue_separator']
     }
     
-    print(separators.get(separator_type, separators['default']))
+    return separators.get(separator_type, separators['default'])
+
+def print_separator(separator_type='default'):
+    """
+    Mencetak separator sesuai tipe.
+    
+    Args:
+        separator_type (str): Tipe separator ('default', 'menu', 'schedule', 'queue')
+    """
+    print(get_separator(separator_type))
 
 def print_header(title, separator_type='default'):
     """
@@ -184,15 +239,21 @@ def print_header(title, separator_type='default'):
     print(f"\n{title}")
     print_separator(separator_type)
 
-def get_current_time_info():
+def get_current_time_info(clock=None):
     """
     Mendapatkan informasi waktu saat ini.
     
+    Args:
+        clock (SystemClock/VirtualClock, optional): Sumber waktu. Default jam default
+    
     Returns:
         dict: Dictionary berisi informasi waktu sekarang
     """
-    now = datetime.datetime.now()
-    today = datetime.date.today()
+    if clock is None:
+        clock = get_clock()
+    
+    now = clock.now()
+    today = now.date()
     
     return {
         'datetime': now,
@@ -202,24 +263,30 @@ def get_current_time_info():
         'timestamp': now.timestamp()
     }
 
-def create_datetime_from_time(hour, minute, date_obj=None):
+def create_datetime_from_time(hour, minute, date_obj=None, zone=None):
     """
     Membuat objek datetime dari jam dan menit.
     
     Args:
         hour (int): Jam
         minute (int): Menit
-        date_obj (date, optional): Objek date. Default hari ini
+        date_obj (date, optional): Objek date. Default hari ini (jam default,
+            atau di zona jika zone diberikan)
+        zone (ZoneInfo, optional): Zona waktu; jika diberikan hasilnya aware
     
     Returns:
         datetime: Objek datetime yang telah dibuat
     """
     if date_obj is None:
-        date_obj = datetime.date.today()
+        if zone is None:
+            date_obj = get_clock().today()
+        else:
+            date_obj = datetime.datetime.fromtimestamp(get_clock().time(), zone).date()
     
     return datetime.datetime.combine(
         date_obj,
-        datetime.time(hour, minute)
+        datetime.time(hour, minute),
+        tzinfo=zone
     )
 
 def is_time_in_range(target_time, current_time=None, tolerance_seconds=None):
@@ -228,14 +295,14 @@ def is_time_in_range(target_time, current_time=None, tolerance_seconds=None):
     
     Args:
         target_time (datetime): Waktu target
-        current_time (datetime, optional): Waktu sekarang
+        current_time (datetime, optional): Waktu sekarang. Default dari jam default
         tolerance_seconds (int, optional): Toleransi dalam detik
     
     Returns:
         bool: True jika dalam rentang toleransi
     """
     if current_time is None:
-        current_time = datetime.datetime.now()
+        current_time = get_clock().now()
     
     if tolerance_seconds is None:
         tolerance_seconds = REMINDER_CONFIG['reminder_tolerance']
@@ -258,17 +325,18 @@ def format_prayer_notification(sholat_name, sholat_time):
     """
     formatted_time = format_time(sholat_time)
     formatted_date = format_date(sholat_time)
+    separator = get_separator('default')
     
     notification = f"""
-{print_separator('default')}
+{separator}
 {MESSAGES['prayer_time_arrived']}
-{print_separator('default')}
+{separator}
    Sholat: {sholat_name}
    Waktu : {formatted_time}
    Tanggal: {formatted_date}
-{print_separator('default')}
+{separator}
 {MESSAGES['prayer_reminder']}
-{print_separator('default')}
+{separator}
 """
     return notification
 
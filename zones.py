@@ -0,0 +1,149 @@
+# zones.py
+# File berisi konversi waktu dinding per zona waktu (zoneinfo) ke epoch UTC
+
+"""
+File ini berisi fungsi zona waktu untuk jadwal multi-wilayah: WIB, WITA,
+WIT dan zona dengan DST (misal pengguna diaspora di Eropa atau Amerika).
+
+Jadwal sholat disimpan sebagai menit waktu dinding (lokal) per hari;
+waktu fire-nya adalah epoch UTC integer, sehingga heap engine dapat
+mengurutkan reminder dari zona mana pun dengan perbandingan integer biasa.
+
+Batas hari (epoch tengah malam hari ini dan besok) per (zona, tanggal)
+di-cache. Pada hari tanpa transisi zona (panjang hari tepat 86400 detik,
+yaitu hampir semua hari) epoch sholat cukup dihitung dengan
+tengah_malam + menit * 60; hanya hari transisi DST yang dihitung per
+waktu dengan zoneinfo.
+
+Zona None berarti waktu lokal sistem (perilaku lama, lewat time.mktime).
+"""
+
+import datetime
+import functools
+import time
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+_DAY_SECONDS = 86400
+
+
+@functools.lru_cache(maxsize=None)
+def get_zone(name):
+    """
+    Objek zona waktu berdasarkan nama IANA.
+
+    Args:
+        name (str/None): Nama zona, misal 'Asia/Jakarta'; None = waktu lokal sistem
+
+    Returns:
+        ZoneInfo atau None: Zona waktu
+
+    Raises:
+        ValueError: Jika nama zona tidak dikenal
+    """
+    if name is None:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise ValueError(f"Zona waktu tidak dikenal: {name}") from e
+
+
+def wall_epoch(zone, date_obj, minute):
+    """
+    Epoch UTC untuk waktu dinding (tanggal, menit sejak tengah malam) di zona.
+    Waktu yang tidak ada (lompatan DST) dipetakan dengan offset sebelum transisi.
+
+    Args:
+        zone (ZoneInfo/None): Zona waktu; None = waktu lokal sistem
+        date_obj (date): Tanggal
+        minute (int): Menit sejak tengah malam
+
+    Returns:
+        int: Epoch UTC (detik)
+    """
+    if zone is None:
+        return int(time.mktime((date_obj.year, date_obj.month, date_obj.day,
+                                minute // 60, minute % 60, 0, 0, 0, -1)))
+    local = datetime.datetime(date_obj.year, date_obj.month, date_obj.day,
+                              minute // 60, minute % 60, tzinfo=zone)
+    return int(local.timestamp())
+
+
+@functools.lru_cache(maxsize=8192)
+def _day_bounds(zone, ordinal):
+    """
+    Epoch tengah malam suatu hari dan hari berikutnya di zona (di-cache).
+
+    Returns:
+        tuple: (epoch tengah malam, epoch tengah malam besok)
+    """
+    date_obj = datetime.date.fromordinal(ordinal)
+    return (wall_epoch(zone, date_obj, 0),
+            wall_epoch(zone, date_obj + datetime.timedelta(days=1), 0))
+
+
+def midnight_epoch(zone, date_obj):
+    """
+    Returns:
+        int: Epoch UTC tengah malam tanggal tersebut di zona
+    """
+    return _day_bounds(zone, date_obj.toordinal())[0]
+
+
+def day_epochs(zone, date_obj, minutes):
+    """
+    Epoch UTC untuk beberapa waktu dinding pada satu tanggal.
+
+    Args:
+        zone (ZoneInfo/None): Zona waktu
+        date_obj (date): Tanggal
+        minutes (iterable): Menit sejak tengah malam
+
+    Returns:
+        list: Epoch UTC (int) per menit
+    """
+    midnight, next_midnight = _day_bounds(zone, date_obj.toordinal())
+    if next_midnight - midnight == _DAY_SECONDS:
+        return [midnight + minute * 60 for minute in minutes]
+    # Hari transisi DST: offset berubah di tengah hari
+    return [wall_epoch(zone, date_obj, minute) for minute in minutes]
+
+
+def local_date(zone, epoch):
+    """
+    Tanggal waktu dinding di zona untuk suatu epoch.
+
+    Args:
+        zone (ZoneInfo/None): Zona waktu
+        epoch (float): Epoch UTC
+
+    Returns:
+        date: Tanggal lokal
+    """
+    if zone is None:
+        return datetime.date.fromtimestamp(epoch)
+    return datetime.datetime.fromtimestamp(epoch, zone).date()
+
+
+@functools.lru_cache(maxsize=8192)
+def _utc_offset_hours(zone, ordinal):
+    date_obj = datetime.date.fromordinal(ordinal)
+    noon = datetime.datetime(date_obj.year, date_obj.month, date_obj.day, 12, tzinfo=zone)
+    return noon.utcoffset().total_seconds() / 3600
+
+
+def utc_offset_hours(zone, date_obj):
+    """
+    Offset zona (jam) pada siang hari tanggal tersebut, untuk perhitungan
+    astronomis di zona ber-DST.
+
+    Args:
+        zone (ZoneInfo/None): Zona waktu
+        date_obj (date): Tanggal
+
+    Returns:
+        float atau None: Offset dalam jam; None untuk waktu lokal sistem
+    """
+    if zone is None:
+        return None
+    return _utc_offset_hours(zone, date_obj.toordinal())